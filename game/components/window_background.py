@@ -2,20 +2,87 @@ import pygame
 import time
 import os
 
-from core import runtime_globals, game_globals
+from core import module_bundle, runtime_globals, game_globals
 import game.core.constants as constants
 from core.utils.module_utils import get_module
-from core.utils.pygame_utils import blit_with_cache, sprite_load_percent
+from core.utils.pygame_utils import blit_with_cache
+
+TIMES_OF_DAY = ("day", "dusk", "night")
+
+
+def get_time_of_day() -> str:
+    """Returns "day", "dusk" or "night" for the current local hour."""
+    current_hour = time.localtime().tm_hour
+    return (
+        "day" if 6 <= current_hour < 16
+        else "dusk" if 16 <= current_hour < 19
+        else "night"
+    )
+
+
+def update_time_of_day() -> None:
+    """Scheduler task: refreshes the shared time of day used by every WindowBackground."""
+    runtime_globals.time_of_day = get_time_of_day()
+    # Keep the other day/dusk/night variants warm so the 16:00/19:00 swaps never decode on the spot
+    prefetch_backgrounds()
+
+
+def get_background_path(name, module_name, time_of_day):
+    """
+    Resolves the image file for a background at the given time of day,
+    preferring the _high variant when high resolution backgrounds are enabled.
+    Returns None if the module is not loaded.
+    """
+    module = get_module(module_name)
+    if module is None:
+        return None
+
+    day_night = True
+    for bg in getattr(module, "backgrounds", []):
+        if bg["name"] == name:
+            day_night = bg.get("day_night", True)
+            break
+
+    suffix = f"_{time_of_day}" if day_night else ""
+    base_filename = f"bg_{name}{suffix}"
+
+    high_path = os.path.join(module.folder_path, "backgrounds", f"{base_filename}_high.png")
+    normal_path = os.path.join(module.folder_path, "backgrounds", f"{base_filename}.png")
+
+    if game_globals.background_high_res and module_bundle.exists(high_path):
+        return high_path
+    return normal_path
+
+
+def get_background_image(path):
+    """Returns the shared, screen-scaled surface for a background file."""
+    return runtime_globals.game_assets.get_sprite(path, percent=100, keep_proportion=True, base_on="width", alpha=False)
+
+
+def prefetch_backgrounds():
+    """Queues every time-of-day variant of the selected background for decoding in the asset worker."""
+    name = game_globals.game_background
+    module_name = game_globals.background_module_name
+    if not name or not module_name:
+        return
+
+    specs = []
+    for time_of_day in TIMES_OF_DAY:
+        path = get_background_path(name, module_name, time_of_day)
+        if path is not None:
+            specs.append((path, 100, True, "width", False))
+    runtime_globals.game_assets.preload_specs(specs)
 
 
 class WindowBackground:
     def __init__(self, boot=False):
         self.time_of_day = "day"
         self.image = None
-        self.last_check_time = 0
+        self.last_request = None
         self.last_background = None
         self.last_module = None
         self.last_image_path = None
+        self.module_revision = runtime_globals.module_revision
         self.center = None
         self.update()
         self.load_sprite(boot)
@@ -26,31 +93,27 @@ class WindowBackground:
             blit_with_cache(surface, self.image, self.center)
 
     def update(self):
-        now = time.time()
-
-        # Exit early if nothing has changed and we checked recently
-        if (game_globals.game_background == self.last_background and
-            game_globals.background_module_name == self.last_module and
-            now - self.last_check_time < 60):
-            return
-
-        self.last_check_time = now
-
-        # Check if we need to reload background
-        current_hour = time.localtime().tm_hour
-        new_time_of_day = (
-            "day" if 6 <= current_hour < 16
-            else "dusk" if 16 <= current_hour < 19
-            else "night"
-        )
+        # Time of day is refreshed once a minute by the scheduler (update_time_of_day)
+        new_time_of_day = runtime_globals.time_of_day
 
         background_changed = (
             game_globals.game_background != self.last_background or
             game_globals.background_module_name != self.last_module
         )
+        if runtime_globals.module_revision != self.module_revision:
+            # A module was hot reloaded: the same path may now hold a different image
+            self.module_revision = runtime_globals.module_revision
+            self.last_image_path = None
+            self.last_request = None
+            background_changed = True
         time_changed = new_time_of_day != self.time_of_day
 
         if background_changed or time_changed:
+            # Only retry a failed load when something we depend on changes
+            request = (game_globals.game_background, game_globals.background_module_name, new_time_of_day)
+            if request == self.last_request:
+                return
+            self.last_request = request
             self.time_of_day = new_time_of_day
             self.load_sprite(False)
 
@@ -66,35 +129,26 @@ class WindowBackground:
                 self.image = None
                 return
 
-            module = get_module(module_name)
-            day_night = True
-            for bg in getattr(module, "backgrounds", []):
-                if bg["name"] == name:
-                    day_night = bg.get("day_night", True)
-                    break
-
-            suffix = f"_{self.time_of_day}" if day_night else ""
-            base_filename = f"bg_{name}{suffix}"
-
-            high_path = os.path.join(module.folder_path, "backgrounds", f"{base_filename}_high.png")
-            normal_path = os.path.join(module.folder_path, "backgrounds", f"{base_filename}.png")
-
-            if game_globals.background_high_res and os.path.exists(high_path):
-                path = high_path
-            else:
-                path = normal_path
+            path = get_background_path(name, module_name, self.time_of_day)
+            if path is None:
+                runtime_globals.game_console.log(f"[!] Background module not loaded: {module_name}")
+                self.image = None
+                return
 
         # Avoid reloading if already loaded
         if path == self.last_image_path:
             return
 
         try:
-            # Use the new sprite loading method to cover the screen, keeping proportions, base on width
-            self.image = sprite_load_percent(path, percent=100, keep_proportion=True, base_on="width", alpha=False)
+            # Shared across WindowBackground instances; usually already decoded by prefetch_backgrounds
+            self.image = get_background_image(path)
             self.last_background = game_globals.game_background
             self.last_module = game_globals.background_module_name
             self.last_image_path = path
             self.center = self.image.get_rect(center=(constants.SCREEN_WIDTH // 2, constants.SCREEN_HEIGHT // 2))
+            if not boot:
+                # New selection or resolution: decode the other times of day ahead of their transition
+                prefetch_backgrounds()
         except Exception:
             runtime_globals.game_console.log(f"[!] Error loading background: {path}")
             self.image = None
@@ -1,5 +1,4 @@
 import pygame
-import time
 import os
 
 from core import runtime_globals
@@ -27,8 +26,6 @@ class WindowClock:
         self.last_time_string = ""
         self.time_surface = None
 
-        self.battery = runtime_globals.i2c  # I2C Battery instance
-
     def load_battery_icons(self):
         names = [
             "battery_charging",
@@ -61,26 +58,27 @@ class WindowClock:
             return "battery_full"
 
     def update_battery_icon(self):
-        now = time.time()
-        if now - self.last_battery_update < 5:
+        # Battery is read on the SystemStatsSampler thread; only pick up new samples here
+        sample = runtime_globals.system_stats.latest
+        if sample.time == self.last_battery_update or sample.battery is None:
             return
 
-        percent, charging = self.battery.get_battery_info()
-        icon_key = self.select_icon_key(percent, charging)
+        icon_key = self.select_icon_key(sample.battery, sample.charging)
 
         icon = self.battery_icons.get(icon_key)
         if icon is not None:
             self.battery_icon = icon
             self.current_icon_key = icon_key
 
-        self.last_battery_update = now
+        self.last_battery_update = sample.time
 
     def draw(self, surface):
-        now = time.time()
+        clock = runtime_globals.game_clock
+        now = clock.wall
 
         # Only update time string and surface once per second
         if now - self.last_time_update >= 1:
-            self.last_time_string = time.strftime("%H:%M:%S")
+            self.last_time_string = clock.now.strftime("%H:%M:%S")
             self.time_surface = self.font.render(self.last_time_string, True, constants.FONT_COLOR_DEFAULT)
             self.last_time_update = now
 
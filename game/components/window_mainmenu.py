@@ -1,4 +1,3 @@
-import time
 import pygame
 
 from core import game_globals, runtime_globals
@@ -31,7 +30,7 @@ class WindowMenu:
         self.top_cache = None
         self.bottom_cache = None
 
-        self.last_alert_check = time.time()
+        self.last_alert_check = runtime_globals.game_clock.wall
 
         self.load_icons()
         self.calculate_spacing()
@@ -127,7 +126,7 @@ class WindowMenu:
 
 
     def check_alert(self):
-        now = time.time()
+        now = runtime_globals.game_clock.wall
         if now - self.last_alert_check < 2:  # Check alert at most once per second
             return runtime_globals.pet_alert
 
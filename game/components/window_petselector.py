@@ -1,7 +1,7 @@
 import pygame
 from core import game_globals, runtime_globals
 import game.core.constants as constants
-from core.utils.pygame_utils import blit_with_shadow, get_font
+from core.utils.pygame_utils import blit_with_shadow, get_font, render_text
 from core.utils.scene_utils import change_scene
 
 PAGE_MARGIN = 0
@@ -105,9 +105,9 @@ class WindowPetSelector:
                 if flag:
                     blit_with_shadow(surface, flag, (PAGE_MARGIN + self.LEFT_PADDING, y_pos + int(6 * constants.UI_SCALE)))
 
-            name_text = self.font.render(f"{pet.name}", True, constants.FONT_COLOR_DEFAULT)
+            name_text = render_text(self.font, f"{pet.name}", True, constants.FONT_COLOR_DEFAULT)
             stage_name = constants.STAGES[pet.stage] if pet.stage < len(constants.STAGES) else "Unknown"
-            attribute_text = self.font.render(f"{stage_name} | {pet.attribute}", True, (200, 200, 200))
+            attribute_text = render_text(self.font, f"{stage_name} | {pet.attribute}", True, (200, 200, 200))
 
             blit_with_shadow(surface, name_text, (PAGE_MARGIN + self.ITEM_HEIGHT + self.LEFT_PADDING, y_pos))
             blit_with_shadow(surface, attribute_text, (PAGE_MARGIN + self.ITEM_HEIGHT + self.LEFT_PADDING, y_pos + int(25 * constants.UI_SCALE)))
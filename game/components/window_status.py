@@ -4,7 +4,7 @@ from components.scrolling_text import ScrollingText
 from core import runtime_globals
 import game.core.constants as constants
 from core.utils.module_utils import get_module
-from core.utils.pygame_utils import blit_with_cache, blit_with_shadow, get_font, sprite_load_percent
+from core.utils.pygame_utils import blit_with_cache, blit_with_shadow, get_font, render_text
 
 def get_page_margin():
     return int(16 * constants.UI_SCALE)
@@ -55,9 +55,9 @@ class WindowStatus:
             "energy_bar_back": constants.ENERGY_BAR_BACK_ICON_PATH, "level": constants.LEVEL_ICON_PATH, "exp": constants.EXP_ICON_PATH,
             "trophies": constants.TROPHIES_ICON_PATH, "vital_values": constants.VITAL_VALUES_ICON_PATH,
         }
-        # Use sprite_load_percent for all icons, scale to MENU_ICON_SIZE height, keep proportions
+        # Use the shared asset cache for all icons, scale to MENU_ICON_SIZE height, keep proportions
         return {
-            key: sprite_load_percent(path, percent=(constants.MENU_ICON_SIZE / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
+            key: runtime_globals.game_assets.get_sprite(path, percent=(constants.MENU_ICON_SIZE / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
             for key, path in sprite_paths.items()
         }
 
@@ -117,7 +117,7 @@ class WindowStatus:
         spacing = int(30 * constants.UI_SCALE)
         blit_with_shadow(surface, self.pet_sprite, (PAGE_MARGIN, PAGE_MARGIN))
 
-        blit_with_shadow(surface, self.font_small.render(f"Stage:", True, constants.FONT_COLOR_DEFAULT), (int(75 * constants.UI_SCALE), PAGE_MARGIN + spacing))
+        blit_with_cache(surface, render_text(self.font_small, f"Stage:", True, constants.FONT_COLOR_DEFAULT, shadow=True), (int(75 * constants.UI_SCALE), PAGE_MARGIN + spacing))
         
         pygame.draw.line(surface, constants.FONT_COLOR_DEFAULT, (0, PAGE_MARGIN + constants.PET_ICON_SIZE + spacing), (constants.SCREEN_WIDTH, PAGE_MARGIN + constants.PET_ICON_SIZE + spacing), 2)
 
@@ -128,9 +128,9 @@ class WindowStatus:
         for i, label in enumerate(labels):
             y_pos = PAGE_MARGIN + (spacing * 3) + i * spacing
             blit_with_shadow(surface, self.sprites[label], (int(10 * constants.UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(f"{label.capitalize()}:", True, constants.FONT_COLOR_DEFAULT), (int(40 * constants.UI_SCALE), y_pos))
+            blit_with_cache(surface, render_text(self.font_small, f"{label.capitalize()}:", True, constants.FONT_COLOR_DEFAULT, shadow=True), (int(40 * constants.UI_SCALE), y_pos))
 
-            value_surf = self.font_small.render(values[i], True, constants.FONT_COLOR_DEFAULT)
+            value_surf = render_text(self.font_small, values[i], True, constants.FONT_COLOR_DEFAULT)
             value_x = self.right_align_x - value_surf.get_width()
             blit_with_shadow(surface, value_surf, (value_x, y_pos))
 
@@ -141,11 +141,11 @@ class WindowStatus:
         module = get_module(self.pet.module)
 
         # Hunger
-        blit_with_shadow(surface, self.font_small.render("Hunger:", True, constants.FONT_COLOR_DEFAULT), (PAGE_MARGIN, PAGE_MARGIN))
+        blit_with_cache(surface, render_text(self.font_small, "Hunger:", True, constants.FONT_COLOR_DEFAULT, shadow=True), (PAGE_MARGIN, PAGE_MARGIN))
         self.draw_hearts(surface, int(constants.SCREEN_WIDTH - (110 * constants.UI_SCALE)), PAGE_MARGIN + int(5 * constants.UI_SCALE), self.pet.hunger)
 
         # Strength
-        blit_with_shadow(surface, self.font_small.render("Strength:", True, constants.FONT_COLOR_DEFAULT), (PAGE_MARGIN, PAGE_MARGIN + distance))
+        blit_with_cache(surface, render_text(self.font_small, "Strength:", True, constants.FONT_COLOR_DEFAULT, shadow=True), (PAGE_MARGIN, PAGE_MARGIN + distance))
         self.draw_hearts(surface, int(constants.SCREEN_WIDTH - (110 * constants.UI_SCALE)), PAGE_MARGIN + distance + int(5 * constants.UI_SCALE), self.pet.strength)
 
         # Trophies and Vital Values (icons only on the same line)
@@ -155,7 +155,7 @@ class WindowStatus:
         # Trophies icon and value
         blit_with_shadow(surface, self.sprites["trophies"], (PAGE_MARGIN, y_pos_trophies_vital))
         trophies_value = str(getattr(self.pet, 'trophies', 0))
-        trophies_text = self.font_small.render(trophies_value, True, constants.FONT_COLOR_DEFAULT)
+        trophies_text = render_text(self.font_small, trophies_value, True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, trophies_text, (PAGE_MARGIN + int(32 * constants.UI_SCALE), y_pos_trophies_vital))
 
         # Vital Values icon and value
@@ -163,7 +163,7 @@ class WindowStatus:
             vital_x = PAGE_MARGIN + icon_spacing
             blit_with_shadow(surface, self.sprites["vital_values"], (vital_x, y_pos_trophies_vital))
             vital_values_value = str(getattr(self.pet, 'vital_values', 0))
-            vital_values_text = self.font_small.render(vital_values_value, True, constants.FONT_COLOR_DEFAULT)
+            vital_values_text = render_text(self.font_small, vital_values_value, True, constants.FONT_COLOR_DEFAULT)
             blit_with_shadow(surface, vital_values_text, (vital_x + int(32 * constants.UI_SCALE), y_pos_trophies_vital))
 
         # Level and Experience (moved down, now on 3rd line, with icons)
@@ -173,23 +173,23 @@ class WindowStatus:
         if self.pet.module == "DMX":
             # Level icon and value
             blit_with_shadow(surface, self.sprites["level"], (PAGE_MARGIN, icon_y))
-            level_text = self.font_small.render(f"Lv: {getattr(self.pet, 'level', '-')}", True, constants.FONT_COLOR_DEFAULT)
+            level_text = render_text(self.font_small, f"Lv: {getattr(self.pet, 'level', '-')}", True, constants.FONT_COLOR_DEFAULT)
             blit_with_shadow(surface, level_text, (PAGE_MARGIN + icon_spacing, level_exp_y))
             # Exp icon and value
             exp_icon_x = PAGE_MARGIN + icon_spacing * 2
             exp_val = getattr(self.pet, 'exp', getattr(self.pet, 'experience', '-'))
-            exp_text = self.font_small.render(f"EXP: {exp_val}", True, constants.FONT_COLOR_DEFAULT)
+            exp_text = render_text(self.font_small, f"EXP: {exp_val}", True, constants.FONT_COLOR_DEFAULT)
             blit_with_shadow(surface, exp_text, (exp_icon_x + icon_spacing, level_exp_y))
 
         # Condition hearts or mistakes (moved down, now on 4th line, with icon for mistakes)
         y_pos = PAGE_MARGIN + distance * 4
         if getattr(module, "use_condition_hearts", False):
-            blit_with_shadow(surface, self.font_small.render("Condition:", True, constants.FONT_COLOR_DEFAULT), (PAGE_MARGIN, y_pos))
+            blit_with_cache(surface, render_text(self.font_small, "Condition:", True, constants.FONT_COLOR_DEFAULT, shadow=True), (PAGE_MARGIN, y_pos))
             self.draw_hearts(surface, int(constants.SCREEN_WIDTH - (110 * constants.UI_SCALE)), y_pos + int(5 * constants.UI_SCALE), getattr(self.pet, "condition_hearts", 0))
         else:
             mistakes = getattr(self.pet, "mistakes", 0)
             blit_with_shadow(surface, self.sprites["mistakes"], (PAGE_MARGIN, y_pos))
-            mistakes_text = self.font_small.render(f"Mistakes: {mistakes}", True, constants.FONT_COLOR_DEFAULT)
+            mistakes_text = render_text(self.font_small, f"Mistakes: {mistakes}", True, constants.FONT_COLOR_DEFAULT)
             blit_with_shadow(surface, mistakes_text, (PAGE_MARGIN + icon_spacing, y_pos))
 
         # Sleep disturbances, overfeed, sick (moved down, now on 5th line, with icons)
@@ -200,21 +200,21 @@ class WindowStatus:
         # Sleep Disturbances
         blit_with_shadow(surface, self.sprites["sleep Dist."], (x_icon, y_pos2))
         sleep_dist = getattr(self.pet, "sleep_disturbances", 0)
-        sleep_text = self.font_small.render(str(sleep_dist), True, constants.FONT_COLOR_DEFAULT)
+        sleep_text = render_text(self.font_small, str(sleep_dist), True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, sleep_text, (x_icon + int(32 * constants.UI_SCALE), y_pos2))
 
         # Overfeed
         x_icon += icon_spacing
         blit_with_shadow(surface, self.sprites["overfeed"], (x_icon, y_pos2))
         overfeed = getattr(self.pet, "overfeed", 0)
-        overfeed_text = self.font_small.render(str(overfeed), True, constants.FONT_COLOR_DEFAULT)
+        overfeed_text = render_text(self.font_small, str(overfeed), True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, overfeed_text, (x_icon + int(32 * constants.UI_SCALE), y_pos2))
 
         # Sick
         x_icon += icon_spacing
         blit_with_shadow(surface, self.sprites["sick"], (x_icon, y_pos2))
         sick = getattr(self.pet, "injuries", 0)
-        sick_text = self.font_small.render(str(sick), True, constants.FONT_COLOR_DEFAULT)
+        sick_text = render_text(self.font_small, str(sick), True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, sick_text, (x_icon + int(32 * constants.UI_SCALE), y_pos2))
 
         # Can Battle and Can Jogress (last line, compact)
@@ -222,7 +222,7 @@ class WindowStatus:
         can_battle = "Y" if getattr(self.pet, "can_battle", lambda: False)() else "N"
         can_jogress = "Y" if getattr(self.pet, "jogress_avaliable", False) else "N"
         battle_jogress_text = f"Battle: {can_battle}   Jogress: {can_jogress}"
-        blit_with_shadow(surface, self.font_small.render(battle_jogress_text, True, constants.FONT_COLOR_DEFAULT), (PAGE_MARGIN, y_pos3))
+        blit_with_cache(surface, render_text(self.font_small, battle_jogress_text, True, constants.FONT_COLOR_DEFAULT, shadow=True), (PAGE_MARGIN, y_pos3))
 
     def draw_dmc_stats(self, surface, distance):
         """Draws DMC-specific stats (mistakes, sleep disturbances, sickness)."""
@@ -232,12 +232,12 @@ class WindowStatus:
         for i, label in enumerate(labels):
             y_pos = constants.PAGE_MARGIN + (distance * (2 + i))
             blit_with_shadow(surface, self.sprites[label], (int(10 * constants.UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(label.capitalize() + ":", True, constants.FONT_COLOR_DEFAULT), (int(40 * constants.UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(str(values[i]), True, constants.FONT_COLOR_DEFAULT), (self.right_align_x, y_pos))
+            blit_with_cache(surface, render_text(self.font_small, label.capitalize() + ":", True, constants.FONT_COLOR_DEFAULT, shadow=True), (int(40 * constants.UI_SCALE), y_pos))
+            blit_with_cache(surface, render_text(self.font_small, str(values[i]), True, constants.FONT_COLOR_DEFAULT, shadow=True), (self.right_align_x, y_pos))
 
     def draw_penc_stats(self, surface, distance):
         """Draws PenC-specific stats (condition hearts, jogress, battle availability)."""
-        blit_with_shadow(surface, self.font_small.render("Condition:", True, constants.FONT_COLOR_DEFAULT), (constants.PAGE_MARGIN, constants.PAGE_MARGIN + (distance * 2)))
+        blit_with_cache(surface, render_text(self.font_small, "Condition:", True, constants.FONT_COLOR_DEFAULT, shadow=True), (constants.PAGE_MARGIN, constants.PAGE_MARGIN + (distance * 2)))
         self.draw_hearts(surface, int(constants.SCREEN_WIDTH - (110 * constants.UI_SCALE)), constants.PAGE_MARGIN + (distance * 2) + int(5 * constants.UI_SCALE), self.pet.condition_hearts)
 
         labels = ["jogress", "battle"]
@@ -247,13 +247,13 @@ class WindowStatus:
         for i, label in enumerate(labels):
             y_pos = constants.PAGE_MARGIN + (distance * (3 + i))
             blit_with_shadow(surface, self.sprites[label], (int(10 * constants.UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(label.capitalize() + ":", True, constants.FONT_COLOR_DEFAULT), (int(40 * constants.UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(yes_no_values[i], True, constants.FONT_COLOR_DEFAULT), (self.right_align_x, y_pos))    
+            blit_with_cache(surface, render_text(self.font_small, label.capitalize() + ":", True, constants.FONT_COLOR_DEFAULT, shadow=True), (int(40 * constants.UI_SCALE), y_pos))
+            blit_with_cache(surface, render_text(self.font_small, yes_no_values[i], True, constants.FONT_COLOR_DEFAULT, shadow=True), (self.right_align_x, y_pos))    
 
         y_pos = constants.PAGE_MARGIN + (distance * (5))
         blit_with_shadow(surface, self.sprites["sick"], (int(10 * constants.UI_SCALE), y_pos))
-        blit_with_shadow(surface, self.font_small.render("Sick" + ":", True, constants.FONT_COLOR_DEFAULT), (int(40 * constants.UI_SCALE), y_pos))
-        blit_with_shadow(surface, self.font_small.render(str(self.pet.injuries), True, constants.FONT_COLOR_DEFAULT), (self.right_align_x, y_pos))  
+        blit_with_cache(surface, render_text(self.font_small, "Sick" + ":", True, constants.FONT_COLOR_DEFAULT, shadow=True), (int(40 * constants.UI_SCALE), y_pos))
+        blit_with_cache(surface, render_text(self.font_small, str(self.pet.injuries), True, constants.FONT_COLOR_DEFAULT, shadow=True), (self.right_align_x, y_pos))  
 
     def draw_dmx_stats(self, surface, distance):
         """Draws DMX-specific stats (level, mistakes, sickness)."""
@@ -263,8 +263,8 @@ class WindowStatus:
         for i, label in enumerate(labels):
             y_pos = constants.PAGE_MARGIN + (distance * (2 + i))
             blit_with_shadow(surface, self.sprites[label], (int(10 * constants.UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(label.capitalize() + ":", True, constants.FONT_COLOR_DEFAULT), (int(40 * constants.UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(str(values[i]), True, constants.FONT_COLOR_DEFAULT), (self.right_align_x, y_pos))
+            blit_with_cache(surface, render_text(self.font_small, label.capitalize() + ":", True, constants.FONT_COLOR_DEFAULT, shadow=True), (int(40 * constants.UI_SCALE), y_pos))
+            blit_with_cache(surface, render_text(self.font_small, str(values[i]), True, constants.FONT_COLOR_DEFAULT, shadow=True), (self.right_align_x, y_pos))
 
     def draw_page_3(self, surface: pygame.Surface) -> None:
         """
@@ -275,30 +275,30 @@ class WindowStatus:
         y = PAGE_MARGIN
 
         # Effort
-        effort_label = self.font_small.render("Effort:", True, constants.FONT_COLOR_DEFAULT)
+        effort_label = render_text(self.font_small, "Effort:", True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, effort_label, (PAGE_MARGIN, y))
         self.draw_hearts(surface, int(constants.SCREEN_WIDTH - (110 * constants.UI_SCALE)), y + int(5 * constants.UI_SCALE), self.pet.effort, factor=4)
 
         # Power
         y += distance
-        power_label = self.font_small.render("Power:", True, constants.FONT_COLOR_DEFAULT)
+        power_label = render_text(self.font_small, "Power:", True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, power_label, (PAGE_MARGIN, y))
 
         power_value = self.pet.get_power()
         power_color = constants.FONT_COLOR_DEFAULT if power_value == self.pet.power else (0, 255, 0)
-        power_text = self.font_small.render(str(power_value), True, power_color)
+        power_text = render_text(self.font_small, str(power_value), True, power_color)
         blit_with_shadow(surface, power_text, (self.right_align_x - power_text.get_width(), y))
 
         # DP (energy bar)
         y += distance
-        dp_label = self.font_small.render("DP:", True, constants.FONT_COLOR_DEFAULT)
+        dp_label = render_text(self.font_small, "DP:", True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, dp_label, (PAGE_MARGIN, y))
         self.draw_energy_bar(surface, constants.SCREEN_WIDTH, y, self.pet.dp, self.pet.energy)
 
         # Battles
         y += distance
-        battles_label = self.font_small.render("Battles:", True, constants.FONT_COLOR_DEFAULT)
-        battles_value = self.font_small.render(f"{self.pet.battles}/{self.pet.totalBattles}", True, constants.FONT_COLOR_DEFAULT)
+        battles_label = render_text(self.font_small, "Battles:", True, constants.FONT_COLOR_DEFAULT)
+        battles_value = render_text(self.font_small, f"{self.pet.battles}/{self.pet.totalBattles}", True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, battles_label, (PAGE_MARGIN, y))
         blit_with_shadow(surface, battles_value, (self.right_align_x - battles_value.get_width(), y))
 
@@ -307,13 +307,13 @@ class WindowStatus:
         stage_win_rate = (self.pet.win * 100 // self.pet.battles) if self.pet.battles > 0 else 0
         total_win_rate = (self.pet.totalWin * 100 // self.pet.totalBattles) if self.pet.totalBattles > 0 else 0
 
-        win_stage_label = self.font_small.render("Win Rate:", True, constants.FONT_COLOR_DEFAULT)
-        win_total_label = self.font_small.render("Win Rate T.:", True, constants.FONT_COLOR_DEFAULT)
+        win_stage_label = render_text(self.font_small, "Win Rate:", True, constants.FONT_COLOR_DEFAULT)
+        win_total_label = render_text(self.font_small, "Win Rate T.:", True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, win_stage_label, (PAGE_MARGIN, y))
         blit_with_shadow(surface, win_total_label, (PAGE_MARGIN, y + distance))
 
-        win_stage_value = self.font_small.render(f"{stage_win_rate}%", True, constants.FONT_COLOR_DEFAULT)
-        win_total_value = self.font_small.render(f"{total_win_rate}%", True, constants.FONT_COLOR_DEFAULT)
+        win_stage_value = render_text(self.font_small, f"{stage_win_rate}%", True, constants.FONT_COLOR_DEFAULT)
+        win_total_value = render_text(self.font_small, f"{total_win_rate}%", True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, win_stage_value, (self.right_align_x - win_stage_value.get_width(), y))
         blit_with_shadow(surface, win_total_value, (self.right_align_x - win_total_value.get_width(), y + distance))
 
@@ -334,52 +334,52 @@ class WindowStatus:
             return "00:00"
 
         # Evolution time
-        evolution_label = self.font_small.render("Evolution:", True, constants.FONT_COLOR_DEFAULT)
+        evolution_label = render_text(self.font_small, "Evolution:", True, constants.FONT_COLOR_DEFAULT)
         if self.pet.time >= 0 and self.pet.evolve:
             evolution_seconds = (self.pet.time * 60) - (self.pet.timer // constants.FRAME_RATE)
             evolution_text = format_seconds(evolution_seconds) if evolution_seconds > 0 else "00:00"
         else:
             evolution_text = ""
-        evolution_value = self.font_small.render(evolution_text, True, constants.FONT_COLOR_DEFAULT)
+        evolution_value = render_text(self.font_small, evolution_text, True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, evolution_label, (PAGE_MARGIN, y))
         blit_with_shadow(surface, evolution_value, (self.right_align_x - evolution_value.get_width(), y))
 
         # Sleeps
         y += distance
-        sleeps_label = self.font_small.render("Sleeps:", True, constants.FONT_COLOR_DEFAULT)
-        sleeps_value = self.font_small.render(self.pet.sleeps, True, constants.FONT_COLOR_DEFAULT)
+        sleeps_label = render_text(self.font_small, "Sleeps:", True, constants.FONT_COLOR_DEFAULT)
+        sleeps_value = render_text(self.font_small, self.pet.sleeps, True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, sleeps_label, (PAGE_MARGIN, y))
         blit_with_shadow(surface, sleeps_value, (self.right_align_x - sleeps_value.get_width(), y))
 
         # Wakes (currently fixed at 00:00)
         y += distance
-        wakes_label = self.font_small.render("Wakes:", True, constants.FONT_COLOR_DEFAULT)
-        wakes_value = self.font_small.render(self.pet.wakes, True, constants.FONT_COLOR_DEFAULT)
+        wakes_label = render_text(self.font_small, "Wakes:", True, constants.FONT_COLOR_DEFAULT)
+        wakes_value = render_text(self.font_small, self.pet.wakes, True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, wakes_label, (PAGE_MARGIN, y))
         blit_with_shadow(surface, wakes_value, (self.right_align_x - wakes_value.get_width(), y))
 
         # Poop Time
         y += distance
-        poop_label = self.font_small.render("Poop Time:", True, constants.FONT_COLOR_DEFAULT)
+        poop_label = render_text(self.font_small, "Poop Time:", True, constants.FONT_COLOR_DEFAULT)
         poop_seconds = (self.pet.poop_timer * 60) - ((self.pet.timer // constants.FRAME_RATE) % max(1,(self.pet.poop_timer * 60)))
         poop_text = format_seconds(poop_seconds)
-        poop_value = self.font_small.render(poop_text, True, constants.FONT_COLOR_DEFAULT)
+        poop_value = render_text(self.font_small, poop_text, True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, poop_label, (PAGE_MARGIN, y))
         blit_with_shadow(surface, poop_value, (self.right_align_x - poop_value.get_width(), y))
 
         # Feed Time
         y += distance
-        feed_label = self.font_small.render("Feed Time:", True, constants.FONT_COLOR_DEFAULT)
+        feed_label = render_text(self.font_small, "Feed Time:", True, constants.FONT_COLOR_DEFAULT)
         feed_seconds = (self.pet.hunger_loss * 60) - ((self.pet.timer // constants.FRAME_RATE) % max(1,(self.pet.hunger_loss * 60)))
         feed_text = format_seconds(feed_seconds)
-        feed_value = self.font_small.render(feed_text, True, constants.FONT_COLOR_DEFAULT)
+        feed_value = render_text(self.font_small, feed_text, True, constants.FONT_COLOR_DEFAULT)
         blit_with_shadow(surface, feed_label, (PAGE_MARGIN, y))
         blit_with_shadow(surface, feed_value, (self.right_align_x - feed_value.get_width(), y))
 
         # Flags
         y += distance
-        flags_label = self.font_small.render("Flags:", True, constants.FONT_COLOR_DEFAULT)
-        flags_value = self.font_small.render("", True, constants.FONT_COLOR_DEFAULT)  # Empty placeholder
+        flags_label = render_text(self.font_small, "Flags:", True, constants.FONT_COLOR_DEFAULT)
+        flags_value = render_text(self.font_small, "", True, constants.FONT_COLOR_DEFAULT)  # Empty placeholder
         blit_with_shadow(surface, flags_label, (PAGE_MARGIN, y))
         blit_with_shadow(surface, flags_value, (self.right_align_x - flags_value.get_width(), y))
 
@@ -81,8 +81,8 @@ class WindowXai:
         # Play sound every half second while rolling
         if self.rolling:
             if not hasattr(self, "_last_sound_tick"):
-                self._last_sound_tick = pygame.time.get_ticks()
-            now = pygame.time.get_ticks()
+                self._last_sound_tick = runtime_globals.game_clock.ticks_ms
+            now = runtime_globals.game_clock.ticks_ms
             if now - self._last_sound_tick >= 500:
                 runtime_globals.game_sound.play("cancel")
                 self._last_sound_tick = now
@@ -14,7 +14,7 @@ from core.combat.sim.models import Digimon
 from core.game_module import sprite_load
 from core.utils.module_utils import get_module
 from core.utils.pet_utils import distribute_pets_evenly, get_battle_targets
-from core.utils.pygame_utils import blit_with_cache, get_font, load_attack_sprites, module_attack_sprites, sprite_load_percent
+from core.utils.pygame_utils import blit_with_cache, get_font, load_attack_sprites, module_attack_sprites
 from core.utils.scene_utils import change_scene
 from core.utils.utils_unlocks import unlock_item
 from core.utils import inventory_utils
@@ -50,39 +50,39 @@ class BattleEncounter:
         self.set_initial_state(area, round, version)
 
         # Graphics and assets (keep in __init__)
-        self.backgroundIm = sprite_load_percent(constants.BATTLE_BACKGROUND_PATH, percent=100, keep_proportion=True, base_on="width")
-        self.battle_sprite = sprite_load_percent(constants.BATTLE_SPRITE_PATH, percent=100, keep_proportion=True, base_on="width")
-        self.level_sprite = sprite_load_percent(constants.BATTLE_LEVEL_SPRITE_PATH, percent=100, keep_proportion=True, base_on="width")
-        self.bar_piece = sprite_load_percent(constants.BAR_PIECE_PATH, percent=(int(12 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
-        self.bar_back = sprite_load_percent(constants.BAR_BACK_PATH, percent=(int(170 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
-        self.training_max = sprite_load_percent(constants.TRAINING_MAX_PATH, percent=(int(60 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
-        self.ready_sprite = sprite_load_percent(constants.READY_SPRITE_PATH, percent=100, keep_proportion=True, base_on="width")
-        self.go_sprite = sprite_load_percent(constants.GO_SPRITE_PATH, percent=100, keep_proportion=True, base_on="width")
+        self.backgroundIm = runtime_globals.game_assets.get_sprite(constants.BATTLE_BACKGROUND_PATH, percent=100, keep_proportion=True, base_on="width")
+        self.battle_sprite = runtime_globals.game_assets.get_sprite(constants.BATTLE_SPRITE_PATH, percent=100, keep_proportion=True, base_on="width")
+        self.level_sprite = runtime_globals.game_assets.get_sprite(constants.BATTLE_LEVEL_SPRITE_PATH, percent=100, keep_proportion=True, base_on="width")
+        self.bar_piece = runtime_globals.game_assets.get_sprite(constants.BAR_PIECE_PATH, percent=(int(12 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
+        self.bar_back = runtime_globals.game_assets.get_sprite(constants.BAR_BACK_PATH, percent=(int(170 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
+        self.training_max = runtime_globals.game_assets.get_sprite(constants.TRAINING_MAX_PATH, percent=(int(60 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
+        self.ready_sprite = runtime_globals.game_assets.get_sprite(constants.READY_SPRITE_PATH, percent=100, keep_proportion=True, base_on="width")
+        self.go_sprite = runtime_globals.game_assets.get_sprite(constants.GO_SPRITE_PATH, percent=100, keep_proportion=True, base_on="width")
 
         self.font = get_font(constants.FONT_SIZE_LARGE)
         self.font_small = get_font(constants.FONT_SIZE_MEDIUM)
         self.result_sprites = {
             "clear": [
-                sprite_load_percent(constants.CLEAR1_PATH, percent=100, keep_proportion=True, base_on="width"),
-                sprite_load_percent(constants.CLEAR2_PATH, percent=100, keep_proportion=True, base_on="width")
+                runtime_globals.game_assets.get_sprite(constants.CLEAR1_PATH, percent=100, keep_proportion=True, base_on="width"),
+                runtime_globals.game_assets.get_sprite(constants.CLEAR2_PATH, percent=100, keep_proportion=True, base_on="width")
             ],
             "warning": [
-                sprite_load_percent(constants.WARNING1_PATH, percent=100, keep_proportion=True, base_on="width"),
-                sprite_load_percent(constants.WARNING2_PATH, percent=100, keep_proportion=True, base_on="width")
+                runtime_globals.game_assets.get_sprite(constants.WARNING1_PATH, percent=100, keep_proportion=True, base_on="width"),
+                runtime_globals.game_assets.get_sprite(constants.WARNING2_PATH, percent=100, keep_proportion=True, base_on="width")
             ]
         }
         self.ready_sprites = {
-            1: sprite_load_percent(constants.READY_SPRITES_PATHS[1], 100, keep_proportion=True, base_on="width"),
-            2: sprite_load_percent(constants.READY_SPRITES_PATHS[2], 100, keep_proportion=True, base_on="width"),
-            3: sprite_load_percent(constants.READY_SPRITES_PATHS[3], 100, keep_proportion=True, base_on="width")
+            1: runtime_globals.game_assets.get_sprite(constants.READY_SPRITES_PATHS[1], 100, keep_proportion=True, base_on="width"),
+            2: runtime_globals.game_assets.get_sprite(constants.READY_SPRITES_PATHS[2], 100, keep_proportion=True, base_on="width"),
+            3: runtime_globals.game_assets.get_sprite(constants.READY_SPRITES_PATHS[3], 100, keep_proportion=True, base_on="width")
         }
         self.count_sprites = {
-            4: sprite_load_percent(constants.COUNT_SPRITES_PATHS[4], 100, keep_proportion=True, base_on="width"),
-            3: sprite_load_percent(constants.COUNT_SPRITES_PATHS[3], 100, keep_proportion=True, base_on="width"),
-            2: sprite_load_percent(constants.COUNT_SPRITES_PATHS[2], 100, keep_proportion=True, base_on="width"),
-            1: sprite_load_percent(constants.COUNT_SPRITES_PATHS[1], 100, keep_proportion=True, base_on="width")
+            4: runtime_globals.game_assets.get_sprite(constants.COUNT_SPRITES_PATHS[4], 100, keep_proportion=True, base_on="width"),
+            3: runtime_globals.game_assets.get_sprite(constants.COUNT_SPRITES_PATHS[3], 100, keep_proportion=True, base_on="width"),
+            2: runtime_globals.game_assets.get_sprite(constants.COUNT_SPRITES_PATHS[2], 100, keep_proportion=True, base_on="width"),
+            1: runtime_globals.game_assets.get_sprite(constants.COUNT_SPRITES_PATHS[1], 100, keep_proportion=True, base_on="width")
         }
-        self.mega_hit = sprite_load_percent(constants.MEGA_HIT_PATH, 100, keep_proportion=True, base_on="width")
+        self.mega_hit = runtime_globals.game_assets.get_sprite(constants.MEGA_HIT_PATH, 100, keep_proportion=True, base_on="width")
         self.attack_sprites = load_attack_sprites()
         
         
@@ -563,7 +563,7 @@ class BattleEncounter:
             runtime_globals.game_console.log("Entering charge phase")
             self.phase = "charge"
             self.frame_counter = 0
-            self.bar_timer = pygame.time.get_ticks()
+            self.bar_timer = runtime_globals.game_clock.ticks_ms
             self.setup_charge()
 
     def setup_charge(self):
@@ -607,7 +607,7 @@ class BattleEncounter:
             elif self.xai_phase == 2:
                 self.window_xaibar.update()
         if self.module.ruleset != "dmx" or self.xai_phase == 3:
-            if pygame.time.get_ticks() - self.bar_timer > combat_constants.BAR_HOLD_TIME_MS:
+            if runtime_globals.game_clock.ticks_ms - self.bar_timer > combat_constants.BAR_HOLD_TIME_MS:
                 runtime_globals.game_console.log("Entering pet_charge phase")
                 self.phase = "battle"
                 self.frame_counter = 0
@@ -1775,7 +1775,7 @@ class BattleEncounter:
                     self.window_xaibar.stop()
                     self.strength = self.window_xaibar.selected_strength or 1
                     self.xai_phase = 3
-                    self.bar_timer = pygame.time.get_ticks()
+                    self.bar_timer = runtime_globals.game_clock.ticks_ms
         elif self.module.ruleset == 'penc':
             if input_action == "Y" or input_action == "SHAKE":
                 if self.phase == "alert":
@@ -1887,7 +1887,8 @@ class BattleEncounter:
         # Simulate the battle using the GlobalBattleSimulator
         sim = GlobalBattleSimulator(
             attribute_advantage=self.module.battle_atribute_advantage,
-            damage_limit=self.module.battle_damage_limit
+            damage_limit=self.module.battle_damage_limit,
+            verbose=constants.DEBUG_MODE and constants.DEBUG_BATTLE_INFO
         )
         result = sim.simulate(team1, team2)
 
@@ -64,7 +64,7 @@ class BattleEncounterVersus(BattleEncounter):
             self.battle_player.team2_max_total_hp = team2hp
 
         # Initialize the BattleSimulator with the given protocol
-        self.simulator = BattleSimulator(protocol)
+        self.simulator = BattleSimulator(protocol, verbose=constants.DEBUG_MODE and constants.DEBUG_BATTLE_INFO)
 
         # Set initial state
         self.phase = "alert"
@@ -1,4 +1,3 @@
-import pygame
 import random
 
 from core import runtime_globals
@@ -6,7 +5,7 @@ from core.animation import PetFrame
 from core.combat.training import Training
 from game.core.combat import combat_constants
 import game.core.constants as constants
-from core.utils.pygame_utils import blit_with_cache, blit_with_shadow, sprite_load_percent
+from core.utils.pygame_utils import blit_with_cache, blit_with_shadow, load_font, render_text, sprite_load_percent
 from core.utils.scene_utils import change_scene
 
 class CountMatchTraining(Training):
@@ -205,8 +204,8 @@ class CountMatchTraining(Training):
             # Draw trophy notification if maximum score achieved
             self.draw_trophy_notification(screen, quantity=1)
         else:
-            font = pygame.font.Font(None, constants.FONT_SIZE_LARGE)
-            text = font.render(f"{hits} Super-Hits", True, (255, 255, 255))
+            font = load_font(None, constants.FONT_SIZE_LARGE)
+            text = render_text(font, f"{hits} Super-Hits", True, (255, 255, 255))
             x = constants.SCREEN_WIDTH // 2 - text.get_width() // 2
             y = int(100 * constants.UI_SCALE)
             screen.blit(text, (x, y))
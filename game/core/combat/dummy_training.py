@@ -40,7 +40,7 @@ class DummyTraining(Training):
         self.bag2 = sprite_load(selected_sprites[1], size=(60 * constants.UI_SCALE, 120 * constants.UI_SCALE))
 
     def update_charge_phase(self):
-        if pygame.time.get_ticks() - self.bar_timer > combat_constants.BAR_HOLD_TIME_MS:
+        if runtime_globals.game_clock.ticks_ms - self.bar_timer > combat_constants.BAR_HOLD_TIME_MS:
             self.phase = "wait_attack"
             self.frame_counter = 0
             self.prepare_attacks()
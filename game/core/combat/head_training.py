@@ -12,7 +12,7 @@ from core.combat.training import Training
 from game.core.combat import combat_constants
 import game.core.constants as constants
 from core.utils.pet_utils import get_training_targets
-from core.utils.pygame_utils import blit_with_shadow, get_font, sprite_load_percent
+from core.utils.pygame_utils import blit_with_shadow, get_font, render_text, sprite_load_percent
 from core.utils.scene_utils import change_scene
 
 class HeadToHeadTraining(Training):
@@ -110,8 +110,8 @@ class HeadToHeadTraining(Training):
         )
 
         font = get_font(int(55 * constants.UI_SCALE))
-        wins_text = font.render(str(self.victories), True, constants.FONT_COLOR_DEFAULT)
-        losses_text = font.render(str(self.failures), True, constants.FONT_COLOR_DEFAULT)
+        wins_text = render_text(font, str(self.victories), True, constants.FONT_COLOR_DEFAULT)
+        losses_text = render_text(font, str(self.failures), True, constants.FONT_COLOR_DEFAULT)
 
         total_width = wins_text.get_width() + vs_img.get_width() + losses_text.get_width() + int(20 * constants.UI_SCALE)
         start_x = center_x - total_width // 2
@@ -11,7 +11,7 @@ from core.combat.training import Training
 from game.core.combat import combat_constants
 import game.core.constants as constants
 from core.game_module import sprite_load
-from core.utils.pygame_utils import blit_with_cache, blit_with_shadow
+from core.utils.pygame_utils import blit_with_cache, blit_with_shadow, load_font, render_text
 from game.core.utils.scene_utils import change_scene
 
 class ShakeTraining(Training):
@@ -41,7 +41,7 @@ class ShakeTraining(Training):
         self.bag2 = sprite_load(selected_sprites[1], size=(60 * constants.UI_SCALE, 120 * constants.UI_SCALE))
 
     def update_charge_phase(self):
-        if self.strength == 20 or pygame.time.get_ticks() - self.bar_timer > combat_constants.PUNCH_HOLD_TIME_MS:
+        if self.strength == 20 or runtime_globals.game_clock.ticks_ms - self.bar_timer > combat_constants.PUNCH_HOLD_TIME_MS:
             self.phase = "wait_attack"
             self.frame_counter = 0
             self.prepare_attacks()
@@ -143,27 +143,27 @@ class ShakeTraining(Training):
 
         # --- Draw timer above "PUNCH" ---
         max_ms = combat_constants.PUNCH_HOLD_TIME_MS
-        elapsed_ms = pygame.time.get_ticks() - self.bar_timer
+        elapsed_ms = runtime_globals.game_clock.ticks_ms - self.bar_timer
         remaining_ms = max(0, max_ms - elapsed_ms)
         remaining_sec = int(remaining_ms / 1000) + (1 if remaining_ms % 1000 > 0 else 0)
 
-        timer_font = pygame.font.Font(None, int(32 * constants.UI_SCALE))
-        timer_text = timer_font.render(str(remaining_sec), True, (255, 255, 255))
+        timer_font = load_font(None, int(32 * constants.UI_SCALE))
+        timer_text = render_text(timer_font, str(remaining_sec), True, (255, 255, 255))
         timer_x = (screen_w - timer_text.get_width()) // 2
         # Place timer above "PUNCH" with a little spacing
         timer_y = screen_h // 2 - int(60 * constants.UI_SCALE) - timer_text.get_height() - int(10 * constants.UI_SCALE)
         blit_with_shadow(surface, timer_text, (timer_x, timer_y))
 
         # Draw "PUNCH" text centered
-        font = pygame.font.Font(None, int(48 * constants.UI_SCALE))
-        punch_text = font.render("PUNCH", True, (255, 255, 255))
+        font = load_font(None, int(48 * constants.UI_SCALE))
+        punch_text = render_text(font, "PUNCH", True, (255, 255, 255))
         punch_x = (screen_w - punch_text.get_width()) // 2
         punch_y = screen_h // 2 - int(60 * constants.UI_SCALE)
         blit_with_shadow(surface, punch_text, (punch_x, punch_y))
 
         # Draw strength number centered below "PUNCH"
-        num_font = pygame.font.Font(None, int(64 * constants.UI_SCALE))
-        strength_text = num_font.render(str(self.strength), True, (255, 255, 255))
+        num_font = load_font(None, int(64 * constants.UI_SCALE))
+        strength_text = render_text(num_font, str(self.strength), True, (255, 255, 255))
         strength_x = (screen_w - strength_text.get_width()) // 2
         strength_y = punch_y + punch_text.get_height() + int(10 * constants.UI_SCALE)
         blit_with_shadow(surface, strength_text, (strength_x, strength_y))
@@ -1,20 +1,146 @@
-import struct
 import random
+import struct
 
 try:
     from battle_utils import get_attack_pattern
     from battle_utils import get_dm20_attack_pattern
     from models import *
+    from packet_codec import EOL, DMC_COU, DMC_PACKETS, DM20_PACKETS, DMX_PACKETS, PEN20_PACKETS
 except ImportError:
     # Absolute imports for direct testing
     from core.combat.sim.battle_utils import get_attack_pattern
     from core.combat.sim.battle_utils import get_dm20_attack_pattern
     from core.combat.sim.models import *
+    from core.combat.sim.packet_codec import EOL, DMC_COU, DMC_PACKETS, DM20_PACKETS, DMX_PACKETS, PEN20_PACKETS
+
+
+# Packet A / Packet 6 check nibble: all 4-bit groups plus the check sum to this value mod 16
+CHECK_REMAINDER = 11
+
+
+def nibble_check(hits, dodges, eol):
+    """
+    Calculates the Check nibble of the DM20/PEN20 Packet A and DMX Packet 6.
+    Ensures the intended remainder when the sum of all 4-bit groups is divided by 16.
+    """
+    total_sum = (hits & 0b1111) + (dodges & 0b1111) + (eol & 0b1111)
+    return (CHECK_REMAINDER - (total_sum % 16)) % 16
+
+
+_DMC_WORDS = {}  # word count -> precompiled Struct
+
+
+def dmc_checksum(packet_bytes: bytes) -> int:
+    """
+    Calculates the DMC_BS checksum: the sum of all 16-bit fields except the
+    trailing check field, keeping only the lowest 16 bits.
+    """
+    count = max(0, len(packet_bytes) - 1) // 2
+    words = _DMC_WORDS.get(count)
+    if words is None:
+        words = _DMC_WORDS[count] = struct.Struct(f">{count}H")
+    return sum(words.unpack_from(packet_bytes)) & 0xFFFF
+
+
+COU = 0b00        # Constant Or Unknown
+VERSION = 0b0001
+
+# Packet exchanges in order: (generator, device 1 arguments, device 2 arguments)
+DM20_EXCHANGE = (
+    ("generate_packet1", {}, {}),
+    ("generate_packet2", {}, {}),
+    ("generate_packet3", {"order": 1, "version": VERSION, "eol": EOL}, {"order": 0, "version": VERSION, "eol": EOL}),
+    ("generate_packet4", {"cou": COU, "eol": EOL}, {"cou": COU, "eol": EOL}),
+    ("generate_packet5", {"eol": EOL}, {"eol": EOL}),
+    ("generate_packet6", {"cou": COU, "eol": EOL}, {"cou": COU, "eol": EOL}),
+    ("generate_packet7", {"cou": COU, "eol": EOL}, {"cou": COU, "eol": EOL}),
+    ("generate_packet8", {"eol": EOL}, {"eol": EOL}),
+    ("generate_packet9", {"eol": EOL}, {"eol": EOL}),
+    ("generate_packetA", {"eol": EOL}, {"eol": EOL}),  # Check, Dodges, Hits, EOL
+)
+
+PEN20_EXCHANGE = (
+    ("generate_packet1", {"order": 0, "version": VERSION, "eol": EOL}, {"order": 1, "version": VERSION, "eol": EOL}),
+    ("generate_packet2", {"cou": COU, "eol": EOL}, {"cou": COU, "eol": EOL}),
+    ("generate_packet3", {"cou": COU, "eol": EOL}, {"cou": COU, "eol": EOL}),
+    ("generate_packet4", {"cou": COU, "eol": EOL}, {"cou": COU, "eol": EOL}),
+    ("generate_packet5", {"cou": COU, "eol": EOL}, {"cou": COU, "eol": EOL}),
+    ("generate_packet6", {"eol": EOL}, {"eol": EOL}),
+    ("generate_packet7", {"cou": COU, "eol": EOL}, {"cou": COU, "eol": EOL}),
+    ("generate_packet8", {"cou": COU, "eol": EOL}, {"cou": COU, "eol": EOL}),
+    ("generate_packet9", {"cou": COU, "eol": EOL}, {"cou": COU, "eol": EOL}),
+    ("generate_packetA", {"eol": EOL}, {"eol": EOL}),  # Check, Dodges, Hits, EOL
+)
+
+DMX_EXCHANGE = (
+    ("generate_packet1", {}, {}),  # Order, Level, Sick, Attack, Version
+    ("generate_packet2", {}, {}),  # Stage, Index, Attribute, EOL
+    ("generate_packet3", {}, {}),  # Shot S, Shot W, EOL
+    ("generate_packet4", {}, {}),  # COU, HP, Shot M, EOL
+    ("generate_packet5", {}, {}),  # COU, Buff, Power, EOL
+    ("generate_packet6", {}, {}),  # Check, COU, Hits, EOL
+)
+
+
+def exchange_packets(device1, device2, exchange) -> tuple:
+    """
+    Runs a packet exchange: both devices generate each packet, then process
+    the other's. Returns (device 1 packets, device 2 packets).
+    """
+    packets_device1 = []
+    packets_device2 = []
+    for generator, arguments1, arguments2 in exchange:
+        packet1 = getattr(device1, generator)(**arguments1)
+        packet2 = getattr(device2, generator)(**arguments2)
+        device2.process_packet(packet1)
+        device1.process_packet(packet2)
+        packets_device1.append(packet1)
+        packets_device2.append(packet2)
+    return packets_device1, packets_device2
+
+
+def _turn_hits(hits) -> tuple:
+    """Hit flags in turn order (MSB of the 4-bit hits field is turn 1)."""
+    return ((hits >> 3) & 1, (hits >> 2) & 1, (hits >> 1) & 1, hits & 1)
+
+
+def has_attribute_advantage(attribute, opponent_attribute):
+    """Vaccine beats Virus, Data beats Vaccine, Virus beats Data."""
+    return (attribute == 0 and opponent_attribute == 2) or \
+           (attribute == 1 and opponent_attribute == 0) or \
+           (attribute == 2 and opponent_attribute == 1)
+
+
+def roll_hits(power, opponent_power, attribute, opponent_attribute):
+    """
+    Rolls the 4 attacks of a single battle. Returns the hits bit pattern
+    (attack 1 in bit 0). Each side with attribute advantage gets +32 power.
+    """
+    if has_attribute_advantage(attribute, opponent_attribute):
+        power += 32
+    if has_attribute_advantage(opponent_attribute, attribute):
+        opponent_power += 32
+
+    hitrate = (power * 100) / (power + opponent_power)
+    hitrate = max(0, min(hitrate, 100))  # Clamp hitrate between 0 and 100
+
+    hits = 0
+    for i in range(4):
+        if random.randint(0, 99) < hitrate:
+            hits |= (1 << i)
+    return hits
+
+
+# DM20 tamer name sent in Packets 1 and 2
+TAMER_NAME = "OMNI"
+
+DMC_PACKET1, DMC_PACKET2 = (codec.encode for codec in DMC_PACKETS)
 
 
 class BattleSimulator:
-    def __init__(self, protocol: BattleProtocol):
+    def __init__(self, protocol: BattleProtocol, verbose: bool = False):
         self.protocol = protocol
+        self.verbose = verbose  # Print the full battle log and packet dumps after each simulation
 
     def simulate(self, device1: Digimon, device2: Digimon) -> BattleResult:
         if self.protocol == BattleProtocol.DMC_BS:
@@ -28,7 +154,8 @@ class BattleSimulator:
         else:
             raise NotImplementedError("Protocol not implemented")
         
-        self.print_battle_log(result)
+        if self.verbose:
+            self.print_battle_log(result)
         return result
     
     def print_battle_log(self, result):
@@ -233,86 +360,8 @@ class BattleSimulator:
         device1 = DM20Device(attacker)
         device2 = DM20Device(defender)
 
-        # Constants
-        EOL = 0b1110  # End of Line
-        COU = 0b00    # Constant Or Unknown
-        VERSION = 0b0001
-
-        # Generate and exchange packets
-        packets_device1 = []
-        packets_device2 = []
-
-        # Packet exchanges (1 to 9)
-        packet1_device1 = device1.generate_packet1()
-        packet1_device2 = device2.generate_packet1()
-        device2.process_packet(packet1_device1)
-        device1.process_packet(packet1_device2)
-        packets_device1.append(packet1_device1)
-        packets_device2.append(packet1_device2)
-
-        packet2_device1 = device1.generate_packet2()
-        packet2_device2 = device2.generate_packet2()
-        device2.process_packet(packet2_device1)
-        device1.process_packet(packet2_device2)
-        packets_device1.append(packet2_device1)
-        packets_device2.append(packet2_device2)
-
-        packet3_device1 = device1.generate_packet3(order=1, version=VERSION, eol=EOL)
-        packet3_device2 = device2.generate_packet3(order=0, version=VERSION, eol=EOL)
-        device2.process_packet(packet3_device1)
-        device1.process_packet(packet3_device2)
-        packets_device1.append(packet3_device1)
-        packets_device2.append(packet3_device2)
-
-        packet4_device1 = device1.generate_packet4(cou=COU, eol=EOL)
-        packet4_device2 = device2.generate_packet4(cou=COU, eol=EOL)
-        device2.process_packet(packet4_device1)
-        device1.process_packet(packet4_device2)
-        packets_device1.append(packet4_device1)
-        packets_device2.append(packet4_device2)
-
-        packet5_device1 = device1.generate_packet5(eol=EOL)
-        packet5_device2 = device2.generate_packet5(eol=EOL)
-        device2.process_packet(packet5_device1)
-        device1.process_packet(packet5_device2)
-        packets_device1.append(packet5_device1)
-        packets_device2.append(packet5_device2)
-
-        packet6_device1 = device1.generate_packet6(cou=COU, eol=EOL)
-        packet6_device2 = device2.generate_packet6(cou=COU, eol=EOL)
-        device2.process_packet(packet6_device1)
-        device1.process_packet(packet6_device2)
-        packets_device1.append(packet6_device1)
-        packets_device2.append(packet6_device2)
-
-        packet7_device1 = device1.generate_packet7(cou=COU, eol=EOL)
-        packet7_device2 = device2.generate_packet7(cou=COU, eol=EOL)
-        device2.process_packet(packet7_device1)
-        device1.process_packet(packet7_device2)
-        packets_device1.append(packet7_device1)
-        packets_device2.append(packet7_device2)
-
-        packet8_device1 = device1.generate_packet8(eol=EOL)
-        packet8_device2 = device2.generate_packet8(eol=EOL)
-        device2.process_packet(packet8_device1)
-        device1.process_packet(packet8_device2)
-        packets_device1.append(packet8_device1)
-        packets_device2.append(packet8_device2)
-
-        packet9_device1 = device1.generate_packet9(eol=EOL)
-        packet9_device2 = device2.generate_packet9(eol=EOL)
-        device2.process_packet(packet9_device1)
-        device1.process_packet(packet9_device2)
-        packets_device1.append(packet9_device1)
-        packets_device2.append(packet9_device2)
-
-        # Packet A: Check, Dodges, Hits, EOL
-        packetA_device1 = device1.generate_packetA(eol=EOL)
-        packetA_device2 = device2.generate_packetA(eol=EOL)
-        device2.process_packet(packetA_device1)
-        device1.process_packet(packetA_device2)
-        packets_device1.append(packetA_device1)
-        packets_device2.append(packetA_device2)
+        # Generate and exchange packets 1 to A
+        packets_device1, packets_device2 = exchange_packets(device1, device2, DM20_EXCHANGE)
 
         # Simulate the battle
         attacker_hp = 4
@@ -323,13 +372,9 @@ class BattleSimulator:
         attack_pattern_device1 = get_dm20_attack_pattern(device1.digimon.tag_meter, device1.digimon.mini_game)
         attack_pattern_device2 = get_dm20_attack_pattern(device2.digimon.tag_meter, device2.digimon.mini_game)
 
-        # Extract hits for both devices
-        device1_hits = [(packetA_device1[1] >> (4 + i)) & 1 for i in range(4)]  # Extract MSB 4 bits from Packet A (Device 1)
-        device2_hits = [(packetA_device2[1] >> (4 + i)) & 1 for i in range(4)]  # Extract MSB 4 bits from Packet A (Device 2)
-
-        # Reverse the order of bits to match the turn order (MSB -> Turn 1, LSB -> Turn 4)
-        device1_hits.reverse()
-        device2_hits.reverse()
+        # Hits from Packet A, in turn order
+        device1_hits = _turn_hits(device1.hits)
+        device2_hits = _turn_hits(device2.hits)
 
         # Simulate up to 6 turns
         for turn in range(6):
@@ -427,86 +472,8 @@ class BattleSimulator:
         device1 = Pen20Device(attacker)
         device2 = Pen20Device(defender)
 
-        # Constants
-        EOL = 0b1110  # End of Line
-        COU = 0b00    # Constant Or Unknown
-        VERSION = 0b0001
-
-        # Generate and exchange packets
-        packets_device1 = []
-        packets_device2 = []
-
-        # Packet exchanges (1 to 9)
-        packet1_device1 = device1.generate_packet1(order=0, version=VERSION, eol=EOL)
-        packet1_device2 = device2.generate_packet1(order=1, version=VERSION, eol=EOL)
-        device2.process_packet(packet1_device1)
-        device1.process_packet(packet1_device2)
-        packets_device1.append(packet1_device1)
-        packets_device2.append(packet1_device2)
-
-        packet2_device1 = device1.generate_packet2(cou=COU, eol=EOL)
-        packet2_device2 = device2.generate_packet2(cou=COU, eol=EOL)
-        device2.process_packet(packet2_device1)
-        device1.process_packet(packet2_device2)
-        packets_device1.append(packet2_device1)
-        packets_device2.append(packet2_device2)
-
-        packet3_device1 = device1.generate_packet3(cou=COU, eol=EOL)
-        packet3_device2 = device2.generate_packet3(cou=COU, eol=EOL)
-        device2.process_packet(packet3_device1)
-        device1.process_packet(packet3_device2)
-        packets_device1.append(packet3_device1)
-        packets_device2.append(packet3_device2)
-
-        packet4_device1 = device1.generate_packet4(cou=COU, eol=EOL)
-        packet4_device2 = device2.generate_packet4(cou=COU, eol=EOL)
-        device2.process_packet(packet4_device1)
-        device1.process_packet(packet4_device2)
-        packets_device1.append(packet4_device1)
-        packets_device2.append(packet4_device2)
-
-        packet5_device1 = device1.generate_packet5(cou=COU, eol=EOL)
-        packet5_device2 = device2.generate_packet5(cou=COU, eol=EOL)
-        device2.process_packet(packet5_device1)
-        device1.process_packet(packet5_device2)
-        packets_device1.append(packet5_device1)
-        packets_device2.append(packet5_device2)
-
-        packet6_device1 = device1.generate_packet6(eol=EOL)
-        packet6_device2 = device2.generate_packet6(eol=EOL)
-        device2.process_packet(packet6_device1)
-        device1.process_packet(packet6_device2)
-        packets_device1.append(packet6_device1)
-        packets_device2.append(packet6_device2)
-
-        packet7_device1 = device1.generate_packet7(cou=COU, eol=EOL)
-        packet7_device2 = device2.generate_packet7(cou=COU, eol=EOL)
-        device2.process_packet(packet7_device1)
-        device1.process_packet(packet7_device2)
-        packets_device1.append(packet7_device1)
-        packets_device2.append(packet7_device2)
-
-        packet8_device1 = device1.generate_packet8(cou=COU, eol=EOL)
-        packet8_device2 = device2.generate_packet8(cou=COU, eol=EOL)
-        device2.process_packet(packet8_device1)
-        device1.process_packet(packet8_device2)
-        packets_device1.append(packet8_device1)
-        packets_device2.append(packet8_device2)
-
-        packet9_device1 = device1.generate_packet9(cou=COU, eol=EOL)
-        packet9_device2 = device2.generate_packet9(cou=COU, eol=EOL)
-        device2.process_packet(packet9_device1)
-        device1.process_packet(packet9_device2)
-        packets_device1.append(packet9_device1)
-        packets_device2.append(packet9_device2)
-
-        # Packet A: Check, Dodges, Hits, EOL
-        packetA_device1 = device1.generate_packetA(eol=EOL)
-        packetA_device2 = device2.generate_packetA(eol=EOL)
-        device2.process_packet(packetA_device1)
-        device1.process_packet(packetA_device2)
-        packets_device1.append(packetA_device1)
-        packets_device2.append(packetA_device2)
+        # Generate and exchange packets 1 to A
+        packets_device1, packets_device2 = exchange_packets(device1, device2, PEN20_EXCHANGE)
 
         # Simulate the battle
         attacker_hp = 3
@@ -517,13 +484,9 @@ class BattleSimulator:
         attack_pattern_device1 = get_attack_pattern(0, 0, protocol="PEN20")
         attack_pattern_device2 = get_attack_pattern(0, 0, protocol="PEN20")
 
-        # Extract hits for both devices
-        device1_hits = [(packetA_device1[1] >> (4 + i)) & 1 for i in range(4)]  # Extract MSB 4 bits from Packet A (Device 1)
-        device2_hits = [(packetA_device2[1] >> (4 + i)) & 1 for i in range(4)]  # Extract MSB 4 bits from Packet A (Device 2)
-
-        # Reverse the order of bits to match the turn order (MSB -> Turn 1, LSB -> Turn 4)
-        device1_hits.reverse()
-        device2_hits.reverse()
+        # Hits from Packet A, in turn order
+        device1_hits = _turn_hits(device1.hits)
+        device2_hits = _turn_hits(device2.hits)
 
         # Simulate up to 6 turns
         for turn in range(6):
@@ -608,66 +571,12 @@ class BattleSimulator:
         device1 = DMXDevice(attacker)
         device2 = DMXDevice(defender)
 
-        # Initialize packet storage
-        packets_device1 = []
-        packets_device2 = []
-
-        # Packet exchanges
-        # Packet 1: Order, Level, Sick, Attack, Version, EOL
-        packet1_device1 = device1.generate_packet1()
-        packet1_device2 = device2.generate_packet1()
-        device2.process_packet(packet1_device1)
-        device1.process_packet(packet1_device2)
-        packets_device1.append(packet1_device1)
-        packets_device2.append(packet1_device2)
-
-        # Packet 2: Stage, Index, Attribute, EOL
-        packet2_device1 = device1.generate_packet2()
-        packet2_device2 = device2.generate_packet2()
-        device2.process_packet(packet2_device1)
-        device1.process_packet(packet2_device2)
-        packets_device1.append(packet2_device1)
-        packets_device2.append(packet2_device2)
-
-        # Packet 3: Shot S, Shot W, EOL
-        packet3_device1 = device1.generate_packet3()
-        packet3_device2 = device2.generate_packet3()
-        device2.process_packet(packet3_device1)
-        device1.process_packet(packet3_device2)
-        packets_device1.append(packet3_device1)
-        packets_device2.append(packet3_device2)
-
-        # Packet 4: COU, HP, Shot M, EOL
-        packet4_device1 = device1.generate_packet4()
-        packet4_device2 = device2.generate_packet4()
-        device2.process_packet(packet4_device1)
-        device1.process_packet(packet4_device2)
-        packets_device1.append(packet4_device1)
-        packets_device2.append(packet4_device2)
-
-        # Packet 5: COU, Buff, Power, EOL
-        packet5_device1 = device1.generate_packet5()
-        packet5_device2 = device2.generate_packet5()
-        device2.process_packet(packet5_device1)
-        device1.process_packet(packet5_device2)
-        packets_device1.append(packet5_device1)
-        packets_device2.append(packet5_device2)
-
-        # Packet 6: Check, COU, Hits, EOL
-        packet6_device1 = device1.generate_packet6()
-        packet6_device2 = device2.generate_packet6()
-        device2.process_packet(packet6_device1)
-        device1.process_packet(packet6_device2)
-        packets_device1.append(packet6_device1)
-        packets_device2.append(packet6_device2)
-
-        # Extract hits for both devices
-        device1_hits = [(device1.hits >> i) & 1 for i in range(4)]  # Extract 4 bits from hits
-        device2_hits = [(device2.hits >> i) & 1 for i in range(4)]  # Extract 4 bits from hits
-
-        # Reverse the order of bits to match the turn order (MSB -> Turn 1, LSB -> Turn 4)
-        device1_hits.reverse()
-        device2_hits.reverse()
+        # Generate and exchange packets 1 to 6
+        packets_device1, packets_device2 = exchange_packets(device1, device2, DMX_EXCHANGE)
+
+        # Hits from Packet 6, in turn order
+        device1_hits = _turn_hits(device1.hits)
+        device2_hits = _turn_hits(device2.hits)
 
         # Retrieve attack patterns for both devices
         attack_pattern_device1 = get_attack_pattern(device1.level, device1.digimon.mini_game, protocol="DMX")
@@ -768,24 +677,10 @@ class DMCDevice:
         self.received_packets = []  # Store received packets
 
     def generate_packet1(self, operation):
-        return DMCBSPacket(
-            operation=operation,
-            index=self.index,
-            power=self.power,
-            attribute=self.attribute,
-            shot=self.shot,
-            outcome=0
-        ).build_packet1()
+        return DMC_PACKET1(operation=operation, index=self.index, power=self.power, attribute=self.attribute)
 
     def generate_packet2(self, operation, outcome):
-        return DMCBSPacket(
-            operation=operation,
-            index=self.index,
-            power=self.power,
-            attribute=self.attribute,
-            shot=self.shot,
-            outcome=outcome
-        ).build_packet2()
+        return DMC_PACKET2(operation=operation, shot=self.shot, outcome=outcome)
 
     def process_packet(self, packet):
         """
@@ -810,12 +705,15 @@ class DMCDevice:
         # Simulate attack roll
         attack_roll = random.randint(0, 99)
         return 1 if attack_roll < hitrate else 0  # 1 = win, 0 = lose
-    
+
+
 class DM20Device:
     """
     Represents a Digimon device in the DM20_BS protocol.
     Handles packet generation, processing, and state management.
     """
+    PACKETS = tuple(codec.encode for codec in DM20_PACKETS)
+
     def __init__(self, digimon: Digimon):
         self.digimon = digimon
         self.hp = digimon.hp
@@ -825,6 +723,7 @@ class DM20Device:
         self.shot1 = digimon.shot1
         self.shot2 = digimon.shot2
         self.tag_meter = digimon.tag_meter  # Use the tag_meter attribute from the Digimon class
+        self.hits = 0  # Hit pattern sent in Packet A
         self.packets = []  # Stores packets received from the opponent
         self.opponent_data = []  # Store opponent's data
 
@@ -832,65 +731,59 @@ class DM20Device:
         """
         Generates Packet 1: Name 2, Name 1.
         """
-        tamer_name = ["O", "M", "N", "I"]
-        return struct.pack(">BB", ord(tamer_name[1]), ord(tamer_name[0]))
+        return self.PACKETS[0](name2=ord(TAMER_NAME[1]), name1=ord(TAMER_NAME[0]))
 
     def generate_packet2(self):
         """
         Generates Packet 2: Name 4, Name 3.
         """
-        tamer_name = ["O", "M", "N", "I"]
-        return struct.pack(">BB", ord(tamer_name[3]), ord(tamer_name[2]))
+        return self.PACKETS[1](name4=ord(TAMER_NAME[3]), name3=ord(TAMER_NAME[2]))
 
     def generate_packet3(self, order, version, eol):
         """
         Generates Packet 3: Order, Attack (Mini-Game Taps), Operation, Version, EOL.
         """
-        attack = self.digimon.mini_game  # Use the mini-game taps value
-        operation = 0b00  # Single Battle
-        return struct.pack(">B", (order << 7) | (attack << 2) | operation) + struct.pack(">B", (version << 4) | eol)
+        # Operation 0b00: Single Battle
+        return self.PACKETS[2](order=order, mini_game=self.digimon.mini_game, operation=0b00, version=version, eol=eol)
 
     def generate_packet4(self, cou, eol):
         """
         Generates Packet 4: COU, Index L, Attribute L, EOL.
         """
-        return struct.pack(">B", (cou << 6) | self.index) + struct.pack(">B", (self.attribute << 4) | eol)
+        return self.PACKETS[3](cou=cou, index=self.index, attribute=self.attribute, eol=eol)
 
     def generate_packet5(self, eol):
         """
         Generates Packet 5: Shot S L, Shot W L, EOL.
         """
-        return struct.pack(">BBB", self.shot1, self.shot2, eol)
+        return self.PACKETS[4](shot1=self.shot1, shot2=self.shot2, eol=eol)
 
     def generate_packet6(self, cou, eol):
         """
         Generates Packet 6: COU, Power L, EOL.
         """
-        return struct.pack(">B", (cou << 6) | (self.power & 0b111111)) + struct.pack(">B", eol)
+        return self.PACKETS[5](cou=cou, power=self.power, eol=eol)
 
     def generate_packet7(self, cou, eol):
         """
         Generates Packet 7: COU, Index R, Attribute R, EOL.
         """
-        index_r = 0  # For single battles, R values are 0
-        attribute_r = 0  # For single battles, R values are 0
-        return struct.pack(">B", (cou << 6) | index_r) + struct.pack(">B", (attribute_r << 4) | eol)
+        # For single battles, R values are 0
+        return self.PACKETS[6](cou=cou, eol=eol)
 
     def generate_packet8(self, eol):
         """
         Generates Packet 8: Shot S R, Shot W R, EOL.
         """
-        shot_s_r = 0  # For single battles, R values are 0
-        shot_w_r = 0  # For single battles, R values are 0
-        return struct.pack(">B", (shot_s_r << 2) | (shot_w_r >> 4)) + struct.pack(">B", ((shot_w_r & 0b1111) << 4) | eol)
+        # For single battles, R values are 0
+        return self.PACKETS[7](eol=eol)
 
     def generate_packet9(self, eol):
         """
         Generates Packet 9: Tag Meter, Power R, EOL.
         """
-        tag_meter = self.digimon.tag_meter  # Use the tag_meter attribute from the Digimon class
-        power_r = 0  # For single battles, Power R is 0
-        return struct.pack(">B", (tag_meter << 4) | (power_r >> 4)) + struct.pack(">B", ((power_r & 0b1111) << 4) | eol)
+        # For single battles, Power R is 0
+        return self.PACKETS[8](tag_meter=self.digimon.tag_meter, eol=eol)
 
     def process_packet(self, packet):
         """
@@ -906,67 +799,25 @@ class DM20Device:
             raise ValueError("Opponent data is not available. Ensure packets are processed before generating Packet A.")
 
         # Extract opponent's power and attribute from the stored packets
-        opponent_power = self.opponent_data[4][0] & 0b11111111  # Power from Packet 5
-        opponent_attribute = (self.opponent_data[1][1] >> 4) & 0b1111  # Attribute from Packet 2
-
-        power = self.digimon.power
-        if (self.digimon.attribute == 0 and opponent_attribute == 2) or \
-           (self.digimon.attribute == 1 and opponent_attribute == 0) or \
-           (self.digimon.attribute == 2 and opponent_attribute == 1):
-            power += 32  # Attribute advantage
-
-        # Add 32 to opponent's power if they have an attribute advantage
-        if (opponent_attribute == 0 and self.digimon.attribute == 2) or \
-           (opponent_attribute == 1 and self.digimon.attribute == 0) or \
-           (opponent_attribute == 2 and self.digimon.attribute == 1):
-            opponent_power += 32
-
-        # Initialize hits and dodges
-        hits = 0
-        dodges = 0
+        opponent_power = self.opponent_data[4][0]  # Power from Packet 5
+        opponent_attribute = self.opponent_data[1][1] >> 4  # Attribute from Packet 2
 
-        # Calculate hits and dodges for 4 attacks
-        for i in range(4):
-            # Calculate hitrate
-            hitrate = ((power * 100) / (power + opponent_power))
-            hitrate = max(0, min(hitrate, 100))  # Clamp hitrate between 0 and 100
-
-            # Simulate hit
-            attack_roll = random.randint(0, 99)
-            hit = 1 if attack_roll < hitrate else 0
-
-            # Calculate dodge (inverted for single battles)
-            dodge = 1 - hit
-
-            # Update hits and dodges bit patterns (right to left)
-            hits |= (hit << i)
-            dodges |= (dodge << i)
-
-        check = self._calculate_check(hits, dodges, eol)
-
-        # Pack the data into bytes
-        return struct.pack(">B", (check << 4) | dodges) + struct.pack(">B", (hits << 4) | eol)
+        self.hits = roll_hits(self.digimon.power, opponent_power, self.digimon.attribute, opponent_attribute)
+        dodges = self.hits ^ 0b1111  # Inverted for single battles
+        check = self._calculate_check(self.hits, dodges, eol)
+        return self.PACKETS[9](check=check, dodges=dodges, hits=self.hits, eol=eol)
 
     def _calculate_check(self, hits, dodges, eol):
         """
         Calculates the Check value for Packet A.
-        Ensures the intended remainder when the sum of all 4-bit groups is divided by 16.
         """
-        # Sum all 4-bit groups
-        total_sum = (hits & 0b1111) + (dodges & 0b1111) + (eol & 0b1111)
-
-        # Intended remainder (example: 11)
-        intended_remainder = 11
-
-        # Calculate the Check value
-        check = (intended_remainder - (total_sum % 16)) % 16
-        return check
+        return nibble_check(hits, dodges, eol)
 
 class DMCBSPacket:
     """
     Represents a DMC_BS packet (2 packets per exchange).
     """
-    COU = 0x47444C43  # 'DMCL'
+    COU = DMC_COU
 
     def __init__(self, operation: int, index: int, power: int, attribute: int, shot: int, outcome: int):
         self.operation = operation  # Operation code (0-3)
@@ -981,11 +832,7 @@ class DMCBSPacket:
         Calculates the checksum for the packet.
         The checksum is the sum of all 16-bit fields, keeping only the lowest 16 bits.
         """
-        check = 0
-        for i in range(0, len(packet_bytes) - 2, 2):  # Exclude the last 2 bytes (checksum field)
-            segment = int.from_bytes(packet_bytes[i:i+2], 'big')
-            check += segment
-        return check & 0xFFFF  # Keep only the lowest 16 bits
+        return dmc_checksum(packet_bytes)
 
     def build_packet1(self) -> bytes:
         """
@@ -994,26 +841,7 @@ class DMCBSPacket:
         COU (4 bytes) | Operation (2 bytes) | Version (2 bytes) | Index (2 bytes) |
         Power (2 bytes) | Attribute (2 bytes) | Check (2 bytes)
         """
-        version = 1  # Fixed version value
-        packet = struct.pack(">IHHHHHH",
-            self.COU,           # COU (4 bytes)
-            self.operation,     # Operation (2 bytes)
-            version,            # Version (2 bytes)
-            self.index,         # Index (2 bytes)
-            self.power,         # Power (2 bytes)
-            self.attribute,     # Attribute (2 bytes)
-            0                   # Check (placeholder, 2 bytes)
-        )
-        check = self._calc_check(packet)
-        return struct.pack(">IHHHHHH",
-            self.COU,
-            self.operation,
-            version,
-            self.index,
-            self.power,
-            self.attribute,
-            check                # Final checksum
-        )
+        return DMC_PACKET1(operation=self.operation, index=self.index, power=self.power, attribute=self.attribute)
 
     def build_packet2(self) -> bytes:
         """
@@ -1022,29 +850,15 @@ class DMCBSPacket:
         COU (4 bytes) | Operation (2 bytes) | Shot (2 bytes) | Outcome (2 bytes) |
         COU (4 bytes) | Check (2 bytes)
         """
-        packet = struct.pack(">IHHHIH",
-            self.COU,           # COU (4 bytes)
-            self.operation,     # Operation (2 bytes)
-            self.shot,          # Shot (2 bytes)
-            self.outcome,       # Outcome (2 bytes)
-            0,                  # Placeholder for repeated COU (4 bytes)
-            0                   # Check (placeholder, 2 bytes)
-        )
-        check = self._calc_check(packet)
-        return struct.pack(">IHHHIH",
-            self.COU,
-            self.operation,
-            self.shot,
-            self.outcome,
-            0,                  # Placeholder for repeated COU
-            check                # Final checksum
-        )
+        return DMC_PACKET2(operation=self.operation, shot=self.shot, outcome=self.outcome)
 
 class Pen20Device:
     """
     Represents a Digimon device in the Pen20_BS protocol.
     Handles packet generation, processing, and state management.
     """
+    PACKETS = tuple(codec.encode for codec in PEN20_PACKETS)
+
     def __init__(self, digimon: Digimon):
         self.digimon = digimon
         self.hp = digimon.hp
@@ -1057,6 +871,7 @@ class Pen20Device:
         self.egg_shake = digimon.egg_shake  # Egg shake status of
         self.sick = digimon.sick  # Sick status of the Digimon
         self.tag_meter = digimon.tag_meter  # Use the tag_meter attribute from the Digimon class
+        self.hits = 0  # Hit pattern sent in Packet A
         self.packets = []  # Stores packets received from the opponent
         self.opponent_data = []  # Store opponent's data
 
@@ -1064,101 +879,61 @@ class Pen20Device:
         """
         Generates Packet 1: Order, COU, Attack, Operation, Version, EOL.
         """
-        attack = self.digimon.mini_game  # Use the mini-game taps value
-        operation = 0b00  # Single Battle
-        cou = 0b0  # Constant or unknown (always 0)
-
-        # Pack the data into two bytes
-        return struct.pack(
-            ">B", (order << 7) | (cou << 6) | (attack << 2) | operation
-        ) + struct.pack(
-            ">B", (version << 4) | eol
-        )
+        # COU is always 0, operation 0b00: Single Battle
+        return self.PACKETS[0](order=order, cou=0b0, mini_game=self.digimon.mini_game, operation=0b00,
+                               version=version, eol=eol)
 
     def generate_packet2(self, cou, eol):
         """
         Generates Packet 2: COU, Index L, Attribute L, EOL.
         """
-        return struct.pack(
-            ">B", (cou << 6) | self.index
-        ) + struct.pack(
-            ">B", (self.attribute << 4) | eol
-        )
+        return self.PACKETS[1](cou=cou, index=self.index, attribute=self.attribute, eol=eol)
 
     def generate_packet3(self, cou, eol):
         """
         Generates Packet 3: COU, Shot W L, EOL.
         """
-        return struct.pack(
-            ">B", (cou << 4) | (self.shot2 >> 4)
-        ) + struct.pack(
-            ">B", ((self.shot2 & 0b1111) << 4) | eol
-        )
+        return self.PACKETS[2](cou=cou, shot2=self.shot2, eol=eol)
 
     def generate_packet4(self, cou, eol):
         """
         Generates Packet 4: Sick, COU, Shot S L, EOL.
         """
-        return struct.pack(
-            ">B", (self.sick << 7) | (cou << 4) | (self.shot1 >> 4)
-        ) + struct.pack(
-            ">B", ((self.shot1 & 0b1111) << 4) | eol
-        )
+        return self.PACKETS[3](sick=self.sick, cou=cou, shot1=self.shot1, eol=eol)
 
     def generate_packet5(self, cou, eol):
         """
         Generates Packet 5: COU, Traited, Egg Shake, Power L, EOL.
         """
-        return struct.pack(
-            ">B", (cou << 6) | (self.traited << 5) | (self.egg_shake << 4) | (self.power & 0b1111_1111)
-        ) + struct.pack(
-            ">B", eol
-        )
+        return self.PACKETS[4](cou=cou, traited=self.traited, egg_shake=self.egg_shake, power=self.power, eol=eol)
 
     def generate_packet6(self, eol):
         """
         Generates Packet 6: Copy, Index R, Attribute R, EOL.
         """
-        index_r = 0  # For single battles, Index R is 0
-        attribute_r = 0  # For single battles, Attribute R is 0
-        return struct.pack(
-            ">B", (0 << 6) | index_r
-        ) + struct.pack(
-            ">B", (attribute_r << 4) | eol
-        )
+        # For single battles, Index R and Attribute R are 0
+        return self.PACKETS[5](eol=eol)
 
     def generate_packet7(self, cou, eol):
         """
         Generates Packet 7: COU, Shot W R, EOL.
         """
-        shot_w_r = 0  # For single battles, Shot W R is 0
-        return struct.pack(
-            ">B", (cou << 4) | (shot_w_r >> 4)
-        ) + struct.pack(
-            ">B", ((shot_w_r & 0b1111) << 4) | eol
-        )
+        # For single battles, Shot W R is 0
+        return self.PACKETS[6](cou=cou, eol=eol)
 
     def generate_packet8(self, cou, eol):
         """
         Generates Packet 8: COU, Shot S R, EOL.
         """
-        shot_s_r = 0  # For single battles, Shot S R is 0
-        return struct.pack(
-            ">B", (cou << 4) | (shot_s_r >> 4)
-        ) + struct.pack(
-            ">B", ((shot_s_r & 0b1111) << 4) | eol
-        )
+        # For single battles, Shot S R is 0
+        return self.PACKETS[7](cou=cou, eol=eol)
 
     def generate_packet9(self, cou, eol):
         """
         Generates Packet 9: COU, Power R, EOL.
         """
-        power_r = 0  # For single battles, Power R is 0
-        return struct.pack(
-            ">B", (cou << 4) | (power_r >> 4)
-        ) + struct.pack(
-            ">B", ((power_r & 0b1111) << 4) | eol
-        )
+        # For single battles, Power R is 0
+        return self.PACKETS[8](cou=cou, eol=eol)
 
     def process_packet(self, packet):
         """
@@ -1174,67 +949,27 @@ class Pen20Device:
             raise ValueError("Opponent data is not available. Ensure packets are processed before generating Packet A.")
 
         # Extract opponent's power and attribute from the stored packets
-        opponent_power = self.opponent_data[4][0] & 0b11111111  # Power from Packet 5
-        opponent_attribute = (self.opponent_data[1][1] >> 4) & 0b1111  # Attribute from Packet 2
-
-        power = self.digimon.power
-        if (self.digimon.attribute == 0 and opponent_attribute == 2) or \
-           (self.digimon.attribute == 1 and opponent_attribute == 0) or \
-           (self.digimon.attribute == 2 and opponent_attribute == 1):
-            power += 32  # Attribute advantage
-
-        # Add 32 to opponent's power if they have an attribute advantage
-        if (opponent_attribute == 0 and self.digimon.attribute == 2) or \
-           (opponent_attribute == 1 and self.digimon.attribute == 0) or \
-           (opponent_attribute == 2 and self.digimon.attribute == 1):
-            opponent_power += 32
-
-        # Initialize hits and dodges
-        hits = 0
-        dodges = 0
-
-        # Calculate hits and dodges for 4 attacks
-        for i in range(4):
-            # Calculate hitrate
-            hitrate = ((power * 100) / (power + opponent_power))
-            hitrate = max(0, min(hitrate, 100))  # Clamp hitrate between 0 and 100
-
-            # Simulate hit
-            attack_roll = random.randint(0, 99)
-            hit = 1 if attack_roll < hitrate else 0
-
-            # Calculate dodge (inverted for single battles)
-            dodge = 1 - hit
-
-            # Update hits and dodges bit patterns (right to left)
-            hits |= (hit << i)
-            dodges |= (dodge << i)
-
-        check = self._calculate_check(hits, dodges, eol)
+        opponent_power = self.opponent_data[4][0]  # Power from Packet 5
+        opponent_attribute = self.opponent_data[1][1] >> 4  # Attribute from Packet 2
 
-        # Pack the data into bytes
-        return struct.pack(">B", (check << 4) | dodges) + struct.pack(">B", (hits << 4) | eol)
+        self.hits = roll_hits(self.digimon.power, opponent_power, self.digimon.attribute, opponent_attribute)
+        dodges = self.hits ^ 0b1111  # Inverted for single battles
+        check = self._calculate_check(self.hits, dodges, eol)
+        return self.PACKETS[9](check=check, dodges=dodges, hits=self.hits, eol=eol)
 
     def _calculate_check(self, hits, dodges, eol):
         """
         Calculates the Check value for Packet A.
-        Ensures the intended remainder when the sum of all 4-bit groups is divided by 16.
         """
-        # Sum all 4-bit groups
-        total_sum = (hits & 0b1111) + (dodges & 0b1111) + (eol & 0b1111)
-
-        # Intended remainder (example: 11)
-        intended_remainder = 11
-
-        # Calculate the Check value
-        check = (intended_remainder - (total_sum % 16)) % 16
-        return check
+        return nibble_check(hits, dodges, eol)
 
 class DMXDevice:
     """
     Represents a Digimon device in the DMX protocol.
     Handles packet generation, processing, and state management.
     """
+    PACKETS = tuple(codec.encode for codec in DMX_PACKETS)
+
     def __init__(self, digimon: Digimon):
         self.digimon = digimon
         self.hp = digimon.hp
@@ -1258,56 +993,32 @@ class DMXDevice:
         """
         Generates Packet 1: Order, Level, Sick, Attack, Version, EOL.
         """
-        attack = self.digimon.mini_game
-        return struct.pack(
-            ">B", (self.order << 7) | (self.level << 3) | (self.sick << 1) | (attack >> 5)
-        ) + struct.pack(
-            ">B", ((attack & 0b11111) << 3) | self.version
-        )
+        return self.PACKETS[0](order=self.order, level=self.level, sick=self.sick, mini_game=self.digimon.mini_game,
+                               version=self.version)
 
     def generate_packet2(self):
         """
         Generates Packet 2: Stage, Index, Attribute, EOL.
         """
-        return struct.pack(
-            ">B", (self.stage << 5) | (self.index >> 3)
-        ) + struct.pack(
-            ">B", ((self.index & 0b111) << 5) | (self.attribute << 3) | 0b1110
-        )
+        return self.PACKETS[1](stage=self.stage, index=self.index, attribute=self.attribute)
 
     def generate_packet3(self):
         """
         Generates Packet 3: Shot S, Shot W, EOL.
         """
-        return struct.pack(
-            ">B", self.shot_s
-        ) + struct.pack(
-            ">B", self.shot_w
-        ) + struct.pack(
-            ">B", 0b1110  # EOL
-        )
+        return self.PACKETS[2](shot_s=self.shot_s, shot_w=self.shot_w)
 
     def generate_packet4(self):
         """
         Generates Packet 4: COU, HP, Shot M, EOL.
         """
-        return struct.pack(
-            ">B", (0b00 << 6) | (self.hp << 1) | (self.shot_m >> 4)
-        ) + struct.pack(
-            ">B", ((self.shot_m & 0b1111) << 4) | 0b1110
-        )
+        return self.PACKETS[3](hp=self.hp, shot_m=self.shot_m)
 
     def generate_packet5(self):
         """
         Generates Packet 5: COU, Buff, Power, EOL.
         """
-        return struct.pack(
-            ">B", (0b00 << 6) | (self.buff << 4)
-        ) + struct.pack(
-            ">B", self.power
-        ) + struct.pack(
-            ">B", 0b1110  # EOL
-        )
+        return self.PACKETS[4](buff=self.buff, power=self.power)
 
     def generate_packet6(self, eol=0b1110):
         """
@@ -1321,46 +1032,11 @@ class DMXDevice:
         opponent_power = self.received_packets[4][1]  # Assuming Packet 5 is at index 4
 
         # Extract opponent's attribute from Packet 2 (second byte of the packet, upper 4 bits)
-        opponent_attribute = (self.received_packets[1][1] >> 4) & 0b1111  # Assuming Packet 2 is at index 1
-
-        # Apply attribute advantage
-        player_power = self.power
-        if (self.attribute == 0 and opponent_attribute == 2) or \
-           (self.attribute == 1 and opponent_attribute == 0) or \
-           (self.attribute == 2 and opponent_attribute == 1):
-            player_power += 32  # Attribute advantage
-
-        if (opponent_attribute == 0 and self.attribute == 2) or \
-           (opponent_attribute == 1 and self.attribute == 0) or \
-           (opponent_attribute == 2 and self.attribute == 1):
-            opponent_power += 32  # Opponent's attribute advantage
-
-        # Calculate hits
-        hits = 0
-        for i in range(4):  # Simulate 4 attacks
-            hitrate = ((player_power * 100) / (player_power + opponent_power))
-            hitrate = max(0, min(hitrate, 100))  # Clamp hitrate between 0 and 100
-
-            # Simulate hit
-            attack_roll = random.randint(0, 99)
-            hit = 1 if attack_roll < hitrate else 0
-
-            # Update hits bit pattern (right to left)
-            hits |= (hit << i)
-
-        self.hits = hits
-
-        # Calculate Check value
-        total_sum = (self.hits & 0b1111) + (0b000 & 0b1111) + (eol & 0b1111)
-        intended_remainder = 11  # Example remainder
-        self.check = (intended_remainder - (total_sum % 16)) % 16
-
-        # Pack the data into bytes
-        return struct.pack(
-            ">B", (self.check << 4) | (0b000 << 1) | (self.hits >> 4)
-        ) + struct.pack(
-            ">B", ((self.hits & 0b1111) << 4) | eol
-        )
+        opponent_attribute = self.received_packets[1][1] >> 4  # Assuming Packet 2 is at index 1
+
+        self.hits = roll_hits(self.power, opponent_power, self.attribute, opponent_attribute)
+        self.check = nibble_check(self.hits, 0b000, eol)
+        return self.PACKETS[5](check=self.check, hits=self.hits, eol=eol)
 
     def process_packet(self, packet):
         """
@@ -1372,9 +1048,7 @@ class DMXDevice:
         """
         Calculates the Check value for Packet 6.
         """
-        total_sum = (self.hits & 0b1111) + (0b000 & 0b1111) + (0b1110 & 0b1111)
-        intended_remainder = 11
-        self.check = (intended_remainder - (total_sum % 16)) % 16
+        self.check = nibble_check(self.hits, 0b000, 0b1110)
 
 # --- Test code ---
 if __name__ == "__main__":
@@ -1419,5 +1093,5 @@ if __name__ == "__main__":
         tag_meter=2  # Example value for Tag Meter
     )
 
-    simulator = BattleSimulator(protocol=BattleProtocol.DM20_BS)
+    simulator = BattleSimulator(protocol=BattleProtocol.DM20_BS, verbose=True)
     result = simulator.simulate(device1, device2)
\ No newline at end of file
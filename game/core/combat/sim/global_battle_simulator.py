@@ -11,11 +11,13 @@ except ImportError:
 
 
 class GlobalBattleSimulator:
-    def __init__(self, attribute_advantage=5, damage_limit=3, force_winner=True, pvp_mode=False):
+    def __init__(self, attribute_advantage=5, damage_limit=3, force_winner=True, pvp_mode=False, verbose=False, rng=None):
         self.attribute_advantage = attribute_advantage
         self.damage_limit = damage_limit
         self.force_winner = force_winner
         self.pvp_mode = pvp_mode
+        self.verbose = verbose  # Print the full battle log after each simulation
+        self.rng = rng or random  # A seeded random.Random makes the battle reproducible
 
     def _attribute_advantage(self, att_attr, def_attr):
         # Vaccine > Virus > Data > Vaccine
@@ -71,7 +73,7 @@ class GlobalBattleSimulator:
                     targets = [t for t in device2 if t.alive]
                     if not targets:
                         break
-                    target = random.choice(targets)  # Pick the first available target
+                    target = self.rng.choice(targets)  # Pick the first available target
 
                 # Calculate attack
                 pattern = pet.attack_pattern
@@ -81,7 +83,7 @@ class GlobalBattleSimulator:
                 handicap = pet.handicap
                 hitrate = ((pet.power * 100) / (pet.power + target.power)) + adv - handicap
                 hitrate = max(0, min(hitrate, 100))
-                hit = random.randint(0, 99) < hitrate
+                hit = self.rng.randint(0, 99) < hitrate
                 actual_dmg = dmg if hit else 0
                 target.current_hp -= actual_dmg
                 if target.current_hp <= 0:
@@ -111,7 +113,7 @@ class GlobalBattleSimulator:
                         handicap = pet.handicap
                         hitrate = ((pet.power * 100) / (pet.power + target.power)) + adv - handicap
                         hitrate = max(0, min(hitrate, 100))
-                        hit = random.randint(0, 99) < hitrate
+                        hit = self.rng.randint(0, 99) < hitrate
                         actual_dmg = dmg if hit else 0
                         target.current_hp -= actual_dmg
                         if target.current_hp <= 0:
@@ -134,7 +136,7 @@ class GlobalBattleSimulator:
                         targets = [t for t in device1 if t.alive]
                         if not targets:
                             break
-                        target = random.choice(targets)  # Pick the first available target
+                        target = self.rng.choice(targets)  # Pick the first available target
 
                     # Calculate attack
                     pattern = pet.attack_pattern
@@ -144,7 +146,7 @@ class GlobalBattleSimulator:
                     handicap = pet.handicap
                     hitrate = ((pet.power * 100) / (pet.power + target.power)) + adv - handicap
                     hitrate = max(0, min(hitrate, 100))
-                    hit = random.randint(0, 99) < hitrate
+                    hit = self.rng.randint(0, 99) < hitrate
                     actual_dmg = dmg if hit else 0
                     target.current_hp -= actual_dmg
                     if target.current_hp <= 0:
@@ -208,7 +210,8 @@ class GlobalBattleSimulator:
             device1_packets=[],
             device2_packets=[]
         )
-        self.print_battle_log(result)
+        if self.verbose:
+            self.print_battle_log(result)
         return result
 
     def print_battle_log(self, result):
@@ -286,5 +289,5 @@ if __name__ == "__main__":
         Digimon(name="Palmon", hp=10, attribute="Da", power=104, handicap=0, buff=0, mini_game=2, level=3, sick=0, shot1=1, shot2=1, order=3, traited=0, egg_shake=0, index=3, stage=3),
     ]
 
-    sim = GlobalBattleSimulator(attribute_advantage=5, damage_limit=3)
+    sim = GlobalBattleSimulator(attribute_advantage=5, damage_limit=3, verbose=True)
     result = sim.simulate(device1, device2)
\ No newline at end of file
@@ -0,0 +1,215 @@
+import struct
+
+#=====================================================================
+# Packet codecs - Field layouts of every battle protocol packet
+#=====================================================================
+# Each packet is declared once as a table of fields. The codec compiles the
+# table into a struct.Struct plus one encode and one decode function, so
+# building a packet is a single call instead of a chain of shifts and
+# struct.pack calls.
+#
+# Bit fields (DM20, PEN20, DMX) are (name, byte, shift, width[, value_shift]):
+# bits value_shift.. of the value, width bits wide, land at bit `shift` of
+# packet byte `byte`. A field split across two bytes is listed once per part.
+# Out-of-range values are truncated to the field width.
+#
+# Word fields (DMC) are (name, struct format character), big endian.
+
+EOL = 0b1110
+DMC_COU = 0x47444C43  # 'GDLC'
+
+# Values used for fields not passed to encode()
+BIT_DEFAULTS = {"eol": EOL}
+
+
+def _compile(source: str, name: str, namespace: dict):
+    """Builds a function from generated source (like collections.namedtuple)."""
+    exec(source, namespace)
+    return namespace[name]
+
+
+class BitCodec:
+    """A packet made of bit fields packed into bytes."""
+
+    def __init__(self, name: str, size: int, fields: tuple, defaults: dict = None) -> None:
+        self.name = name
+        self.size = size
+        self.struct = struct.Struct(f">{size}B")
+        self.fields = tuple(dict.fromkeys(field[0] for field in fields))
+        self.defaults = {**BIT_DEFAULTS, **(defaults or {})}
+        self.layout = tuple((field + (0,))[:5] for field in fields)
+
+        namespace = {"_pack": self.struct.pack}
+        parameters = ", ".join(f"{field}={self.defaults.get(field, 0)}" for field in self.fields)
+        byte_terms = [[] for _ in range(size)]
+        for field, byte, shift, width, value_shift in self.layout:
+            mask = (1 << width) - 1
+            value = f"({field} >> {value_shift})" if value_shift else field
+            byte_terms[byte].append(f"({value} & {mask}) << {shift}" if shift else f"({value} & {mask})")
+        packed = ", ".join(" | ".join(terms) or "0" for terms in byte_terms)
+        self.encode = _compile(f"def encode({parameters}):\n    return _pack({packed})\n", "encode", namespace)
+
+        arguments = ", ".join(f"b{byte}" for byte in range(size))
+        values = ", ".join(f"{field!r}: {self.field_source(field, 'b{byte}')}" for field in self.fields)
+        self._decode = _compile(f"def decode({arguments}):\n    return {{{values}}}\n", "decode", namespace)
+
+    def field_source(self, field: str, byte_name: str) -> str:
+        """Source of an expression reading field, with byte_name formatted by byte index (e.g. 'b{byte}')."""
+        terms = []
+        for name, byte, shift, width, value_shift in self.layout:
+            if name != field:
+                continue
+            source = byte_name.format(byte=byte)
+            part = f"({source} >> {shift}) & {(1 << width) - 1}" if shift else f"{source} & {(1 << width) - 1}"
+            terms.append(f"(({part}) << {value_shift})" if value_shift else f"({part})")
+        return " | ".join(terms)
+
+    def decode(self, packet: bytes) -> dict:
+        """Returns {field: value} for one packet."""
+        return self._decode(*packet)
+
+    def encode_many(self, rows) -> bytes:
+        """Encodes an iterable of {field: value} dicts into one buffer of packets."""
+        encode = self.encode
+        return b"".join([encode(**row) for row in rows])
+
+    def decode_many(self, data: bytes) -> list:
+        """Decodes a buffer of back-to-back packets."""
+        decode = self._decode
+        return [decode(*row) for row in self.struct.iter_unpack(data)]
+
+    def __repr__(self) -> str:
+        return f"BitCodec({self.name!r}, {self.size} bytes)"
+
+
+class WordCodec:
+    """
+    A packet made of whole 16/32-bit words. The field named by check is filled
+    with the 16-bit sum of every other 16-bit word (the DMC checksum).
+    """
+
+    def __init__(self, name: str, fields: tuple, defaults: dict = None, check: str = None) -> None:
+        self.name = name
+        self.struct = struct.Struct(">" + "".join(fmt for _, fmt in fields))
+        self.size = self.struct.size
+        self.fields = tuple(field for field, _ in fields)
+        self.defaults = defaults or {}
+        self.check = check
+
+        namespace = {"_pack": self.struct.pack}
+        inputs = [field for field in self.fields if field != check]
+        parameters = ", ".join(f"{field}={self.defaults.get(field, 0)}" for field in inputs)
+        body = ""
+        if check:
+            words = []
+            for field, fmt in fields:
+                if field == check:
+                    continue
+                words += [f"({field} >> 16)", f"({field} & 65535)"] if fmt in "Ii" else [field]
+            body = f"    {check} = ({' + '.join(words)}) & 65535\n"
+        self.encode = _compile(f"def encode({parameters}):\n{body}    return _pack({', '.join(self.fields)})\n",
+                               "encode", namespace)
+
+    def decode(self, packet: bytes) -> dict:
+        return dict(zip(self.fields, self.struct.unpack(packet)))
+
+    def encode_many(self, rows) -> bytes:
+        encode = self.encode
+        return b"".join([encode(**row) for row in rows])
+
+    def decode_many(self, data: bytes) -> list:
+        fields = self.fields
+        return [dict(zip(fields, row)) for row in self.struct.iter_unpack(data)]
+
+    def __repr__(self) -> str:
+        return f"WordCodec({self.name!r}, {self.size} bytes)"
+
+
+#=====================================================================
+# Protocol layouts (in exchange order, one codec per packet)
+#=====================================================================
+
+def _shot(name, byte=0):
+    """An 8-bit shot split as high nibble in the low bits of byte, low nibble in the next byte."""
+    return ((name, byte, 0, 4, 4), (name, byte + 1, 4, 4))
+
+
+# Packet A of DM20 and PEN20: Check, Dodges, Hits, EOL
+_PACKET_A = (("check", 0, 4, 4), ("dodges", 0, 0, 4), ("hits", 1, 4, 4), ("eol", 1, 0, 4))
+
+DMC_PACKETS = (
+    WordCodec("DMC 1", (("cou", "I"), ("operation", "H"), ("version", "H"), ("index", "H"),
+                        ("power", "H"), ("attribute", "H"), ("check", "H")),
+              defaults={"cou": DMC_COU, "version": 1}, check="check"),
+    WordCodec("DMC 2", (("cou", "I"), ("operation", "H"), ("shot", "H"), ("outcome", "H"),
+                        ("cou2", "I"), ("check", "H")),
+              defaults={"cou": DMC_COU}, check="check"),
+)
+
+DM20_PACKETS = (
+    BitCodec("DM20 1", 2, (("name2", 0, 0, 8), ("name1", 1, 0, 8))),
+    BitCodec("DM20 2", 2, (("name4", 0, 0, 8), ("name3", 1, 0, 8))),
+    BitCodec("DM20 3", 2, (("order", 0, 7, 1), ("mini_game", 0, 2, 5), ("operation", 0, 0, 2),
+                           ("version", 1, 4, 4), ("eol", 1, 0, 4))),
+    BitCodec("DM20 4", 2, (("cou", 0, 6, 2), ("index", 0, 0, 6), ("attribute", 1, 4, 4), ("eol", 1, 0, 4))),
+    BitCodec("DM20 5", 3, (("shot1", 0, 0, 8), ("shot2", 1, 0, 8), ("eol", 2, 0, 8))),
+    BitCodec("DM20 6", 2, (("cou", 0, 6, 2), ("power", 0, 0, 6), ("eol", 1, 0, 8))),
+    BitCodec("DM20 7", 2, (("cou", 0, 6, 2), ("index_r", 0, 0, 6), ("attribute_r", 1, 4, 4), ("eol", 1, 0, 4))),
+    BitCodec("DM20 8", 2, (("shot_s_r", 0, 2, 6), ("shot_w_r", 0, 0, 2, 4), ("shot_w_r", 1, 4, 4), ("eol", 1, 0, 4))),
+    BitCodec("DM20 9", 2, (("tag_meter", 0, 4, 4), ("power_r", 0, 0, 4, 4), ("power_r", 1, 4, 4), ("eol", 1, 0, 4))),
+    BitCodec("DM20 A", 2, _PACKET_A),
+)
+
+PEN20_PACKETS = (
+    BitCodec("PEN20 1", 2, (("order", 0, 7, 1), ("cou", 0, 6, 1), ("mini_game", 0, 2, 4), ("operation", 0, 0, 2),
+                            ("version", 1, 4, 4), ("eol", 1, 0, 4))),
+    BitCodec("PEN20 2", 2, (("cou", 0, 6, 2), ("index", 0, 0, 6), ("attribute", 1, 4, 4), ("eol", 1, 0, 4))),
+    BitCodec("PEN20 3", 2, (("cou", 0, 4, 4), *_shot("shot2"), ("eol", 1, 0, 4))),
+    BitCodec("PEN20 4", 2, (("sick", 0, 7, 1), ("cou", 0, 4, 3), *_shot("shot1"), ("eol", 1, 0, 4))),
+    # Power L takes the whole byte: the devices read it back as 8 bits, so high
+    # powers overlap the COU/Traited/Egg Shake bits exactly as on the toys
+    BitCodec("PEN20 5", 2, (("cou", 0, 6, 2), ("traited", 0, 5, 1), ("egg_shake", 0, 4, 1), ("power", 0, 0, 8),
+                            ("eol", 1, 0, 8))),
+    BitCodec("PEN20 6", 2, (("copy", 0, 6, 2), ("index_r", 0, 0, 6), ("attribute_r", 1, 4, 4), ("eol", 1, 0, 4))),
+    BitCodec("PEN20 7", 2, (("cou", 0, 4, 4), *_shot("shot_w_r"), ("eol", 1, 0, 4))),
+    BitCodec("PEN20 8", 2, (("cou", 0, 4, 4), *_shot("shot_s_r"), ("eol", 1, 0, 4))),
+    BitCodec("PEN20 9", 2, (("cou", 0, 4, 4), *_shot("power_r"), ("eol", 1, 0, 4))),
+    BitCodec("PEN20 A", 2, _PACKET_A),
+)
+
+DMX_PACKETS = (
+    BitCodec("DMX 1", 2, (("order", 0, 7, 1), ("level", 0, 3, 4), ("sick", 0, 1, 1), ("mini_game", 0, 0, 1, 5),
+                          ("mini_game", 1, 3, 5), ("version", 1, 0, 3))),
+    # Attribute shares bit 3 with the EOL nibble, as sent by the original code
+    BitCodec("DMX 2", 2, (("stage", 0, 5, 3), ("index", 0, 0, 5, 3), ("index", 1, 5, 3), ("attribute", 1, 3, 2),
+                          ("eol", 1, 0, 4))),
+    BitCodec("DMX 3", 3, (("shot_s", 0, 0, 8), ("shot_w", 1, 0, 8), ("eol", 2, 0, 8))),
+    # HP and the high nibble of Shot M overlap in bits 1-3
+    BitCodec("DMX 4", 2, (("cou", 0, 6, 2), ("hp", 0, 1, 5), *_shot("shot_m"), ("eol", 1, 0, 4))),
+    BitCodec("DMX 5", 3, (("cou", 0, 6, 2), ("buff", 0, 4, 2), ("power", 1, 0, 8), ("eol", 2, 0, 8))),
+    BitCodec("DMX 6", 2, (("check", 0, 4, 4), ("cou", 0, 1, 3), ("hits", 0, 0, 1, 4), ("hits", 1, 4, 4),
+                          ("eol", 1, 0, 4))),
+)
+
+
+def compile_decoder(codecs: tuple):
+    """
+    Compiles one function decoding all packets of a device (a sequence in
+    exchange order) into a single {field: value} dict. Fields sent in several
+    packets (COU, EOL...) keep the value of the last one.
+    """
+    owners = {}
+    for index, codec in enumerate(codecs):
+        for field in codec.fields:
+            owners[field] = (index, codec)
+    values = ", ".join(f"{field!r}: {codec.field_source(field, f'p{index}[{{byte}}]')}"
+                       for field, (index, codec) in owners.items())
+    arguments = ", ".join(f"p{index}" for index in range(len(codecs)))
+    return _compile(f"def decode(packets):\n    {arguments}, = packets\n    return {{{values}}}\n", "decode", {})
+
+
+
+# One-call decoders of a device's full packet list, for bulk trace validation
+DM20_DECODER = compile_decoder(DM20_PACKETS)
+PEN20_DECODER = compile_decoder(PEN20_PACKETS)
+DMX_DECODER = compile_decoder(DMX_PACKETS)
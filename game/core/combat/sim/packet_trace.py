@@ -0,0 +1,367 @@
+import random
+import struct
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List
+
+try:
+    from battle_simulator import BattleSimulator, dmc_checksum, nibble_check
+    from battle_utils import get_attack_pattern, get_dm20_attack_pattern
+    from models import *
+    from packet_codec import DM20_DECODER, DMC_COU, DMC_PACKETS, DM20_PACKETS, DMX_DECODER, DMX_PACKETS, EOL, PEN20_DECODER, PEN20_PACKETS
+except ImportError:
+    # Absolute imports for direct testing
+    from core.combat.sim.battle_simulator import BattleSimulator, dmc_checksum, nibble_check
+    from core.combat.sim.battle_utils import get_attack_pattern, get_dm20_attack_pattern
+    from core.combat.sim.models import *
+    from core.combat.sim.packet_codec import DM20_DECODER, DMC_COU, DMC_PACKETS, DM20_PACKETS, DMX_DECODER, DMX_PACKETS, EOL, PEN20_DECODER, PEN20_PACKETS
+
+#=====================================================================
+# Packet traces - Bulk decoding and validation of captured battles
+#=====================================================================
+# A trace holds many battles, each with the packets sent by both devices
+# and optionally the winner the devices showed.
+#
+# Hex text (one battle per line, # starts a comment):
+#   DM20_BS 4d4f 494e ... | 4d4f 494e ... | device1
+#
+# Binary (MAGIC, then one record per battle):
+#   u8 protocol, u8 winner, u8 device1 packet count, u8 device2 packet count,
+#   then every packet as u8 length + bytes (device1 first)
+
+MAGIC = b"OMPT\x01"
+RECORD = struct.Struct("<BBBB")
+
+PROTOCOL_IDS = {protocol: protocol.value for protocol in BattleProtocol}
+PROTOCOLS_BY_ID = {protocol.value: protocol for protocol in BattleProtocol}
+WINNERS = (None, "device1", "device2", "draw")
+WINNER_IDS = {winner: index for index, winner in enumerate(WINNERS)}
+
+# Packet codecs of each device, in exchange order
+PROTOCOL_PACKETS = {
+    BattleProtocol.DMC_BS: DMC_PACKETS,
+    BattleProtocol.DM20_BS: DM20_PACKETS,
+    BattleProtocol.PEN20_BS: PEN20_PACKETS,
+    BattleProtocol.DMX_BS: DMX_PACKETS,
+}
+
+# Packet sizes sent by each device, in exchange order
+PACKET_SIZES = {protocol: tuple(codec.size for codec in codecs) for protocol, codecs in PROTOCOL_PACKETS.items()}
+
+# Packets whose last nibble must be EOL (index into the device's packets)
+EOL_PACKETS = {
+    BattleProtocol.DMC_BS: (),
+    BattleProtocol.DM20_BS: (2, 3, 4, 5, 6, 7, 8, 9),
+    BattleProtocol.PEN20_BS: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+    BattleProtocol.DMX_BS: (2, 3, 4, 5),
+}
+
+
+@dataclass
+class TraceBattle:
+    """A captured battle: the packets of both devices and the winner shown (if known)."""
+    protocol: BattleProtocol
+    device1_packets: List[bytes]
+    device2_packets: List[bytes]
+    winner: str = None
+
+
+@dataclass
+class BattleRecord:
+    """A decoded battle with the outcome re-simulated from its packets."""
+    protocol: BattleProtocol
+    device1: dict
+    device2: dict
+    winner: str
+    device1_hp: int
+    device2_hp: int
+    errors: List[str] = field(default_factory=list)
+
+
+#=====================================================================
+# Decoding
+#=====================================================================
+
+def decode_dmc(packets: List[bytes]) -> dict:
+    packet1, packet2 = DMC_PACKETS[0].decode(packets[0]), DMC_PACKETS[1].decode(packets[1])
+    fields = {**packet1, "operation2": packet2["operation"], "shot": packet2["shot"], "outcome": packet2["outcome"]}
+    fields["check"] = (packet1["check"], packet2["check"])
+    return fields
+
+
+def decode_dm20(packets: List[bytes]) -> dict:
+    fields = DM20_DECODER(packets)
+    fields["tamer"] = bytes((fields["name1"], fields["name2"], fields["name3"], fields["name4"])).decode("latin-1")
+    return fields
+
+
+DECODERS = {
+    BattleProtocol.DMC_BS: decode_dmc,
+    BattleProtocol.DM20_BS: decode_dm20,
+    BattleProtocol.PEN20_BS: PEN20_DECODER,
+    BattleProtocol.DMX_BS: DMX_DECODER,
+}
+
+
+#=====================================================================
+# Validation
+#=====================================================================
+
+def validate_packets(protocol: BattleProtocol, packets: List[bytes], fields: dict, device: str) -> List[str]:
+    """Checks packet EOLs and checksums of one device. Returns a list of errors."""
+    errors = []
+    for index in EOL_PACKETS[protocol]:
+        if packets[index][-1] & 0b1111 != EOL:
+            errors.append(f"{device} packet {index + 1}: bad EOL")
+
+    if protocol == BattleProtocol.DMC_BS:
+        if fields["cou"] != DMC_COU:
+            errors.append(f"{device} packet 1: bad COU")
+        for index, check in enumerate(fields["check"]):
+            if dmc_checksum(packets[index]) != check:
+                errors.append(f"{device} packet {index + 1}: checksum mismatch")
+    elif protocol == BattleProtocol.DMX_BS:
+        if nibble_check(fields["hits"], 0, packets[5][1]) != fields["check"]:
+            errors.append(f"{device} packet 6: check mismatch")
+    else:
+        if nibble_check(fields["hits"], fields["dodges"], packets[9][1]) != fields["check"]:
+            errors.append(f"{device} packet A: check mismatch")
+    return errors
+
+
+#=====================================================================
+# Outcome re-simulation
+#=====================================================================
+# Same turn rules as BattleSimulator._simulate_*, without building battle logs.
+
+@lru_cache(maxsize=None)
+def _dmx_pattern(level, mini_game):
+    return tuple(get_attack_pattern(level, mini_game, protocol="DMX"))
+
+
+@lru_cache(maxsize=None)
+def _dm20_pattern(tag_meter, mini_game):
+    return tuple(get_dm20_attack_pattern(tag_meter, mini_game))
+
+
+PEN20_PATTERN = tuple(get_attack_pattern(0, 0, protocol="PEN20"))
+
+
+def _hit_bits(hits):
+    """Hit flags in turn order (MSB of the 4-bit hits field is turn 1)."""
+    return ((hits >> 3) & 1, (hits >> 2) & 1, (hits >> 1) & 1, hits & 1)
+
+
+def _compare_hp(hp1, hp2):
+    if hp1 > hp2:
+        return "device1"
+    if hp2 > hp1:
+        return "device2"
+    return "draw"
+
+
+def resimulate(protocol: BattleProtocol, device1: dict, device2: dict):
+    """Returns (winner, device1 hp, device2 hp) for decoded packets."""
+    if protocol == BattleProtocol.DMC_BS:
+        # The outcome is exchanged in packet 2; HP is not part of the protocol
+        return ("device1" if device1["outcome"] == 1 else "device2"), None, None
+
+    hits1, hits2 = _hit_bits(device1["hits"]), _hit_bits(device2["hits"])
+    if protocol == BattleProtocol.DMX_BS:
+        pattern1 = _dmx_pattern(device1["level"], device1["mini_game"])
+        pattern2 = _dmx_pattern(device2["level"], device2["mini_game"])
+        hp1, hp2 = device1["hp"], device2["hp"]
+        for turn in range(5):
+            index = turn % 4
+            hp2 = max(0, hp2 - (pattern1[index] if hits1[index] else 0))
+            hp1 = max(0, hp1 - (pattern2[index] if hits2[index] else 0))
+            if hp1 == 0 or hp2 == 0:
+                break
+        return _compare_hp(hp1, hp2), hp1, hp2
+
+    if protocol == BattleProtocol.DM20_BS:
+        pattern1 = _dm20_pattern(device1["tag_meter"], device1["mini_game"])
+        pattern2 = _dm20_pattern(device2["tag_meter"], device2["mini_game"])
+        hp1 = hp2 = 4
+    else:
+        pattern1 = pattern2 = PEN20_PATTERN
+        hp1 = hp2 = 3
+
+    for turn in range(6):
+        index = turn % 4
+        hp2 = max(0, hp2 - (pattern1[index] if hits1[index] else 0))
+        hp1 = max(0, hp1 - (pattern2[index] if hits2[index] else 0))
+        if protocol == BattleProtocol.DM20_BS:
+            # Device 1 attacks first, so it wins when both fall in the same turn
+            if hp1 == 0 and hp2 == 0:
+                return "device1", hp1, hp2
+            if hp1 == 0:
+                return "device2", hp1, hp2
+            if hp2 == 0:
+                return "device1", hp1, hp2
+        elif hp1 == 0 or hp2 == 0:
+            break
+    return _compare_hp(hp1, hp2), hp1, hp2
+
+
+def decode_battle(battle: TraceBattle) -> BattleRecord:
+    """Decodes, validates and re-simulates one captured battle."""
+    protocol = battle.protocol
+    sizes = PACKET_SIZES[protocol]
+    errors = []
+    for device, packets in (("device1", battle.device1_packets), ("device2", battle.device2_packets)):
+        if tuple(map(len, packets)) != sizes:
+            errors.append(f"{device}: expected packets of {sizes} bytes")
+    if errors:
+        return BattleRecord(protocol, {}, {}, None, None, None, errors)
+
+    decoder = DECODERS[protocol]
+    device1, device2 = decoder(battle.device1_packets), decoder(battle.device2_packets)
+    errors += validate_packets(protocol, battle.device1_packets, device1, "device1")
+    errors += validate_packets(protocol, battle.device2_packets, device2, "device2")
+
+    if protocol == BattleProtocol.DMC_BS and device1["outcome"] + device2["outcome"] != 1:
+        errors.append("outcomes do not oppose")
+    winner, hp1, hp2 = resimulate(protocol, device1, device2)
+    if battle.winner is not None and battle.winner != winner:
+        errors.append(f"outcome mismatch: recorded {battle.winner}, re-simulated {winner}")
+    return BattleRecord(protocol, device1, device2, winner, hp1, hp2, errors)
+
+
+#=====================================================================
+# Trace files
+#=====================================================================
+
+def parse_hex_line(line: str) -> TraceBattle:
+    """Parses 'PROTOCOL hex hex ... | hex hex ... [| winner]'."""
+    parts = [part.split() for part in line.split("|")]
+    protocol = BattleProtocol[parts[0][0]]
+    device1 = [bytes.fromhex(packet) for packet in parts[0][1:]]
+    device2 = [bytes.fromhex(packet) for packet in parts[1]]
+    winner = parts[2][0] if len(parts) > 2 and parts[2] else None
+    return TraceBattle(protocol, device1, device2, winner)
+
+
+def format_hex_line(battle: TraceBattle) -> str:
+    line = f"{battle.protocol.name} {' '.join(p.hex() for p in battle.device1_packets)} | {' '.join(p.hex() for p in battle.device2_packets)}"
+    return f"{line} | {battle.winner}" if battle.winner else line
+
+
+def read_trace(path: str):
+    """Yields every TraceBattle of a hex or binary trace file."""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if not data.startswith(MAGIC):
+        for number, line in enumerate(data.decode("utf-8").splitlines(), 1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            try:
+                yield parse_hex_line(line)
+            except (KeyError, ValueError, IndexError) as e:
+                raise ValueError(f"{path}:{number}: unreadable battle ({e})")
+        return
+
+    view = memoryview(data)
+    offset = len(MAGIC)
+    while offset < len(data):
+        start = offset
+        if offset + RECORD.size > len(data):
+            raise ValueError(f"{path}: truncated record at byte {start}")
+        protocol_id, winner_id, count1, count2 = RECORD.unpack_from(data, offset)
+        if protocol_id not in PROTOCOLS_BY_ID or winner_id >= len(WINNERS):
+            raise ValueError(f"{path}: unknown protocol {protocol_id} or winner {winner_id} at byte {start}")
+        offset += RECORD.size
+        packets = []
+        for _ in range(count1 + count2):
+            if offset >= len(data) or offset + 1 + data[offset] > len(data):
+                raise ValueError(f"{path}: truncated record at byte {start}")
+            length = data[offset]
+            packets.append(bytes(view[offset + 1:offset + 1 + length]))
+            offset += 1 + length
+        yield TraceBattle(PROTOCOLS_BY_ID[protocol_id], packets[:count1], packets[count1:], WINNERS[winner_id])
+
+
+def write_trace(path: str, battles, binary: bool = True) -> int:
+    """Writes battles as a binary (default) or hex trace. Returns the number written."""
+    count = 0
+    if binary:
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            for battle in battles:
+                chunks = [RECORD.pack(PROTOCOL_IDS[battle.protocol], WINNER_IDS[battle.winner],
+                                      len(battle.device1_packets), len(battle.device2_packets))]
+                for packet in battle.device1_packets + battle.device2_packets:
+                    chunks.append(bytes((len(packet),)))
+                    chunks.append(packet)
+                f.write(b"".join(chunks))
+                count += 1
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            for battle in battles:
+                f.write(format_hex_line(battle) + "\n")
+                count += 1
+    return count
+
+
+#=====================================================================
+# Bulk processing
+#=====================================================================
+
+@dataclass
+class TraceReport:
+    battles: int = 0
+    invalid: int = 0
+    mismatches: int = 0
+    elapsed: float = 0.0
+    by_protocol: dict = field(default_factory=dict)
+    issues: list = field(default_factory=list)  # (battle number, protocol, errors), first max_issues only
+
+    @property
+    def rate(self) -> float:
+        return self.battles / self.elapsed if self.elapsed else 0.0
+
+
+def process_trace(battles, max_issues: int = 20) -> TraceReport:
+    """Decodes and validates every battle, counting invalid packets and outcome mismatches."""
+    report = TraceReport()
+    start = time.perf_counter()
+    for number, battle in enumerate(battles, 1):
+        record = decode_battle(battle)
+        report.battles += 1
+        report.by_protocol[battle.protocol.name] = report.by_protocol.get(battle.protocol.name, 0) + 1
+        if record.errors:
+            if any(error.startswith("outcome mismatch") for error in record.errors):
+                report.mismatches += 1
+            else:
+                report.invalid += 1
+            if len(report.issues) < max_issues:
+                report.issues.append((number, battle.protocol.name, record.errors))
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def random_digimon(rng: random.Random, name: str) -> Digimon:
+    """A random Digimon within the field ranges every protocol can encode."""
+    return Digimon(
+        name=name, order=0, traited=rng.randint(0, 1), egg_shake=rng.randint(0, 1),
+        index=rng.randint(0, 63), hp=rng.randint(1, 15), attribute=rng.randint(0, 3),
+        power=rng.randint(1, 63), handicap=0, buff=rng.randint(0, 3), mini_game=rng.randint(0, 15),
+        level=rng.randint(1, 10), stage=rng.randint(0, 5), sick=rng.randint(0, 1),
+        # DMX packet 4 shares bits between HP and the high nibble of Shot M, keep it clear
+        shot1=rng.randint(0, 15), shot2=rng.randint(0, 255), tag_meter=rng.randint(0, 4),
+    )
+
+
+def generate_battles(count: int, protocols=None, seed: int = None):
+    """Yields simulated battles (packets and winner) for building sample traces."""
+    rng = random.Random(seed)
+    random.seed(seed)  # The device classes roll hits with the global RNG
+    protocols = list(protocols or BattleProtocol)
+    simulators = {protocol: BattleSimulator(protocol) for protocol in protocols}
+    for _ in range(count):
+        protocol = rng.choice(protocols)
+        result = simulators[protocol].simulate(random_digimon(rng, "A"), random_digimon(rng, "B"))
+        yield TraceBattle(protocol, list(result.device1_packets), list(result.device2_packets), result.winner)
@@ -0,0 +1,540 @@
+"""
+Tournament
+LAN tournaments between several Omnimon devices. One device hosts: every
+participant (the host included) keeps a single TCP connection for the whole
+tournament, the host simulates the independent pairings of each round
+concurrently and streams every result back as soon as it is known.
+Pygame-free, so it also runs in headless instances (utilities/tournament_loopback.py).
+"""
+
+import json
+import os
+import queue
+import random
+import socket
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from core.combat.sim.global_battle_simulator import GlobalBattleSimulator
+from core.combat.sim.models import Digimon
+
+#=====================================================================
+# Protocol
+#=====================================================================
+# One compact JSON object per line. "t" is the message type:
+#   join    client -> host  {"t":"join","name":"ABCD","team":[pet data...]}
+#   welcome host -> client  {"t":"welcome","id":1}
+#   start   host -> all     {"t":"start","mode":"bracket","players":["ABCD",...],"module":"DMC"}
+#   round   host -> all     {"t":"round","n":1,"pairs":[[0,1],...],"byes":[2],"standings":[...]}
+#   result  host -> all     {"t":"result","n":1,"p":[0,1],"w":0,"hp":[3,0]}
+#   ready   client -> host  {"t":"ready","n":1}
+#   final   host -> all     {"t":"final","standings":[...],"champion":0}
+# Standings are [[player id, wins, losses, hp left], ...], best first.
+# Results of walkovers (opponent disconnected) carry "wo":1.
+
+TOURNAMENT_PORT = 12347
+MODES = ("bracket", "league")
+MAX_PLAYERS = 8
+JOIN_TIMEOUT = 5.0     # Seconds a new connection has to send its join message
+READY_TIMEOUT = 15.0   # Seconds the host waits for ready acks between rounds
+DEFAULT_RULES = (5, 3)  # (attribute advantage, damage limit) when no module is shared
+
+
+def send_message(sock: socket.socket, message: dict) -> None:
+    sock.sendall(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+
+
+def read_messages(sock: socket.socket):
+    """Yields messages from sock until the connection closes."""
+    buffer = b""
+    while True:
+        data = sock.recv(4096)
+        if not data:
+            return
+        buffer += data
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            if line.strip():
+                yield json.loads(line)
+
+
+#=====================================================================
+# Matches
+#=====================================================================
+
+def team_from_pet_data(pet_data: list) -> list:
+    """Builds simulator Digimon from SceneConnect.create_pet_data() dicts (no mini-game or item boosts)."""
+    return [Digimon(
+        name=pet["name"],
+        order=i,
+        traited=1 if pet.get("traited") else 0,
+        egg_shake=1 if pet.get("shook") else 0,
+        index=i,
+        hp=pet["hp"],
+        attribute=pet["attribute"],
+        power=pet["power"],
+        handicap=0,
+        buff=0,
+        mini_game=1,
+        level=pet["level"],
+        stage=pet["stage"],
+        sick=1 if pet.get("sick") else 0,
+        shot1=pet.get("atk_main", 0),
+        shot2=pet.get("atk_alt", 0),
+        tag_meter=0
+    ) for i, pet in enumerate(pet_data)]
+
+
+def match_seed(seed: int, round_number: int, player_a: int, player_b: int) -> int:
+    """Seed of one match, so results do not depend on which worker runs it first."""
+    return ((seed * 1000003 + round_number) * 1009 + player_a) * 1009 + player_b
+
+
+def simulate_match(args: tuple) -> tuple:
+    """
+    Simulates one pairing. args is (seed, team_a, team_b, attribute_advantage,
+    damage_limit) with teams as pet data lists, so it can run in a process pool.
+    Returns (a_won, hp left by a, hp left by b).
+    """
+    seed, team_a, team_b, attribute_advantage, damage_limit = args
+    sim = GlobalBattleSimulator(
+        attribute_advantage=attribute_advantage,
+        damage_limit=damage_limit,
+        pvp_mode=True,
+        rng=random.Random(seed)
+    )
+    result = sim.simulate(team_from_pet_data(team_a), team_from_pet_data(team_b))
+    return (result.winner == "device1",
+            sum(status.hp for status in result.device1_final),
+            sum(status.hp for status in result.device2_final))
+
+
+#=====================================================================
+# Pairings and standings
+#=====================================================================
+
+def round_robin_rounds(players: list) -> list:
+    """Every round of a round robin (circle method): [(pairs, byes), ...]."""
+    entrants = list(players) + ([None] if len(players) % 2 else [])
+    rounds = []
+    for _ in range(len(entrants) - 1):
+        half = len(entrants) // 2
+        pairs, byes = [], []
+        for a, b in zip(entrants[:half], reversed(entrants[half:])):
+            if a is None or b is None:
+                byes.append(b if a is None else a)
+            else:
+                pairs.append((a, b))
+        rounds.append((pairs, byes))
+        entrants = [entrants[0], entrants[-1]] + entrants[1:-1]
+    return rounds
+
+
+class Tournament:
+    """
+    Pairings and standings of a single elimination bracket or a league (round robin).
+    Players are ids; the bracket is seeded in the given order and padded to a power
+    of two, so the top seeds get every bye in the first round. Should a drop leave
+    an odd count later, the bye goes to the best seed that has not had one yet.
+    """
+
+    def __init__(self, players: list, mode: str = "bracket") -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown tournament mode: {mode}")
+        self.players = list(players)
+        self.mode = mode
+        self.round = 0
+        self.stats = {player: [0, 0, 0] for player in self.players}  # wins, losses, hp left
+        self.remaining = list(self.players)  # Bracket entrants still in
+        self.dropped = set()
+        self.schedule = round_robin_rounds(self.players) if mode == "league" else None
+        self.had_bye = set()
+        self._round_winners = []
+
+    @property
+    def finished(self) -> bool:
+        if self.mode == "league":
+            return self.round >= len(self.schedule)
+        return len(self.remaining) <= 1
+
+    @property
+    def champion(self):
+        if not self.finished:
+            return None
+        if self.mode == "league":
+            return self.standings()[0][0] if self.players else None
+        return self.remaining[0] if self.remaining else None
+
+    def next_round(self) -> tuple:
+        """Starts the next round and returns its (pairs, byes)."""
+        if self.finished:
+            return [], []
+        if self.mode == "league":
+            pairs, byes = self.schedule[self.round]
+        else:
+            entrants = self.remaining
+            if self.round == 0:
+                bye_count = (1 << (len(entrants) - 1).bit_length()) - len(entrants)
+            else:
+                bye_count = len(entrants) % 2
+            candidates = [player for player in entrants if player not in self.had_bye]
+            candidates += [player for player in entrants if player in self.had_bye]
+            byes = candidates[:bye_count]
+            self.had_bye.update(byes)
+            playing = [player for player in entrants if player not in byes]
+            pairs = list(zip(playing[0::2], playing[1::2]))
+            self._round_winners = []
+        self.round += 1
+        return pairs, byes
+
+    def record(self, player_a: int, player_b: int, a_won: bool, hp_a: int = 0, hp_b: int = 0) -> int:
+        """Records a result and returns the winner."""
+        winner, loser = (player_a, player_b) if a_won else (player_b, player_a)
+        self.stats[winner][0] += 1
+        self.stats[loser][1] += 1
+        self.stats[player_a][2] += hp_a
+        self.stats[player_b][2] += hp_b
+        self._round_winners.append(winner)
+        return winner
+
+    def end_round(self, byes: list) -> None:
+        """Advances bracket winners and byes (in seeding order) to the next round."""
+        if self.mode == "bracket":
+            advancing = set(self._round_winners) | set(byes)
+            self.remaining = [player for player in self.remaining if player in advancing and player not in self.dropped]
+
+    def drop(self, player: int) -> None:
+        """Removes a disconnected player: every later match of theirs is a walkover."""
+        self.dropped.add(player)
+
+    def walkover(self, player_a: int, player_b: int):
+        """Returns a_won for a match decided by a disconnection, or None if both are still in."""
+        if player_a in self.dropped or player_b in self.dropped:
+            return player_b in self.dropped
+        return None
+
+    def standings(self) -> list:
+        """[[player, wins, losses, hp left], ...] by wins, then hp left."""
+        rows = [[player, *self.stats[player]] for player in self.players]
+        rows.sort(key=lambda row: (-row[1], -row[3], row[0]))
+        return rows
+
+
+def play_local(teams: list, mode: str = "bracket", seed: int = 0, rules: tuple = DEFAULT_RULES) -> Tournament:
+    """Plays a whole tournament in this process, one match at a time (reference for the LAN host)."""
+    tournament = Tournament(range(len(teams)), mode)
+    while not tournament.finished:
+        pairs, byes = tournament.next_round()
+        for a, b in pairs:
+            a_won, hp_a, hp_b = simulate_match((match_seed(seed, tournament.round, a, b), teams[a], teams[b], *rules))
+            tournament.record(a, b, a_won, hp_a, hp_b)
+        tournament.end_round(byes)
+    return tournament
+
+
+#=====================================================================
+# TournamentState - What a participant knows, built from host messages
+#=====================================================================
+
+class TournamentState:
+    """Tournament progress as seen by a participant, updated by apply()."""
+
+    def __init__(self) -> None:
+        self.player_id = None
+        self.mode = None
+        self.module = None
+        self.players = []
+        self.round = 0
+        self.pairs = []
+        self.byes = []
+        self.results = []
+        self.standings = []
+        self.champion = None
+        self.finished = False
+        self.version = 0  # Bumped on every message, for redraws
+
+    def apply(self, message: dict) -> None:
+        kind = message.get("t")
+        if kind == "welcome":
+            self.player_id = message["id"]
+        elif kind == "start":
+            self.mode = message["mode"]
+            self.module = message.get("module")
+            self.players = message["players"]
+        elif kind == "round":
+            self.round = message["n"]
+            self.pairs = message["pairs"]
+            self.byes = message["byes"]
+            self.standings = message["standings"]
+            self.results = []
+        elif kind == "result":
+            self.results.append(message)
+        elif kind == "final":
+            self.standings = message["standings"]
+            self.champion = message["champion"]
+            self.finished = True
+        self.version += 1
+
+    @property
+    def round_complete(self) -> bool:
+        return self.round > 0 and len(self.results) >= len(self.pairs)
+
+    def name(self, player) -> str:
+        if player is None or not 0 <= player < len(self.players):
+            return "-"
+        return self.players[player]
+
+
+#=====================================================================
+# TournamentHost
+#=====================================================================
+
+class Participant:
+    def __init__(self, player_id: int, name: str, team: list, sock: socket.socket = None) -> None:
+        self.id = player_id
+        self.name = name
+        self.team = team
+        self.sock = sock  # None for the host's own team
+        self.connected = True
+
+
+class TournamentHost:
+    """
+    Accepts participants on a TCP port (lobby), then runs the tournament from
+    run(), usually on a network thread. The host's own team is player 0.
+    Matches of a round run on a thread pool, or a process pool with
+    use_processes; results are broadcast in completion order.
+    """
+
+    def __init__(self, name: str, team: list, mode: str = "bracket", port: int = TOURNAMENT_PORT,
+                 address: str = "0.0.0.0", workers: int = None, use_processes: bool = False,
+                 seed: int = None, log=print) -> None:
+        self.mode = mode
+        self.port = port
+        self.address = address
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.use_processes = use_processes
+        self.seed = random.randrange(1 << 30) if seed is None else seed
+        self.log = log
+        self.participants = [Participant(0, name, team)]
+        self.state = TournamentState()
+        self.state.apply({"t": "welcome", "id": 0})
+        self.tournament = None
+        self.server_socket = None
+        self.running = False
+        self.inbox = queue.Queue()  # (player id, message or None on disconnect)
+        self.lock = threading.Lock()
+
+    # -----------------------------------------------------------------
+    # Lobby
+    # -----------------------------------------------------------------
+    def open_lobby(self) -> None:
+        """Starts accepting participants."""
+        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server_socket.bind((self.address, self.port))
+        self.server_socket.listen(MAX_PLAYERS)
+        self.server_socket.settimeout(1.0)
+        self.running = True
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        self.log(f"[Tournament] Lobby open on port {self.port}")
+
+    def _accept_loop(self) -> None:
+        while self.running and self.tournament is None:
+            try:
+                sock, addr = self.server_socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            try:
+                self._admit(sock, addr)
+            except Exception as e:
+                self.log(f"[Tournament] Rejected {addr}: {e}")
+                sock.close()
+
+    def _admit(self, sock: socket.socket, addr) -> None:
+        sock.settimeout(JOIN_TIMEOUT)
+        join = next(read_messages(sock))
+        if join.get("t") != "join":
+            raise ValueError("expected a join message")
+        with self.lock:
+            if self.tournament is not None or len(self.participants) >= MAX_PLAYERS:
+                raise ValueError("tournament full or already started")
+            participant = Participant(len(self.participants), join["name"], join["team"], sock)
+            sock.settimeout(None)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            send_message(sock, {"t": "welcome", "id": participant.id})
+            self.participants.append(participant)
+        threading.Thread(target=self._read_loop, args=(participant,), daemon=True).start()
+        self.log(f"[Tournament] {participant.name} joined from {addr[0]} as player {participant.id}")
+
+    def _read_loop(self, participant: Participant) -> None:
+        try:
+            for message in read_messages(participant.sock):
+                self.inbox.put((participant.id, message))
+        except (OSError, ValueError):
+            pass
+        self.inbox.put((participant.id, None))
+
+    def player_names(self) -> list:
+        with self.lock:
+            return [participant.name for participant in self.participants]
+
+    # -----------------------------------------------------------------
+    # Tournament
+    # -----------------------------------------------------------------
+    def broadcast(self, message: dict) -> None:
+        self.state.apply(message)
+        for participant in self.participants:
+            if participant.sock and participant.connected:
+                try:
+                    send_message(participant.sock, message)
+                except OSError:
+                    self._disconnect(participant)
+
+    def _disconnect(self, participant: Participant) -> None:
+        if participant.connected:
+            participant.connected = False
+            self.tournament.drop(participant.id)
+            self.log(f"[Tournament] {participant.name} disconnected (forfeits)")
+
+    def _drain_inbox(self, timeout: float):
+        try:
+            player_id, message = self.inbox.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if message is None:
+            self._disconnect(self.participants[player_id])
+        return player_id, message
+
+    def run(self, rules: tuple = DEFAULT_RULES, module: str = None) -> Tournament:
+        """Closes the lobby and plays every round. Returns the finished Tournament."""
+        with self.lock:
+            self.tournament = Tournament([participant.id for participant in self.participants], self.mode)
+        if self.server_socket:
+            self.server_socket.close()
+        while self._drain_inbox(0) is not None:
+            pass  # Players who left the lobby forfeit from the first round
+        self.broadcast({"t": "start", "mode": self.mode, "players": [participant.name for participant in self.participants],
+                        "module": module})
+
+        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=self.workers) as pool:
+            while not self.tournament.finished and self.running:
+                self._play_round(pool, rules)
+
+        tournament = self.tournament
+        self.broadcast({"t": "final", "standings": tournament.standings(), "champion": tournament.champion})
+        self.log(f"[Tournament] Finished, champion: {self.state.name(tournament.champion)}")
+        return tournament
+
+    def _play_round(self, pool, rules: tuple) -> None:
+        tournament = self.tournament
+        pairs, byes = tournament.next_round()
+        number = tournament.round
+        self.broadcast({"t": "round", "n": number, "pairs": pairs, "byes": byes, "standings": tournament.standings()})
+
+        futures = {}
+        for a, b in pairs:
+            a_won = tournament.walkover(a, b)
+            if a_won is not None:
+                tournament.record(a, b, a_won)
+                self.broadcast({"t": "result", "n": number, "p": [a, b], "w": a if a_won else b, "hp": [0, 0], "wo": 1})
+                continue
+            args = (match_seed(self.seed, number, a, b), self.participants[a].team, self.participants[b].team, *rules)
+            futures[pool.submit(simulate_match, args)] = (a, b)
+
+        for future in as_completed(futures):
+            a, b = futures[future]
+            a_won, hp_a, hp_b = future.result()
+            winner = tournament.record(a, b, a_won, hp_a, hp_b)
+            self.broadcast({"t": "result", "n": number, "p": [a, b], "w": winner, "hp": [hp_a, hp_b]})
+        tournament.end_round(byes)
+
+        if not tournament.finished:
+            self._wait_ready(number)
+
+    def _wait_ready(self, number: int) -> None:
+        """Waits until every connected participant acked the round (or READY_TIMEOUT)."""
+        waiting = {participant.id for participant in self.participants if participant.sock and participant.connected}
+        deadline = READY_TIMEOUT
+        while waiting and deadline > 0 and self.running:
+            received = self._drain_inbox(0.25)
+            deadline -= 0.25
+            if received is None:
+                continue
+            player_id, message = received
+            if message is None or (message.get("t") == "ready" and message.get("n") == number):
+                waiting.discard(player_id)
+        if waiting:
+            self.log(f"[Tournament] No ready from players {sorted(waiting)}, continuing")
+
+    def stop(self) -> None:
+        self.running = False
+        if self.server_socket:
+            try:
+                self.server_socket.close()
+            except OSError:
+                pass
+        for participant in self.participants:
+            if participant.sock:
+                try:
+                    participant.sock.close()
+                except OSError:
+                    pass
+
+
+#=====================================================================
+# TournamentClient
+#=====================================================================
+
+class TournamentClient:
+    """A participant connected to a TournamentHost; a reader thread keeps state up to date."""
+
+    def __init__(self, name: str, team: list, log=print) -> None:
+        self.name = name
+        self.team = team
+        self.log = log
+        self.state = TournamentState()
+        self.sock = None
+        self.connected = False
+        self.messages = queue.Queue()
+
+    def connect(self, address: str, port: int = TOURNAMENT_PORT, timeout: float = 5.0) -> None:
+        self.sock = socket.create_connection((address, port), timeout=timeout)
+        self.sock.settimeout(None)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        send_message(self.sock, {"t": "join", "name": self.name, "team": self.team})
+        self.connected = True
+        threading.Thread(target=self._read_loop, daemon=True).start()
+
+    def _read_loop(self) -> None:
+        try:
+            for message in read_messages(self.sock):
+                self.state.apply(message)
+                self.messages.put(message)
+                if message.get("t") == "final":
+                    break
+        except (OSError, ValueError) as e:
+            if self.connected and not self.state.finished:
+                self.log(f"[Tournament] Connection lost: {e}")
+        self.connected = False
+        self.messages.put(None)
+
+    def ready(self, round_number: int) -> None:
+        """Tells the host this device is ready for the round after round_number."""
+        if self.connected:
+            try:
+                send_message(self.sock, {"t": "ready", "n": round_number})
+            except OSError:
+                self.connected = False
+
+    def close(self) -> None:
+        self.connected = False
+        if self.sock:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
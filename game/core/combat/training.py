@@ -8,7 +8,7 @@ from core.animation import PetFrame
 from game.core.combat import combat_constants
 import game.core.constants as constants
 from core.utils.pet_utils import distribute_pets_evenly, get_training_targets
-from core.utils.pygame_utils import blit_with_shadow, load_attack_sprites, module_attack_sprites, sprite_load_percent
+from core.utils.pygame_utils import blit_with_shadow, load_attack_sprites, load_font, module_attack_sprites, render_text
 from core.utils.scene_utils import change_scene
 from game.core.game_quest import QuestType
 from game.core.utils.quest_event_utils import update_quest_progress
@@ -36,18 +36,18 @@ class Training:
         self.pet_state = None
 
         # Load and cache all sprites once
-        self._sprite_cache['ready'] = sprite_load_percent(constants.READY_SPRITE_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
-        self._sprite_cache['go'] = sprite_load_percent(constants.GO_SPRITE_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
-        self._sprite_cache['bar_piece'] = sprite_load_percent(constants.BAR_PIECE_PATH, percent=(int(12 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
-        self._sprite_cache['training_max'] = sprite_load_percent(constants.TRAINING_MAX_PATH, percent=(int(60 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
-        self._sprite_cache['bar_back'] = sprite_load_percent(constants.BAR_BACK_PATH, percent=(int(170 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
-        self._sprite_cache['battle1'] = sprite_load_percent(constants.BATTLE1_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
-        self._sprite_cache['battle2'] = sprite_load_percent(constants.BATTLE2_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
-        self._sprite_cache['bad'] = sprite_load_percent(constants.BAD_SPRITE_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
-        self._sprite_cache['good'] = sprite_load_percent(constants.GOOD_SPRITE_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
-        self._sprite_cache['great'] = sprite_load_percent(constants.GREAT_SPRITE_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
-        self._sprite_cache['excellent'] = sprite_load_percent(constants.EXCELLENT_SPRITE_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
-        self._sprite_cache['trophy'] = sprite_load_percent(constants.TROPHIES_ICON_PATH, percent=(int(24 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
+        self._sprite_cache['ready'] = runtime_globals.game_assets.get_sprite(constants.READY_SPRITE_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
+        self._sprite_cache['go'] = runtime_globals.game_assets.get_sprite(constants.GO_SPRITE_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
+        self._sprite_cache['bar_piece'] = runtime_globals.game_assets.get_sprite(constants.BAR_PIECE_PATH, percent=(int(12 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
+        self._sprite_cache['training_max'] = runtime_globals.game_assets.get_sprite(constants.TRAINING_MAX_PATH, percent=(int(60 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
+        self._sprite_cache['bar_back'] = runtime_globals.game_assets.get_sprite(constants.BAR_BACK_PATH, percent=(int(170 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
+        self._sprite_cache['battle1'] = runtime_globals.game_assets.get_sprite(constants.BATTLE1_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
+        self._sprite_cache['battle2'] = runtime_globals.game_assets.get_sprite(constants.BATTLE2_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
+        self._sprite_cache['bad'] = runtime_globals.game_assets.get_sprite(constants.BAD_SPRITE_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
+        self._sprite_cache['good'] = runtime_globals.game_assets.get_sprite(constants.GOOD_SPRITE_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
+        self._sprite_cache['great'] = runtime_globals.game_assets.get_sprite(constants.GREAT_SPRITE_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
+        self._sprite_cache['excellent'] = runtime_globals.game_assets.get_sprite(constants.EXCELLENT_SPRITE_PATH, 100, keep_proportion=True, base_on="width", alpha=False)
+        self._sprite_cache['trophy'] = runtime_globals.game_assets.get_sprite(constants.TROPHIES_ICON_PATH, percent=(int(24 * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
 
         self.attack_jump = 0
         self.attack_forward = 0
@@ -96,7 +96,7 @@ class Training:
         if self.frame_counter >= combat_constants.ALERT_DURATION_FRAMES:
             self.phase = "charge"
             self.frame_counter = 0
-            self.bar_timer = pygame.time.get_ticks()
+            self.bar_timer = runtime_globals.game_clock.ticks_ms
 
     def update_charge_phase(self):
         pass
@@ -179,8 +179,8 @@ class Training:
         if quantity > 0:
             """Draw a small trophy icon with +1 in the bottom right corner"""
             trophy_size = int(24 * constants.UI_SCALE)
-            font = pygame.font.Font(None, int(24 * constants.UI_SCALE))
-            plus_text = font.render(f"+{quantity}", True, constants.FONT_COLOR_YELLOW)
+            font = load_font(None, int(24 * constants.UI_SCALE))
+            plus_text = render_text(font, f"+{quantity}", True, constants.FONT_COLOR_YELLOW)
 
             # Draw trophy icon in bottom right
             trophy_x = constants.SCREEN_WIDTH - trophy_size - plus_text.get_width() - int(4 * constants.UI_SCALE)
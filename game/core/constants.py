@@ -24,7 +24,9 @@ DEFAULT_CONFIG = {
     "DEBUG_FILE_LOGGING": False,
     "SHOW_FPS": False,
     "DEBUG_BLIT_LOGGING": False,
-    "DEBUG_BATTLE_INFO": False
+    "DEBUG_BATTLE_INFO": False,
+    "LOG_LEVEL": "INFO",
+    "MODULE_HOT_RELOAD": False
 }
 
 try:
@@ -45,6 +47,8 @@ DEBUG_FILE_LOGGING = user_config.get("DEBUG_FILE_LOGGING", user_config.get("LOGG
 SHOW_FPS = user_config.get("SHOW_FPS", DEFAULT_CONFIG["SHOW_FPS"])
 DEBUG_BLIT_LOGGING = user_config.get("DEBUG_BLIT_LOGGING", user_config.get("LOG_BLITS", DEFAULT_CONFIG["DEBUG_BLIT_LOGGING"]))  # Backward compatibility
 DEBUG_BATTLE_INFO = user_config.get("DEBUG_BATTLE_INFO", DEFAULT_CONFIG["DEBUG_BATTLE_INFO"])
+LOG_LEVEL = user_config.get("LOG_LEVEL", DEFAULT_CONFIG["LOG_LEVEL"])  # DEBUG, INFO, WARNING or ERROR
+MODULE_HOT_RELOAD = user_config.get("MODULE_HOT_RELOAD", DEFAULT_CONFIG["MODULE_HOT_RELOAD"])  # Watch modules/ and reload edited modules
 
 # Legacy aliases for backward compatibility
 DEBUG = DEBUG_MODE
@@ -141,6 +145,9 @@ BACKGROUND_COLOR = (198, 203, 173)
 # Paths: General Resources
 #=====================================================================
 MODULES_FOLDER = "modules"
+CACHE_FOLDER = "save/cache"
+MODULE_SYNC_FOLDER = "save/module_sync"  # Partial module downloads from other devices (resumable)
+ASSET_CACHE_BUDGET = 16 * 1024 * 1024  # Bytes of decoded UI sprites kept in memory by GameAssets
 ARROW_IMAGE_PATH = "assets/Arrow.png"
 FOOD_SHEET_PATH = "assets/FoodVitamin.png"
 ATK_FOLDER = "assets/atk"
@@ -0,0 +1,222 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+import pygame
+
+#=====================================================================
+# FrameProfiler - Per-scene frame time breakdown and trace export
+#=====================================================================
+
+# Frames kept per scene and section for the rolling percentiles
+PROFILE_HISTORY_SIZE = 300
+
+# Frames between overlay redraws (rendering text every frame would show up in the profile)
+OVERLAY_REFRESH_FRAMES = 30
+
+# Frames captured by a trace when no count is given
+TRACE_FRAMES = 300
+
+
+class FrameProfiler:
+    """
+    Times named sections of each frame (scene update/draw, pet updates, blits,
+    scaling, display flip) and keeps rolling per-scene histories.
+
+    Sections are timed only while the overlay is shown or a trace is being
+    captured; otherwise start() returns None and stop() returns immediately:
+
+        start = profiler.start()
+        self.scene.update()
+        profiler.stop("scene.update", start)
+
+    A section hit several times in one frame (e.g. blits) is summed for the
+    histograms and recorded as separate events in traces.
+    """
+
+    def __init__(self, history_size: int = PROFILE_HISTORY_SIZE) -> None:
+        self.enabled = False
+        self.overlay = False
+        self.history_size = history_size
+        self.histories = {}  # scene -> {section: deque of seconds per frame}
+        self.scene = None
+        self.frame = 0
+
+        self._frame_start = None
+        self._current = {}  # section -> seconds in the current frame
+
+        # Trace capture
+        self._trace = None
+        self._trace_origin = 0.0
+        self._trace_frames_left = 0
+        self._trace_path = None
+        self.last_trace_path = None
+
+        self._overlay_surface = None
+        self._overlay_frame = 0
+
+    # -----------------------------------------------------------------
+    # Timing
+    # -----------------------------------------------------------------
+    def start(self):
+        """Returns the section start time, or None while profiling is off."""
+        return time.perf_counter() if self.enabled else None
+
+    def stop(self, name: str, start) -> None:
+        """Ends a section begun with start()."""
+        if start is None:
+            return
+        end = time.perf_counter()
+        self._current[name] = self._current.get(name, 0.0) + (end - start)
+        if self._trace is not None:
+            self._trace.append(self._event(name, "section", start, end))
+
+    def begin_frame(self, scene_name: str) -> None:
+        """Marks the start of a frame spent in the given scene."""
+        self.scene = scene_name
+        self._frame_start = time.perf_counter() if self.enabled else None
+
+    def end_frame(self) -> None:
+        """Marks the end of a frame (after display.flip) and files its sections."""
+        self.frame += 1
+        if self._frame_start is None:
+            self._current.clear()  # Profiling was switched on mid-frame
+            return
+        end = time.perf_counter()
+        self._current["frame"] = end - self._frame_start
+
+        scene_history = self.histories.get(self.scene)
+        if scene_history is None:
+            scene_history = self.histories[self.scene] = {}
+        for name, seconds in self._current.items():
+            history = scene_history.get(name)
+            if history is None:
+                history = scene_history[name] = deque(maxlen=self.history_size)
+            history.append(seconds)
+
+        if self._trace is not None:
+            self._trace.append(self._event(f"frame {self.frame}", "frame", self._frame_start, end, {"scene": self.scene}))
+            self._trace_frames_left -= 1
+            if self._trace_frames_left <= 0:
+                self._finish_trace()
+
+        self._current.clear()
+        self._frame_start = None
+
+    def _update_enabled(self) -> None:
+        self.enabled = self.overlay or self._trace is not None
+
+    # -----------------------------------------------------------------
+    # Statistics
+    # -----------------------------------------------------------------
+    def get_percentiles(self, scene: str = None) -> dict:
+        """Returns {section: {"count", "p50", "p95", "p99", "max"}} in milliseconds for a scene (default: current)."""
+        stats = {}
+        for name, history in self.histories.get(scene or self.scene, {}).items():
+            values = sorted(history)
+            if not values:
+                continue
+            def percentile(p):
+                return values[min(len(values) - 1, int(p / 100 * len(values)))] * 1000
+            stats[name] = {
+                "count": len(values),
+                "p50": percentile(50),
+                "p95": percentile(95),
+                "p99": percentile(99),
+                "max": values[-1] * 1000,
+            }
+        return stats
+
+    def reset(self) -> None:
+        self.histories.clear()
+        self._overlay_surface = None
+
+    # -----------------------------------------------------------------
+    # Overlay
+    # -----------------------------------------------------------------
+    def toggle_overlay(self) -> bool:
+        """Shows or hides the overlay. Returns the new state."""
+        self.overlay = not self.overlay
+        self._overlay_surface = None
+        self._update_enabled()
+        return self.overlay
+
+    def draw_overlay(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
+        """Draws p50/p95/p99 per section for the current scene, refreshed every OVERLAY_REFRESH_FRAMES."""
+        if self._overlay_surface is None or self.frame - self._overlay_frame >= OVERLAY_REFRESH_FRAMES:
+            self._overlay_surface = self._render_overlay(font)
+            self._overlay_frame = self.frame
+        surface.blit(self._overlay_surface, (0, surface.get_height() - self._overlay_surface.get_height()))
+
+    def _render_overlay(self, font: pygame.font.Font) -> pygame.Surface:
+        stats = self.get_percentiles()
+        lines = [f"{self.scene}  ms p50/p95/p99"]
+        for name, values in sorted(stats.items(), key=lambda item: item[1]["p95"], reverse=True):
+            lines.append(f"{name:<13}{values['p50']:6.1f}{values['p95']:6.1f}{values['p99']:6.1f}")
+
+        line_height = font.get_linesize()
+        width = max(font.size(line)[0] for line in lines) + 8
+        panel = pygame.Surface((width, line_height * len(lines) + 4), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        for index, line in enumerate(lines):
+            color = (255, 255, 0) if index == 0 else (255, 255, 255)
+            panel.blit(font.render(line, True, color), (4, 2 + index * line_height))
+        return panel
+
+    # -----------------------------------------------------------------
+    # Chrome trace export
+    # -----------------------------------------------------------------
+    def capture_trace(self, frames: int = TRACE_FRAMES, path: str = None) -> str:
+        """
+        Records every section of the next frames and writes them as Chrome
+        trace-event JSON (open in chrome://tracing or ui.perfetto.dev).
+        Returns the path the trace will be written to.
+        """
+        if path is None:
+            logs_dir = os.path.join(os.getcwd(), "logs")
+            os.makedirs(logs_dir, exist_ok=True)
+            path = os.path.join(logs_dir, f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        self._trace = []
+        self._trace_origin = time.perf_counter()
+        self._trace_frames_left = frames
+        self._trace_path = path
+        self._update_enabled()
+        return path
+
+    @property
+    def capturing(self) -> bool:
+        return self._trace is not None
+
+    def _event(self, name, category, start, end, args=None) -> dict:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._trace_origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": 1,
+            "tid": 1,
+        }
+        if args:
+            event["args"] = args
+        return event
+
+    def _finish_trace(self) -> None:
+        """Hands the captured events to a writer thread so the dump does not stall a frame."""
+        events, path = self._trace, self._trace_path
+        self._trace = None
+        self._update_enabled()
+        threading.Thread(target=self._write_trace, args=(events, path), name="TraceWriter", daemon=True).start()
+
+    def _write_trace(self, events: list, path: str) -> None:
+        from core import runtime_globals  # runtime_globals creates the profiler, import on use
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+            self.last_trace_path = path
+            runtime_globals.game_console.log(f"[FrameProfiler] Trace with {len(events)} events written to {path}")
+        except OSError as e:
+            runtime_globals.game_console.log(f"[FrameProfiler] Failed to write trace: {e}")
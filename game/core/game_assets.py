@@ -0,0 +1,224 @@
+import os
+import queue
+import threading
+from collections import OrderedDict
+
+import pygame
+
+import game.core.constants as constants
+from core import module_bundle
+
+#=====================================================================
+# GameAssets - Shared sprite cache with per-scene preloading
+#=====================================================================
+
+def _icon_percent(pixels: int) -> float:
+    """Percent of screen height used by sprites sized in 240x240 reference pixels."""
+    return (int(pixels * constants.UI_SCALE) / constants.SCREEN_HEIGHT) * 100
+
+
+def get_scene_manifest(manifest: str) -> list:
+    """
+    Returns the sprite specs (path, percent, keep_proportion, base_on, alpha) of a manifest.
+    Built on demand so percents follow the resolution set by main.py after import.
+    """
+    manifests = {
+        "battle": [
+            (constants.BATTLE_BACKGROUND_PATH, 100, True, "width", True),
+            (constants.BATTLE_SPRITE_PATH, 100, True, "width", True),
+            (constants.BATTLE_LEVEL_SPRITE_PATH, 100, True, "width", True),
+            (constants.BAR_PIECE_PATH, _icon_percent(12), True, "height", True),
+            (constants.BAR_BACK_PATH, _icon_percent(170), True, "height", True),
+            (constants.TRAINING_MAX_PATH, _icon_percent(60), True, "height", True),
+            (constants.READY_SPRITE_PATH, 100, True, "width", True),
+            (constants.GO_SPRITE_PATH, 100, True, "width", True),
+            (constants.CLEAR1_PATH, 100, True, "width", True),
+            (constants.CLEAR2_PATH, 100, True, "width", True),
+            (constants.WARNING1_PATH, 100, True, "width", True),
+            (constants.WARNING2_PATH, 100, True, "width", True),
+            (constants.MEGA_HIT_PATH, 100, True, "width", True),
+        ] + [(path, 100, True, "width", True) for path in constants.READY_SPRITES_PATHS.values()]
+          + [(path, 100, True, "width", True) for path in constants.COUNT_SPRITES_PATHS.values()],
+        "training": [
+            (constants.READY_SPRITE_PATH, 100, True, "width", False),
+            (constants.GO_SPRITE_PATH, 100, True, "width", False),
+            (constants.BAR_PIECE_PATH, _icon_percent(12), True, "height", True),
+            (constants.TRAINING_MAX_PATH, _icon_percent(60), True, "height", True),
+            (constants.BAR_BACK_PATH, _icon_percent(170), True, "height", True),
+            (constants.BATTLE1_PATH, 100, True, "width", False),
+            (constants.BATTLE2_PATH, 100, True, "width", False),
+            (constants.BAD_SPRITE_PATH, 100, True, "width", False),
+            (constants.GOOD_SPRITE_PATH, 100, True, "width", False),
+            (constants.GREAT_SPRITE_PATH, 100, True, "width", False),
+            (constants.EXCELLENT_SPRITE_PATH, 100, True, "width", False),
+            (constants.TROPHIES_ICON_PATH, _icon_percent(24), True, "height", True),
+        ],
+        "status": [
+            (path, (constants.MENU_ICON_SIZE / constants.SCREEN_HEIGHT) * 100, True, "height", True)
+            for path in (
+                constants.AGE_ICON_PATH, constants.WEIGHT_ICON_PATH, constants.MODULE_ICON_PATH,
+                constants.VERSION_ICON_PATH, constants.MISTAKES_ICON_PATH, constants.BATTLE_ICON_PATH,
+                constants.JOGRESS_ICON_PATH, constants.SPECIAL_ICON_PATH, constants.TRAITED_ICON_PATH,
+                constants.SHINY_ICON_PATH, constants.SHOOK_ICON_PATH, constants.OVERFEED_ICON_PATH,
+                constants.SICK_ICON_PATH, constants.SLEEP_DISTURBANCES_ICON_PATH,
+                constants.HEART_EMPTY_ICON_PATH, constants.HEART_HALF_ICON_PATH,
+                constants.HEART_FULL_ICON_PATH, constants.ENERGY_BAR_ICON_PATH,
+                constants.ENERGY_BAR_BACK_ICON_PATH, constants.LEVEL_ICON_PATH, constants.EXP_ICON_PATH,
+                constants.TROPHIES_ICON_PATH, constants.VITAL_VALUES_ICON_PATH,
+            )
+        ],
+    }
+    return manifests.get(manifest, [])
+
+
+# Manifests worth warming up while a scene is open (its likely next step)
+SCENE_PRELOADS = {
+    "game": ("status",),
+    "battle": ("battle",),
+    "battle_pvp": ("battle",),
+    "training": ("training",),
+}
+
+# Decoded images finalized (convert + scale) on the main thread per frame
+PRELOAD_PER_FRAME = 2
+
+
+class GameAssets:
+    """
+    LRU cache of scaled UI sprites keyed by (path, percent, keep_proportion, base_on, alpha).
+    Files listed in a scene manifest are decoded by a worker thread; conversion and
+    scaling stay on the main thread and are spread over a few frames.
+    Cached surfaces are shared: callers must copy before drawing onto them.
+    """
+
+    def __init__(self, budget: int = constants.ASSET_CACHE_BUDGET) -> None:
+        self.budget = budget
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self._sprites = OrderedDict()  # key -> (surface, size in bytes)
+        self._attack_sets = {}         # folder -> {atk_id: surface}
+        self._pending = set()
+        self._requests = queue.Queue()
+        self._decoded = queue.Queue()
+        self._worker = None
+
+    # -----------------------------------------------------------------
+    # Lookups
+    # -----------------------------------------------------------------
+    def get_sprite(self, path, percent=100, keep_proportion=True, base_on="height", alpha=True) -> pygame.Surface:
+        """Drop-in cached replacement for sprite_load_percent."""
+        key = (path, percent, keep_proportion, base_on, alpha)
+        entry = self._sprites.get(key)
+        if entry is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        return self._store(key, self._finalize(key, pygame.image.load(module_bundle.image_source(path))))
+
+    def get_attack_sprites(self, folder: str) -> dict:
+        """Returns the attack sprites of a folder, decoded once per folder."""
+        sprites = self._attack_sets.get(folder)
+        if sprites is None:
+            from core.utils.pygame_utils import load_attack_folder
+            sprites = load_attack_folder(folder)
+            self._attack_sets[folder] = sprites
+        return sprites
+
+    # -----------------------------------------------------------------
+    # Preloading
+    # -----------------------------------------------------------------
+    def preload(self, manifest: str) -> None:
+        """Queues every sprite of a manifest that is not cached yet for background decode."""
+        self.preload_specs(get_scene_manifest(manifest))
+
+    def preload_specs(self, specs) -> None:
+        """Queues (path, percent, keep_proportion, base_on, alpha) specs for background decode."""
+        for spec in specs:
+            if spec in self._sprites or spec in self._pending or not module_bundle.exists(spec[0]):
+                continue
+            self._pending.add(spec)
+            self._requests.put(spec)
+        if self._pending:
+            self._ensure_worker()
+
+    def preload_for_scene(self, state: str) -> None:
+        """Warms up the manifests likely needed after the given scene state."""
+        for manifest in SCENE_PRELOADS.get(state, ()):
+            self.preload(manifest)
+
+    def update(self) -> None:
+        """Finalizes a few decoded sprites per frame. Called from the main loop."""
+        for _ in range(PRELOAD_PER_FRAME):
+            try:
+                key, image = self._decoded.get_nowait()
+            except queue.Empty:
+                return
+            self._pending.discard(key)
+            if image is None or key in self._sprites:
+                continue
+            self._store(key, self._finalize(key, image))
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._decode_loop, name="AssetDecoder", daemon=True)
+            self._worker.start()
+
+    def _decode_loop(self) -> None:
+        while True:
+            key = self._requests.get()
+            try:
+                image = pygame.image.load(module_bundle.image_source(key[0]))
+            except (OSError, ValueError, pygame.error):  # ValueError: bundle released by a reload
+                image = None
+            self._decoded.put((key, image))
+
+    # -----------------------------------------------------------------
+    # Cache management
+    # -----------------------------------------------------------------
+    def _finalize(self, key, image) -> pygame.Surface:
+        from core.utils.pygame_utils import scale_percent
+        path, percent, keep_proportion, base_on, alpha = key
+        image = image.convert_alpha() if alpha else image.convert()
+        return scale_percent(image, percent, keep_proportion, base_on)
+
+    def _store(self, key, surface: pygame.Surface) -> pygame.Surface:
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self._sprites[key] = (surface, size)
+        self.used += size
+        while self.used > self.budget and len(self._sprites) > 1:
+            _, (_, evicted_size) = self._sprites.popitem(last=False)
+            self.used -= evicted_size
+        return surface
+
+    def invalidate(self, folder: str) -> None:
+        """Drops cached sprites and attack sets loaded from under a folder (e.g. a reloaded module)."""
+        folder = os.path.normpath(folder)
+
+        def inside(path):
+            path = os.path.normpath(path)
+            return path == folder or path.startswith(folder + os.sep)
+
+        for key in [key for key in self._sprites if inside(key[0])]:
+            _, size = self._sprites.pop(key)
+            self.used -= size
+        for path in [path for path in self._attack_sets if inside(path)]:
+            del self._attack_sets[path]
+
+    def clear(self) -> None:
+        """Drops every cached sprite (e.g. after a resolution change)."""
+        self._sprites.clear()
+        self._attack_sets.clear()
+        self.used = 0
+
+    def get_stats(self) -> dict:
+        return {
+            "sprites": len(self._sprites),
+            "used_kb": self.used // 1024,
+            "budget_kb": self.budget // 1024,
+            "hits": self.hits,
+            "misses": self.misses,
+            "pending": len(self._pending),
+        }
@@ -0,0 +1,83 @@
+import time
+from datetime import datetime
+
+#=====================================================================
+# GameClock - Per-frame snapshot of wall and monotonic time
+#=====================================================================
+
+# "HH:MM" string -> seconds since midnight, shared by every pet of a species
+_parsed_times = {}
+
+
+def parse_clock_time(value) -> int:
+    """
+    Converts a "HH:MM" string or a datetime.time into seconds since midnight.
+    Strings are parsed once and memoized. Raises ValueError on malformed input.
+    """
+    if hasattr(value, "hour"):
+        return value.hour * 3600 + value.minute * 60 + value.second
+    seconds = _parsed_times.get(value)
+    if seconds is None:
+        parsed = datetime.strptime(value.strip(), "%H:%M")
+        seconds = parsed.hour * 3600 + parsed.minute * 60
+        _parsed_times[value] = seconds
+    return seconds
+
+
+def in_window(seconds: int, start: int, end: int, inclusive_end: bool = False) -> bool:
+    """Returns True if seconds falls inside [start, end) (or [start, end]), handling overnight windows."""
+    if start < end:
+        return start <= seconds <= end if inclusive_end else start <= seconds < end
+    return seconds >= start or (seconds <= end if inclusive_end else seconds < end)
+
+
+class GameClock:
+    """
+    Captures the time once per frame so pets, scenes and windows share one reading.
+    Sleep window checks are memoized until the minute changes.
+    A session recorder or replayer can install `source`, a callable returning
+    (wall, monotonic), to quantize or substitute the readings.
+    """
+
+    def __init__(self) -> None:
+        self.minute_key = None
+        self._asleep = {}
+        self.source = None
+        self.tick()
+
+    def tick(self) -> None:
+        """Takes a new snapshot. Called once at the start of every frame."""
+        if self.source is not None:
+            self.wall, self.monotonic = self.source()
+        else:
+            self.wall = time.time()
+            self.monotonic = time.monotonic()
+        self.ticks_ms = int(self.monotonic * 1000)  # Frame-time stand-in for pygame.time.get_ticks()
+        self.now = datetime.fromtimestamp(self.wall)
+        self.seconds_of_day = self.now.hour * 3600 + self.now.minute * 60 + self.now.second
+        self.day_of_year = self.now.timetuple().tm_yday
+
+        minute_key = (self.now.date(), self.now.hour, self.now.minute)
+        if minute_key != self.minute_key:
+            self.minute_key = minute_key
+            self._asleep.clear()
+
+    def is_sleep_time(self, sleeps, wakes) -> bool:
+        """
+        Returns True if the current time is inside the [sleeps, wakes) window.
+        sleeps/wakes may be "HH:MM" strings or datetime.time objects.
+        """
+        key = (sleeps, wakes)
+        asleep = self._asleep.get(key)
+        if asleep is None:
+            asleep = in_window(self.seconds_of_day, parse_clock_time(sleeps), parse_clock_time(wakes))
+            self._asleep[key] = asleep
+        return asleep
+
+    def in_time_range(self, start, end) -> bool:
+        """Returns True if the current time is inside the inclusive [start, end] range."""
+        return in_window(self.seconds_of_day, parse_clock_time(start), parse_clock_time(end), inclusive_end=True)
+
+    def is_clock_minute(self, value) -> bool:
+        """Returns True if the current hour and minute match the given time."""
+        return self.seconds_of_day // 60 == parse_clock_time(value) // 60
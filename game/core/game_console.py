@@ -1,7 +1,10 @@
-from datetime import datetime
+import atexit
 import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
 
-from core import game_globals
 from game.core import constants
 
 
@@ -9,39 +12,226 @@ from game.core import constants
 # GameConsole - Debug Logger
 #=====================================================================
 
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+LEVELS = {name: level for level, name in LEVEL_NAMES.items()}
+
+# Records waiting for the writer thread (oldest are dropped when full)
+LOG_BUFFER_SIZE = 4096
+
+# Seconds the writer thread sleeps between drains
+LOG_FLUSH_INTERVAL = 0.1
+
+# Size-based rotation of the session log file
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# At most RATE_LIMIT_COUNT identical messages (same format string and args) per RATE_LIMIT_WINDOW seconds
+RATE_LIMIT_COUNT = 5
+RATE_LIMIT_WINDOW = 1.0
+RATE_LIMIT_KEYS = 1024
+
+
 class GameConsole:
     """
-    Simple console logger for debugging.
-    Outputs timestamped messages only if debug mode is active.
-    Also writes logs to a file if debug mode is enabled.
+    Console logger for debugging.
+    Outputs timestamped messages only if debug mode is active, and also writes
+    them to a log file if DEBUG_FILE_LOGGING is enabled.
+
+    log() only filters and appends a record to a ring buffer; a writer thread
+    formats, prints and writes them. Messages may use %-style arguments
+    (log("%s hp %d", name, hp)) so calls filtered out by level, category or
+    rate limit never build their string.
     """
 
-    log_file = None
+    def __init__(self, level=None, buffer_size: int = LOG_BUFFER_SIZE) -> None:
+        self.enabled = constants.DEBUG_MODE
+        self.level = LEVELS.get(str(constants.LOG_LEVEL).upper(), INFO) if level is None else level
+        self.muted_categories = set()
+        self.dropped = 0
 
-    @staticmethod
-    def _init_log_file():
-        """Initialize a new log file for this session if debug is enabled."""
-        if GameConsole.log_file is None and constants.DEBUG_FILE_LOGGING:
-            logs_dir = os.path.join(os.getcwd(), "logs")
-            os.makedirs(logs_dir, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_path = os.path.join(logs_dir, f"omnimon_{timestamp}.log")
-            GameConsole.log_file = open(log_path, "w", encoding="utf-8")
+        self._buffer = deque(maxlen=buffer_size)
+        self._rates = {}  # (category, message, args) -> [window start, count, suppressed, args]
+        self._rates_lock = threading.Lock()  # log() runs on several threads, the writer reports suppressions
+        self._wake = threading.Event()
+        self._write_lock = threading.Lock()
+        self._writer = None
+        self._reported_drops = 0
 
-    @staticmethod
-    def log(message: str) -> None:
+        self.log_file = None
+        self.log_path = None
+
+    # -----------------------------------------------------------------
+    # Logging
+    # -----------------------------------------------------------------
+    def is_enabled(self, level: int = INFO, category: str = None) -> bool:
+        """Returns True if a message of this level and category would be written."""
+        return self.enabled and level >= self.level and category not in self.muted_categories
+
+    def log(self, message: str, *args, level: int = INFO, category: str = None) -> None:
         """
-        Logs a timestamped message to the console if debug mode is enabled.
-        Also writes to a log file if debug mode is enabled.
-        
+        Queues a timestamped message if debug mode is enabled.
+
         Args:
-            message (str): Message to be logged.
+            message (str): Message, or %-style format string when args are given.
+            level (int): DEBUG, INFO, WARNING or ERROR.
+            category (str): Optional category, can be muted with mute().
         """
-        if constants.DEBUG_MODE:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_line = f"[{timestamp}] {message}"
-            print(log_line)
+        if not self.enabled or level < self.level or category in self.muted_categories:
+            return
+        if self._rate_limited(message, args, category):
+            return
+
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append((time.time(), level, category, message, args))
+
+        if self._writer is None:
+            self._start_writer()
+        if level >= ERROR:
+            self._wake.set()
+
+    def debug(self, message: str, *args, category: str = None) -> None:
+        self.log(message, *args, level=DEBUG, category=category)
+
+    def warning(self, message: str, *args, category: str = None) -> None:
+        self.log(message, *args, level=WARNING, category=category)
+
+    def error(self, message: str, *args, category: str = None) -> None:
+        self.log(message, *args, level=ERROR, category=category)
+
+    def mute(self, category: str) -> None:
+        self.muted_categories.add(category)
+
+    def unmute(self, category: str) -> None:
+        self.muted_categories.discard(category)
+
+    def _rate_limited(self, message: str, args: tuple, category: str) -> bool:
+        """Counts the message in its rate window. Returns True if it must be suppressed."""
+        now = time.monotonic()
+        key = (category, message, args)
+        with self._rates_lock:
+            try:
+                rate = self._rates.get(key)
+            except TypeError:
+                key = (category, message, repr(args))  # Unhashable args (lists, dicts)
+                rate = self._rates.get(key)
+            if rate is None:
+                if len(self._rates) >= RATE_LIMIT_KEYS:
+                    self._flush_suppressed_locked(now, final=True)
+                    self._rates.clear()
+                self._rates[key] = [now, 1, 0, args]
+                return False
+
+            if now - rate[0] >= RATE_LIMIT_WINDOW:
+                if rate[2]:
+                    self._append_suppressed(category, message, args, rate[2])
+                rate[0], rate[1], rate[2] = now, 1, 0
+                return False
+
+            rate[1] += 1
+            if rate[1] > RATE_LIMIT_COUNT:
+                rate[2] += 1
+                return True
+            return False
+
+    def _append_suppressed(self, category, message, args, count) -> None:
+        self._buffer.append((time.time(), WARNING, category, "Suppressed %d repeats of: %s",
+                             (count, self._format_message(message, args))))
+
+    def _flush_suppressed(self, final: bool = False) -> None:
+        """Reports suppression counts of rate windows that ended (or all of them, at exit)."""
+        with self._rates_lock:
+            self._flush_suppressed_locked(time.monotonic(), final)
+
+    def _flush_suppressed_locked(self, now: float, final: bool) -> None:
+        for (category, message, _), rate in self._rates.items():
+            if rate[2] and (final or now - rate[0] >= RATE_LIMIT_WINDOW):
+                self._append_suppressed(category, message, rate[3], rate[2])
+                rate[2] = 0
+
+    # -----------------------------------------------------------------
+    # Writer thread
+    # -----------------------------------------------------------------
+    def _start_writer(self) -> None:
+        self._writer = threading.Thread(target=self._write_loop, name="GameConsoleWriter", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush, True)
+
+    def _write_loop(self) -> None:
+        while True:
+            self._wake.wait(LOG_FLUSH_INTERVAL)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self, final: bool = False) -> None:
+        """Writes every buffered record. Called by the writer thread and at exit (final)."""
+        with self._write_lock:
+            self._flush_suppressed(final)
+            lines = []
+            while True:
+                try:
+                    timestamp, level, category, message, args = self._buffer.popleft()
+                except IndexError:
+                    break
+                lines.append(self._format(timestamp, level, category, message, args))
+
+            if self.dropped != self._reported_drops:
+                lines.append(self._format(time.time(), WARNING, None, "Log buffer full, dropped %d messages", (self.dropped - self._reported_drops,)))
+                self._reported_drops = self.dropped
+
+            if not lines:
+                return
+            text = "\n".join(lines)
+            print(text)
             if constants.DEBUG_FILE_LOGGING:
-                GameConsole._init_log_file()
-                if GameConsole.log_file:
-                    GameConsole.log_file.write(log_line + "\n")
+                self._write_file(text + "\n")
+
+    def _format_message(self, message, args) -> str:
+        if args:
+            try:
+                return message % args
+            except (TypeError, ValueError):
+                return f"{message} {args}"
+        return message
+
+    def _format(self, timestamp, level, category, message, args) -> str:
+        message = self._format_message(message, args)
+        prefix = datetime.fromtimestamp(timestamp).strftime("[%Y-%m-%d %H:%M:%S]")
+        if level != INFO:
+            prefix += f" [{LEVEL_NAMES.get(level, level)}]"
+        if category:
+            prefix += f" [{category}]"
+        return f"{prefix} {message}"
+
+    # -----------------------------------------------------------------
+    # Log file
+    # -----------------------------------------------------------------
+    def _init_log_file(self) -> None:
+        """Initialize a new log file for this session."""
+        logs_dir = os.path.join(os.getcwd(), "logs")
+        os.makedirs(logs_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.log_path = os.path.join(logs_dir, f"omnimon_{timestamp}.log")
+        self.log_file = open(self.log_path, "w", encoding="utf-8")
+
+    def _write_file(self, text: str) -> None:
+        try:
+            if self.log_file is None:
+                self._init_log_file()
+            self.log_file.write(text)
+            self.log_file.flush()
+            if self.log_file.tell() >= LOG_MAX_BYTES:
+                self._rotate()
+        except OSError as e:
+            print(f"[GameConsole] Log file write failed: {e}")
+
+    def _rotate(self) -> None:
+        """Shifts omnimon_x.log -> .1 -> .2 ... keeping LOG_BACKUP_COUNT backups."""
+        self.log_file.close()
+        for index in range(LOG_BACKUP_COUNT - 1, 0, -1):
+            source = f"{self.log_path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.log_path}.{index + 1}")
+        os.replace(self.log_path, f"{self.log_path}.1")
+        self.log_file = open(self.log_path, "w", encoding="utf-8")
@@ -40,6 +40,8 @@ class GameEnemy:
             from core.utils.module_utils import get_module
             module_obj = get_module(module_name)
             name_format = getattr(module_obj, 'name_format', '$_dmc') if module_obj else '$_dmc'
+            if module_obj:
+                module_path = module_obj.folder_path  # Module folder or bundle, checked before assets
         except:
             name_format = '$_dmc'  # Default fallback
         
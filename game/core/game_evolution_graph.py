@@ -0,0 +1,274 @@
+import json
+import os
+from collections import deque
+
+from core import module_bundle, runtime_globals
+import game.core.constants as constants
+
+#=====================================================================
+# GameEvolutionGraph - Precomputed evolution graph per module
+#=====================================================================
+
+GRAPH_FORMAT = 1
+
+# Evolution keys that describe the edge itself rather than a requirement
+_EDGE_KEYS = ("to", "version")
+
+_graphs = {}
+
+
+class GameEvolutionGraph:
+    """
+    Evolution graph of a single module.
+    Nodes are (name, version) pairs, edges carry the requirement summary of
+    each "evolve" entry. Layered layouts for every egg (stage 0 root) are
+    precomputed so the Digidex tree view is a plain lookup.
+    """
+
+    def __init__(self, module_name: str, fingerprint: list) -> None:
+        self.module_name = module_name
+        self.fingerprint = fingerprint
+        self.nodes = {}      # (name, version) -> {"stage": int, "attribute": str}
+        self.edges = []      # {"from": (name, version), "to": (name, version), "kind": str, "requirements": dict}
+        self.children = {}   # (name, version) -> [edge index]
+        self.parents = {}    # (name, version) -> [edge index]
+        self.trees = {}      # version -> {name: [child names]}
+        self.layers = {}     # (version, root name) -> [[names of depth 0], [depth 1], ...]
+        self.eggs = {}       # (name, version) -> [(egg name, egg version)]
+
+    # -----------------------------------------------------------------
+    # Building
+    # -----------------------------------------------------------------
+    def build(self, monsters: list[dict]) -> None:
+        """Builds nodes, edges, per-version trees, layouts and egg reachability from monster.json data."""
+        for monster in monsters:
+            key = (monster["name"], monster["version"])
+            self.nodes[key] = {"stage": monster.get("stage", 0), "attribute": monster.get("attribute", "")}
+
+        for monster in monsters:
+            source = (monster["name"], monster["version"])
+            for evo in monster.get("evolve", []):
+                target = (evo["to"], evo.get("version", monster["version"]))
+                if target not in self.nodes:
+                    continue
+                if "jogress" in evo:
+                    kind = "jogress"
+                elif "item" in evo:
+                    kind = "item"
+                else:
+                    kind = "normal"
+                requirements = {k: v for k, v in evo.items() if k not in _EDGE_KEYS}
+                self.edges.append({"from": source, "to": target, "kind": kind, "requirements": requirements})
+
+        # Same-version name trees, matching what the Digidex has always shown
+        names_by_version = {}
+        for name, version in self.nodes:
+            names_by_version.setdefault(version, set()).add(name)
+        for monster in monsters:
+            version = monster["version"]
+            valid_names = names_by_version[version]
+            tree = self.trees.setdefault(version, {})
+            tree[monster["name"]] = [evo["to"] for evo in monster.get("evolve", []) if evo["to"] in valid_names]
+
+        self._index_edges()
+
+        for (name, version), node in self.nodes.items():
+            if node["stage"] == 0:
+                self.layers[(version, name)] = self._compute_layers(version, name)
+
+        self._compute_eggs()
+
+    def _index_edges(self) -> None:
+        self.children = {}
+        self.parents = {}
+        for index, edge in enumerate(self.edges):
+            self.children.setdefault(edge["from"], []).append(index)
+            self.parents.setdefault(edge["to"], []).append(index)
+
+    def _compute_layers(self, version: int, root: str) -> list[list[str]]:
+        """Breadth-first layering of the same-version tree starting at root."""
+        tree = self.trees.get(version, {})
+        layers = []
+        queue = deque([(root, 0)])
+        visited = set()
+        while queue:
+            current, depth = queue.popleft()
+            if current in visited:
+                continue
+            visited.add(current)
+            while len(layers) <= depth:
+                layers.append([])
+            layers[depth].append(current)
+            for child in tree.get(current, []):
+                queue.append((child, depth + 1))
+        return layers
+
+    def _compute_eggs(self) -> None:
+        self.eggs = {}
+        for key, node in self.nodes.items():
+            if node["stage"] != 0:
+                continue
+            for reached in self.reachable_from(key):
+                self.eggs.setdefault(reached, []).append(key)
+
+    # -----------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------
+    def get_tree(self, version: int) -> dict:
+        """Returns {name: [child names]} for every monster of the given version."""
+        return self.trees.get(version, {})
+
+    def get_layers(self, version: int, root: str) -> list[list[str]]:
+        """Returns the layered layout for a tree rooted at root (computed and memoized if root is not an egg)."""
+        key = (version, root)
+        if key not in self.layers:
+            self.layers[key] = self._compute_layers(version, root)
+        return self.layers[key]
+
+    def get_evolutions(self, name: str, version: int) -> list[dict]:
+        """Returns the outgoing edges of a node."""
+        return [self.edges[i] for i in self.children.get((name, version), [])]
+
+    def get_devolutions(self, name: str, version: int) -> list[dict]:
+        """Returns the incoming edges of a node."""
+        return [self.edges[i] for i in self.parents.get((name, version), [])]
+
+    def reachable_from(self, start: tuple) -> set:
+        """Returns every node reachable from start (inclusive) following all edges."""
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            for index in self.children.get(current, []):
+                target = self.edges[index]["to"]
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return seen
+
+    def get_eggs_reaching(self, name: str, version: int) -> list[tuple]:
+        """Returns the (name, version) of every egg that can evolve into the given monster."""
+        return list(self.eggs.get((name, version), []))
+
+    # -----------------------------------------------------------------
+    # Persistence
+    # -----------------------------------------------------------------
+    def to_dict(self) -> dict:
+        return {
+            "format": GRAPH_FORMAT,
+            "module": self.module_name,
+            "fingerprint": self.fingerprint,
+            "nodes": [[name, version, node["stage"], node["attribute"]] for (name, version), node in self.nodes.items()],
+            "edges": [
+                {"from": list(e["from"]), "to": list(e["to"]), "kind": e["kind"], "requirements": e["requirements"]}
+                for e in self.edges
+            ],
+            "trees": [[version, tree] for version, tree in self.trees.items()],
+            "layers": [[version, root, layers] for (version, root), layers in self.layers.items()],
+            "eggs": [[name, version, [list(egg) for egg in eggs]] for (name, version), eggs in self.eggs.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GameEvolutionGraph":
+        graph = cls(data["module"], data["fingerprint"])
+        graph.nodes = {(name, version): {"stage": stage, "attribute": attribute} for name, version, stage, attribute in data["nodes"]}
+        graph.edges = [
+            {"from": tuple(e["from"]), "to": tuple(e["to"]), "kind": e["kind"], "requirements": e["requirements"]}
+            for e in data["edges"]
+        ]
+        graph.trees = {version: tree for version, tree in data["trees"]}
+        graph.layers = {(version, root): layers for version, root, layers in data["layers"]}
+        graph.eggs = {(name, version): [tuple(egg) for egg in eggs] for name, version, eggs in data["eggs"]}
+        graph._index_edges()
+        return graph
+
+
+#=====================================================================
+# Module-level cache
+#=====================================================================
+
+def get_module_fingerprint(module) -> list:
+    """Returns a cheap fingerprint (size, mtime) of the module's monster.json (or of its bundle)."""
+    json_path = os.path.join(module.folder_path, "monster.json")
+    try:
+        stat = os.stat(module_bundle.real_path(json_path))
+    except OSError:
+        return [0, 0]
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _cache_path(module_name: str) -> str:
+    safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in module_name)
+    return os.path.join(constants.CACHE_FOLDER, f"evolution_{safe_name}.json")
+
+
+def _load_cached_graph(module_name: str, fingerprint: list):
+    path = _cache_path(module_name)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != GRAPH_FORMAT or data.get("fingerprint") != fingerprint:
+            return None
+        return GameEvolutionGraph.from_dict(data)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        runtime_globals.game_console.log(f"[EvolutionGraph] Ignoring unreadable cache {path}: {e}")
+        return None
+
+
+def _save_cached_graph(graph: GameEvolutionGraph) -> None:
+    path = _cache_path(graph.module_name)
+    tmp_path = path + ".tmp"
+    try:
+        os.makedirs(constants.CACHE_FOLDER, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(graph.to_dict(), f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        runtime_globals.game_console.log(f"[EvolutionGraph] Failed to write cache {path}: {e}")
+
+
+def get_evolution_graph(module) -> GameEvolutionGraph:
+    """
+    Returns the evolution graph for a GameModule, building it only when
+    monster.json changed since the last build (in memory or on disk).
+    """
+    fingerprint = get_module_fingerprint(module)
+    graph = _graphs.get(module.name)
+    if graph is not None and graph.fingerprint == fingerprint:
+        return graph
+
+    graph = _load_cached_graph(module.name, fingerprint)
+    if graph is None:
+        graph = GameEvolutionGraph(module.name, fingerprint)
+        graph.build(module.get_all_monsters())
+        _save_cached_graph(graph)
+        runtime_globals.game_console.log(f"[EvolutionGraph] Built graph for {module.name}: {len(graph.nodes)} nodes, {len(graph.edges)} edges")
+
+    _graphs[module.name] = graph
+    return graph
+
+
+def invalidate_evolution_graph(module_name: str = None) -> None:
+    """Drops the in-memory graph of one module (or all modules)."""
+    if module_name is None:
+        _graphs.clear()
+    else:
+        _graphs.pop(module_name, None)
+
+
+def get_eggs_reaching(name: str, version: int, module_name: str = None) -> list[tuple]:
+    """
+    Returns (module, egg name, egg version) for every egg that can reach the given monster.
+    Searches every loaded module unless module_name is given.
+    """
+    if module_name is not None:
+        modules = [runtime_globals.game_modules[module_name]] if module_name in runtime_globals.game_modules else []
+    else:
+        modules = list(runtime_globals.game_modules.values())
+    result = []
+    for module in modules:
+        for egg_name, egg_version in get_evolution_graph(module).get_eggs_reaching(name, version):
+            result.append((module.name, egg_name, egg_version))
+    return result
@@ -2,7 +2,6 @@ import datetime
 import os
 import pickle
 import random
-import time
 
 #=====================================================================
 # Game Global State
@@ -37,9 +36,10 @@ quests = []
 event = None
 event_time = None
 
-# Internal timer for autosave
-_last_save_time = time.time()
-AUTOSAVE_INTERVAL_SECONDS = 60  # 5 minutes
+# Runtime-only lookup sets mirroring `unlocks` (not saved, rebuilt on demand)
+unlock_sets = {}
+
+AUTOSAVE_INTERVAL_SECONDS = 60  # Scheduler "autosave" task interval
 
 def get_next_save_number():
     """Get the next save file number for backup rotation (1 to MAX_BACKUPS)."""
@@ -318,14 +318,3 @@ def load() -> None:
     wake_time = None
     sleep_time = None
     screen_timeout = 60
-
-def autosave() -> None:
-    """
-    Automatically saves the game if the autosave interval has passed.
-    """
-    global _last_save_time
-    now = time.time()
-
-    if now - _last_save_time >= AUTOSAVE_INTERVAL_SECONDS:
-        save()
-        _last_save_time = now
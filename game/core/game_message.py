@@ -1,6 +1,6 @@
 import pygame
 import game.core.constants as constants
-from core.utils.pygame_utils import blit_with_shadow, get_font
+from core.utils.pygame_utils import blit_with_shadow, get_font, load_font
 
 
 class GameMessage:
@@ -13,7 +13,7 @@ class GameMessage:
         self.slide_speed = 6 * (30 / constants.FRAME_RATE)  # Pixels per frame
 
     def add(self, text: str, pos: tuple[int, int], color: tuple[int, int, int], font_size=constants.FONT_SIZE_MEDIUM_LARGE):
-        font = pygame.font.Font(None, font_size)
+        font = load_font(None, font_size)
         surface = font.render(text, True, color).convert_alpha()
         self.messages.append([surface, list(pos), 255, 0])
 
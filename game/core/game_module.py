@@ -4,7 +4,7 @@ from typing import List, Optional
 
 import pygame
 
-from core import runtime_globals
+from core import module_bundle, runtime_globals
 import game.core.constants as constants
 from core.game_enemy import GameEnemy
 import copy
@@ -19,7 +19,8 @@ from core.quest_event_data import QuestData, EventData
 
 class GameModule:
     """
-    Represents a game module, capable of loading metadata and monsters from its folder.
+    Represents a game module, capable of loading metadata and monsters from its folder
+    or from a packed .omb bundle (folder_path is then the bundle file).
     """
 
     def __init__(self, folder_path: str) -> None:
@@ -35,9 +36,9 @@ class GameModule:
 
     def load_module_data(self) -> None:
         json_path = os.path.join(self.folder_path, "module.json")
-        if os.path.exists(json_path):
+        if module_bundle.exists(json_path):
             try:
-                with open(json_path, "r", encoding="utf-8") as file:
+                with module_bundle.open_file(json_path) as file:
                     data = json.load(file)
                     self.name = data.get("name", "default")
                     self.name_format = data.get("name_format", "$_dmc")
@@ -122,8 +123,8 @@ class GameModule:
     def load_items(self):
         """Loads items from item.json if it exists in the module folder."""
         json_path = os.path.join(self.folder_path, "item.json")
-        if os.path.exists(json_path):
-            with open(json_path, "r", encoding="utf-8") as file:
+        if module_bundle.exists(json_path):
+            with module_bundle.open_file(json_path) as file:
                 try:
                     data = json.load(file)
                     # Expecting a list of items in the JSON file
@@ -136,11 +137,11 @@ class GameModule:
     def load_quests_json(self) -> List[QuestData]:
         """Loads quest data from quests.json if it exists in the module folder."""
         json_path = os.path.join(self.folder_path, "quests.json")
-        if not os.path.exists(json_path):
+        if not module_bundle.exists(json_path):
             return []
             
         try:
-            with open(json_path, "r", encoding="utf-8") as file:
+            with module_bundle.open_file(json_path) as file:
                 data = json.load(file)
                 return self.parse_quests_from_json(data)
         except json.JSONDecodeError:
@@ -150,11 +151,11 @@ class GameModule:
     def load_events_json(self) -> List[EventData]:
         """Loads event data from events.json if it exists in the module folder."""
         json_path = os.path.join(self.folder_path, "events.json")
-        if not os.path.exists(json_path):
+        if not module_bundle.exists(json_path):
             return []
             
         try:
-            with open(json_path, "r", encoding="utf-8") as file:
+            with module_bundle.open_file(json_path) as file:
                 data = json.load(file)
                 return self.parse_events_from_json(data)
         except json.JSONDecodeError:
@@ -292,12 +293,12 @@ class GameModule:
         monsters = []
         json_path = os.path.join(self.folder_path, "monster.json")
 
-        if not os.path.exists(json_path):
+        if not module_bundle.exists(json_path):
             runtime_globals.game_console.log(f"⚠️ Monster file {json_path} not found.")
             return monsters
 
         try:
-            with open(json_path, "r", encoding="utf-8") as file:
+            with module_bundle.open_file(json_path) as file:
                 data = json.load(file)
                 for monster in data.get("monster", []):
                     if monster["stage"] == stage and (special_list is None or (monster["special"] and monster["name"] in special_list)):
@@ -313,12 +314,12 @@ class GameModule:
     def get_monster(self, name: str, version: int) -> Optional[dict]:
         json_path = os.path.join(self.folder_path, "monster.json")
 
-        if not os.path.exists(json_path):
+        if not module_bundle.exists(json_path):
             runtime_globals.game_console.log(f"⚠️ Monster file {json_path} not found.")
             return None
 
         try:
-            with open(json_path, "r", encoding="utf-8") as file:
+            with module_bundle.open_file(json_path) as file:
                 data = json.load(file)
                 for monster in data.get("monster", []):
                     if monster["name"] == name and monster["version"] == version:
@@ -329,10 +330,10 @@ class GameModule:
 
     def _parse_battle_json(self, path):
         """Helper to load and normalize battle.json data to a list of dicts."""
-        if not os.path.exists(path):
+        if not module_bundle.exists(path):
             return []
         try:
-            with open(path, "r", encoding="utf-8") as file:
+            with module_bundle.open_file(path) as file:
                 data = json.load(file)
                 if isinstance(data, dict) and "enemies" in data and isinstance(data["enemies"], list):
                     return data["enemies"]
@@ -432,12 +433,12 @@ class GameModule:
         Retorna todos os monstros listados no monster.json deste módulo.
         """
         json_path = os.path.join(self.folder_path, "monster.json")
-        if not os.path.exists(json_path):
+        if not module_bundle.exists(json_path):
             runtime_globals.game_console.log(f"⚠️ Monster file {json_path} not found.")
             return []
 
         try:
-            with open(json_path, "r", encoding="utf-8") as file:
+            with module_bundle.open_file(json_path) as file:
                 data = json.load(file)
                 return data.get("monster", [])
         except json.JSONDecodeError:
@@ -486,7 +487,7 @@ class GameModule:
         
 def sprite_load(path, size=None, scale=1):
     """Loads a sprite and optionally scales it to a fixed size or by a scale factor."""
-    img = pygame.image.load(path).convert_alpha()
+    img = pygame.image.load(module_bundle.image_source(path)).convert_alpha()
     
     if size:
         return pygame.transform.scale(img, size)  # 🔹 Scale to a fixed size
@@ -1,4 +1,3 @@
-from datetime import datetime
 import pygame
 import random
 
@@ -32,6 +31,7 @@ class GamePet:
         self.set_state("idle")
         
         self.age_timer = 0
+        self.last_age_day = 0
         self.direction = -1
         self.injuries = 0
         self.move_timer = random.randint(60, 120)
@@ -83,6 +83,7 @@ class GamePet:
 
     def reset_variables(self):
         self.timer = 0
+        self.last_minute = 0
         if self.evol_weight > 0:
             self.weight = self.evol_weight
         if self.weight < self.min_weight:
@@ -151,15 +152,14 @@ class GamePet:
             if hasattr(self, 'dirty'):
                 self.dirty = True
             
-            runtime_globals.game_console.log(f"{self.name} status {self.state}")
+            runtime_globals.game_console.debug("%s status %s", self.name, self.state, category="Pet")
 
             if self.state == "nap" and self.should_sleep() and new_state != "nap":
                 self.set_back_to_sleep()
 
             # Handle sleeping
             if new_state == "nap":
-                from datetime import datetime
-                self.sleep_start_time = datetime.now()
+                self.sleep_start_time = runtime_globals.game_clock.now
                 self.sleep_timer = 0
             elif self.state == "idle":
                 self.sleep_start_time = None
@@ -265,31 +265,42 @@ class GamePet:
         elif self.state in ("moving", "idle") and self.timer % (constants.FRAME_RATE // 2) == 0 and self.should_sleep():
             self.set_state("tired")
 
+    def update_timed_checks(self):
+        """
+        Runs the daily, per-minute and hourly checks once the frame timers cross
+        a boundary. Called about once a second by SceneMainGame's "pet_checks"
+        scheduler task instead of testing frame modulos on every update.
+        """
         # Increase age every day (24 * 60 * 60 = 86.400)
-        if self.age_timer % (constants.FRAME_RATE * 86400) == 0:
+        day = self.age_timer // (constants.FRAME_RATE * 86400)
+        if day != self.last_age_day:
+            self.last_age_day = day
             self.age += 1
             runtime_globals.game_console.log(f"{self.name} aged to {self.age}")
 
         # Check for evolutions once a minute, considering variable constants
-        if self.timer % (constants.FRAME_RATE * 60) == 0:
-            if self.state not in ("nap", "dead"):
-                self.update_evolution()
-                self.update_needs()
-                self.update_pooping()
-                self.update_care_mistakes()
-                self.update_vital_values_loss()
-            if self.state != "nap":
-                self.update_death_check()
-            
-            if self.back_to_sleep > 0:
-                self.back_to_sleep -= 1
-                if self.back_to_sleep == 0 and self.state != "nap" and self.should_sleep():
-                    self.set_state("nap")
+        minute = self.timer // (constants.FRAME_RATE * 60)
+        if minute == self.last_minute:
+            return
+        self.last_minute = minute
+
+        if self.state not in ("nap", "dead"):
+            self.update_evolution()
+            self.update_needs(minute)
+            self.update_pooping(minute)
+            self.update_care_mistakes()
+            self.update_vital_values_loss()
+        if self.state != "nap":
+            self.update_death_check()
+
+        if self.back_to_sleep > 0:
+            self.back_to_sleep -= 1
+            if self.back_to_sleep == 0 and self.state != "nap" and self.should_sleep():
+                self.set_state("nap")
 
         # Check for vital values gain every hour (60 minutes)
-        if self.timer % (constants.FRAME_RATE * 60 * 60) == 0:
-            if self.state not in ("nap", "dead"):
-                self.update_vital_values_gain()
+        if minute % 60 == 0 and self.state not in ("nap", "dead"):
+            self.update_vital_values_gain()
 
     def update_cache(self):
         # Check for changes that require cache invalidation
@@ -486,6 +497,7 @@ class GamePet:
             runtime_globals.pet_sprites[self][1] = dead_sprite
 
             self.timer = 0
+            self.last_minute = 0
 
         # 🔥 Remove pet from game if dead for too long
         if self.state == "dead" and self.timer > 9000:
@@ -566,15 +578,8 @@ class GamePet:
             def in_range(val, r): return r[0] <= val <= r[1]
             def in_time_range(time_range):
                 try:
-                    now_time = datetime.now().time()
-                    start_time = datetime.strptime(time_range[0].strip(), "%H:%M").time()
-                    end_time = datetime.strptime(time_range[1].strip(), "%H:%M").time()
-                    
-                    if start_time < end_time:
-                        return start_time <= now_time <= end_time
-                    else:
-                        # Handle overnight range (e.g., 23:00 to 01:00)
-                        return now_time >= start_time or now_time <= end_time
+                    # Handles overnight ranges (e.g., 23:00 to 01:00)
+                    return runtime_globals.game_clock.in_time_range(time_range[0], time_range[1])
                 except Exception as e:
                     runtime_globals.game_console.log(f"[!] Error parsing time_range: {e}")
                     return False
@@ -636,15 +641,16 @@ class GamePet:
             
             break
 
-    def update_needs(self):
-        if self.timer % (self.hunger_loss  * 60 * constants.FRAME_RATE) == 0 and self.overfeed_timer == 0:
+    def update_needs(self, minute):
+        frames = minute * 60 * constants.FRAME_RATE  # Timer value at this minute boundary
+        if frames % (self.hunger_loss * 60 * constants.FRAME_RATE) == 0 and self.overfeed_timer == 0:
             if self.hunger > 0:
                 self.hunger -= 1
                 if self.hunger < 0:
                     self.hunger = 0
             else:
                 self.starvation_counter += 1
-        if self.timer % (self.strength_loss * 60 * constants.FRAME_RATE) == 0 and self.strength > 0:
+        if frames % (self.strength_loss * 60 * constants.FRAME_RATE) == 0 and self.strength > 0:
             if self.strength > 4:
                 self.strength = 4
             else:
@@ -654,8 +660,8 @@ class GamePet:
         if self.overfeed_timer > 0:
             self.overfeed_timer -= 1
 
-    def update_pooping(self):
-        if self.stage <= 0 or (self.timer / ( constants.FRAME_RATE * 60)) < 1: return
+    def update_pooping(self, minute):
+        if self.stage <= 0 or minute < 1: return
         if len(game_globals.poop_list) >= (len(game_globals.pet_list) * 8) and self.stage >= 2:
             if self.poop_count_flag == 0:
                 self.poop_count_flag = 1
@@ -668,7 +674,8 @@ class GamePet:
         if self.stage >= 6 and self.age_timer >= 48 * 60 * 60 * constants.FRAME_RATE:
             depletion_rate = 2  # Accelerate depletion after 48 hours
 
-        if self.timer % (self.poop_timer * 60 * constants.FRAME_RATE // depletion_rate) == 0:
+        # Period in frames, so an odd poop_timer at double depletion keeps its half minute
+        if minute * 60 * constants.FRAME_RATE % (self.poop_timer * 60 * constants.FRAME_RATE // depletion_rate) == 0:
             self.set_state("pooping")
 
     def update_care_mistakes(self):
@@ -720,7 +727,7 @@ class GamePet:
         # Add to vital_values (capped at 9999)
         self.vital_values = min(9999, self.vital_values + vital_gain)
         
-        runtime_globals.game_console.log(f"[Vital] {self.name} gained {vital_gain} vital values (activities: {len(self.vital_activities)}). Total: {self.vital_values}")
+        runtime_globals.game_console.debug("%s gained %s vital values (activities: %d). Total: %s", self.name, vital_gain, len(self.vital_activities), self.vital_values, category="Vital")
         
         # Clear activities after gaining vital values
         self.vital_activities.clear()
@@ -738,7 +745,7 @@ class GamePet:
         self.vital_values = max(0, self.vital_values - vital_loss)
         
         if old_vital != self.vital_values:
-            runtime_globals.game_console.log(f"[Vital] {self.name} lost {vital_loss} vital values (poor condition). Total: {self.vital_values}")
+            runtime_globals.game_console.debug("%s lost %s vital values (poor condition). Total: %s", self.name, vital_loss, self.vital_values, category="Vital")
     
     def add_care_mistake(self, mistake_type):
         if self.use_condition_hearts:
@@ -807,7 +814,7 @@ class GamePet:
 
     def check_disturbed_sleep(self):
         if self.state == "nap":
-            runtime_globals.game_console.log(f"[DEBUG] Sleep disturbance {self.sleep_disturbances}")
+            runtime_globals.game_console.debug("Sleep disturbance %s", self.sleep_disturbances, category="Pet")
             self.set_state("idle")
             self.sleep_disturbances += 1
             self.disturbance_penalty += 2
@@ -1006,35 +1013,18 @@ class GamePet:
         global_wake = getattr(game_globals, "wake_time", None)
 
         try:
-            now_time = datetime.now().time()
-
-            # Use global times if set
+            # Use global times if set; windows are parsed once and memoized per minute by the clock
             if global_sleep is not None and global_wake is not None:
-                sleep_time = global_sleep
-                wake_time = global_wake
-            elif self.sleeps and self.wakes:
-                # Cache parsing whenever sleeps/wakes change
-                if not hasattr(self, '_cached_sleep_time') or self._last_sleeps != self.sleeps or self._last_wakes != self.wakes:
-                    self._cached_sleep_time = datetime.strptime(self.sleeps.strip(), "%H:%M").time()
-                    self._cached_wake_time = datetime.strptime(self.wakes.strip(), "%H:%M").time()
-                    self._last_sleeps = self.sleeps
-                    self._last_wakes = self.wakes
-                sleep_time = self._cached_sleep_time
-                wake_time = self._cached_wake_time
-            else:
-                return False
-
-            if sleep_time < wake_time:
-                return sleep_time <= now_time < wake_time
-            else:
-                return now_time >= sleep_time or now_time < wake_time
+                return runtime_globals.game_clock.is_sleep_time(global_sleep, global_wake)
+            return runtime_globals.game_clock.is_sleep_time(self.sleeps, self.wakes)
 
         except Exception as e:
             runtime_globals.game_console.log(f"[!] Error parsing sleep range: {e}")
             return False
 
     def check_wake_up(self):
-        now = datetime.now()
+        clock = runtime_globals.game_clock
+        now = clock.now
 
         if not hasattr(self, 'sleep_start_time'):
             return
@@ -1046,16 +1036,12 @@ class GamePet:
             if global_wake is not None:
                 wake_time = global_wake
             elif self.wakes:
-                # Cache parsing if wakes change
-                if not hasattr(self, '_cached_wake_time') or self._last_wakes != self.wakes:
-                    self._cached_wake_time = datetime.strptime(self.wakes.strip(), "%H:%M").time()
-                    self._last_wakes = self.wakes
-                wake_time = self._cached_wake_time
+                wake_time = self.wakes
             else:
                 return
 
             # Wake up if it's the wake time exactly (match hour and minute)
-            if now.hour == wake_time.hour and now.minute == wake_time.minute:
+            if clock.is_clock_minute(wake_time):
                 slept_seconds = (now - self.sleep_start_time).total_seconds()
                 slept_hours = int(slept_seconds // 3600)
 
@@ -1064,7 +1050,7 @@ class GamePet:
                     runtime_globals.game_console.log(f"{self.name} slept {slept_hours}h and recovered DP!")
 
                 self.set_state("idle")
-                runtime_globals.game_console.log(f"{self.name} woke up naturally at {wake_time.strftime('%H:%M')}")
+                runtime_globals.game_console.log(f"{self.name} woke up naturally at {wake_time if isinstance(wake_time, str) else wake_time.strftime('%H:%M')}")
 
         except Exception as e:
             runtime_globals.game_console.log(f"[!] Error parsing wake time: {e}")
@@ -1083,6 +1069,9 @@ class GamePet:
             runtime_globals.pet_sprites[self][1] = runtime_globals.pet_sprites[self][0]
 
     def patch(self):
+        if not hasattr(self, "last_minute"):
+            self.last_minute = self.timer // (constants.FRAME_RATE * 60)
+            self.last_age_day = self.age_timer // (constants.FRAME_RATE * 86400)
         if not hasattr(self, "trophies"):
             self.trophies = 0
         if not hasattr(self, "vital_values"):
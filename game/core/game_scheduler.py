@@ -0,0 +1,139 @@
+import heapq
+import itertools
+import time
+import weakref
+
+#=====================================================================
+# GameScheduler - Central timer for recurring and one-shot game tasks
+#=====================================================================
+
+class ScheduledTask:
+    """
+    A task registered with the GameScheduler.
+    Bound-method callbacks are held weakly so a task dies with its component.
+    """
+
+    def __init__(self, name: str, callback, interval: float, due: float, owner=None) -> None:
+        self.name = name
+        self.interval = interval  # None for one-shot tasks
+        self.due = due
+        self.owner = owner
+        self.cancelled = False
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            self._callback = weakref.WeakMethod(callback)
+            self._weak = True
+        else:
+            self._callback = callback
+            self._weak = False
+
+        # Profiling
+        self.runs = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.last_run = None
+
+    def get_callback(self):
+        return self._callback() if self._weak else self._callback
+
+    def cancel(self) -> None:
+        self.cancelled = True
+        # The heap keeps cancelled tasks until they come due; drop what they hold now
+        self.owner = None
+        self._callback = None
+        self._weak = False
+
+
+class GameScheduler:
+    """
+    Min-heap of tasks keyed on monotonic time.
+    Each update only peeks at the earliest due time, so frames with nothing
+    due cost a single comparison no matter how many tasks are registered.
+    """
+
+    def __init__(self, clock=time.monotonic) -> None:
+        self.clock = clock
+        self._heap = []
+        self._counter = itertools.count()
+        self.tasks = []
+
+    def every(self, name: str, interval: float, callback, owner=None, first_delay: float = None) -> ScheduledTask:
+        """Registers a recurring task running every interval seconds."""
+        delay = interval if first_delay is None else first_delay
+        task = ScheduledTask(name, callback, interval, self.clock() + delay, owner)
+        self._push(task)
+        return task
+
+    def once(self, name: str, delay: float, callback, owner=None) -> ScheduledTask:
+        """Registers a task that runs once after delay seconds."""
+        task = ScheduledTask(name, callback, None, self.clock() + delay, owner)
+        self._push(task)
+        return task
+
+    def cancel_owner(self, owner) -> None:
+        """Cancels every task registered with the given owner."""
+        for task in self.tasks:
+            if task.owner is owner:
+                task.cancel()
+        self._prune()
+
+    def update(self) -> None:
+        """Runs every task whose due time has passed."""
+        if not self._heap:
+            return
+        now = self.clock()
+        if self._heap[0][0] > now:
+            return
+
+        while self._heap and self._heap[0][0] <= now:
+            _, _, task = heapq.heappop(self._heap)
+            if task.cancelled:
+                continue
+            callback = task.get_callback()
+            if callback is None:
+                task.cancel()
+                continue
+
+            start = time.perf_counter()
+            try:
+                callback()
+            except Exception as e:
+                from core import runtime_globals  # runtime_globals creates the scheduler, import on use
+                runtime_globals.game_console.log(f"[Scheduler] Task '{task.name}' failed: {e}")
+            elapsed = time.perf_counter() - start
+            task.runs += 1
+            task.total_time += elapsed
+            task.max_time = max(task.max_time, elapsed)
+            task.last_run = now
+
+            if task.interval is not None and not task.cancelled:
+                task.due += task.interval
+                if task.due <= now:
+                    # Fell behind (e.g. system suspended): skip missed runs
+                    task.due = now + task.interval
+                heapq.heappush(self._heap, (task.due, next(self._counter), task))
+            else:
+                task.cancel()
+        self._prune()
+
+    def get_task_stats(self) -> list[dict]:
+        """Returns a snapshot of live tasks for inspection from the debug scene."""
+        now = self.clock()
+        stats = []
+        for task in sorted(self.tasks, key=lambda t: t.due):
+            stats.append({
+                "name": task.name,
+                "interval": task.interval,
+                "due_in": task.due - now,
+                "runs": task.runs,
+                "avg_ms": (task.total_time / task.runs * 1000) if task.runs else 0.0,
+                "max_ms": task.max_time * 1000,
+            })
+        return stats
+
+    def _push(self, task: ScheduledTask) -> None:
+        self.tasks.append(task)
+        heapq.heappush(self._heap, (task.due, next(self._counter), task))
+
+    def _prune(self) -> None:
+        if any(task.cancelled for task in self.tasks):
+            self.tasks = [task for task in self.tasks if not task.cancelled]
@@ -0,0 +1,242 @@
+import gzip
+import os
+import random
+import struct
+import time
+import zlib
+
+from core import game_digidex, game_globals, runtime_globals
+
+#=====================================================================
+# Session recording - Deterministic record and replay of game sessions
+#=====================================================================
+# File layout (gzip-compressed):
+#   header   MAGIC, version, seed, head-to-head pattern, start wall/monotonic,
+#            screen size, then the save file and digidex loaded at boot
+#   records  one type byte followed by its payload:
+#            F  u16 milliseconds since the previous frame (one per update)
+#            W  f64 wall, f64 monotonic (absolute resync after long gaps)
+#            I  u8 source, u8 length, action (input handled in the current frame)
+#            C  u32 frame, u32 state checksum (every CHECKSUM_INTERVAL frames)
+#
+# The recorder feeds its quantized readings back into the game clock, so the
+# live session sees exactly the times the replay will reproduce.
+
+MAGIC = b"OMNIREC"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<7sBQBddHHII")
+FRAME = struct.Struct("<H")
+RESYNC = struct.Struct("<dd")
+INPUT = struct.Struct("<BB")
+CHECKSUM = struct.Struct("<II")
+
+CHECKSUM_INTERVAL = 60
+MAX_FRAME_DELTA_MS = 0xFFFF
+WALL_DRIFT_LIMIT = 1.0  # Seconds the wall clock may drift from monotonic before a resync
+
+INPUT_SOURCES = ("keyboard", "joystick", "gpio", "shake", "script")
+
+
+def compute_state_checksum() -> int:
+    """CRC of the simulation state that must match between a session and its replay."""
+    pets = [
+        tuple(getattr(pet, field, None) for field in (
+            "name", "stage", "state", "age", "weight", "hunger", "strength", "effort",
+            "mistakes", "sick", "injuries", "dp", "level", "experience", "x", "y",
+        ))
+        for pet in game_globals.pet_list
+    ]
+    state = (pets, len(game_globals.poop_list), runtime_globals.game_state, game_globals.xai)
+    return zlib.crc32(repr(state).encode("utf-8"))
+
+
+def _read_file(path: str) -> bytes:
+    if path and os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read()
+    return b""
+
+
+#=====================================================================
+# SessionRecorder
+#=====================================================================
+
+class SessionRecorder:
+    """
+    Records a session from boot: call start() before VirtualPetGame is created
+    and close() on exit.
+    """
+
+    def __init__(self, path: str, width: int, height: int, seed: int = None) -> None:
+        self.path = path
+        self.width = width
+        self.height = height
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        self.file = None
+        self.frame = 0
+
+    def start(self) -> None:
+        """Snapshots the save, seeds the RNG and hooks the game clock and input queue."""
+        save_data = _read_file(game_globals.get_latest_save_file())
+        digidex_data = _read_file(game_digidex.DIGIDEX_PATH)
+
+        random.seed(self.seed)
+        runtime_globals.last_headtohead_pattern = random.randint(0, 5)
+
+        self.wall = time.time()
+        self.monotonic = round(time.monotonic(), 3)
+        self.file = gzip.open(self.path, "wb")
+        self.file.write(HEADER.pack(
+            MAGIC, FORMAT_VERSION, self.seed, runtime_globals.last_headtohead_pattern,
+            self.wall, self.monotonic, self.width, self.height, len(save_data), len(digidex_data)
+        ))
+        self.file.write(save_data)
+        self.file.write(digidex_data)
+
+        clock = runtime_globals.game_clock
+        clock.source = lambda: (self.wall, self.monotonic)
+        clock.tick()
+        clock.source = self.next_time
+        runtime_globals.game_input.listener = self.record_inputs
+        runtime_globals.game_console.log(f"[Session] Recording to {self.path} (seed {self.seed})")
+
+    def next_time(self):
+        """Clock source: quantizes real time to whole milliseconds and records it."""
+        if self.frame and self.frame % CHECKSUM_INTERVAL == 0:
+            self.file.write(b"C" + CHECKSUM.pack(self.frame, compute_state_checksum()))
+
+        now = time.monotonic()
+        delta_ms = max(0, round((now - self.monotonic) * 1000))
+        predicted_wall = self.wall + delta_ms / 1000
+        if delta_ms > MAX_FRAME_DELTA_MS or abs(time.time() - predicted_wall) > WALL_DRIFT_LIMIT:
+            self.wall = time.time()
+            self.monotonic = round(now, 3)
+            self.file.write(b"W" + RESYNC.pack(self.wall, self.monotonic))
+        else:
+            self.wall = predicted_wall
+            self.monotonic += delta_ms / 1000
+            self.file.write(b"F" + FRAME.pack(delta_ms))
+
+        self.frame += 1
+        return self.wall, self.monotonic
+
+    def record_inputs(self, events) -> None:
+        """Input queue listener: records the actions handled in the current frame."""
+        for _, source, action in events:
+            data = action.encode("utf-8")[:255]
+            source_id = INPUT_SOURCES.index(source) if source in INPUT_SOURCES else len(INPUT_SOURCES) - 1
+            self.file.write(b"I" + INPUT.pack(source_id, len(data)) + data)
+
+    def close(self) -> None:
+        if self.file is None:
+            return
+        runtime_globals.game_clock.source = None
+        runtime_globals.game_input.listener = None
+        self.file.close()
+        self.file = None
+        runtime_globals.game_console.log(f"[Session] Recorded {self.frame} frames to {self.path}")
+
+
+#=====================================================================
+# SessionReplayer
+#=====================================================================
+
+class SessionReplayer:
+    """
+    Replays a recorded session. Pass it to HeadlessRunner.boot(session=...) so
+    the recorded save and seed are installed before the game is created, then
+    step the runner until finished is set.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file = gzip.open(path, "rb")
+        header = self.file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path} is not a session recording")
+        (magic, version, self.seed, self.headtohead, self.start_wall, self.start_monotonic,
+         self.width, self.height, save_size, digidex_size) = HEADER.unpack(header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} session recording")
+        self.save_data = self.file.read(save_size)
+        self.digidex_data = self.file.read(digidex_size)
+
+        self.frame = 0
+        self.finished = False
+        self.divergences = []  # (frame, recorded checksum, replayed checksum)
+        self._pending = None
+
+    def start(self) -> None:
+        """Restores the recorded save and digidex, seeds the RNG and hooks the game clock."""
+        if self.save_data:
+            os.makedirs(game_globals.SAVE_DIR, exist_ok=True)
+            with open(os.path.join(game_globals.SAVE_DIR, "save_data_1.dat"), "wb") as f:
+                f.write(self.save_data)
+        if self.digidex_data:
+            with open(game_digidex.DIGIDEX_PATH, "wb") as f:
+                f.write(self.digidex_data)
+
+        random.seed(self.seed)
+        runtime_globals.last_headtohead_pattern = random.randint(0, 5)
+        self.wall, self.monotonic = self.start_wall, self.start_monotonic
+
+        clock = runtime_globals.game_clock
+        clock.source = lambda: (self.wall, self.monotonic)
+        clock.tick()
+        clock.source = self.next_time
+
+    def _read_record(self):
+        if self._pending is not None:
+            record, self._pending = self._pending, None
+            return record
+        kind = self.file.read(1)
+        if not kind:
+            return None
+        if kind == b"F":
+            return kind, FRAME.unpack(self.file.read(FRAME.size))
+        if kind == b"W":
+            return kind, RESYNC.unpack(self.file.read(RESYNC.size))
+        if kind == b"C":
+            return kind, CHECKSUM.unpack(self.file.read(CHECKSUM.size))
+        if kind == b"I":
+            source_id, length = INPUT.unpack(self.file.read(INPUT.size))
+            return kind, (INPUT_SOURCES[source_id], self.file.read(length).decode("utf-8"))
+        raise ValueError(f"Corrupt session recording at frame {self.frame}: record type {kind!r}")
+
+    def next_time(self):
+        """Clock source: returns the recorded time of this frame and queues its inputs."""
+        while True:
+            record = self._read_record()
+            if record is None:
+                self.finished = True
+                return self.wall, self.monotonic
+            kind, payload = record
+            if kind == b"C":
+                recorded_frame, recorded = payload
+                replayed = compute_state_checksum()
+                if recorded != replayed:
+                    self.divergences.append((recorded_frame, recorded, replayed))
+                continue
+            if kind == b"F":
+                self.wall += payload[0] / 1000
+                self.monotonic += payload[0] / 1000
+            elif kind == b"W":
+                self.wall, self.monotonic = payload
+            break
+
+        # Inputs recorded after this frame's time were handled during this frame
+        game_input = runtime_globals.game_input
+        while True:
+            record = self._read_record()
+            if record is None or record[0] != b"I":
+                self._pending = record
+                break
+            source, action = record[1]
+            game_input.push(action, source)
+
+        self.frame += 1
+        return self.wall, self.monotonic
+
+    def close(self) -> None:
+        runtime_globals.game_clock.source = None
+        self.file.close()
@@ -1,5 +1,7 @@
 import pygame
 import os
+import threading
+import time
 from core import game_globals
 import game.core.constants as constants
 
@@ -7,20 +9,36 @@ import game.core.constants as constants
 # GameSound - Sound management (loading and playing sounds)
 #=====================================================================
 
+# Each category owns a reserved mixer channel, so a new effect only cuts
+# off the previous effect of the same kind instead of every sound.
+SOUND_CATEGORIES = {
+    "ui": ("noise_beep", "cancel", "menu"),
+    "alert": ("need_attention", "alarm"),
+    "battle": ("battle", "attack", "attack_hit", "attack_fail", "battle_online"),
+    "event": ("evolution", "fail_long", "success", "happy", "fail", "death", "happy2"),
+}
+
+# Labels at or above this index are streamed as music instead of decoded effects
+MUSIC_INDEX = 18
+
+
 class GameSound:
     """
     Handles loading and playing of game sounds.
+    Effects are decoded lazily (and warmed up by a background thread),
+    music fades are advanced by update() once per frame.
     """
 
     def __init__(self, base_path: str = constants.DMC_SOUNDS_PATH) -> None:
         """
-        Initializes the sound system and loads all sounds.
+        Initializes the sound system and starts warming up the effect cache.
 
         Args:
             base_path (str): Path where sound files are located.
         """
         self.base_path = base_path
         self.sounds = {}
+        self.missing = set()
         self.sound_labels = {
             1: "noise_beep",
             2: "cancel",
@@ -42,28 +60,64 @@ class GameSound:
             18: "evolution_plus",
             19: "evolution_2020",
         }
+        self.label_index = {label: index for index, label in self.sound_labels.items()}
+        self.label_category = {label: category for category, labels in SOUND_CATEGORIES.items() for label in labels}
+        self.channels = {}
+        self.fade = None  # (start volume, target volume, start time, duration, stop when done)
+        self._lock = threading.Lock()
 
         # Initialize pygame mixer
-        pygame.mixer.init()
+        try:
+            pygame.mixer.init()
+            pygame.mixer.set_reserved(len(SOUND_CATEGORIES))
+            self.channels = {category: pygame.mixer.Channel(i) for i, category in enumerate(SOUND_CATEGORIES)}
+            self.enabled = True
+        except pygame.error as e:
+            print(f"[!] Audio disabled, mixer unavailable: {e}")
+            self.enabled = False
+            return
 
-        # Load all sounds
-        self.load_sounds()
+        # Decode effects in the background so the first play of each one does not stall a frame
+        threading.Thread(target=self.load_sounds, name="SoundLoader", daemon=True).start()
 
     def load_sounds(self) -> None:
         """
         Loads all sounds defined in sound_labels into memory.
         """
-        for index, label in self.sound_labels.items():
+        for label in self.sound_labels.values():
+            self.get_sound(label)
+
+    def get_sound(self, name: str):
+        """
+        Returns the decoded Sound (or music file path) for a label, loading it on first use.
+        Returns None if the label is unknown or its file is missing.
+        """
+        sound = self.sounds.get(name)
+        if sound is not None or name in self.missing:
+            return sound
+
+        index = self.label_index.get(name)
+        if index is None:
+            return None
+
+        with self._lock:
+            if name in self.sounds:
+                return self.sounds[name]
             filename = f"{index}.wav"
             filepath = os.path.join(self.base_path, filename)
             try:
-                if index < 18:
+                if index < MUSIC_INDEX:
                     sound = pygame.mixer.Sound(filepath)
-                    self.sounds[label] = sound
+                elif os.path.exists(filepath):
+                    sound = filepath
                 else:
-                    self.sounds[label] = filepath
-            except pygame.error as e:
+                    raise FileNotFoundError(filepath)
+            except (pygame.error, OSError) as e:
                 print(f"[!] Failed to load sound '{filename}': {e}")
+                self.missing.add(name)
+                return None
+            self.sounds[name] = sound
+            return sound
 
     def play(self, name: str) -> None:
         """
@@ -72,45 +126,63 @@ class GameSound:
         Args:
             name (str): The sound label to play (e.g., 'menu', 'fail', 'evolution').
         """
-        if not game_globals.sound:
+        if not game_globals.sound or not self.enabled:
             return
 
-        if name in self.sounds:
-            if isinstance(self.sounds[name], pygame.mixer.Sound):
-                self.stop_all()
-                self.sounds[name].set_volume(game_globals.sound / 10)
-                self.sounds[name].play()
+        if name not in self.label_index:
+            print(f"[!] Sound '{name}' not found.")
+            return
+
+        sound = self.get_sound(name)
+        if sound is None:
+            return
+
+        volume = game_globals.sound / 10
+        if isinstance(sound, pygame.mixer.Sound):
+            sound.set_volume(volume)
+            channel = self.channels.get(self.label_category.get(name, "event"))
+            if channel is not None:
+                channel.play(sound)
             else:
-                pygame.mixer.music.load(self.sounds[name])
-                pygame.mixer.music.set_volume(game_globals.sound / 10)
-                pygame.mixer.music.play()
+                sound.play()
         else:
-            print(f"[!] Sound '{name}' not found.")
+            self.fade = None
+            pygame.mixer.music.load(sound)
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play()
 
     def stop_all(self) -> None:
         """
         Stops all currently playing sounds.
         """
-        pygame.mixer.stop()
+        if self.enabled:
+            pygame.mixer.stop()
 
     def get_music_position(self) -> float:
-        """Returns the current playback position in milliseconds."""
+        """Returns the current playback position in seconds."""
+        if not self.enabled:
+            return 0
         return pygame.mixer.music.get_pos() / 1000
 
-    def fade_in_music(target_volume=1.0, duration=3):
-        """Gradually increases the volume over the given duration in seconds."""
-        steps = 30  # 🔹 Adjust volume in 30 steps for smooth fading
-        increment = target_volume / steps
-        for i in range(steps):
-            pygame.mixer.music.set_volume(i * increment)
-            pygame.time.delay(duration * 1000 // steps)  # 🔥 Small delay for smooth transition
-
-    def fade_out_music(duration=3):
-        """Gradually decreases the volume to 0 over the given duration."""
-        steps = 30  
-        current_volume = pygame.mixer.music.get_volume()  # 🔹 Get current volume
-        decrement = current_volume / steps
-        for i in range(steps):
-            pygame.mixer.music.set_volume(current_volume - (i * decrement))
-            pygame.time.delay(duration * 1000 // steps)  
-        pygame.mixer.music.stop()  # 🔥 Stops music after fade-out
\ No newline at end of file
+    def fade_in_music(self, target_volume=1.0, duration=3):
+        """Starts raising the music volume to target_volume over duration seconds (advanced by update)."""
+        if self.enabled:
+            self.fade = (0.0, target_volume, time.monotonic(), duration, False)
+            pygame.mixer.music.set_volume(0.0)
+
+    def fade_out_music(self, duration=3):
+        """Starts lowering the music volume to 0 over duration seconds, then stops it (advanced by update)."""
+        if self.enabled:
+            self.fade = (pygame.mixer.music.get_volume(), 0.0, time.monotonic(), duration, True)
+
+    def update(self) -> None:
+        """Advances the active music fade. Called once per frame by the game loop."""
+        if self.fade is None:
+            return
+        start_volume, target_volume, start_time, duration, stop_when_done = self.fade
+        progress = 1.0 if duration <= 0 else min(1.0, (time.monotonic() - start_time) / duration)
+        pygame.mixer.music.set_volume(start_volume + (target_volume - start_volume) * progress)
+        if progress >= 1.0:
+            self.fade = None
+            if stop_when_done:
+                pygame.mixer.music.stop()
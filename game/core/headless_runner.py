@@ -0,0 +1,191 @@
+"""
+Headless Runner
+Boots VirtualPetGame without a display, audio device or I2C hardware and drives it
+with scripted input, running frames as fast as possible. Used by the benchmark
+suite (utilities/benchmark.py) and for reproducing bugs without a device.
+"""
+
+import os
+import tempfile
+import time
+
+import pygame
+
+#=====================================================================
+# Hardware stand-ins
+#=====================================================================
+
+class HeadlessI2C:
+    """
+    Stand-in for I2CUtils: no accelerometer and a full, unplugged battery.
+    """
+
+    def __init__(self):
+        self.valid = False
+        self.fifo_enabled = False
+        self.charging = False
+        self.battery_percent = 100.0
+
+    def get_battery_info(self):
+        return self.battery_percent, self.charging
+
+    def read_accel(self):
+        return 0.0, 0.0, 1.0
+
+
+#=====================================================================
+# HeadlessRunner
+#=====================================================================
+
+class HeadlessRunner:
+    """
+    Runs the game under the SDL dummy video/audio drivers.
+    Saves go to a temporary directory unless save_dir is given, so a run never
+    touches the player's save files.
+    """
+
+    def __init__(self, width: int = 240, height: int = 240, save_dir: str = None, verbose: bool = False) -> None:
+        self.width = width
+        self.height = height
+        self.save_dir = save_dir
+        self.verbose = verbose
+        self.game = None
+        self.screen = None
+        self.frame = 0
+        self.boot_time = None
+
+    # -----------------------------------------------------------------
+    # Boot
+    # -----------------------------------------------------------------
+    def boot(self, session=None):
+        """
+        Initializes pygame headlessly, installs the hardware stand-ins and creates VirtualPetGame.
+        session is an optional SessionRecorder or SessionReplayer started right before the game.
+        """
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+        start = time.perf_counter()
+        pygame.init()
+
+        from core import game_digidex, game_globals, runtime_globals
+        from core.input.shake_detector import ShakeDetector, SimulatedAccelerometer
+        import game.core.constants as constants
+
+        constants.update_resolution_constants(width=self.width, height=self.height)
+        self.screen = pygame.display.set_mode((self.width, self.height))
+
+        if self.save_dir is None:
+            self.save_dir = tempfile.mkdtemp(prefix="omnimon_headless_")
+        game_globals.SAVE_DIR = self.save_dir
+        game_globals.SAVE_FILE = os.path.join(self.save_dir, "save_data.dat")
+        game_digidex.DIGIDEX_PATH = os.path.join(self.save_dir, "digidex.json")
+
+        # Pre-set the deferred managers so the real hardware is never probed
+        runtime_globals.i2c = HeadlessI2C()
+        self.accelerometer = SimulatedAccelerometer()
+        runtime_globals.shake_detector = ShakeDetector(self.accelerometer)
+        runtime_globals.game_console.enabled = self.verbose
+        if session is not None:
+            session.start()
+
+        from game.vpet import VirtualPetGame
+        self.game = VirtualPetGame()
+        self.boot_time = time.perf_counter() - start
+        return self.game
+
+    # -----------------------------------------------------------------
+    # Input
+    # -----------------------------------------------------------------
+    def press(self, action: str) -> None:
+        """Queues an input action (e.g. "A", "LEFT") for the next frame."""
+        from core import runtime_globals
+        runtime_globals.game_input.push(action, "script")
+
+    def shake(self) -> None:
+        """Queues a shake for the next frame."""
+        from core import runtime_globals
+        runtime_globals.game_input.push("SHAKE", "script")
+
+    def change_scene(self, state: str, frames: int = 1) -> None:
+        """Switches to a scene state and runs a few frames so it is fully entered."""
+        from core.utils.scene_utils import change_scene
+        change_scene(state)
+        self.run_frames(frames)
+
+    # -----------------------------------------------------------------
+    # Frames
+    # -----------------------------------------------------------------
+    def step(self) -> float:
+        """Runs one update + draw and returns its duration in seconds."""
+        from core import runtime_globals
+        start = time.perf_counter()
+        self.game.update()
+        self.game.draw(self.screen)
+        runtime_globals.frame_profiler.end_frame()
+        self.frame += 1
+        return time.perf_counter() - start
+
+    def run_frames(self, count: int, inputs: dict = None) -> list:
+        """
+        Runs count frames without frame limiting.
+
+        Args:
+            count (int): Number of frames.
+            inputs (dict): Optional {frame offset: [actions]} pressed before that frame.
+
+        Returns:
+            list: Duration of each frame in seconds.
+        """
+        timings = []
+        for offset in range(count):
+            for action in (inputs or {}).get(offset, ()):
+                self.press(action)
+            timings.append(self.step())
+        return timings
+
+    def run_script(self, script) -> list:
+        """
+        Runs a list of steps and returns every frame duration.
+        Steps are tuples: ("frames", n), ("press", action), ("shake",), ("scene", state).
+        """
+        timings = []
+        for step in script:
+            kind = step[0]
+            if kind == "frames":
+                timings += self.run_frames(step[1])
+            elif kind == "press":
+                self.press(step[1])
+            elif kind == "shake":
+                self.shake()
+            elif kind == "scene":
+                self.change_scene(step[1], 0)
+            else:
+                raise ValueError(f"Unknown script step: {step}")
+        return timings
+
+    # -----------------------------------------------------------------
+    # Game state helpers
+    # -----------------------------------------------------------------
+    def set_pets(self, count: int, stage: int = 3) -> list:
+        """Replaces the pet list with count pets at the given stage, one per loaded module in turn."""
+        from core import game_globals, runtime_globals
+        from core.game_pet import GamePet
+
+        game_globals.pet_list.clear()
+        modules = list(runtime_globals.game_modules.values())
+        for index in range(count):
+            module = modules[index % len(modules)]
+            egg = module.get_monsters_by_stage(0)[0]
+            pet = GamePet(egg)
+            target = next(
+                (m for m in module.get_all_monsters() if m["stage"] == stage and m["version"] == egg["version"]),
+                None
+            )
+            if target is not None:
+                pet.evolve_to(target["name"], target["version"])
+            game_globals.pet_list.append(pet)
+        return game_globals.pet_list
+
+    def close(self) -> None:
+        pygame.quit()
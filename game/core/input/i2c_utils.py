@@ -1,6 +1,7 @@
 import time
 import struct
 import os
+import threading
 
 try:
     import smbus  # type: ignore
@@ -24,6 +25,14 @@ CW2015_REG_VCELL = 0x02
 CW2015_REG_SOC = 0x04
 CW2015_REG_MODE = 0x0A
 BMI160_ADDRESS = 0x69
+BMI160_REG_FIFO_LENGTH = 0x22
+BMI160_REG_FIFO_DATA = 0x24
+BMI160_REG_FIFO_CONFIG_1 = 0x47
+BMI160_CMD = 0x7E
+BMI160_CMD_FIFO_FLUSH = 0xB0
+BMI160_FIFO_ACC_HEADERLESS = 0x40  # Accelerometer frames only, no frame headers
+BMI160_FIFO_FRAME_SIZE = 6
+SMBUS_BLOCK_LIMIT = 30  # Largest multiple of the frame size within a 32-byte SMBus block
 
 class I2CUtils:
     def __init__(self):
@@ -38,6 +47,10 @@ class I2CUtils:
         self._last_voltage = None
         self._charging_counter = 0  # For debounce
 
+        # The shake sampler thread and the battery reads share the bus
+        self.bus_lock = threading.Lock()
+        self.fifo_enabled = False
+
         if IS_RPI:
             self.quick_start()  # Initialize CW2015 at startup
             self.init_bmi160()
@@ -57,7 +70,8 @@ class I2CUtils:
         if not IS_RPI:
             return None
         try:
-            vcell = self.bus.read_word_data(CW2015_ADDRESS, CW2015_REG_VCELL)
+            with self.bus_lock:
+                vcell = self.bus.read_word_data(CW2015_ADDRESS, CW2015_REG_VCELL)
             voltage = ((vcell & 0xFF) << 8 | (vcell >> 8)) * 0.305 / 1000
 
             # Charging detection logic
@@ -80,7 +94,8 @@ class I2CUtils:
         if not IS_RPI:
             return None
         try:
-            soc = self.bus.read_word_data(CW2015_ADDRESS, CW2015_REG_SOC)
+            with self.bus_lock:
+                soc = self.bus.read_word_data(CW2015_ADDRESS, CW2015_REG_SOC)
             capacity = ((soc & 0xFF) << 8 | (soc >> 8)) / 256
             return capacity
         except Exception as e:
@@ -140,11 +155,46 @@ class I2CUtils:
         if not self.valid or not IS_RPI:
             return 0.0, 0.0, 1.0  # Default Z-axis down
         try:
-            data = self.bus.read_i2c_block_data(self.bmi160_addr, 0x12, 6)
+            with self.bus_lock:
+                data = self.bus.read_i2c_block_data(self.bmi160_addr, 0x12, 6)
             x = struct.unpack('<h', bytes(data[0:2]))[0]
             y = struct.unpack('<h', bytes(data[2:4]))[0]
             z = struct.unpack('<h', bytes(data[4:6]))[0]
             factor = 16384.0
             return x / factor, y / factor, z / factor
         except Exception:
-            return None, None, None
\ No newline at end of file
+            return None, None, None
+
+    def init_bmi160_fifo(self):
+        """ Enable the BMI160 FIFO in headerless accelerometer-only mode """
+        if not self.valid or not IS_RPI:
+            return
+        try:
+            with self.bus_lock:
+                self.bus.write_byte_data(self.bmi160_addr, BMI160_REG_FIFO_CONFIG_1, BMI160_FIFO_ACC_HEADERLESS)
+                self.bus.write_byte_data(self.bmi160_addr, BMI160_CMD, BMI160_CMD_FIFO_FLUSH)
+            self.fifo_enabled = True
+        except Exception as e:
+            print(f"BMI160 FIFO init error: {e}")
+            self.fifo_enabled = False
+
+    def read_accel_fifo(self):
+        """ Drain the BMI160 FIFO, returning a list of (x, y, z) samples (None on error) """
+        if not self.fifo_enabled:
+            return None
+        try:
+            with self.bus_lock:
+                length_data = self.bus.read_i2c_block_data(self.bmi160_addr, BMI160_REG_FIFO_LENGTH, 2)
+                length = (length_data[0] | (length_data[1] << 8)) & 0x07FF
+                length -= length % BMI160_FIFO_FRAME_SIZE
+                raw = []
+                while len(raw) < length:
+                    chunk = min(SMBUS_BLOCK_LIMIT, length - len(raw))
+                    raw += self.bus.read_i2c_block_data(self.bmi160_addr, BMI160_REG_FIFO_DATA, chunk)
+            factor = 16384.0
+            samples = []
+            for x, y, z in struct.iter_unpack('<hhh', bytes(raw)):
+                samples.append((x / factor, y / factor, z / factor))
+            return samples
+        except Exception:
+            return None
\ No newline at end of file
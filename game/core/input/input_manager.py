@@ -2,6 +2,10 @@ import pygame
 import platform
 import json
 import os
+import queue
+import threading
+import time
+from collections import deque
 
 # Try to import gpiozero, but handle gracefully if not available (e.g., desktop)
 try:
@@ -13,6 +17,17 @@ except ImportError:
 
 CONFIG_PATH = "config/input_config.json"
 
+# Press-to-handle latencies kept per source for the percentile report
+LATENCY_HISTORY_SIZE = 256
+
+# Analog stick directions are forwarded to scenes as plain directions
+ANALOG_DIRECTIONS = {
+    "ANALOG_UP": "UP",
+    "ANALOG_DOWN": "DOWN",
+    "ANALOG_LEFT": "LEFT",
+    "ANALOG_RIGHT": "RIGHT",
+}
+
 def load_input_config():
     # Load and parse the config file
     with open(CONFIG_PATH, "r") as f:
@@ -36,6 +51,8 @@ class InputManager:
     """
     Unified input layer for keyboard, GPIO, and joystick/controller input.
     Joystick events are normalized + stateful to avoid duplicates and ghost releases.
+    Every source pushes (timestamp, source, action) into one thread-safe queue
+    (GPIO from gpiozero callback threads), which the game loop drains in order.
     """
 
     def __init__(self, analog_deadzone=0.1):
@@ -51,11 +68,15 @@ class InputManager:
         # We’ll populate per‑joystick button maps after init (allows overrides).
         self.joystick_button_maps = {}  # joy_id -> {button_index: action}
 
-        # --- State tracking sets (GPIO + joystick unified) ---
-        self.just_pressed_gpio = set()
+        # --- Timestamped event queue shared by every source ---
+        self.events = queue.SimpleQueue()
+        self.latencies = {}  # source -> deque of press-to-handle seconds
+        self.listener = None  # Optional callable receiving each drained batch (session recorder)
+
+        # --- State tracking sets ---
         self.active_gpio_inputs = set()
+        self.gpio_lock = threading.Lock()  # gpiozero calls handlers from its own threads
 
-        self.joystick_just_pressed = set()
         self.joystick_active_inputs = set()
 
         # Track directional states separately so we emit clean changes
@@ -79,6 +100,51 @@ class InputManager:
                 except Exception:
                     pass  # ignore missing pins
 
+    # ------------------------------------------------------------------
+    # Event queue
+    # ------------------------------------------------------------------
+    def push(self, action, source, timestamp=None):
+        """Queues an action from any thread. timestamp defaults to now (time.monotonic)."""
+        self.events.put((time.monotonic() if timestamp is None else timestamp, source, action))
+
+    def drain(self):
+        """Returns every queued (timestamp, source, action), ordered by timestamp."""
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        events.sort(key=lambda event: event[0])
+        if events and self.listener is not None:
+            self.listener(events)
+        return events
+
+    def record_latency(self, source, timestamp):
+        """Records the time from press (timestamp) until the scene finished handling it."""
+        history = self.latencies.get(source)
+        if history is None:
+            history = self.latencies[source] = deque(maxlen=LATENCY_HISTORY_SIZE)
+        history.append(time.monotonic() - timestamp)
+
+    def get_latency_stats(self):
+        """Returns {source: {"count", "p50", "p95", "p99", "max"}} with latencies in milliseconds."""
+        stats = {}
+        for source, history in self.latencies.items():
+            values = sorted(history)
+            if not values:
+                continue
+            def percentile(p):
+                return values[min(len(values) - 1, int(p / 100 * len(values)))] * 1000
+            stats[source] = {
+                "count": len(values),
+                "p50": percentile(50),
+                "p95": percentile(95),
+                "p99": percentile(99),
+                "max": values[-1] * 1000,
+            }
+        return stats
+
     # ------------------------------------------------------------------
     # GPIO helpers
     # ------------------------------------------------------------------
@@ -88,12 +154,14 @@ class InputManager:
         return handler
 
     def handle_gpio_input(self, action, pressed):
-        if pressed:
-            if action not in self.active_gpio_inputs:
-                self.just_pressed_gpio.add(action)
-            self.active_gpio_inputs.add(action)
-        else:
-            self.active_gpio_inputs.discard(action)
+        timestamp = time.monotonic()
+        with self.gpio_lock:
+            if pressed:
+                if action not in self.active_gpio_inputs:
+                    self.push(action, "gpio", timestamp)
+                self.active_gpio_inputs.add(action)
+            else:
+                self.active_gpio_inputs.discard(action)
 
     # ------------------------------------------------------------------
     # Joystick init + mapping
@@ -130,35 +198,25 @@ class InputManager:
     # ------------------------------------------------------------------
     def _joy_press(self, action):
         if action not in self.joystick_active_inputs:
-            self.joystick_just_pressed.add(action)
             self.joystick_active_inputs.add(action)
+            # Analog sticks are delivered as plain directions; D-pad hats only track state
+            if action in ANALOG_DIRECTIONS:
+                self.push(ANALOG_DIRECTIONS[action], "joystick")
 
     def _joy_release(self, action):
         self.joystick_active_inputs.discard(action)
         # We do not emit "just pressed" on release
 
-    # ------------------------------------------------------------------
-    # Accessor used by game loop
-    # ------------------------------------------------------------------
-    def get_gpio_just_pressed(self):
-        """Returns only GPIO inputs to avoid duplicate joystick events"""
-        pressed = list(self.just_pressed_gpio)
-        self.just_pressed_gpio.clear()
-        return pressed
-    
-    def get_just_pressed_joystick(self):
-        """Returns only joystick inputs (used internally by process_event)"""
-        pressed = list(self.joystick_just_pressed)
-        self.joystick_just_pressed.clear()
-        return pressed
-
     # ------------------------------------------------------------------
     # Event processing
     # ------------------------------------------------------------------
     def process_event(self, event):
+        """Translates a pygame event, queues the resulting action (if any) and returns it."""
         # --- Keyboard ---
         if event.type == pygame.KEYDOWN and event.key in self.key_map:
-            return self.key_map[event.key]
+            action = self.key_map[event.key]
+            self.push(action, "keyboard")
+            return action
 
         # --- Joystick Buttons ---
         if event.type == pygame.JOYBUTTONDOWN:
@@ -169,6 +227,7 @@ class InputManager:
                 # Only trigger if not already active to prevent duplicates
                 if action not in self.joystick_active_inputs:
                     self._joy_press(action)
+                    self.push(action, "joystick")
                     return action
 
         elif event.type == pygame.JOYBUTTONUP:
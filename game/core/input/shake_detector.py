@@ -1,38 +1,163 @@
+import threading
 import time
+from collections import deque
+
+#=====================================================================
+# ShakeDetector - Accelerometer sampling and shake detection
+#=====================================================================
+
+# Sensor output rate (samples per second), matching the BMI160 ODR set in init_bmi160
+SAMPLE_RATE = 100
+
+# Seconds between FIFO drains (the BMI160 FIFO holds well over a second at 100 Hz)
+FIFO_POLL_INTERVAL = 0.05
+
+# Shake events kept while the game loop is busy (older ones are dropped)
+MAX_PENDING_SHAKES = 32
 
 
 class ShakeDetector:
-    def __init__(self, i2c_utils, threshold=1.5, cooldown=0.1):
+    def __init__(self, i2c_utils, threshold=1.5, cooldown=0.1, sample_rate=SAMPLE_RATE):
         """
         Detects shakes based on directional changes rather than just exceeding a threshold.
+        Once started, the sensor is sampled on its own thread and detected shakes are
+        queued with their timestamp until the game loop drains them.
 
         Args:
-            i2c_utils: Utility for reading accelerometer data.
+            i2c_utils: Utility for reading accelerometer data (I2CUtils or SimulatedAccelerometer).
             threshold (float): Minimum G-force value to consider a shake.
             cooldown (float): Minimum time (seconds) between registered shakes.
+            sample_rate (int): Sensor output rate in samples per second.
         """
         self.i2c = i2c_utils
         self.threshold = threshold
         self.cooldown = cooldown
-        
+        self.sample_interval = 1.0 / sample_rate
+
         self.last_shake_time = 0
         self.previous_x = None  # Track the previous acceleration value
 
-    def check_for_shake(self):
-        """Detects a shake when movement direction changes and exceeds threshold."""
-        _, x, _ = self.i2c.read_accel()
+        self._events = deque(maxlen=MAX_PENDING_SHAKES)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.samples = 0
+
+    # -----------------------------------------------------------------
+    # Detection
+    # -----------------------------------------------------------------
+    def process_sample(self, x, timestamp) -> bool:
+        """Feeds one reading of the tracked axis. Returns True when it completes a shake."""
         if x is None:
             return False
 
-        now = time.time()
-        
         # Check if acceleration exceeds threshold and direction flips
         if self.previous_x is not None and abs(x) > self.threshold:
             if (self.previous_x < 0 and x > 0) or (self.previous_x > 0 and x < 0):  # Movement switches direction
-                if (now - self.last_shake_time) > self.cooldown:
-                    self.last_shake_time = now
+                if (timestamp - self.last_shake_time) > self.cooldown:
+                    self.last_shake_time = timestamp
                     self.previous_x = x  # Update previous reading
                     return True
 
         self.previous_x = x  # Track last acceleration value
-        return False
\ No newline at end of file
+        return False
+
+    def check_for_shake(self):
+        """Reads the sensor once on the calling thread. Used when the sampler is not running."""
+        _, x, _ = self.i2c.read_accel()
+        return self.process_sample(x, time.monotonic())
+
+    # -----------------------------------------------------------------
+    # Background sampling
+    # -----------------------------------------------------------------
+    def start(self) -> bool:
+        """
+        Starts the sampler thread if the sensor is usable.
+        Returns False (and starts nothing) when there is no accelerometer to read.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return True
+        if not getattr(self.i2c, "valid", False):
+            return False
+        if hasattr(self.i2c, "init_bmi160_fifo"):
+            self.i2c.init_bmi160_fifo()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name="ShakeSampler", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """Stops the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _read_batch(self) -> list:
+        """Returns the pending (x, y, z) samples, from the hardware FIFO when enabled."""
+        if getattr(self.i2c, "fifo_enabled", False):
+            samples = self.i2c.read_accel_fifo()
+            if samples is not None:
+                return samples
+        return [self.i2c.read_accel()]
+
+    def _sample_loop(self) -> None:
+        poll_interval = FIFO_POLL_INTERVAL if getattr(self.i2c, "fifo_enabled", False) else self.sample_interval
+        while not self._stop.is_set():
+            batch = self._read_batch()
+            now = time.monotonic()
+            # FIFO frames arrive together: spread their timestamps back over the sample period
+            for index, (_, x, _) in enumerate(batch):
+                timestamp = now - (len(batch) - 1 - index) * self.sample_interval
+                self.samples += 1
+                if self.process_sample(x, timestamp):
+                    with self._lock:
+                        self._events.append((timestamp, "SHAKE"))
+            self._stop.wait(poll_interval)
+
+    def get_events(self) -> list:
+        """Drains and returns the queued (timestamp, "SHAKE") events, oldest first."""
+        if not self._events:
+            return []
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+        return events
+
+
+#=====================================================================
+# SimulatedAccelerometer - Scripted sensor backend
+#=====================================================================
+
+class SimulatedAccelerometer:
+    """
+    Stand-in for I2CUtils on machines without a BMI160.
+    Returns queued (x, y, z) readings in order, then rests with the Z axis down.
+    """
+
+    def __init__(self, samples=None):
+        self.valid = True
+        self.fifo_enabled = False
+        self._samples = deque(samples or [])
+        self._lock = threading.Lock()
+
+    def feed(self, samples) -> None:
+        """Queues (x, y, z) readings."""
+        with self._lock:
+            self._samples.extend(samples)
+
+    def shake(self, count=1, strength=2.0) -> None:
+        """Queues readings that swing the Y axis back and forth count times."""
+        samples = []
+        for _ in range(count):
+            samples += [(0.0, strength, 1.0), (0.0, -strength, 1.0)]
+        self.feed(samples)
+
+    def read_accel(self):
+        with self._lock:
+            if self._samples:
+                return self._samples.popleft()
+        return 0.0, 0.0, 1.0
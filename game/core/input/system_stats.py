@@ -2,6 +2,8 @@ import time
 import os
 import platform
 import shutil
+import threading
+from collections import deque, namedtuple
 
 try:
     import psutil
@@ -9,9 +11,12 @@ try:
 except ImportError:
     HAS_PSUTIL = False
 
-# Cache system stats and update every 3 seconds to reduce overhead
-last_update_time = 0
-cached_temp, cached_cpu, cached_memory = None, None, None
+# Seconds between samples and number of samples kept for the history graphs
+STATS_INTERVAL = 3
+STATS_HISTORY_SIZE = 60
+
+StatsSample = namedtuple("StatsSample", ["time", "temp", "cpu", "memory", "battery", "charging"])
+EMPTY_SAMPLE = StatsSample(0, None, None, None, None, False)
 
 def get_cpu_temp_linux():
     """Get CPU temperature on Linux, with fallback for Batocera."""
@@ -22,7 +27,7 @@ def get_cpu_temp_linux():
             return float(temp_str.replace("temp=", "").replace("'C\n", ""))
         except Exception:
             pass
-    
+
     # Fallback: read from /sys/class/thermal
     try:
         with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
@@ -30,50 +35,115 @@ def get_cpu_temp_linux():
     except Exception:
         return None
 
-def get_system_stats():
-    """Fetch system stats only if at least 3 seconds have passed. Never crash if a value can't be obtained."""
-    global last_update_time, cached_temp, cached_cpu, cached_memory
-    now = time.time()
-
+def read_system_stats():
+    """Measure CPU temperature, CPU usage and memory usage. Never crash if a value can't be obtained."""
     if not HAS_PSUTIL:
         return None, None, None
 
-    if now - last_update_time >= 3:  # Limit updates to once every 3 seconds to reduce overhead
-        last_update_time = now
+    # Detect OS
+    is_windows = platform.system() == "Windows"
+    is_linux = platform.system() == "Linux"
 
-        # Detect OS
-        is_windows = platform.system() == "Windows"
-        is_linux = platform.system() == "Linux"
+    # Get CPU usage since the previous call (non-blocking)
+    try:
+        cpu = psutil.cpu_percent(interval=None)
+    except Exception:
+        cpu = None
 
-        # Get CPU usage (non-blocking)
-        try:
-            cached_cpu = psutil.cpu_percent(interval=0)
-        except Exception:
-            cached_cpu = None
+    # Get memory usage
+    try:
+        memory = psutil.virtual_memory().percent
+    except Exception:
+        memory = None
 
-        # Get memory usage
-        try:
-            cached_memory = psutil.virtual_memory().percent
-        except Exception:
-            cached_memory = None
-
-        # Get CPU temperature
-        cached_temp = None
-        if is_linux:
-            cached_temp = get_cpu_temp_linux()
-            if cached_temp is None:
-                try:
-                    temps = psutil.sensors_temperatures()
-                    if "coretemp" in temps:
-                        cached_temp = temps["coretemp"][0].current
-                except Exception:
-                    cached_temp = None
-        elif is_windows:
+    # Get CPU temperature
+    temp = None
+    if is_linux:
+        temp = get_cpu_temp_linux()
+        if temp is None:
             try:
                 temps = psutil.sensors_temperatures()
-                if "cpu_thermal" in temps:
-                    cached_temp = temps["cpu_thermal"][0].current
+                if "coretemp" in temps:
+                    temp = temps["coretemp"][0].current
             except Exception:
-                cached_temp = None
+                temp = None
+    elif is_windows:
+        try:
+            temps = psutil.sensors_temperatures()
+            if "cpu_thermal" in temps:
+                temp = temps["cpu_thermal"][0].current
+        except Exception:
+            temp = None
+
+    return temp, cpu, memory
+
+
+#=====================================================================
+# SystemStatsSampler - Background system and battery sampling
+#=====================================================================
+
+class SystemStatsSampler:
+    """
+    Samples system stats and battery level on its own thread so the vcgencmd
+    subprocess, psutil and I2C reads never run on the render thread.
+    The newest sample is published by swapping a single reference, so readers
+    use `latest` without locking; the history ring buffer is copied under a lock.
+    """
+
+    def __init__(self, battery=None, interval=STATS_INTERVAL, history_size=STATS_HISTORY_SIZE):
+        """
+        Args:
+            battery: Object providing get_battery_info() -> (percent, charging), e.g. I2CUtils.
+            interval (float): Seconds between samples.
+            history_size (int): Number of samples kept in the history.
+        """
+        self.battery = battery
+        self.interval = interval
+        self.history_size = history_size
+        self.latest = EMPTY_SAMPLE
+        self._history = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        """Starts the sampler thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name="SystemStatsSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def sample(self) -> StatsSample:
+        """Takes one sample, publishes it as `latest` and appends it to the history."""
+        temp, cpu, memory = read_system_stats()
+        battery, charging = None, False
+        if self.battery is not None:
+            try:
+                battery, charging = self.battery.get_battery_info()
+            except Exception as e:
+                print(f"[SystemStats] Battery read error: {e}")
+
+        sample = StatsSample(time.time(), temp, cpu, memory, battery, charging)
+        with self._lock:
+            self._history.append(sample)
+        self.latest = sample
+        return sample
+
+    def _sample_loop(self) -> None:
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
 
-    return cached_temp, cached_cpu, cached_memory
+    def get_history(self, field: str) -> list:
+        """Returns the recorded values of one field (e.g. "cpu"), oldest first, skipping gaps."""
+        with self._lock:
+            samples = list(self._history)
+        return [getattr(sample, field) for sample in samples if getattr(sample, field) is not None]
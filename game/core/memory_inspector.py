@@ -0,0 +1,192 @@
+import gc
+import tracemalloc
+from collections import deque
+
+import pygame
+
+from core import game_globals, runtime_globals
+from core.utils import pygame_utils
+
+#=====================================================================
+# MemoryInspector - Surface accounting and tracemalloc snapshots
+#=====================================================================
+
+# Modules whose objects are inspected when counting live Surfaces by origin
+GAME_PACKAGES = ("core.", "components.", "scenes.", "game.")
+
+# Containers are followed at most this deep below a cache or object
+MAX_WALK_DEPTH = 6
+
+# Frames of traceback stored by tracemalloc (more frames cost more memory)
+TRACEMALLOC_FRAMES = 1
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Pixel memory held by a Surface (row pitch x height)."""
+    return surface.get_pitch() * surface.get_height()
+
+
+def _is_game_object(obj) -> bool:
+    return hasattr(obj, "__dict__") and type(obj).__module__.startswith(GAME_PACKAGES)
+
+
+def walk_surfaces(root, seen: set, follow_objects: bool = True):
+    """
+    Yields every Surface reachable from root through dicts, lists, tuples, sets and
+    deques (and through game object attributes when follow_objects is True).
+    Objects already in seen are skipped, so shared surfaces are counted once.
+    """
+    stack = [(root, 0)]
+    while stack:
+        obj, depth = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
+        if isinstance(obj, pygame.Surface):
+            yield obj
+        elif depth >= MAX_WALK_DEPTH:
+            continue
+        elif isinstance(obj, dict):
+            stack.extend((value, depth + 1) for value in obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            stack.extend((item, depth + 1) for item in obj)
+        elif follow_objects and _is_game_object(obj):
+            stack.extend((value, depth + 1) for value in vars(obj).values())
+
+
+def measure(root, seen: set = None, follow_objects: bool = True) -> tuple:
+    """Returns (surface count, bytes) reachable from root."""
+    count = total = 0
+    for surface in walk_surfaces(root, set() if seen is None else seen, follow_objects):
+        count += 1
+        total += surface_bytes(surface)
+    return count, total
+
+
+def get_global_caches() -> dict:
+    """Named module-level and runtime caches that hold Surfaces."""
+    assets = runtime_globals.game_assets
+    return {
+        "pet_sprites": runtime_globals.pet_sprites,
+        "misc_sprites": runtime_globals.misc_sprites,
+        "battle_enemies": runtime_globals.battle_enemies,
+        "feeding_frames": runtime_globals.feeding_frames,
+        "game_background": game_globals.game_background,
+        "game_assets": assets._sprites,
+        "attack_sprites": assets._attack_sets,
+        "shadow_cache": pygame_utils.shadow_cache,
+        "blit_cache": pygame_utils.blit_cache,
+        "text_cache": pygame_utils.text_cache,
+    }
+
+
+def get_live_scenes() -> list:
+    """Every scene instance still alive; more than one usually means a scene leaked."""
+    return [obj for obj in gc.get_objects() if type(obj).__module__.startswith("scenes.") and hasattr(obj, "__dict__")]
+
+
+def get_cache_report() -> list:
+    """
+    Returns [(name, surfaces, bytes)] for the non-empty global caches and every
+    cache-like attribute (name containing "cache") of live scenes, largest first.
+    """
+    caches = list(get_global_caches().items())
+    for scene in get_live_scenes():
+        scene_name = type(scene).__name__
+        caches += [(f"{scene_name}.{attribute}", value) for attribute, value in vars(scene).items() if "cache" in attribute.lower()]
+
+    report = []
+    for name, cache in caches:
+        count, size = measure(cache)
+        if count:
+            report.append((name, count, size))
+
+    report.sort(key=lambda entry: entry[2], reverse=True)
+    return report
+
+
+def count_live_surfaces() -> dict:
+    """
+    Counts live Surfaces by origin: the global cache or the game class (window,
+    scene, pet...) whose attributes hold them. Surfaces shared by several owners
+    are attributed to the first one found, global caches first.
+    Returns {origin: [surfaces, bytes]}.
+    """
+    gc.collect()
+    seen = set()
+    origins = {}
+
+    def add(origin, count, size):
+        if count:
+            entry = origins.setdefault(origin, [0, 0])
+            entry[0] += count
+            entry[1] += size
+
+    for name, cache in get_global_caches().items():
+        add(name, *measure(cache, seen, follow_objects=False))
+
+    for obj in gc.get_objects():
+        if _is_game_object(obj) and id(obj) not in seen:
+            add(type(obj).__name__, *measure(vars(obj), seen, follow_objects=False))
+
+    return dict(sorted(origins.items(), key=lambda item: item[1][1], reverse=True))
+
+
+#=====================================================================
+# Tracemalloc snapshots
+#=====================================================================
+
+class MemoryInspector:
+    """
+    Takes tracemalloc snapshots at scene transitions while tracing is on and
+    logs what grew since the previous transition.
+    """
+
+    def __init__(self) -> None:
+        self.tracing = False  # Only tracing started here snapshots scene changes
+        self.snapshots = deque(maxlen=2)  # (label, snapshot)
+
+    def start_tracing(self, frames: int = TRACEMALLOC_FRAMES) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self.tracing = True
+        self.snapshots.clear()
+        self.take_snapshot("start")
+
+    def stop_tracing(self) -> None:
+        self.tracing = False
+        self.snapshots.clear()
+        tracemalloc.stop()
+
+    def take_snapshot(self, label: str):
+        """Stores a snapshot, ignoring tracemalloc's own allocations."""
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        self.snapshots.append((label, snapshot))
+        return snapshot
+
+    def compare(self, limit: int = 10) -> list:
+        """Returns the largest allocation changes between the last two snapshots as text lines."""
+        if len(self.snapshots) < 2:
+            return []
+        (old_label, old), (new_label, new) = self.snapshots
+        stats = new.compare_to(old, "lineno")
+        total = sum(stat.size_diff for stat in stats)
+        lines = [f"{old_label} -> {new_label}: {total / 1024:+.1f} KiB"]
+        lines += [str(stat) for stat in stats[:limit]]
+        return lines
+
+    def on_scene_change(self, state: str) -> None:
+        """Called by VirtualPetGame after a scene switch."""
+        if not self.tracing:
+            return
+        self.take_snapshot(state)
+        for line in self.compare(limit=5):
+            runtime_globals.game_console.log(f"[Memory] {line}")
+
+    def get_traced_memory(self) -> tuple:
+        """Returns (current, peak) bytes allocated by Python while tracing, or (0, 0)."""
+        return tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
@@ -0,0 +1,280 @@
+"""
+Packed single-file module bundles (.omb).
+
+A bundle holds every file of a module folder plus the sprites of its monsters
+in one file. It is memory-mapped and read by entry name through an index, so
+opening a species is a dictionary hit instead of opening a separate zip.
+
+Layout (little endian):
+    header   magic (4s) | version (H) | entry count (I) | index offset (Q)
+    payloads entry data, back to back
+    index    per entry: name length (H) | name (utf-8) | offset (Q) | size (I) | raw size (I) | codec (B)
+
+Entry names:
+    <relative path>                 module files (module.json, backgrounds/Day.png, ...)
+    sprites/<sprite name>/<n>.png   monster frames, as shipped in the monster zips
+    strips/<sprite name>@<w>x<h>    frames pre-scaled to w x h, RGBA, side by side
+
+Paths inside a bundle are written as if the bundle were the module folder
+(e.g. "modules/DMC.omb/monster.json"); exists(), open_file() and
+image_source() resolve them and fall back to the filesystem for any other path.
+"""
+
+import io
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+BUNDLE_EXTENSION = ".omb"
+MAGIC = b"OMB1"
+VERSION = 1
+
+CODEC_STORED = 0
+CODEC_ZLIB = 1
+
+HEADER = struct.Struct("<4sHIQ")
+INDEX_NAME = struct.Struct("<H")
+INDEX_ENTRY = struct.Struct("<QIIB")
+STRIP_HEADER = struct.Struct("<HHHH")  # frame count, width, height, names length
+
+SPRITES_PREFIX = "sprites/"
+STRIPS_PREFIX = "strips/"
+
+
+class BundleError(Exception):
+    """Raised when a bundle file is missing, truncated or not a bundle."""
+
+
+#=====================================================================
+# Reading
+#=====================================================================
+
+class ModuleBundle:
+    """Read-only view of a bundle file, mapped once and shared by every loader."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries = {}  # name -> (offset, size, raw_size, codec)
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._read_index()
+        except (ValueError, struct.error, UnicodeDecodeError) as e:
+            self.close()
+            raise BundleError(f"{path} is not a valid module bundle: {e}")
+        except BundleError:
+            self.close()
+            raise
+
+    def _read_index(self) -> None:
+        magic, version, count, offset = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version > VERSION:
+            raise BundleError(f"{self.path} has an unknown header ({magic!r} v{version})")
+        for _ in range(count):
+            (length,) = INDEX_NAME.unpack_from(self._map, offset)
+            offset += INDEX_NAME.size
+            name = self._map[offset:offset + length].decode("utf-8")
+            offset += length
+            entry = INDEX_ENTRY.unpack_from(self._map, offset)
+            offset += INDEX_ENTRY.size
+            if entry[0] + entry[1] > len(self._map):
+                raise BundleError(f"{self.path} is truncated at entry {name}")
+            self.entries[name] = entry
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def read(self, name: str) -> bytes:
+        """
+        Returns the decoded payload of an entry (KeyError if it does not exist,
+        ValueError if the bundle was released meanwhile).
+        """
+        offset, size, raw_size, codec = self.entries[name]
+        mapped = self._map
+        if mapped is None:
+            raise ValueError(f"{self.path} is closed")
+        data = mapped[offset:offset + size]
+        if codec == CODEC_ZLIB:
+            data = zlib.decompress(data, bufsize=raw_size)
+        return data
+
+    def listdir(self, folder: str) -> list:
+        """Names of the direct children of a folder inside the bundle."""
+        prefix = folder.strip("/") + "/" if folder.strip("/") else ""
+        children = set()
+        for name in self.entries:
+            if name.startswith(prefix):
+                children.add(name[len(prefix):].split("/", 1)[0])
+        return sorted(children)
+
+    def is_dir(self, folder: str) -> bool:
+        prefix = folder.strip("/") + "/"
+        return any(name.startswith(prefix) for name in self.entries)
+
+    def read_strip(self, sprite_name: str, size: tuple):
+        """
+        Returns (frame names, width, height, RGBA pixels) of a pre-scaled strip,
+        or None when the bundle has no strip at that size.
+        """
+        name = strip_name(sprite_name, size)
+        if name not in self.entries:
+            return None
+        data = self.read(name)
+        count, width, height, names_length = STRIP_HEADER.unpack_from(data, 0)
+        start = STRIP_HEADER.size
+        frame_names = data[start:start + names_length].decode("utf-8").split("\n")
+        pixels = data[start + names_length:]
+        if len(frame_names) != count or len(pixels) != count * width * height * 4:
+            return None
+        return frame_names, width, height, pixels
+
+    def close(self) -> None:
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+def strip_name(sprite_name: str, size: tuple) -> str:
+    return f"{STRIPS_PREFIX}{sprite_name}@{int(size[0])}x{int(size[1])}"
+
+
+#=====================================================================
+# Bundle registry and path resolution
+#=====================================================================
+
+_bundles = {}
+_bundles_lock = threading.Lock()
+
+
+def is_bundle(path: str) -> bool:
+    return path.endswith(BUNDLE_EXTENSION) and os.path.isfile(path)
+
+
+def get_bundle(path: str):
+    """Returns the mapped bundle at path (opened once), or None if it cannot be read."""
+    path = os.path.normpath(path)
+    with _bundles_lock:
+        bundle = _bundles.get(path)
+        if bundle is None:
+            try:
+                bundle = ModuleBundle(path)
+            except (OSError, BundleError):
+                return None
+            _bundles[path] = bundle
+        return bundle
+
+
+def release_bundle(path: str) -> None:
+    """Unmaps a bundle so the file can be replaced; the next lookup maps it again."""
+    with _bundles_lock:
+        bundle = _bundles.pop(os.path.normpath(path), None)
+    if bundle is not None:
+        bundle.close()
+
+
+def resolve(path: str):
+    """Splits a path inside a bundle into (bundle, entry name); (None, None) otherwise."""
+    normalized = os.path.normpath(path).replace("\\", "/")
+    marker = normalized.find(BUNDLE_EXTENSION + "/")
+    if marker < 0:
+        return None, None
+    split = marker + len(BUNDLE_EXTENSION)
+    bundle = get_bundle(normalized[:split]) if os.path.isfile(normalized[:split]) else None
+    return bundle, normalized[split + 1:]
+
+
+def real_path(path: str) -> str:
+    """The file on disk holding path: the bundle file for bundled paths, path otherwise."""
+    bundle, _ = resolve(path)
+    return bundle.path if bundle is not None else path
+
+
+def exists(path: str) -> bool:
+    bundle, name = resolve(path)
+    if bundle is not None:
+        return name in bundle or bundle.is_dir(name)
+    return os.path.exists(path)
+
+
+def listdir(path: str) -> list:
+    bundle, name = resolve(path)
+    if bundle is not None:
+        return bundle.listdir(name)
+    return os.listdir(path)
+
+
+def open_file(path: str, mode: str = "r"):
+    """open() for paths that may live inside a bundle (text mode is utf-8)."""
+    bundle, name = resolve(path)
+    if bundle is None:
+        if "b" in mode:
+            return open(path, mode)
+        return open(path, mode, encoding="utf-8")
+    if name not in bundle:
+        raise FileNotFoundError(path)
+    data = bundle.read(name)
+    return io.BytesIO(data) if "b" in mode else io.StringIO(data.decode("utf-8"))
+
+
+def image_source(path: str):
+    """What to hand to pygame.image.load: the path itself, or the bundled bytes as a file object."""
+    bundle, name = resolve(path)
+    if bundle is None:
+        return path
+    if name not in bundle:
+        raise FileNotFoundError(path)
+    return io.BytesIO(bundle.read(name))
+
+
+#=====================================================================
+# Writing
+#=====================================================================
+
+class BundleWriter:
+    """Writes a bundle to a temporary file and moves it in place on close()."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.temp_path = path + ".tmp"
+        self.index = []
+        self.names = set()
+        self._file = open(self.temp_path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+
+    def add(self, name: str, data: bytes, compress: bool = False) -> None:
+        name = name.replace("\\", "/").strip("/")
+        if name in self.names:
+            raise BundleError(f"Duplicate bundle entry {name}")
+        payload, codec = data, CODEC_STORED
+        if compress:
+            packed = zlib.compress(data, 6)
+            if len(packed) < len(data):
+                payload, codec = packed, CODEC_ZLIB
+        self.index.append((name, self._file.tell(), len(payload), len(data), codec))
+        self.names.add(name)
+        self._file.write(payload)
+
+    def add_strip(self, sprite_name: str, size: tuple, frame_names: list, pixels: bytes) -> None:
+        names = "\n".join(frame_names).encode("utf-8")
+        header = STRIP_HEADER.pack(len(frame_names), int(size[0]), int(size[1]), len(names))
+        self.add(strip_name(sprite_name, size), header + names + pixels, compress=True)
+
+    def close(self) -> None:
+        index_offset = self._file.tell()
+        for name, offset, size, raw_size, codec in self.index:
+            encoded = name.encode("utf-8")
+            self._file.write(INDEX_NAME.pack(len(encoded)) + encoded)
+            self._file.write(INDEX_ENTRY.pack(offset, size, raw_size, codec))
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, len(self.index), index_offset))
+        self._file.close()
+        release_bundle(self.path)
+        os.replace(self.temp_path, self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
@@ -0,0 +1,474 @@
+"""
+Module Sync
+Content-addressed module transfer between two devices over an open TCP link.
+A module is described by a manifest of its files (size, SHA-256 and one hash
+per chunk); the receiving device only requests chunks it does not already
+have in its staging folder or in an older copy of the module, verifies every
+chunk and file, and keeps progress on disk so an interrupted sync resumes.
+"""
+
+import hashlib
+import json
+import os
+import queue
+import shutil
+import socket
+import threading
+
+from core import module_bundle
+from core.constants import MODULES_FOLDER, MODULE_SYNC_FOLDER
+
+#=====================================================================
+# Manifests
+#=====================================================================
+# {"module": "DMX", "folder": "DMX", "chunk_size": 65536,
+#  "files": {"monster.json": {"size": 1234, "sha256": "...", "chunks": ["<16 hex>", ...]}, ...}}
+
+CHUNK_SIZE = 64 * 1024
+EXCLUDED_DIRS = ("documentation", "__pycache__")  # Not needed to play a module
+
+_manifest_cache = {}  # folder path -> (file stamps, manifest)
+
+
+def chunk_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def hash_file(path: str, chunk_size: int = CHUNK_SIZE) -> dict:
+    """Returns {"size", "sha256", "chunks"} for one file."""
+    digest = hashlib.sha256()
+    chunks = []
+    size = 0
+    with open(path, "rb") as file:
+        for data in iter(lambda: file.read(chunk_size), b""):
+            digest.update(data)
+            chunks.append(chunk_hash(data))
+            size += len(data)
+    return {"size": size, "sha256": digest.hexdigest(), "chunks": chunks}
+
+
+def list_module_files(folder_path: str) -> list:
+    """Relative paths (with /) of every file a module needs, sorted."""
+    files = []
+    for root, dirs, names in os.walk(folder_path):
+        dirs[:] = sorted(d for d in dirs if d not in EXCLUDED_DIRS)
+        for name in names:
+            relative = os.path.relpath(os.path.join(root, name), folder_path)
+            files.append(relative.replace(os.sep, "/"))
+    return sorted(files)
+
+
+def build_manifest(module_name: str, folder_path: str) -> dict:
+    """
+    Builds the manifest of a module folder. Cached while no file changes
+    size or modification time, so serving several peers hashes once.
+    """
+    relative_paths = list_module_files(folder_path)
+    stamps = []
+    for relative in relative_paths:
+        stat = os.stat(os.path.join(folder_path, relative))
+        stamps.append((relative, stat.st_size, stat.st_mtime_ns))
+    stamps = tuple(stamps)
+    cached = _manifest_cache.get(folder_path)
+    if cached and cached[0] == stamps:
+        return cached[1]
+
+    manifest = {
+        "module": module_name,
+        "folder": os.path.basename(os.path.normpath(folder_path)),
+        "chunk_size": CHUNK_SIZE,
+        "files": {relative: hash_file(os.path.join(folder_path, relative)) for relative in relative_paths},
+    }
+    _manifest_cache[folder_path] = (stamps, manifest)
+    return manifest
+
+
+def manifest_size(manifest: dict) -> int:
+    return sum(entry["size"] for entry in manifest["files"].values())
+
+
+def is_safe_path(relative: str) -> bool:
+    """Rejects absolute paths and paths leaving the module folder."""
+    parts = relative.split("/")
+    return bool(relative) and not relative.startswith("/") and ".." not in parts and "\\" not in relative and ":" not in relative
+
+
+def is_safe_folder(folder: str) -> bool:
+    return bool(folder) and folder not in (".", "..") and "/" not in folder and "\\" not in folder and ":" not in folder
+
+
+def installed_module_name(path: str):
+    """Name in the module.json of a module folder or bundle, or None if there is no readable one."""
+    try:
+        with module_bundle.open_file(os.path.join(path, "module.json")) as file:
+            return json.load(file).get("name")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class SyncError(Exception):
+    pass
+
+
+#=====================================================================
+# Staging - Partial downloads kept between sessions
+#=====================================================================
+
+class StagedModule:
+    """
+    A module being received: files are preallocated in
+    MODULE_SYNC_FOLDER/<folder>/ and the verified chunks of each file are
+    recorded in MODULE_SYNC_FOLDER/<folder>.json.
+    """
+
+    def __init__(self, manifest: dict) -> None:
+        folder = manifest.get("folder", "")
+        if not is_safe_folder(folder) or not all(is_safe_path(relative) for relative in manifest["files"]):
+            raise SyncError(f"Unsafe paths in manifest of {manifest.get('module')}")
+        self.manifest = manifest
+        self.chunk_size = manifest["chunk_size"]
+        self.folder_path = os.path.join(MODULE_SYNC_FOLDER, folder)
+        self.state_path = self.folder_path + ".json"
+        self.have = {}  # relative path -> set of verified chunk indexes
+        self.load_state()
+
+    def load_state(self) -> None:
+        state = {}
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, "r", encoding="utf-8") as file:
+                    state = json.load(file)
+            except (OSError, ValueError):
+                state = {}
+
+        for relative, entry in self.manifest["files"].items():
+            path = self.path(relative)
+            saved = state.get(relative, {})
+            if saved.get("sha256") == entry["sha256"] and os.path.exists(path) and os.path.getsize(path) == entry["size"]:
+                self.have[relative] = set(saved.get("have", []))
+            else:
+                # New file, or the sender's copy changed since the last session
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as file:
+                    file.truncate(entry["size"])
+                self.have[relative] = set()
+
+    def save_state(self) -> None:
+        state = {relative: {"sha256": self.manifest["files"][relative]["sha256"], "have": sorted(have)}
+                 for relative, have in self.have.items()}
+        with open(self.state_path, "w", encoding="utf-8") as file:
+            json.dump(state, file, separators=(",", ":"))
+
+    def path(self, relative: str) -> str:
+        return os.path.join(self.folder_path, *relative.split("/"))
+
+    def missing(self) -> list:
+        """(relative path, chunk index) of every chunk still needed."""
+        return [(relative, index)
+                for relative, entry in self.manifest["files"].items()
+                for index in range(len(entry["chunks"]))
+                if index not in self.have[relative]]
+
+    def received_bytes(self) -> int:
+        total = 0
+        for relative, have in self.have.items():
+            size = self.manifest["files"][relative]["size"]
+            total += sum(min(self.chunk_size, size - index * self.chunk_size) for index in have)
+        return total
+
+    def write_chunk(self, relative: str, index: int, data: bytes) -> bool:
+        """Stores a chunk if its hash matches the manifest. Returns False when it does not."""
+        if chunk_hash(data) != self.manifest["files"][relative]["chunks"][index]:
+            return False
+        with open(self.path(relative), "r+b") as file:
+            file.seek(index * self.chunk_size)
+            file.write(data)
+        self.have[relative].add(index)
+        return True
+
+    def reuse_local_chunks(self, local_folder: str = None) -> int:
+        """
+        Fills missing chunks whose content is already on this device: chunks of
+        other staged files, or an older installed copy of the module. Returns
+        the number of chunks reused.
+        """
+        available = {}  # chunk hash -> (path, offset)
+        for relative, have in self.have.items():
+            chunks = self.manifest["files"][relative]["chunks"]
+            for index in have:
+                available.setdefault(chunks[index], (self.path(relative), index * self.chunk_size))
+        if local_folder and os.path.isdir(local_folder):
+            for relative in self.manifest["files"]:
+                path = os.path.join(local_folder, *relative.split("/"))
+                if os.path.isfile(path):
+                    for index, digest in enumerate(hash_file(path, self.chunk_size)["chunks"]):
+                        available.setdefault(digest, (path, index * self.chunk_size))
+
+        reused = 0
+        for relative, index in self.missing():
+            source = available.get(self.manifest["files"][relative]["chunks"][index])
+            if source is None:
+                continue
+            with open(source[0], "rb") as file:
+                file.seek(source[1])
+                data = file.read(self.chunk_size)
+            if self.write_chunk(relative, index, data):
+                reused += 1
+        return reused
+
+    def verify(self) -> list:
+        """Checks the SHA-256 of every complete file; resets and returns the ones that fail."""
+        failed = []
+        for relative, entry in self.manifest["files"].items():
+            if hash_file(self.path(relative), self.chunk_size)["sha256"] != entry["sha256"]:
+                self.have[relative] = set()
+                failed.append(relative)
+        return failed
+
+    def install(self) -> str:
+        """Moves the finished module into MODULES_FOLDER and returns its folder path."""
+        name = self.manifest["module"]
+        target = os.path.join(MODULES_FOLDER, self.manifest["folder"])
+        # A folder wins over a bundle of the same name, so either would be replaced
+        for path in (target, target + module_bundle.BUNDLE_EXTENSION):
+            existing = installed_module_name(path)
+            if existing is not None and existing != name:
+                raise SyncError(f"{path} holds module {existing}, not {name}")
+        if os.path.exists(target):
+            # An older copy: keep it aside until the new one is in place
+            backup = os.path.join(MODULE_SYNC_FOLDER, self.manifest["folder"] + ".old")
+            shutil.rmtree(backup, ignore_errors=True)
+            shutil.move(target, backup)
+            shutil.move(self.folder_path, target)
+            shutil.rmtree(backup, ignore_errors=True)
+        else:
+            shutil.move(self.folder_path, target)
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+        return target
+
+
+#=====================================================================
+# ModuleSyncSession - Both ends of a sync over one socket
+#=====================================================================
+# Line-delimited JSON; a chunk message is followed by "size" raw bytes.
+#   {"t":"manifest_req","module":"DMX"}           -> {"t":"manifest","module":"DMX","manifest":{...}}
+#   {"t":"chunk_req","module":"DMX","chunks":[["monster.json",0],...]}
+#                                                  -> {"t":"chunk","file":"monster.json","index":0,"size":65536} + bytes
+#   {"t":"error","module":"DMX","error":"..."}     (unknown module or file)
+#   {"t":"done"}                                    sender needs nothing more
+# Each device requests what it lacks and serves what the other requests at the
+# same time; the session ends once both sent "done".
+
+SYNC_TIMEOUT = 30.0   # Seconds without data before the link is considered lost
+POLL_INTERVAL = 0.5   # Socket timeout of the reader, so it can stop once both sides are done
+REQUEST_WINDOW = 32   # Chunks requested per round trip
+MAX_RETRIES = 3       # Attempts for a chunk that fails its checksum
+
+
+class _Stopped(Exception):
+    pass
+
+
+class ModuleSyncSession:
+    """
+    Runs a sync over sock. modules maps the module names this device serves to
+    their folders. run() downloads the wanted modules into the staging folder
+    and returns their StagedModule objects, ready to install.
+    """
+
+    def __init__(self, sock: socket.socket, modules: dict, log=print) -> None:
+        self.sock = sock
+        self.modules = modules
+        self.log = log
+        self.buffer = b""
+        self.send_lock = threading.Lock()
+        self.responses = queue.Queue()
+        self.requests = queue.Queue()  # Peer requests, served on their own thread so reading never blocks
+        self.peer_done = threading.Event()
+        self.local_done = False
+        self.stopping = False
+        self.module = None          # Module being downloaded
+        self.received = 0           # Bytes of that module on disk
+        self.total = 0
+
+    @property
+    def progress(self) -> float:
+        return self.received / self.total if self.total else 0.0
+
+    # -----------------------------------------------------------------
+    # Link
+    # -----------------------------------------------------------------
+    def send(self, message: dict, payload: bytes = b"") -> None:
+        data = json.dumps(message, separators=(",", ":")).encode() + b"\n" + payload
+        with self.send_lock:
+            self.sock.sendall(data)
+
+    def _fill(self) -> None:
+        idle = 0.0
+        while True:
+            try:
+                data = self.sock.recv(65536)
+                break
+            except socket.timeout:
+                if self.stopping:
+                    raise _Stopped()
+                idle += POLL_INTERVAL
+                if idle >= SYNC_TIMEOUT:
+                    raise
+        if not data:
+            raise ConnectionError("connection closed")
+        self.buffer += data
+        if self.stopping:
+            raise _Stopped()  # Whatever follows belongs to the battle handshake
+
+    def read_message(self) -> dict:
+        while b"\n" not in self.buffer:
+            self._fill()
+        line, self.buffer = self.buffer.split(b"\n", 1)
+        return json.loads(line)
+
+    def read_bytes(self, size: int) -> bytes:
+        while len(self.buffer) < size:
+            self._fill()
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+    # -----------------------------------------------------------------
+    # Reading and serving
+    # -----------------------------------------------------------------
+    def _read_loop(self) -> None:
+        try:
+            while True:
+                message = self.read_message()
+                kind = message.get("t")
+                if kind in ("manifest_req", "chunk_req"):
+                    self.requests.put(message)
+                elif kind == "chunk":
+                    self.responses.put((message, self.read_bytes(message["size"])))
+                elif kind in ("manifest", "error"):
+                    self.responses.put((message, None))
+                elif kind == "done":
+                    self.peer_done.set()
+                    if self.local_done:
+                        return
+                    # Otherwise keep reading: our own requests may be pending
+        except _Stopped:
+            return
+        except (OSError, ValueError, KeyError) as e:
+            self.log(f"[ModuleSync] Link lost: {e}")
+        self.responses.put((None, None))
+        self.peer_done.set()
+
+    def _serve_loop(self) -> None:
+        while True:
+            message = self.requests.get()
+            if message is None:
+                return
+            try:
+                if message["t"] == "manifest_req":
+                    self._serve_manifest(message["module"])
+                else:
+                    self._serve_chunks(message["module"], message["chunks"])
+            except (OSError, KeyError, ValueError) as e:
+                self.log(f"[ModuleSync] Serve error: {e}")
+
+    def _serve_manifest(self, name: str) -> None:
+        if name not in self.modules:
+            self.send({"t": "error", "module": name, "error": "unknown module"})
+            return
+        self.send({"t": "manifest", "module": name, "manifest": build_manifest(name, self.modules[name])})
+
+    def _serve_chunks(self, name: str, chunks: list) -> None:
+        manifest = build_manifest(name, self.modules[name]) if name in self.modules else None
+        for relative, index in chunks:
+            if manifest is None or relative not in manifest["files"]:
+                self.send({"t": "error", "module": name, "error": f"unknown file {relative}"})
+                continue
+            with open(os.path.join(self.modules[name], *relative.split("/")), "rb") as file:
+                file.seek(index * manifest["chunk_size"])
+                data = file.read(manifest["chunk_size"])
+            self.send({"t": "chunk", "file": relative, "index": index, "size": len(data)}, data)
+
+    # -----------------------------------------------------------------
+    # Downloading
+    # -----------------------------------------------------------------
+    def _response(self) -> tuple:
+        try:
+            message, data = self.responses.get(timeout=SYNC_TIMEOUT)
+        except queue.Empty:
+            raise SyncError("peer stopped responding")
+        if message is None:
+            raise SyncError("connection lost")
+        if message["t"] == "error":
+            raise SyncError(message["error"])
+        return message, data
+
+    def download(self, name: str) -> StagedModule:
+        """Downloads one module into the staging folder, resuming a previous attempt."""
+        self.send({"t": "manifest_req", "module": name})
+        message, _ = self._response()
+        manifest = message.get("manifest")
+        if not isinstance(manifest, dict) or manifest.get("module") != name:
+            raise SyncError(f"peer sent no manifest for {name}")
+        staged = StagedModule(manifest)
+        reused = staged.reuse_local_chunks(os.path.join(MODULES_FOLDER, staged.manifest["folder"]))
+        self.module = name
+        self.total = manifest_size(staged.manifest)
+        self.received = staged.received_bytes()
+        self.log(f"[ModuleSync] {name}: {self.received}/{self.total} bytes already here ({reused} chunks reused)")
+
+        retries = {}
+        verifications = 0
+        while True:
+            missing = staged.missing()
+            if not missing:
+                failed = staged.verify()
+                staged.save_state()
+                if not failed:
+                    return staged
+                verifications += 1
+                if verifications > MAX_RETRIES:
+                    raise SyncError(f"{name}: {failed} keep failing their checksum")
+                self.log(f"[ModuleSync] {name}: checksum mismatch in {failed}, downloading again")
+                missing = staged.missing()
+            for start in range(0, len(missing), REQUEST_WINDOW):
+                window = missing[start:start + REQUEST_WINDOW]
+                self.send({"t": "chunk_req", "module": name, "chunks": window})
+                for _ in window:
+                    message, data = self._response()
+                    key = (message["file"], message["index"])
+                    if staged.write_chunk(message["file"], message["index"], data):
+                        self.received += len(data)
+                    else:
+                        retries[key] = retries.get(key, 0) + 1
+                        if retries[key] > MAX_RETRIES:
+                            raise SyncError(f"chunk {key} of {name} keeps failing its checksum")
+                staged.save_state()
+
+    def run(self, wanted: list) -> list:
+        """Downloads the wanted modules while serving the peer; returns the StagedModules."""
+        previous_timeout = self.sock.gettimeout()
+        self.sock.settimeout(POLL_INTERVAL)
+        reader = threading.Thread(target=self._read_loop, daemon=True)
+        server = threading.Thread(target=self._serve_loop, daemon=True)
+        reader.start()
+        server.start()
+        try:
+            staged = [self.download(name) for name in wanted]
+        finally:
+            self.local_done = True
+            try:
+                self.send({"t": "done"})
+            except OSError:
+                pass
+        # Keep serving until the peer has everything too
+        self.peer_done.wait()
+        self.stopping = True
+        reader.join(timeout=POLL_INTERVAL * 2)
+        self.requests.put(None)
+        server.join(timeout=SYNC_TIMEOUT)
+        if self.buffer:
+            self.log(f"[ModuleSync] {len(self.buffer)} bytes received after the sync were dropped")
+        self.sock.settimeout(previous_timeout)
+        return staged
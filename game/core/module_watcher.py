@@ -0,0 +1,238 @@
+"""
+Module hot reload: watches modules/ for edited module files and reloads only
+the modules that changed, so content edited in the Module Editor shows up
+without restarting the game.
+
+A background thread collects changed module entries (a module folder or a
+.omb bundle), using inotify on Linux and polling file sizes/mtimes elsewhere.
+apply_changes() runs on the main thread (from the scheduler) once an entry
+has been quiet for SETTLE_TIME, since editors save several files in a row.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+from core import runtime_globals
+from core.constants import MODULES_FOLDER
+from core.module_bundle import BUNDLE_EXTENSION
+
+POLL_INTERVAL = 2.0        # Seconds between scans with the polling backend
+SETTLE_TIME = 0.5          # Seconds without new events before a module is reloaded
+IGNORED_FOLDERS = ("documentation",)
+WATCHED_SUFFIXES = (".json", ".png", ".zip", BUNDLE_EXTENSION)
+
+# inotify(7)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+
+def is_watched_file(name: str) -> bool:
+    """Module data and sprites; editor temp files and partial bundle writes are ignored."""
+    return name.lower().endswith(WATCHED_SUFFIXES) and not name.startswith(".")
+
+
+#=====================================================================
+# Backends
+#=====================================================================
+
+class InotifyBackend:
+    """Blocking inotify watches on modules/ and every folder below it (Linux only)."""
+
+    def __init__(self, root: str) -> None:
+        self.root = os.path.normpath(root)
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches = {}  # watch descriptor -> folder
+        self.add_tree(self.root)
+
+    def add_tree(self, folder: str) -> None:
+        for path, folders, _ in os.walk(folder):
+            folders[:] = [name for name in folders if name not in IGNORED_FOLDERS]
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+            if wd >= 0:
+                self.watches[wd] = path
+
+    def wait(self, timeout: float) -> list:
+        """Returns the paths that changed, or [] after timeout."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        data = os.read(self.fd, 64 * 1024)
+        changed = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "replace")
+            offset += length
+            folder = self.watches.get(wd)
+            if folder is None:
+                continue
+            if mask & IN_DELETE_SELF:
+                self.watches.pop(wd, None)
+                changed.append(folder)
+                continue
+            path = os.path.join(folder, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and name not in IGNORED_FOLDERS:
+                    self.add_tree(path)
+                changed.append(path)
+            elif is_watched_file(name):
+                changed.append(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingBackend:
+    """Compares (size, mtime) snapshots of modules/ every POLL_INTERVAL seconds."""
+
+    def __init__(self, root: str, interval: float = POLL_INTERVAL) -> None:
+        self.root = os.path.normpath(root)
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self) -> dict:
+        snapshot = {}
+        for path, folders, files in os.walk(self.root):
+            folders[:] = [name for name in folders if name not in IGNORED_FOLDERS]
+            for name in files:
+                if not is_watched_file(name):
+                    continue
+                file_path = os.path.join(path, name)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue  # Deleted while scanning
+                snapshot[file_path] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def wait(self, timeout: float) -> list:
+        time.sleep(self.interval)  # A full scan per call, so timeout is not honored
+        snapshot = self.scan()
+        previous, self.snapshot = self.snapshot, snapshot
+        return [path for path in previous.keys() | snapshot.keys() if previous.get(path) != snapshot.get(path)]
+
+    def close(self) -> None:
+        pass
+
+
+#=====================================================================
+# ModuleWatcher
+#=====================================================================
+
+class ModuleWatcher:
+    """Watches the modules folder on a daemon thread and reloads changed modules on the main thread."""
+
+    def __init__(self, folder: str = MODULES_FOLDER, use_inotify: bool = True) -> None:
+        self.folder = os.path.normpath(folder)
+        self.use_inotify = use_inotify and sys.platform.startswith("linux")
+        self.backend = None
+        self.running = False
+        self.thread = None
+        self.lock = threading.Lock()
+        self.pending = {}  # module entry (folder or bundle name) -> time of its last change
+
+    def start(self) -> None:
+        if self.running:
+            return
+        if self.use_inotify:
+            try:
+                self.backend = InotifyBackend(self.folder)
+            except (OSError, AttributeError) as e:
+                runtime_globals.game_console.log(f"[ModuleWatcher] inotify unavailable ({e}), polling instead")
+        if self.backend is None:
+            self.backend = PollingBackend(self.folder)
+        self.running = True
+        self.thread = threading.Thread(target=self.watch_loop, name="ModuleWatcher", daemon=True)
+        self.thread.start()
+        runtime_globals.game_console.log(f"[ModuleWatcher] Watching {self.folder} ({type(self.backend).__name__})")
+
+    def stop(self) -> None:
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(timeout=POLL_INTERVAL + SETTLE_TIME)
+            self.thread = None
+        if self.backend is not None:
+            self.backend.close()
+            self.backend = None
+
+    def watch_loop(self) -> None:
+        while self.running:
+            try:
+                paths = self.backend.wait(SETTLE_TIME)
+            except OSError as e:
+                runtime_globals.game_console.log(f"[ModuleWatcher] Stopped watching: {e}")
+                self.running = False
+                return
+            for path in paths:
+                self.mark_changed(path)
+
+    def mark_changed(self, path: str) -> None:
+        """Records a change of a path below the modules folder against its module entry."""
+        relative = os.path.relpath(path, self.folder)
+        entry = relative.split(os.sep, 1)[0]
+        if entry in (".", "..") or entry.endswith(".tmp"):
+            return  # The modules folder itself, or a bundle still being written
+        with self.lock:
+            self.pending[entry] = time.monotonic()
+
+    def take_changes(self) -> list:
+        """Module entries that changed and have been quiet for SETTLE_TIME."""
+        now = time.monotonic()
+        with self.lock:
+            settled = [entry for entry, changed in self.pending.items() if now - changed >= SETTLE_TIME]
+            for entry in settled:
+                del self.pending[entry]
+        return settled
+
+    def module_path(self, entry: str):
+        """
+        Path to reload for a changed entry, following load_modules precedence:
+        an unpacked folder wins over a bundle of the same name.
+        """
+        path = os.path.join(self.folder, entry)
+        if entry.endswith(BUNDLE_EXTENSION):
+            if os.path.isdir(path[:-len(BUNDLE_EXTENSION)]):
+                return None
+        elif not os.path.exists(path) and os.path.isfile(path + BUNDLE_EXTENSION):
+            return path + BUNDLE_EXTENSION
+        return path
+
+    def apply_changes(self) -> list:
+        """Reloads the modules that changed. Main thread only (creates surfaces). Returns their names."""
+        from core.utils.module_utils import reload_module
+        from core.utils.pet_utils import refresh_module_pets
+
+        reloaded = []
+        for entry in self.take_changes():
+            path = self.module_path(entry)
+            if path is None:
+                continue
+            names_before = {name for name, module in runtime_globals.game_modules.items()
+                            if os.path.normpath(module.folder_path) == os.path.normpath(path)}
+            module = reload_module(path)
+            names = names_before | ({module.name} if module else set())
+            for name in names:
+                pets = refresh_module_pets(name)
+                if pets:
+                    runtime_globals.game_console.log(f"[ModuleWatcher] Refreshed {pets} pets of {name}")
+            reloaded.extend(names)
+        return reloaded
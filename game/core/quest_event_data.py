@@ -1,5 +1,7 @@
+from bisect import bisect_left
+from itertools import accumulate
 from typing import List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -35,3 +37,26 @@ class EventData:
     round: int = 1
     item: str = ""
     item_quantity: int = 1
+
+
+@dataclass
+class EventTable:
+    """
+    Precomputed weighted table of a module's events.
+    Cumulative chance_percent weights are built once so a roll is a bisect
+    instead of a linear walk over the event list.
+    """
+    events: List[EventData]
+    cumulative: List[int] = field(default_factory=list)
+    total_chance: int = 0
+
+    def __post_init__(self):
+        self.cumulative = list(accumulate(event.chance_percent for event in self.events))
+        self.total_chance = self.cumulative[-1] if self.cumulative else 0
+
+    def pick(self, roll: int) -> Optional[EventData]:
+        """Returns the event whose cumulative range contains roll (1-based), or None."""
+        index = bisect_left(self.cumulative, roll)
+        if index >= len(self.events):
+            return None
+        return self.events[index]
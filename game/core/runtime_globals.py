@@ -1,12 +1,17 @@
 import random
+import time
 
+from core.game_assets import GameAssets
+from core.game_clock import GameClock
 from core.game_console import GameConsole
+from core.frame_profiler import FrameProfiler
 from core.game_item import GameItem
 from core.game_message import GameMessage
-from core.game_sound import GameSound
-from core.input.i2c_utils import I2CUtils
-from core.input.input_manager import InputManager
-from core.input.shake_detector import ShakeDetector
+from core.game_scheduler import GameScheduler
+
+# Reference point for the startup report (time to first frame)
+startup_time = time.perf_counter()
+startup_timings = {}  # step name -> seconds
 
 #=====================================================================
 # Runtime (Non-Persistent) Global Variables
@@ -36,12 +41,27 @@ evolution_pet = None
 last_headtohead_pattern = random.randint(0, 5)
 
 # --- Global Managers ---
-game_sound = GameSound()
+# game_sound and game_input (and i2c/shake_detector below) are created on first
+# access, see Deferred Managers at the end of this file.
 game_console = GameConsole()
 game_message = GameMessage()
-game_input = InputManager()
+game_clock = GameClock()
+game_scheduler = GameScheduler(clock=lambda: game_clock.monotonic)  # Frame time, so replays fire tasks on the same frames
+game_assets = GameAssets()
+frame_profiler = FrameProfiler()
 game_modules = {}
 game_module_flag = {}
+module_revision = 0      # Bumped by module hot reload so windows drop module art they hold
+module_watcher = None    # ModuleWatcher when MODULE_HOT_RELOAD is enabled
+
+# --- Module Indexes (rebuilt by load_modules) ---
+item_index = {}          # item id -> GameItem
+item_name_index = {}     # (module, item name) -> GameItem
+unlock_index = {}        # (module, type, name) -> unlock metadata
+unlock_groups = {}       # (module, name) -> [group unlocks listing that name]
+quest_index = {}         # quest id -> (module name, QuestData)
+module_quests = {}       # module name -> [QuestData]
+event_tables = {}        # module name -> EventTable (only modules with events)
 game_pet_eating = {}
 
 default_items = {
@@ -72,6 +92,7 @@ default_items = {
 }
 
 # --- Pet/Gameplay Flags ---
+time_of_day = "day"
 pet_alert = False
 show_hearts = False
 check_shaking = False
@@ -83,6 +104,66 @@ dmx_enabled = False
 vb_enabled = False
 
 # --- Hardware/Input ---
-i2c = I2CUtils()
-shake_detector = ShakeDetector(i2c)
-last_input_frame = 0
\ No newline at end of file
+# i2c, shake_detector and system_stats are deferred managers
+last_input_frame = 0
+
+
+#=====================================================================
+# Deferred Managers
+#=====================================================================
+# Hardware-facing managers are built on first access so importing this module
+# (and therefore the boot splash) does not wait for the mixer, input config or I2C bus.
+
+def _create_game_sound():
+    from core.game_sound import GameSound
+    return GameSound()
+
+
+def _create_game_input():
+    from core.input.input_manager import InputManager
+    return InputManager()
+
+
+def _create_i2c():
+    from core.input.i2c_utils import I2CUtils
+    return I2CUtils()
+
+
+def _create_shake_detector():
+    from core.input.shake_detector import ShakeDetector
+    detector = ShakeDetector(globals().get("i2c") or __getattr__("i2c"))
+    detector.start()
+    return detector
+
+
+def _create_system_stats():
+    from core.input.system_stats import SystemStatsSampler
+    sampler = SystemStatsSampler(battery=globals().get("i2c") or __getattr__("i2c"))
+    sampler.start()
+    return sampler
+
+
+def _create_memory_inspector():
+    from core.memory_inspector import MemoryInspector
+    return MemoryInspector()
+
+
+_deferred_managers = {
+    "game_sound": _create_game_sound,
+    "game_input": _create_game_input,
+    "i2c": _create_i2c,
+    "shake_detector": _create_shake_detector,
+    "system_stats": _create_system_stats,
+    "memory_inspector": _create_memory_inspector,
+}
+
+
+def __getattr__(name):
+    factory = _deferred_managers.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    start = time.perf_counter()
+    manager = factory()
+    globals()[name] = manager
+    startup_timings[f"create {name}"] = time.perf_counter() - start
+    return manager
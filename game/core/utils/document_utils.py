@@ -1,8 +1,17 @@
 import os
+import re
 import json
+import hashlib
+import threading
 from typing import List, Dict, Optional
 
 
+# Bump when the generated markup or CSS changes so existing guides are rebuilt
+GUIDE_FORMAT = 1
+
+FINGERPRINT_PATTERN = re.compile(r"<!-- module-guide-fingerprint: ([0-9a-f]+) -->")
+
+
 class DocumentationBuilder:
     """
     Utility class to build dynamic documentation pages based on available modules.
@@ -52,6 +61,66 @@ class DocumentationBuilder:
         
         return modules
     
+    def compute_fingerprint(self) -> str:
+        """
+        Compute a fingerprint of everything the module guide is generated from.
+        
+        Covers the template, each module folder's module.json contents, the
+        presence of its documentation and the mtime of its logo/flag.
+        
+        Returns:
+            Hex digest string
+        """
+        digest = hashlib.sha1(f"format:{GUIDE_FORMAT}".encode())
+        
+        try:
+            stat = os.stat(self.template_path)
+            digest.update(f"template:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        except OSError:
+            digest.update(b"template:missing")
+        
+        if not os.path.exists(self.modules_dir):
+            return digest.hexdigest()
+        
+        for module_name in sorted(os.listdir(self.modules_dir)):
+            module_path = os.path.join(self.modules_dir, module_name)
+            if not os.path.isdir(module_path):
+                continue
+            
+            has_doc = os.path.exists(os.path.join(module_path, "documentation", "index.html"))
+            digest.update(f"module:{module_name}:{has_doc}".encode())
+            if not has_doc:
+                continue
+            
+            for icon_file in ("logo.png", "Flag.png"):
+                try:
+                    mtime = os.stat(os.path.join(module_path, icon_file)).st_mtime_ns
+                    digest.update(f"{icon_file}:{mtime}".encode())
+                except OSError:
+                    pass
+            
+            try:
+                with open(os.path.join(module_path, "module.json"), 'rb') as f:
+                    digest.update(f.read())
+            except OSError:
+                digest.update(b"module.json:missing")
+        
+        return digest.hexdigest()
+    
+    def read_output_fingerprint(self) -> Optional[str]:
+        """
+        Read the fingerprint stamped into the current module guide.
+        
+        Returns:
+            The stored fingerprint, or None if the guide is missing or unstamped
+        """
+        try:
+            with open(self.output_path, 'r', encoding='utf-8') as f:
+                match = FINGERPRINT_PATTERN.search(f.read())
+        except OSError:
+            return None
+        return match.group(1) if match else None
+    
     def _get_module_info(self, module_path: str, module_name: str) -> Optional[Dict[str, Optional[str]]]:
         """
         Extract module information from module.json and check for required files.
@@ -277,14 +346,23 @@ class DocumentationBuilder:
         </style>
         """
     
-    def build_module_guide(self) -> bool:
+    def build_module_guide(self, force: bool = False) -> bool:
         """
         Build the module guide HTML page by scanning modules and updating the template.
+        The rebuild is skipped when the stamped fingerprint matches the current modules.
+        
+        Args:
+            force: Rebuild even if nothing changed
         
         Returns:
-            True if successful, False otherwise
+            True if successful (or already up to date), False otherwise
         """
         try:
+            fingerprint = self.compute_fingerprint()
+            if not force and self.read_output_fingerprint() == fingerprint:
+                print("Module guide is up to date")
+                return True
+            
             # Read template
             if not os.path.exists(self.template_path):
                 print(f"Template not found: {self.template_path}")
@@ -302,8 +380,9 @@ class DocumentationBuilder:
             # Get CSS
             css_content = self.get_module_guide_css()
             
-            # Insert CSS before </head>
-            final_content = template_content.replace('</head>', f'{css_content}\n</head>')
+            # Insert fingerprint stamp and CSS before </head>
+            stamp = f"<!-- module-guide-fingerprint: {fingerprint} -->"
+            final_content = template_content.replace('</head>', f'{stamp}\n{css_content}\n</head>')
             
             # If we have modules, replace the entire content section with module cards
             if modules:
@@ -329,9 +408,11 @@ class DocumentationBuilder:
             # Ensure output directory exists
             os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
             
-            # Write final content
-            with open(self.output_path, 'w', encoding='utf-8') as f:
+            # Write final content atomically so a reader never sees a half-written guide
+            tmp_path = self.output_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 f.write(final_content)
+            os.replace(tmp_path, self.output_path)
             
             print(f"Module guide built successfully with {len(modules)} modules")
             return True
@@ -341,15 +422,37 @@ class DocumentationBuilder:
             return False
 
 
-def build_module_documentation(project_root: str) -> bool:
+def build_module_documentation(project_root: str, force: bool = False) -> bool:
     """
     Convenience function to build module documentation.
     
     Args:
         project_root: Path to the root directory of the Omnimon project
+        force: Rebuild even if nothing changed
         
     Returns:
         True if successful, False otherwise
     """
     builder = DocumentationBuilder(project_root)
-    return builder.build_module_guide()
+    return builder.build_module_guide(force)
+
+
+def build_module_documentation_async(project_root: str) -> threading.Thread:
+    """
+    Build module documentation on a background thread.
+    Fingerprinting also runs on the thread, so the caller pays nothing when the guide is up to date.
+    
+    Args:
+        project_root: Path to the root directory of the Omnimon project
+        
+    Returns:
+        The started (daemon) thread
+    """
+    thread = threading.Thread(
+        target=build_module_documentation,
+        args=(project_root,),
+        name="DocumentationBuilder",
+        daemon=True
+    )
+    thread.start()
+    return thread
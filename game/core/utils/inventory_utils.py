@@ -26,35 +26,11 @@ def get_item_by_id(item_id):
     Gets an item object by item ID across all modules.
     Returns the item object if found, None otherwise.
     """
-    # Search through all loaded modules for the item
-    for module_name, module in runtime_globals.game_modules.items():
-        # Check if module has items
-        if hasattr(module, "items"):
-            # Search for item by ID
-            for item in module.items:
-                if item.id == item_id:
-                    return item
-    
-    return None
+    return runtime_globals.item_index.get(item_id)
 
 def get_item_by_name(module_name, item_name):
     """
     Gets an item object by module name and item name.
     Returns the item object if found, None otherwise.
     """
-    # Check if module exists
-    if module_name not in runtime_globals.game_modules:
-        return None
-    
-    module = runtime_globals.game_modules[module_name]
-    
-    # Check if module has items
-    if not hasattr(module, "items"):
-        return None
-    
-    # Search for item by name
-    for item in module.items:
-        if item.name == item_name:
-            return item
-    
-    return None
\ No newline at end of file
+    return runtime_globals.item_name_index.get((module_name, item_name))
@@ -1,33 +1,151 @@
+import json
 import os
 from core.constants import MODULES_FOLDER
 from core.game_module import GameModule
-from core import runtime_globals, game_globals
+from core.game_evolution_graph import invalidate_evolution_graph
+from core import module_bundle, runtime_globals, game_globals
+from core.module_bundle import BUNDLE_EXTENSION
+from core.quest_event_data import EventTable
 
 def load_modules():
     """
-    Loads all modules from the MODULES_FOLDER and registers them in runtime_globals.game_modules.
+    Loads all modules (folders and .omb bundles) from the MODULES_FOLDER and registers them in runtime_globals.game_modules.
     Also sets ruleset flags and initializes adventure mode progress if needed.
     """
     module_dir = MODULES_FOLDER
     runtime_globals.game_modules = {}
-    for folder in os.listdir(module_dir):
+    entries = os.listdir(module_dir)
+    for folder in entries:
         folder_path = os.path.join(module_dir, folder)
         module_json_path = os.path.join(folder_path, "module.json")
         if os.path.isdir(folder_path) and os.path.exists(module_json_path):
-            module = GameModule(folder_path)
-            if module.ruleset == "dmc":
-                runtime_globals.dmc_enabled = True
-            if module.ruleset == "penc":
-                runtime_globals.penc_enabled = True
-            if module.ruleset == "dmx":
-                runtime_globals.dmx_enabled = True
-            if module.adventure_mode and game_globals.battle_area.get(module.name) is None:
-                game_globals.battle_area[module.name] = 1
-                game_globals.battle_round[module.name] = 1
-            runtime_globals.game_modules[module.name] = module
+            register_module(folder_path)
+        elif folder.endswith(BUNDLE_EXTENSION) and module_bundle.exists(module_json_path):
+            # Packed bundle; an unpacked folder of the same name takes precedence
+            if folder[:-len(BUNDLE_EXTENSION)] not in entries:
+                register_module(folder_path)
+    build_module_indexes()
     runtime_globals.game_console.log(f"[SceneEggSelection] Loaded Modules: {len(runtime_globals.game_modules)}")
     return runtime_globals.game_modules
 
+def register_module(folder_path):
+    """
+    Loads one module folder into runtime_globals.game_modules (without rebuilding indexes).
+    """
+    module = GameModule(folder_path)
+    if module.ruleset == "dmc":
+        runtime_globals.dmc_enabled = True
+    if module.ruleset == "penc":
+        runtime_globals.penc_enabled = True
+    if module.ruleset == "dmx":
+        runtime_globals.dmx_enabled = True
+    if module.adventure_mode and game_globals.battle_area.get(module.name) is None:
+        game_globals.battle_area[module.name] = 1
+        game_globals.battle_round[module.name] = 1
+    runtime_globals.game_modules[module.name] = module
+    return module
+
+def add_module(folder_path):
+    """
+    Loads a module installed while the game runs (e.g. received from another device)
+    and refreshes the lookup tables that depend on the module list.
+    """
+    module = register_module(folder_path)
+    build_module_indexes()
+    invalidate_evolution_graph(module.name)
+    runtime_globals.game_console.log(f"[ModuleUtils] Added module {module.name} from {folder_path}")
+    return module
+
+def reload_module(folder_path):
+    """
+    Reloads a module whose files changed on disk (module hot reload). Drops what was
+    cached from the old files, registers the module again in place and refreshes the
+    lookup tables. Returns the new module, or None if it was removed or is unreadable.
+    """
+    normalized = os.path.normpath(folder_path)
+    old = next((module for module in runtime_globals.game_modules.values()
+                if os.path.normpath(module.folder_path) == normalized), None)
+
+    module_bundle.release_bundle(folder_path)
+    runtime_globals.game_assets.invalidate(folder_path)
+    runtime_globals.module_revision += 1
+
+    module_json_path = os.path.join(folder_path, "module.json")
+    if not module_bundle.exists(module_json_path):
+        if old is not None and module_in_use(old.name):
+            runtime_globals.game_console.warning(
+                f"[ModuleUtils] {folder_path} is gone but module {old.name} is still in use, keeping it loaded")
+        elif old is not None:
+            del runtime_globals.game_modules[old.name]
+            runtime_globals.game_module_flag.pop(old.name, None)
+            build_module_indexes()
+            invalidate_evolution_graph(old.name)
+            runtime_globals.game_console.log(f"[ModuleUtils] Removed module {old.name} ({folder_path} is gone)")
+        return None
+    try:
+        # A half-written module.json would register a "default" module; keep the old one instead
+        with module_bundle.open_file(module_json_path) as file:
+            json.load(file)
+    except (OSError, ValueError) as e:
+        runtime_globals.game_console.log(f"[ModuleUtils] Not reloading {folder_path}, module.json is invalid: {e}")
+        return None
+
+    # Same name: the dict entry is replaced in place, so module order (and index priority) is kept
+    module = register_module(folder_path)
+    if old is not None and old.name != module.name and module_in_use(old.name):
+        runtime_globals.game_console.warning(
+            f"[ModuleUtils] {folder_path} now holds {module.name} but {old.name} is still in use, keeping it loaded")
+    elif old is not None and old.name != module.name:
+        del runtime_globals.game_modules[old.name]
+        runtime_globals.game_module_flag.pop(old.name, None)
+        invalidate_evolution_graph(old.name)
+    build_module_indexes()
+    invalidate_evolution_graph(module.name)
+    runtime_globals.game_console.log(f"[ModuleUtils] Reloaded module {module.name} from {folder_path}")
+    return module
+
+def module_in_use(name):
+    """True while a pet or the saved background still refers to a module."""
+    return game_globals.background_module_name == name or any(pet.module == name for pet in game_globals.pet_list)
+
+def build_module_indexes():
+    """
+    Builds the cross-module lookup tables in runtime_globals (items, unlocks, quests, events)
+    so runtime lookups are dictionary hits and never touch module files.
+    """
+    runtime_globals.item_index = {}
+    runtime_globals.item_name_index = {}
+    runtime_globals.unlock_index = {}
+    runtime_globals.unlock_groups = {}
+    runtime_globals.quest_index = {}
+    runtime_globals.module_quests = {}
+    runtime_globals.event_tables = {}
+
+    for module_name, module in runtime_globals.game_modules.items():
+        for item in getattr(module, "items", []) or []:
+            # First module wins, matching the old linear search order
+            runtime_globals.item_index.setdefault(item.id, item)
+            runtime_globals.item_name_index.setdefault((module_name, item.name), item)
+
+        unlocks = getattr(module, "unlocks", [])
+        if isinstance(unlocks, list):
+            for unlock in unlocks:
+                if not isinstance(unlock, dict):
+                    continue
+                runtime_globals.unlock_index.setdefault((module_name, unlock.get("type"), unlock.get("name")), unlock)
+                if unlock.get("type") == "group" and isinstance(unlock.get("list"), list):
+                    for key in unlock["list"]:
+                        runtime_globals.unlock_groups.setdefault((module_name, key), []).append(unlock)
+
+        quests = module.load_quests_json()
+        runtime_globals.module_quests[module_name] = quests
+        for quest_data in quests:
+            runtime_globals.quest_index.setdefault(quest_data.id, (module_name, quest_data))
+
+        events = module.load_events_json()
+        if events:
+            runtime_globals.event_tables[module_name] = EventTable(events)
+
 def get_module(name):
     """
     Returns the loaded GameModule instance by name.
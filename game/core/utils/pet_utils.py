@@ -1,4 +1,4 @@
-from core import game_globals, runtime_globals
+from core import game_globals, module_bundle, runtime_globals
 from game.core import constants
 
 def get_selected_pets():
@@ -11,6 +11,12 @@ def get_selected_pets():
         pet_list = [pet for pet in game_globals.pet_list if pet.state != "dead"]
     return pet_list
 
+def get_pet_modules():
+    """
+    Returns the set of module names that currently have a pet in the party.
+    """
+    return frozenset(pet.module for pet in game_globals.pet_list)
+
 def get_training_targets():
     """
     Returns pets eligible for training based on the current strategy.
@@ -61,6 +67,27 @@ def distribute_pets_evenly():
         pet.x = int(center_positions[i] - constants.PET_WIDTH / 2)
         pet.subpixel_x = float(pet.x)
 
+def refresh_module_pets(module_name):
+    """
+    Rebinds the pets of a reloaded module to its new monster data and sprites.
+    Only species data (set_data) is replaced; care, battle and timer state is kept.
+    Pets of a module that is gone from disk keep their current data and sprites.
+    """
+    module = runtime_globals.game_modules.get(module_name)
+    if module is None or not module_bundle.exists(module.folder_path):
+        return 0
+    refreshed = 0
+    for pet in game_globals.pet_list:
+        if pet.module != module_name:
+            continue
+        data = module.get_monster(pet.name, pet.version)
+        if data:
+            pet.set_data(dict(data, module=module.name))
+        pet.load_sprite()
+        pet.dirty = True
+        refreshed += 1
+    return refreshed
+
 def draw_pet_outline(surface, frame, x, y, color=(255, 255, 0)):
     """
     Draws an outline around a pet sprite frame.
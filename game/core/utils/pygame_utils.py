@@ -2,12 +2,18 @@ import hashlib
 import os
 import pygame
 import time
+from collections import OrderedDict
 import game.core.constants as constants
-from core import game_console, game_globals, runtime_globals
+from core import game_console, game_globals, module_bundle, runtime_globals
 from game.core.utils.module_utils import get_module
 
 shadow_cache = {}
 
+# Fonts memoized by (path, size); rendered text kept in a small LRU
+font_cache = {}
+text_cache = OrderedDict()
+TEXT_CACHE_SIZE = 256
+
 def get_surface_hash(surface):
     """Generate a hash of the surface’s pixel data to uniquely identify it."""
     return hashlib.md5(pygame.image.tostring(surface, "RGBA")).hexdigest()
@@ -38,18 +44,56 @@ def blit_with_shadow(surface, sprite, pos, offset=(2, 2)):
             _last_log_time = current_time
 
     # Perform the blit with shadow
+    profiler = runtime_globals.frame_profiler
+    start = profiler.start()
     shadow = get_shadow(sprite)
     surface.blit(shadow, (pos[0] + offset[0], pos[1] + offset[1]))
     surface.blit(sprite, pos)
+    profiler.stop("blit", start)
+
+def load_font(path, size):
+    """Returns a shared Font for (path, size), opening the file only once. path=None uses pygame's default font."""
+    key = (path, size)
+    font = font_cache.get(key)
+    if font is None:
+        font = pygame.font.Font(path, size)
+        font_cache[key] = font
+    return font
 
 def get_font(size=24):
-    return pygame.font.Font(constants.FONT_TTF_PATH, size)
+    return load_font(constants.FONT_TTF_PATH, size)
 
 def get_font_alt(size=24):
-    return pygame.font.Font(constants.FONT_ALT_TTF_PATH, size)
+    return load_font(constants.FONT_ALT_TTF_PATH, size)
+
+def render_text(font, text, antialias, color, shadow=False):
+    """
+    Cached font.render(text, antialias, color). With shadow=True the surface already
+    contains the blit_with_shadow drop shadow, so it can be drawn with a single blit.
+    Returned surfaces are shared and must not be modified.
+    """
+    key = (font, text, antialias, tuple(color), shadow)
+    rendered = text_cache.get(key)
+    if rendered is not None:
+        text_cache.move_to_end(key)
+        return rendered
+
+    rendered = font.render(text, antialias, color)
+    if shadow:
+        shadow_surface = rendered.copy()
+        shadow_surface.fill((0, 0, 0, 100), special_flags=pygame.BLEND_RGBA_MULT)
+        shadowed = pygame.Surface((rendered.get_width() + 2, rendered.get_height() + 2), pygame.SRCALPHA)
+        shadowed.blit(shadow_surface, (2, 2))
+        shadowed.blit(rendered, (0, 0))
+        rendered = shadowed
+
+    text_cache[key] = rendered
+    if len(text_cache) > TEXT_CACHE_SIZE:
+        text_cache.popitem(last=False)
+    return rendered
 
 def sprite_load(path, size=None, scale=1):
-    img = pygame.image.load(path).convert_alpha()
+    img = pygame.image.load(module_bundle.image_source(path)).convert_alpha()
     if size:
         return pygame.transform.scale(img, size)
     elif scale != 1:
@@ -59,11 +103,15 @@ def sprite_load(path, size=None, scale=1):
     return img
 
 def sprite_load_percent(path, percent=100, keep_proportion=True, base_on="height", alpha=True):
-    img = pygame.image.load(path)
+    img = pygame.image.load(module_bundle.image_source(path))
     if alpha:
         img = img.convert_alpha()
     else:
         img = img.convert()
+    return scale_percent(img, percent, keep_proportion, base_on)
+
+def scale_percent(img, percent=100, keep_proportion=True, base_on="height"):
+    """Scales an already loaded surface the same way sprite_load_percent does."""
     orig_w, orig_h = img.get_size()
     ref_size = constants.SCREEN_WIDTH if base_on == "width" else constants.SCREEN_HEIGHT
     target = int(ref_size * (percent / 100.0))
@@ -81,7 +129,7 @@ def sprite_load_percent(path, percent=100, keep_proportion=True, base_on="height
     return pygame.transform.scale(img, (new_w, new_h))
 
 def sprite_load_percent_wh(path, percent_w=100, percent_h=100, keep_proportion=True):
-    img = pygame.image.load(path).convert_alpha()
+    img = pygame.image.load(module_bundle.image_source(path)).convert_alpha()
     orig_w, orig_h = img.get_size()
     target_w = int(constants.SCREEN_WIDTH * (percent_w / 100.0))
     target_h = int(constants.SCREEN_HEIGHT * (percent_h / 100.0))
@@ -95,11 +143,15 @@ def sprite_load_percent_wh(path, percent_w=100, percent_h=100, keep_proportion=T
     return pygame.transform.scale(img, (new_w, new_h))
 
 def load_attack_sprites():
+    """Returns the shared attack sprites (decoded once and kept by the asset manager)."""
+    return dict(runtime_globals.game_assets.get_attack_sprites(constants.ATK_FOLDER))
+
+def load_attack_folder(folder):
     attack_sprites = {}
-    for filename in os.listdir(constants.ATK_FOLDER):
+    for filename in module_bundle.listdir(folder):
         if filename.endswith(".png"):
-            path = os.path.join(constants.ATK_FOLDER, filename)
-            sprite = pygame.image.load(path).convert_alpha()
+            path = os.path.join(folder, filename)
+            sprite = pygame.image.load(module_bundle.image_source(path)).convert_alpha()
             sprite = pygame.transform.scale(sprite, (24 * constants.UI_SCALE, 24 * constants.UI_SCALE))
             atk_id = filename.split(".")[0]
             attack_sprites[atk_id] = sprite
@@ -115,21 +167,14 @@ def module_attack_sprites(module):
         game_console.log(f"[!] Module {module} not found for attack sprites.")
         return {}
     
-    attack_sprites = {}
     atk_folder = os.path.join(mod.folder_path, "atk")
     
     # Check if atk folder exists
-    if not os.path.exists(atk_folder):
+    if not module_bundle.exists(atk_folder):
         return {}
     
     try:
-        for filename in os.listdir(atk_folder):
-            if filename.endswith(".png"):
-                path = os.path.join(atk_folder, filename)
-                sprite = pygame.image.load(path).convert_alpha()
-                sprite = pygame.transform.scale(sprite, (24 * constants.UI_SCALE, 24 * constants.UI_SCALE))
-                atk_id = filename.split(".")[0]
-                attack_sprites[atk_id] = sprite
+        attack_sprites = dict(runtime_globals.game_assets.get_attack_sprites(atk_folder))
     except (OSError, pygame.error) as e:
         game_console.log(f"[!] Error loading attack sprites for module {module}: {e}")
         return {}
@@ -193,4 +238,7 @@ def blit_with_cache(surface, sprite, pos):
             _last_cache_log_time = current_time
 
     # Perform the blit
-    surface.blit(sprite, pos)
\ No newline at end of file
+    profiler = runtime_globals.frame_profiler
+    start = profiler.start()
+    surface.blit(sprite, pos)
+    profiler.stop("blit", start)
\ No newline at end of file
@@ -1,5 +1,4 @@
 import random
-from datetime import datetime
 from typing import List, Optional
 
 from core import runtime_globals, game_globals
@@ -7,6 +6,7 @@ from core.game_quest import GameQuest, QuestType, QuestStatus, RewardType
 from core.game_event import GameEvent, EventType
 from core.quest_event_data import QuestData, EventData
 from game.core.utils.inventory_utils import add_to_inventory, get_item_by_name
+from core.utils.pet_utils import get_pet_modules
 
 
 def get_all_available_quest_data() -> List[QuestData]:
@@ -17,12 +17,22 @@ def get_all_available_quest_data() -> List[QuestData]:
         List of all available quest templates across all modules
     """
     all_quest_data = []
-    for module_name, module in runtime_globals.game_modules.items():
-        quest_data = module.load_quests_json()
+    for quest_data in runtime_globals.module_quests.values():
         all_quest_data.extend(quest_data)
     return all_quest_data
 
 
+def get_quest_module_name(quest_id: str) -> str:
+    """
+    Get the name of the module that owns a quest template.
+    
+    Returns:
+        Module name, or "Unknown" if no loaded module defines the quest
+    """
+    entry = runtime_globals.quest_index.get(quest_id)
+    return entry[0] if entry else "Unknown"
+
+
 def get_all_available_event_data() -> List[EventData]:
     """
     Get all available event data from all loaded modules.
@@ -31,9 +41,8 @@ def get_all_available_event_data() -> List[EventData]:
         List of all available event templates across all modules
     """
     all_event_data = []
-    for module_name, module in runtime_globals.game_modules.items():
-        event_data = module.load_events_json()
-        all_event_data.extend(event_data)
+    for event_table in runtime_globals.event_tables.values():
+        all_event_data.extend(event_table.events)
     return all_event_data
 
 
@@ -97,7 +106,7 @@ def create_quest_instance_from_data(quest_data: QuestData, module_name: str) ->
         module=module_name,
         quest_type=quest_type_enum,
         target_amount=target_amount,
-        date_obtained=datetime.now().strftime("%Y-%m-%d"),
+        date_obtained=runtime_globals.game_clock.now.strftime("%Y-%m-%d"),
         reward_type=reward_type_enum,
         reward_value=reward_value,
         reward_quantity=reward_quantity
@@ -142,13 +151,7 @@ def generate_daily_quests() -> List[GameQuest]:
         # Convert all available quest data to instances
         selected_instances = []
         for quest_data in all_quest_data:
-            # Find the module name for this quest
-            module_name = "Unknown"
-            for mod_name, module in runtime_globals.game_modules.items():
-                mod_quest_data = module.load_quests_json()
-                if any(q.id == quest_data.id for q in mod_quest_data):
-                    module_name = mod_name
-                    break
+            module_name = get_quest_module_name(quest_data.id)
             selected_instances.append(create_quest_instance_from_data(quest_data, module_name))
         return selected_instances
     
@@ -156,18 +159,11 @@ def generate_daily_quests() -> List[GameQuest]:
     selected_quest_data = random.sample(all_quest_data, 3)
     
     # Convert to quest instances and set assignment date
-    current_date = datetime.now().strftime("%Y-%m-%d")
+    current_date = runtime_globals.game_clock.now.strftime("%Y-%m-%d")
     selected_instances = []
     
     for quest_data in selected_quest_data:
-        # Find the module name for this quest
-        module_name = "Unknown"
-        for mod_name, module in runtime_globals.game_modules.items():
-            mod_quest_data = module.load_quests_json()
-            if any(q.id == quest_data.id for q in mod_quest_data):
-                module_name = mod_name
-                break
-                
+        module_name = get_quest_module_name(quest_data.id)
         quest_instance = create_quest_instance_from_data(quest_data, module_name)
         # Status is already set to PENDING by default in GameQuest constructor
         quest_instance.date_assigned = current_date
@@ -176,6 +172,32 @@ def generate_daily_quests() -> List[GameQuest]:
     return selected_instances
 
 
+def check_new_day() -> bool:
+    """
+    Roll a new XAI and reset daily quests when the date changed since the last check.
+        
+    Returns:
+        True if a new day was detected
+    """
+    today = runtime_globals.game_clock.now.date()
+    if game_globals.xai_date >= today:
+        return False
+    game_globals.xai = random.randint(1, 7)
+    game_globals.xai_date = today
+    # Reset daily quests when day changes
+    game_globals.quests = []
+    runtime_globals.game_console.log(f"[Quest] New day detected, XAI set to {game_globals.xai}, quests reset")
+    return True
+
+
+def daily_reset_task() -> None:
+    """
+    Scheduler task: rolls over XAI and daily quests at midnight without waiting for a scene change.
+    """
+    if check_new_day():
+        game_globals.quests = generate_daily_quests()
+
+
 def get_hourly_random_event() -> Optional[GameEvent]:
     """
     Get a random event for the current hour based on XAI algorithm.
@@ -191,43 +213,27 @@ def get_hourly_random_event() -> Optional[GameEvent]:
     if roll > xai_chance:
         return None  # No event this hour
     
-    # Step 2: Get all modules that have events
-    modules_with_events = []
-    for module_name, module in runtime_globals.game_modules.items():
-        event_data = module.load_events_json()
-        if event_data:  # Only include modules that have events
-            modules_with_events.append((module_name, event_data))
-    
-    if not modules_with_events:
+    # Step 2: Get all modules that have events (tables are built at module load)
+    if not runtime_globals.event_tables:
         return None  # No modules have events
     
     # Step 3: Roll a random module from those that have events
-    selected_module_name, event_list = random.choice(modules_with_events)
+    selected_module_name = random.choice(list(runtime_globals.event_tables))
+    event_table = runtime_globals.event_tables[selected_module_name]
 
     # Step 4: Roll an event from the selected module using chance_percent
-    total_chance = sum(event_data.chance_percent for event_data in event_list)
-    if total_chance <= 0:
+    if event_table.total_chance <= 0:
         return None
 
-    event_roll = random.randint(1, min(100, total_chance))
-
-    # Find which event triggers
-    cumulative_chance = 0
-    selected_event_data = None
-    for event_data in event_list:
-        cumulative_chance += event_data.chance_percent 
-        if event_roll <= cumulative_chance:
-            selected_event_data = event_data
-            break
+    event_roll = random.randint(1, min(100, event_table.total_chance))
+    selected_event_data = event_table.pick(event_roll)
     
     if not selected_event_data:
         return None
     
     # Step 5: Final check - if event is not global, check if any pet has the module
     if not selected_event_data.global_event:
-        # Check if any pet in pet_list has the same module as the event
-        has_module_pet = any(pet.module == selected_module_name for pet in game_globals.pet_list)
-        if not has_module_pet:
+        if selected_module_name not in get_pet_modules():
             return None  # No pet with the required module
     
     # Event passes all checks, create and return the instance
@@ -1,8 +1,66 @@
+import importlib
+import time
+
 from core import runtime_globals
 
+# Scene state -> (module, class). Modules are imported on first use (or warmed up after boot),
+# most likely first, so the boot splash does not wait for every scene and its components.
+SCENE_REGISTRY = {
+    "boot": ("scenes.scene_boot", "SceneBoot"),
+    "game": ("scenes.scene_maingame", "SceneMainGame"),
+    "egg": ("scenes.scene_eggselection", "SceneEggSelection"),
+    "status": ("scenes.scene_statusmenu", "SceneStatusMenu"),
+    "feeding": ("scenes.scene_feedingmenu", "SceneFeedingMenu"),
+    "training": ("scenes.scene_training", "SceneTraining"),
+    "battle": ("scenes.scene_battle", "SceneBattle"),
+    "sleepmenu": ("scenes.scene_sleepmenu", "SceneSleepMenu"),
+    "settings": ("scenes.scene_settingsmenu", "SceneSettingsMenu"),
+    "evolution": ("scenes.scene_evolution", "SceneEvolution"),
+    "digidex": ("scenes.scene_digidex", "SceneDigidex"),
+    "freezer": ("scenes.scene_freezerbox", "SceneFreezerBox"),
+    "library": ("scenes.scene_library", "SceneLibrary"),
+    "connect": ("scenes.scene_connect", "SceneConnect"),
+    "battle_pvp": ("scenes.scene_battle_pvp", "SceneBattlePvP"),
+    "debug": ("scenes.scene_debug", "SceneDebug"),
+}
+
+_scene_classes = {}
+
+
 def change_scene(scene):
     """
     Changes the current game scene/state.
     """
     runtime_globals.game_state_update = True
-    runtime_globals.game_state = scene
\ No newline at end of file
+    runtime_globals.game_state = scene
+
+
+def get_scene_class(state):
+    """
+    Returns the scene class registered for a state, importing its module on first use.
+    Returns None for unknown states.
+    """
+    scene_class = _scene_classes.get(state)
+    if scene_class is None:
+        entry = SCENE_REGISTRY.get(state)
+        if entry is None:
+            return None
+        module_name, class_name = entry
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        runtime_globals.startup_timings[f"import {module_name}"] = time.perf_counter() - start
+        scene_class = getattr(module, class_name)
+        _scene_classes[state] = scene_class
+    return scene_class
+
+
+def warm_up_next_scene() -> bool:
+    """
+    Imports the next scene module that has not been loaded yet.
+    Returns False once every registered scene is loaded.
+    """
+    for state in SCENE_REGISTRY:
+        if state not in _scene_classes:
+            get_scene_class(state)
+            return True
+    return False
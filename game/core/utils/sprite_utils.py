@@ -1,12 +1,13 @@
 """
-Sprite loading utilities for pets and enemies with fallback support and zip file compatibility.
+Sprite loading utilities for pets and enemies with fallback support, zip file and module bundle compatibility.
 """
 import os
 import zipfile
+import zlib
 import pygame
 import io
 from typing import Dict, List
-from core import runtime_globals
+from core import module_bundle, runtime_globals
 
 
 def get_sprite_name(pet_name: str, name_format: str = "$_dmc") -> str:
@@ -122,11 +123,64 @@ def load_sprites_from_zip(zip_path: str, pet_name: str, size: tuple = None, scal
     return sprites
 
 
+def load_sprites_from_bundle(bundle_path: str, sprite_name: str, size: tuple = None, scale: float = 1.0) -> Dict[str, pygame.Surface]:
+    """
+    Load sprites from a packed module bundle (.omb).
+
+    When the bundle has a strip pre-scaled to the requested size, the frames are
+    subsurfaces of one sheet and no PNG is decoded or scaled.
+
+    Args:
+        bundle_path: Path to the bundle file
+        sprite_name: Formatted sprite name (e.g., "Agumon_dmc")
+        size: Target size tuple (width, height) for scaling
+        scale: Scale factor if size is not provided
+
+    Returns:
+        Dictionary mapping filename (without .png) to pygame Surface
+    """
+    sprites = {}
+    bundle = module_bundle.get_bundle(bundle_path)
+    if bundle is None:
+        return sprites
+
+    strip = bundle.read_strip(sprite_name, size) if size else None
+    if strip:
+        frame_names, width, height, pixels = strip
+        sheet = pygame.image.frombuffer(pixels, (width * len(frame_names), height), "RGBA").convert_alpha()
+        for i, frame_name in enumerate(frame_names):
+            sprites[frame_name] = sheet.subsurface((i * width, 0, width, height))
+        return sprites
+
+    folder = module_bundle.SPRITES_PREFIX + sprite_name
+    for filename in bundle.listdir(folder):
+        if not filename.lower().endswith('.png'):
+            continue
+        entry = f"{folder}/{filename}"
+        try:
+            sprite = pygame.image.load(io.BytesIO(bundle.read(entry))).convert_alpha()
+
+            # Apply scaling
+            if size:
+                sprite = pygame.transform.scale(sprite, size)
+            elif scale != 1.0:
+                base_size = sprite.get_size()
+                new_size = (int(base_size[0] * scale), int(base_size[1] * scale))
+                sprite = pygame.transform.scale(sprite, new_size)
+
+            sprites[filename[:-4]] = sprite
+        except (pygame.error, zlib.error) as e:
+            runtime_globals.game_console.log(f"Failed to load sprite {entry} from {bundle_path}: {e}")
+
+    return sprites
+
+
 def load_pet_sprites(pet_name: str, module_path: str, name_format: str = "$_dmc", size: tuple = None, scale: float = 1.0) -> Dict[str, pygame.Surface]:
     """
     Load pet sprites with fallback support and zip file compatibility.
     
     Loading order:
+    0. Try the module bundle, when module_path is a .omb file
     1. Try module_path/monsters/PetName_format/ directory
     2. Try module_path/monsters/PetName_format.zip file
     3. Try assets/monsters/PetName_format/ directory (fallback)
@@ -144,33 +198,40 @@ def load_pet_sprites(pet_name: str, module_path: str, name_format: str = "$_dmc"
     """
     sprite_name = get_sprite_name(pet_name, name_format)
     sprites = {}
+
+    # Path 0: Try the packed module bundle
+    if module_bundle.is_bundle(module_path):
+        sprites = load_sprites_from_bundle(module_path, sprite_name, size, scale)
+        if sprites:
+            runtime_globals.game_console.debug("Loaded %d sprites for %s from module bundle", len(sprites), pet_name, category="Sprites")
+            return sprites
     
     # Path 1: Try module_path/monsters/PetName_format/ directory
     module_sprite_dir = os.path.join(module_path, "monsters", sprite_name)
     sprites = load_sprites_from_directory(module_sprite_dir, size, scale)
     if sprites:
-        runtime_globals.game_console.log(f"Loaded {len(sprites)} sprites for {pet_name} from module directory")
+        runtime_globals.game_console.debug("Loaded %d sprites for %s from module directory", len(sprites), pet_name, category="Sprites")
         return sprites
     
     # Path 2: Try module_path/monsters/PetName_format.zip file
     module_sprite_zip = os.path.join(module_path, "monsters", f"{sprite_name}.zip")
     sprites = load_sprites_from_zip(module_sprite_zip, sprite_name, size, scale)
     if sprites:
-        runtime_globals.game_console.log(f"Loaded {len(sprites)} sprites for {pet_name} from module zip")
+        runtime_globals.game_console.debug("Loaded %d sprites for %s from module zip", len(sprites), pet_name, category="Sprites")
         return sprites
     
     # Path 3: Try assets/monsters/PetName_format/ directory (fallback)
     assets_sprite_dir = os.path.join("assets", "monsters", sprite_name)
     sprites = load_sprites_from_directory(assets_sprite_dir, size, scale)
     if sprites:
-        runtime_globals.game_console.log(f"Loaded {len(sprites)} sprites for {pet_name} from assets directory")
+        runtime_globals.game_console.debug("Loaded %d sprites for %s from assets directory", len(sprites), pet_name, category="Sprites")
         return sprites
     
     # Path 4: Try assets/monsters/PetName_format.zip file (fallback)
     assets_sprite_zip = os.path.join("assets", "monsters", f"{sprite_name}.zip")
     sprites = load_sprites_from_zip(assets_sprite_zip, sprite_name, size, scale)
     if sprites:
-        runtime_globals.game_console.log(f"Loaded {len(sprites)} sprites for {pet_name} from assets zip")
+        runtime_globals.game_console.debug("Loaded %d sprites for %s from assets zip", len(sprites), pet_name, category="Sprites")
         return sprites
     
     # No sprites found
@@ -9,6 +9,35 @@ def ensure_module_key(module: str):
     if module not in game_globals.unlocks:
         game_globals.unlocks[module] = []
 
+def get_unlock_set(module: str) -> dict:
+    """
+    Returns the set-backed view of a module's unlocked entries:
+    {"typed": {(type, name)}, "names": {name}}.
+    The view is rebuilt whenever the persisted list was replaced (e.g. after a load)
+    or changed size behind our back, so it always mirrors game_globals.unlocks.
+    """
+    ensure_module_key(module)
+    entries = game_globals.unlocks[module]
+    cached = game_globals.unlock_sets.get(module)
+    if cached is None or cached["source"] is not entries or cached["count"] != len(entries):
+        typed = set()
+        names = set()
+        for u in entries:
+            if isinstance(u, dict):
+                typed.add((u.get("type"), u.get("name")))
+                names.add(u.get("name"))
+        cached = {"source": entries, "count": len(entries), "typed": typed, "names": names}
+        game_globals.unlock_sets[module] = cached
+    return cached
+
+def _add_unlock_entry(module: str, entry: dict):
+    """Appends an unlock entry to the persisted list and keeps the lookup sets in sync."""
+    unlock_set = get_unlock_set(module)
+    game_globals.unlocks[module].append(entry)
+    unlock_set["typed"].add((entry["type"], entry["name"]))
+    unlock_set["names"].add(entry["name"])
+    unlock_set["count"] += 1
+
 def unlock_item(module: str, unlock_type: str, name: str, label: str = None):
     """
     Unlocks an item (egg, background, evolution, etc) for a specific module,
@@ -16,58 +45,44 @@ def unlock_item(module: str, unlock_type: str, name: str, label: str = None):
     """
     ensure_module_key(module)
     # Find the item in the module's unlocks
-    module_obj = runtime_globals.game_modules.get(module)
-    unlocks = getattr(module_obj, "unlocks", []) if module_obj else []
-    unlock_data = None
-    for unlock in unlocks:
-        if unlock.get("type") == unlock_type and unlock.get("name") == name:
-            unlock_data = unlock
-            break
+    unlock_data = runtime_globals.unlock_index.get((module, unlock_type, name))
     if not unlock_data:
         # Do not unlock if not present in module's unlockables
         runtime_globals.game_console.log(f"[Unlocks] Tried to unlock missing item: {module} {unlock_type} {name}")
         return
     # Only add if not already unlocked
-    if not any(isinstance(u, dict) and u.get("type") == unlock_type and u.get("name") == name for u in game_globals.unlocks[module]):
+    if not is_unlocked(module, unlock_type, name):
         unlock_entry = {"type": unlock_type, "name": name}
         entry_label = label if label else unlock_data.get("label", name)
         if entry_label:
             unlock_entry["label"] = entry_label
-        game_globals.unlocks[module].append(unlock_entry)
+        _add_unlock_entry(module, unlock_entry)
         runtime_globals.game_message.add_slide(f"{entry_label} unlocked!", (255, 255, 0), 56 * UI_SCALE, FONT_SIZE_SMALL)
 
         # --- Group unlock logic ---
-        # After unlocking, check for group unlocks in this module
-        for group_unlock in unlocks:
-            if group_unlock.get("type") == "group" and isinstance(group_unlock.get("list"), list):
-                group_list = group_unlock["list"]
-                # If the just-unlocked item is in the group list
-                if name in group_list:
-                    # Check if all items in the group list are unlocked
-                    all_unlocked = all(
-                        is_unlocked(module, None, key)  # None means any type
-                        if not any(u.get("name") == key for u in game_globals.unlocks[module])
-                        else True
-                        for key in group_list
-                    )
-                    # If all are unlocked, unlock the group record
-                    if all_unlocked and not is_unlocked(module, "group", group_unlock["name"]):
-                        group_label = group_unlock.get("label", group_unlock["name"])
-                        group_entry = {"type": "group", "name": group_unlock["name"]}
-                        if group_label:
-                            group_entry["label"] = group_label
-                        game_globals.unlocks[module].append(group_entry)
-                        runtime_globals.game_message.add_slide(f"{group_label} unlocked!", (255, 255, 0), 56 * UI_SCALE, FONT_SIZE_SMALL)
+        # After unlocking, check the group unlocks that list the just-unlocked item
+        unlocked_names = get_unlock_set(module)["names"]
+        for group_unlock in runtime_globals.unlock_groups.get((module, name), []):
+            # Check if all items in the group list are unlocked (any type)
+            all_unlocked = all(key in unlocked_names for key in group_unlock["list"])
+            # If all are unlocked, unlock the group record
+            if all_unlocked and not is_unlocked(module, "group", group_unlock["name"]):
+                group_label = group_unlock.get("label", group_unlock["name"])
+                group_entry = {"type": "group", "name": group_unlock["name"]}
+                if group_label:
+                    group_entry["label"] = group_label
+                _add_unlock_entry(module, group_entry)
+                runtime_globals.game_message.add_slide(f"{group_label} unlocked!", (255, 255, 0), 56 * UI_SCALE, FONT_SIZE_SMALL)
 
 def is_unlocked(module: str, unlock_type: str, name: str) -> bool:
     """
     Checks if an item is unlocked.
     If unlock_type is None, checks for any type with that name.
     """
-    ensure_module_key(module)
+    unlock_set = get_unlock_set(module)
     if unlock_type is None:
-        return any(isinstance(u, dict) and u.get("name") == name for u in game_globals.unlocks[module])
-    return any(isinstance(u, dict) and u.get("type") == unlock_type and u.get("name") == name for u in game_globals.unlocks[module])
+        return name in unlock_set["names"]
+    return (unlock_type, name) in unlock_set["typed"]
 
 def get_unlocked_backgrounds(module: str, module_backgrounds: list = None) -> list[dict]:
     """
@@ -76,7 +91,7 @@ def get_unlocked_backgrounds(module: str, module_backgrounds: list = None) -> li
     """
     ensure_module_key(module)
     # Get all unlocked background names for this module
-    unlocked_names = {u["name"] for u in game_globals.unlocks[module]}
+    unlocked_names = get_unlock_set(module)["names"]
     backgrounds = []
     # Use the module's backgrounds list to get labels and info
     if module_backgrounds:
@@ -86,4 +101,4 @@ def get_unlocked_backgrounds(module: str, module_backgrounds: list = None) -> li
     else:
         # Fallback: just return unlocked names with their label if present
         backgrounds = [{"name": u["name"], "label": u.get("label", u["name"])} for u in game_globals.unlocks[module] if isinstance(u, dict) and u.get("type") == "background"]
-    return backgrounds
\ No newline at end of file
+    return backgrounds
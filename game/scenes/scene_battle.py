@@ -9,7 +9,7 @@ from components.window_background import WindowBackground
 from components.window_horizontalmenu import WindowHorizontalMenu
 from components.window_menu import WindowMenu
 from components.window_petview import WindowPetList
-from core import game_globals, runtime_globals
+from core import game_globals, module_bundle, runtime_globals
 from core.combat.battle_encounter import BattleEncounter
 from core.combat.battle_encounter_versus import BattleEncounterVersus
 from core.combat.sim.battle_simulator import BattleProtocol
@@ -731,8 +731,8 @@ class SceneBattle:
                             if not sprite_name.lower().endswith(".png"):
                                 sprite_name += ".png"
                             sprite_path = os.path.join(module.folder_path, "items", sprite_name)
-                            if os.path.exists(sprite_path):
-                                icon = pygame.image.load(sprite_path).convert_alpha()
+                            if module_bundle.exists(sprite_path):
+                                icon = pygame.image.load(module_bundle.image_source(sprite_path)).convert_alpha()
                             else:
                                 icon = pygame.Surface((48 * constants.UI_SCALE, 48 * constants.UI_SCALE), pygame.SRCALPHA)
                             digimental_items.append({
@@ -13,7 +13,10 @@ import copy
 
 from components.window_background import WindowBackground
 from components.window_menu import WindowMenu
-from core import game_globals, runtime_globals
+from core import game_globals, module_bundle, runtime_globals
+from core.combat.tournament import DEFAULT_RULES, MODES, TOURNAMENT_PORT, TournamentClient, TournamentHost
+from core.module_sync import ModuleSyncSession, SyncError
+from core.utils.module_utils import add_module
 from game.components.window_horizontalmenu import WindowHorizontalMenu
 from game.components.window_petview import WindowPetList
 import game.core.constants as constants
@@ -47,7 +50,7 @@ class SceneConnect:
             runtime_globals.strategy_index = 0
             
             # Phase management
-            self.phase = "menu"  # menu, pet_selection, host_join_menu, hosting, joining, device_list, module_check, battle_confirm, connecting
+            self.phase = "menu"  # menu, pet_selection, host_join_menu, hosting, joining, device_list, module_check, battle_confirm, connecting, module_sync, tournament_lobby, tournament
             
             # Pet selection setup
             self.pet_list_window = WindowPetList(lambda: game_globals.pet_list)
@@ -81,10 +84,17 @@ class SceneConnect:
             self.enemy_pet_count = 0
             self.enemy_modules = []
             self.missing_modules = []
+            self.module_sync = None  # ModuleSyncSession while modules are exchanged
+            self._synced_modules = None  # Folders installed by the sync thread, loaded by update()
             self.enemies = []
             self.chosen_module = None
             self.battle_simulation_data = None
 
+            # Tournament (TournamentHost when hosting, TournamentClient when joined)
+            self.tournament = None
+            self.tournament_mode = MODES[0]
+            self.tournament_ready_round = 0
+
             # Caching
             self._cache_surface = None
             self._cache_key = None
@@ -105,6 +115,11 @@ class SceneConnect:
         if hasattr(self, '_phase_changed'):
             self._cache_surface = None
             delattr(self, '_phase_changed')
+
+        # Modules received by the sync thread are loaded here, on the main thread
+        if self._synced_modules is not None:
+            folders, self._synced_modules = self._synced_modules, None
+            self.finish_module_sync(folders)
         
         # If a battle start was requested from the input handler, wait a small
         # amount of time to allow the UI to draw the "connecting" state, then
@@ -154,6 +169,8 @@ class SceneConnect:
                 len(self.discovered_devices),
                 self.enemy_pet_count,
                 tuple(self.missing_modules),
+                self.get_tournament_key(),
+                int(self.module_sync.progress * 20) if self.module_sync else None,
             )
 
             if cache_key != self._cache_key or self._cache_surface is None:
@@ -183,6 +200,12 @@ class SceneConnect:
                     self.draw_battle_confirmation(cache_surface)
                 elif self.phase == "connecting":
                     self.draw_connecting_screen(cache_surface)
+                elif self.phase == "module_sync":
+                    self.draw_module_sync(cache_surface)
+                elif self.phase == "tournament_lobby":
+                    self.draw_tournament_lobby(cache_surface)
+                elif self.phase == "tournament":
+                    self.draw_tournament(cache_surface)
 
                 self._cache_surface = cache_surface
                 self._cache_key = cache_key
@@ -214,8 +237,14 @@ class SceneConnect:
             self.handle_device_list_input(input_action)
         elif self.phase == "module_check":
             self.handle_module_check_input(input_action)
+        elif self.phase == "module_sync":
+            self.handle_module_sync_input(input_action)
         elif self.phase == "battle_confirm":
             self.handle_battle_confirm_input(input_action)
+        elif self.phase == "tournament_lobby":
+            self.handle_tournament_lobby_input(input_action)
+        elif self.phase == "tournament":
+            self.handle_tournament_input(input_action)
 
     def handle_menu_input(self, input_action) -> None:
         """Handles input for the main menu phase."""
@@ -274,6 +303,8 @@ class SceneConnect:
             runtime_globals.game_console.log(f"[SceneConnect] Selected: {selected_option}")
             if selected_option == "Host":
                 self.start_hosting()
+            elif selected_option == "Tournament":
+                self.start_tournament_lobby()
             elif selected_option == "Join":
                 self.start_joining()
 
@@ -304,6 +335,13 @@ class SceneConnect:
             self.stop_networking()
             self.phase = "menu"
 
+    def handle_module_sync_input(self, input_action) -> None:
+        """Handles input while modules are exchanged (B gives up; the download resumes next time)."""
+        if input_action == "B":
+            runtime_globals.game_sound.play("cancel")
+            self.stop_networking()
+            self.phase = "menu"
+
     def handle_battle_confirm_input(self, input_action) -> None:
         """Handles input for battle confirmation screen."""
         if input_action == "A":
@@ -319,6 +357,38 @@ class SceneConnect:
             self.stop_networking()
             self.phase = "menu"
 
+    def handle_tournament_lobby_input(self, input_action) -> None:
+        """Handles input while the tournament lobby is open."""
+        if input_action == "B":
+            runtime_globals.game_sound.play("cancel")
+            self.stop_networking()
+            self.phase = "host_join_menu"
+        elif input_action in ("LEFT", "RIGHT"):
+            runtime_globals.game_sound.play("menu")
+            direction = 1 if input_action == "RIGHT" else -1
+            self.tournament_mode = MODES[(MODES.index(self.tournament_mode) + direction) % len(MODES)]
+            self.tournament.mode = self.tournament_mode
+        elif input_action == "A":
+            if len(self.tournament.player_names()) >= 2:
+                runtime_globals.game_sound.play("menu")
+                self.start_tournament()
+            else:
+                runtime_globals.game_sound.play("cancel")
+
+    def handle_tournament_input(self, input_action) -> None:
+        """Handles input during a tournament: A acknowledges a finished round, A/B leave once it is over."""
+        state = self.tournament.state
+        if state.finished or (isinstance(self.tournament, TournamentClient) and not self.tournament.connected):
+            if input_action in ("A", "B"):
+                runtime_globals.game_sound.play("menu")
+                self.stop_networking()
+                self.phase = "menu"
+        elif input_action == "A" and isinstance(self.tournament, TournamentClient):
+            if state.round_complete and self.tournament_ready_round < state.round:
+                runtime_globals.game_sound.play("menu")
+                self.tournament_ready_round = state.round
+                self.tournament.ready(state.round)
+
     def confirm_selection(self) -> None:
         """
         Handles the selection of a menu option.
@@ -338,7 +408,7 @@ class SceneConnect:
         self.host_join_menu = WindowMenu()
         self.host_join_menu.open(
             position=((constants.SCREEN_WIDTH - int(120 * constants.UI_SCALE)) // 2, (constants.SCREEN_HEIGHT - int(100 * constants.UI_SCALE)) // 2),
-            options=["Host", "Join"]
+            options=["Host", "Tournament", "Join"]
         )
         self.phase = "host_join_menu"
 
@@ -355,6 +425,75 @@ class SceneConnect:
         
         runtime_globals.game_console.log(f"[SceneConnect] Started hosting with code: {self.host_code}")
 
+    def start_tournament_lobby(self) -> None:
+        """Opens a tournament lobby other devices can discover and join."""
+        runtime_globals.game_sound.play("menu")
+        self.is_host = True
+        self.host_code = self.generate_host_code()
+        try:
+            self.tournament = TournamentHost(self.host_code, self.create_pet_data(), mode=self.tournament_mode,
+                                             log=runtime_globals.game_console.log)
+            self.tournament.open_lobby()
+        except OSError as e:
+            runtime_globals.game_console.log(f"[SceneConnect] Tournament lobby error: {e}")
+            self.tournament = None
+            runtime_globals.game_sound.play("cancel")
+            return
+        self.phase = "tournament_lobby"
+        threading.Thread(target=self.handle_discovery_requests, daemon=True).start()
+        runtime_globals.game_console.log(f"[SceneConnect] Tournament lobby open with code: {self.host_code}")
+
+    def start_tournament(self) -> None:
+        """Closes the lobby and plays the tournament on the network thread."""
+        rules, module = self.choose_tournament_rules()
+        self.tournament_ready_round = 0
+        self.set_phase("tournament")
+        self.network_thread = threading.Thread(target=self.run_tournament, args=(rules, module), daemon=True)
+        self.network_thread.start()
+
+    def run_tournament(self, rules: tuple, module: str) -> None:
+        """Network thread function for the tournament host."""
+        try:
+            self.tournament.run(rules, module)
+        except Exception as e:
+            runtime_globals.game_console.log(f"[SceneConnect] Tournament error: {e}")
+
+    def choose_tournament_rules(self) -> tuple:
+        """Picks a random module among the participants' modules; its battle rules apply to every match."""
+        all_modules = set()
+        for participant in self.tournament.participants:
+            all_modules.update(pet["module"] for pet in participant.team)
+        available_modules = list(all_modules.intersection(runtime_globals.game_modules.keys()))
+        if not available_modules:
+            return DEFAULT_RULES, None
+        module_name = random.choice(available_modules)
+        module = runtime_globals.game_modules[module_name]
+        runtime_globals.game_console.log(f"[SceneConnect] Tournament module: {module_name}")
+        return (module.battle_atribute_advantage, module.battle_damage_limit), module_name
+
+    def join_tournament(self, device_info: dict) -> None:
+        """Joins a tournament host; the connection stays open until the tournament ends."""
+        try:
+            self.tournament = TournamentClient(self.generate_host_code(), self.create_pet_data(),
+                                               log=runtime_globals.game_console.log)
+            self.tournament.connect(device_info["address"], device_info.get("port", TOURNAMENT_PORT))
+            self.tournament_ready_round = 0
+            self.phase = "tournament"
+            runtime_globals.game_console.log(f"[SceneConnect] Joined tournament {device_info['host_code']}")
+        except OSError as e:
+            runtime_globals.game_console.log(f"[SceneConnect] Tournament join error: {e}")
+            self.tournament = None
+            self.phase = "device_list"
+
+    def get_tournament_key(self):
+        """Part of the draw cache key that changes with tournament progress."""
+        if not self.tournament:
+            return None
+        if self.phase == "tournament_lobby":
+            return (self.tournament_mode, tuple(self.tournament.player_names()))
+        connected = getattr(self.tournament, "connected", True)
+        return (self.tournament.state.version, connected, self.tournament_ready_round)
+
     def start_joining(self) -> None:
         """Starts joining mode to discover available hosts."""
         runtime_globals.game_sound.play("menu")
@@ -394,9 +533,64 @@ class SceneConnect:
         return {
                 "pet_count": len(self.pets),
             "modules": self.get_selected_modules(),
-            "host_code": self.host_code if self.is_host else ""
+            "host_code": self.host_code if self.is_host else "",
+            "installed": sorted(runtime_globals.game_modules.keys()),
+            "sync": 1
         }
 
+    def resolve_module_check(self, peer_data: dict) -> str:
+        """
+        Returns the phase after the handshake: battle_confirm when both devices have every
+        module, module_sync when either lacks one and both can sync, module_check otherwise.
+        Both devices reach the same answer from the data they exchanged.
+        """
+        compatible = self.check_module_compatibility(self.enemy_modules)
+        peer_installed = peer_data.get("installed")
+        # Devices without sync do not report their modules and check on their own
+        peer_missing = set(self.get_selected_modules()) - set(peer_installed) if peer_installed is not None else set()
+        if compatible and not peer_missing:
+            return "battle_confirm"
+        if peer_data.get("sync"):
+            return "module_sync"
+        return "module_check"
+
+    def start_module_sync(self) -> None:
+        """Exchanges missing modules over the open connection on a background thread."""
+        self.set_phase("module_sync")
+        # Packed bundles are not served: the sync protocol transfers module folders
+        servable = {name: module.folder_path for name, module in runtime_globals.game_modules.items()
+                    if not module_bundle.is_bundle(module.folder_path)}
+        self.module_sync = ModuleSyncSession(self.connection_socket, servable, log=runtime_globals.game_console.log)
+        threading.Thread(target=self.run_module_sync, daemon=True).start()
+
+    def run_module_sync(self) -> None:
+        """Sync thread function: downloads and installs our missing modules while serving the peer's."""
+        session = self.module_sync
+        try:
+            runtime_globals.game_console.log(f"[SceneConnect] Syncing modules, missing here: {self.missing_modules}")
+            staged = session.run(self.missing_modules)
+            folders = [module.install() for module in staged]
+            if self.module_sync is session:
+                self._synced_modules = folders
+        except (SyncError, OSError, KeyError, ValueError) as e:  # KeyError/ValueError: malformed messages
+            runtime_globals.game_console.log(f"[SceneConnect] Module sync failed: {e!r}")
+            if self.module_sync is session:  # Not cancelled from the scene
+                self.module_sync = None
+                self.set_phase("module_check")
+
+    def finish_module_sync(self, folders: list) -> None:
+        """Loads the received modules and continues to the battle confirmation."""
+        try:
+            for folder in folders:
+                add_module(folder)
+        except Exception as e:
+            runtime_globals.game_console.log(f"[SceneConnect] Error loading synced module: {e}")
+        self.module_sync = None
+        if self.check_module_compatibility(self.enemy_modules):
+            self.set_phase("battle_confirm")
+        else:
+            self.set_phase("module_check")
+
     def host_network(self) -> None:
         """Network thread function for hosting."""
         try:
@@ -435,13 +629,17 @@ class SceneConnect:
                     self.enemy_pet_count = enemy_data["pet_count"]
                     self.enemy_modules = enemy_data["modules"]
                     
-                    if self.check_module_compatibility(self.enemy_modules):
-                        self.set_phase("battle_confirm")
-                        self.connection_established = True
-                    else:
+                    next_phase = self.resolve_module_check(enemy_data)
+                    if next_phase == "module_check":
                         self.set_phase("module_check")
                         self.connection_socket.close()
                         self.connection_socket = None
+                    else:
+                        self.connection_established = True
+                        if next_phase == "module_sync":
+                            self.start_module_sync()
+                        else:
+                            self.set_phase("battle_confirm")
                     break
                     
                 except socket.timeout:
@@ -460,7 +658,7 @@ class SceneConnect:
             udp_socket.bind(('0.0.0.0', 12346))
             udp_socket.settimeout(1.0)
             
-            while self.phase == "hosting":
+            while self.phase in ("hosting", "tournament_lobby"):
                 try:
                     data, addr = udp_socket.recvfrom(1024)
                     message = json.loads(data.decode())
@@ -472,6 +670,9 @@ class SceneConnect:
                             "host_code": self.host_code,
                             "pet_count": len(self.pets)
                         }
+                        if self.phase == "tournament_lobby":
+                            response["mode"] = "tournament"
+                            response["port"] = self.tournament.port
                         udp_socket.sendto(json.dumps(response).encode(), addr)
                         runtime_globals.game_console.log(f"[SceneConnect] Sent discovery response to {addr}")
                         
@@ -510,7 +711,9 @@ class SceneConnect:
                         device_info = {
                             "host_code": response["host_code"],
                             "address": addr[0],
-                            "pet_count": response["pet_count"]
+                            "pet_count": response["pet_count"],
+                            "mode": response.get("mode", "battle"),
+                            "port": response.get("port", 12345)
                         }
                         
                         # Add unique devices only
@@ -541,7 +744,8 @@ class SceneConnect:
     def create_device_list_menu(self) -> None:
         """Creates the device selection menu."""
         if self.discovered_devices:
-            device_options = [f"{device['host_code']} ({device['pet_count']} pets)" for device in self.discovered_devices]
+            device_options = [f"{device['host_code']} (Tournament)" if device.get("mode") == "tournament"
+                              else f"{device['host_code']} ({device['pet_count']} pets)" for device in self.discovered_devices]
             self.device_list_menu = WindowMenu()
             self.device_list_menu.open(
                 position=((constants.SCREEN_WIDTH - int(200 * constants.UI_SCALE)) // 2, (constants.SCREEN_HEIGHT - int(150 * constants.UI_SCALE)) // 2),
@@ -550,6 +754,9 @@ class SceneConnect:
 
     def connect_to_device(self, device_info: dict) -> None:
         """Connects to a selected device."""
+        if device_info.get("mode") == "tournament":
+            self.join_tournament(device_info)
+            return
         try:
             runtime_globals.game_console.log(f"[SceneConnect] Connecting to {device_info['host_code']}...")
             
@@ -568,12 +775,16 @@ class SceneConnect:
             runtime_globals.game_console.log(f"[SceneConnect] Sending battle data to host: {battle_data}")  # LOG
             self.client_socket.send(json.dumps(battle_data).encode())
             
-            if self.check_module_compatibility(self.enemy_modules):
-                self.phase = "battle_confirm"
+            next_phase = self.resolve_module_check(host_data)
+            if next_phase != "module_check":
                 self.connection_established = True
                 # Set the connection socket for later use
                 self.connection_socket = self.client_socket
-                runtime_globals.game_console.log("[SceneConnect] Module compatibility check passed - ready for battle")
+                if next_phase == "module_sync":
+                    self.start_module_sync()
+                else:
+                    self.phase = "battle_confirm"
+                    runtime_globals.game_console.log("[SceneConnect] Module compatibility check passed - ready for battle")
             else:
                 self.phase = "module_check"
                 self.connection_established = False
@@ -621,6 +832,16 @@ class SceneConnect:
             if self.device_list_menu:
                 self.device_list_menu.close()
                 self.device_list_menu = None
+
+            self.module_sync = None
+            self._synced_modules = None
+
+            if self.tournament:
+                if isinstance(self.tournament, TournamentHost):
+                    self.tournament.stop()
+                else:
+                    self.tournament.close()
+                self.tournament = None
                 
             # Wait for network thread to finish
             if self.network_thread and self.network_thread.is_alive():
@@ -720,6 +941,32 @@ class SceneConnect:
                 blit_with_shadow(surface, subtitle_text, (subtitle_x, base_y + int(40 * constants.UI_SCALE)))
                 blit_with_shadow(surface, cancel_text, (cancel_x, base_y + int(80 * constants.UI_SCALE)))
 
+    def draw_module_sync(self, surface: pygame.Surface) -> None:
+        """Draws the module sync progress screen."""
+        font_large = get_font(int(24 * constants.UI_SCALE))
+        font_small = get_font(int(18 * constants.UI_SCALE))
+
+        sync = self.module_sync
+        if sync and sync.module:
+            status = f"{sync.module}: {int(sync.progress * 100)}%"
+        elif self.missing_modules:
+            status = "Preparing..."
+        else:
+            status = "Sending modules to the other device..."
+        self.draw_centered_lines(surface, [
+            ("Syncing Modules", font_large, constants.FONT_COLOR_DEFAULT),
+            (status, font_small, constants.FONT_COLOR_YELLOW),
+            ("Press B to cancel", font_small, constants.FONT_COLOR_GRAY),
+        ], constants.SCREEN_HEIGHT // 3, int(40 * constants.UI_SCALE))
+
+        # Progress bar
+        if sync and sync.module:
+            bar_width = constants.SCREEN_WIDTH - int(60 * constants.UI_SCALE)
+            bar_rect = pygame.Rect(int(30 * constants.UI_SCALE), constants.SCREEN_HEIGHT // 3 + int(130 * constants.UI_SCALE),
+                                   bar_width, int(10 * constants.UI_SCALE))
+            pygame.draw.rect(surface, constants.FONT_COLOR_GRAY, bar_rect, 1)
+            pygame.draw.rect(surface, constants.FONT_COLOR_GREEN, (bar_rect.x, bar_rect.y, int(bar_width * sync.progress), bar_rect.height))
+
     def draw_module_error(self, surface: pygame.Surface) -> None:
         """Draws the module compatibility error screen."""
         font_large = get_font(int(20 * constants.UI_SCALE))
@@ -1322,3 +1569,72 @@ class SceneConnect:
         base_y = constants.SCREEN_HEIGHT // 2 - int(40 * constants.UI_SCALE)
         blit_with_shadow(surface, connecting_text, (connecting_x, base_y))
         blit_with_shadow(surface, wait_text, (wait_x, base_y + int(40 * constants.UI_SCALE)))
+
+    def draw_centered_lines(self, surface: pygame.Surface, lines: list, base_y: int, spacing: int) -> None:
+        """Draws (text, font, color) lines centered horizontally, one below the other."""
+        y = base_y
+        for text, font, color in lines:
+            rendered = font.render(text, True, color)
+            blit_with_shadow(surface, rendered, ((constants.SCREEN_WIDTH - rendered.get_width()) // 2, y))
+            y += spacing
+
+    def draw_tournament_lobby(self, surface: pygame.Surface) -> None:
+        """Draws the tournament lobby with the joined players."""
+        font_large = get_font(int(24 * constants.UI_SCALE))
+        font_small = get_font(int(18 * constants.UI_SCALE))
+
+        names = self.tournament.player_names()
+        lines = [
+            ("Tournament Lobby", font_large, constants.FONT_COLOR_DEFAULT),
+            (f"Host Code: {self.host_code}", font_large, constants.FONT_COLOR_GREEN),
+            (f"< {self.tournament_mode.capitalize()} >", font_small, constants.FONT_COLOR_YELLOW),
+            (f"Players: {len(names)}", font_small, constants.FONT_COLOR_DEFAULT),
+        ]
+        for start in range(0, len(names), 4):
+            lines.append((" ".join(names[start:start + 4]), font_small, constants.FONT_COLOR_DEFAULT))
+        if len(names) >= 2:
+            lines.append(("Press A to start", font_small, constants.FONT_COLOR_GREEN))
+        else:
+            lines.append(("Waiting for other devices...", font_small, constants.FONT_COLOR_DEFAULT))
+        lines.append(("Press B to cancel", font_small, constants.FONT_COLOR_GRAY))
+        self.draw_centered_lines(surface, lines, int(30 * constants.UI_SCALE), int(32 * constants.UI_SCALE))
+
+    def draw_tournament(self, surface: pygame.Surface) -> None:
+        """Draws the current round's results and the standings."""
+        font_large = get_font(int(22 * constants.UI_SCALE))
+        font_small = get_font(int(16 * constants.UI_SCALE))
+        state = self.tournament.state
+        is_client = isinstance(self.tournament, TournamentClient)
+
+        if state.finished:
+            lines = [(f"Champion: {state.name(state.champion)}", font_large, constants.FONT_COLOR_GREEN)]
+        elif state.round == 0:
+            lines = [("Tournament starting...", font_large, constants.FONT_COLOR_YELLOW)]
+        else:
+            lines = [(f"{(state.mode or '').capitalize()} - Round {state.round}", font_large, constants.FONT_COLOR_DEFAULT)]
+            decided = {tuple(result["p"]): result for result in state.results}
+            for a, b in state.pairs:
+                result = decided.get((a, b))
+                if result is None:
+                    lines.append((f"{state.name(a)} vs {state.name(b)}...", font_small, constants.FONT_COLOR_GRAY))
+                else:
+                    loser = b if result["w"] == a else a
+                    mine = state.player_id in (a, b)
+                    color = (constants.FONT_COLOR_GREEN if result["w"] == state.player_id else constants.FONT_COLOR_RED) if mine else constants.FONT_COLOR_DEFAULT
+                    lines.append((f"{state.name(result['w'])} beat {state.name(loser)}", font_small, color))
+            for player in state.byes:
+                lines.append((f"{state.name(player)} has a bye", font_small, constants.FONT_COLOR_GRAY))
+
+        for place, (player, wins, losses, _) in enumerate(state.standings[:4], 1):
+            color = constants.FONT_COLOR_YELLOW if player == state.player_id else constants.FONT_COLOR_DEFAULT
+            lines.append((f"{place}. {state.name(player)}  {wins}W {losses}L", font_small, color))
+
+        if state.finished or (is_client and not self.tournament.connected):
+            if not state.finished:
+                lines.append(("Connection lost", font_small, constants.FONT_COLOR_RED))
+            lines.append(("Press A or B to exit", font_small, constants.FONT_COLOR_GRAY))
+        elif is_client and state.round_complete:
+            ready = self.tournament_ready_round >= state.round
+            lines.append(("Waiting for next round..." if ready else "Press A for next round", font_small,
+                          constants.FONT_COLOR_GRAY if ready else constants.FONT_COLOR_GREEN))
+        self.draw_centered_lines(surface, lines, int(20 * constants.UI_SCALE), int(24 * constants.UI_SCALE))
@@ -12,6 +12,7 @@ import game.core.constants as constants
 from core.utils.scene_utils import change_scene
 from core.utils.pet_utils import get_selected_pets
 from core.utils.module_utils import get_module
+from core.memory_inspector import count_live_surfaces, get_cache_report, get_live_scenes
 from game.core.game_quest import QuestStatus
 from game.core.utils.pygame_utils import blit_with_shadow, get_font
 from game.core.utils.quest_event_utils import force_complete_quest, generate_daily_quests, get_hourly_random_event
@@ -66,7 +67,14 @@ class SceneDebug:
             ("Traited", self._add_traited_egg, "Add random traited egg"),
             ("Quest Reset", self._reset_quests, "Reset daily quests"),
             ("Complete Quests", self._complete_quests, "Complete all available quests"),
-            ("Try Event", self._try_event, "Attempt to trigger an event")
+            ("Try Event", self._try_event, "Attempt to trigger an event"),
+            ("Tasks", self._log_scheduler_tasks, "Log scheduler task timings"),
+            ("Stats", self._toggle_stats_history, "Show system stats history"),
+            ("Input", self._log_input_latency, "Log input latency percentiles"),
+            ("Profiler", self._toggle_frame_profiler, "Show frame time overlay"),
+            ("Trace", self._capture_frame_trace, "Export a Chrome trace of the next frames"),
+            ("Memory", self._log_memory_usage, "Log surface memory per cache and origin"),
+            ("Tracemalloc", self._toggle_tracemalloc, "Diff allocations at scene changes")
         ]
         
         # Initialize counters
@@ -81,6 +89,11 @@ class SceneDebug:
         # Cache system
         self._last_cache = None
         self._last_cache_key = None
+
+        # System stats history panel (redrawn only when a new sample arrives)
+        self.show_stats_history = False
+        self._stats_panel = None
+        self._stats_panel_time = None
         
         runtime_globals.game_console.log("[SceneDebug] Debug scene initialized.")
 
@@ -128,6 +141,9 @@ class SceneDebug:
         # Blit cached content
         surface.blit(self._last_cache, (0, 0))
 
+        if self.show_stats_history:
+            self._draw_stats_history(surface)
+
     def _draw_title(self, surface: pygame.Surface) -> None:
         """
         Draws the "Debug Menu" title.
@@ -138,6 +154,54 @@ class SceneDebug:
         title_y = int(8 * constants.UI_SCALE)
         blit_with_shadow(surface, title_text, (title_x, title_y))
 
+    def _draw_stats_history(self, surface: pygame.Surface) -> None:
+        """
+        Draws sparklines of the sampled system stats over the options grid.
+        """
+        stats = runtime_globals.system_stats
+        if self._stats_panel is None or self._stats_panel_time != stats.latest.time:
+            self._stats_panel = self._render_stats_panel(stats)
+            self._stats_panel_time = stats.latest.time
+        surface.blit(self._stats_panel, (0, int(45 * constants.UI_SCALE)))
+
+    def _render_stats_panel(self, stats) -> pygame.Surface:
+        """
+        Renders one labelled sparkline row per stat from the sampler history.
+        """
+        rows = [
+            ("CPU", "cpu", "%", 100, constants.FONT_COLOR_GREEN),
+            ("RAM", "memory", "%", 100, constants.FONT_COLOR_YELLOW),
+            ("Temp", "temp", "C", 90, constants.FONT_COLOR_ORANGE),
+            ("Batt", "battery", "%", 100, constants.FONT_COLOR_DEFAULT),
+        ]
+        row_height = int(24 * constants.UI_SCALE)
+        padding = int(4 * constants.UI_SCALE)
+        label_width = int(70 * constants.UI_SCALE)
+        panel = pygame.Surface((constants.SCREEN_WIDTH, row_height * len(rows)), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 200))
+        font = get_font(constants.FONT_SIZE_SMALL)
+
+        for index, (label, field, unit, max_value, color) in enumerate(rows):
+            top = index * row_height
+            values = stats.get_history(field)
+            text = f"{label} {values[-1]:.0f}{unit}" if values else f"{label} --"
+            text_surface = font.render(text, True, color)
+            panel.blit(text_surface, (padding, top + (row_height - text_surface.get_height()) // 2))
+
+            graph = pygame.Rect(label_width, top + padding, constants.SCREEN_WIDTH - label_width - padding, row_height - padding * 2)
+            pygame.draw.rect(panel, (64, 64, 64), graph, 1)
+            if len(values) < 2:
+                continue
+            step = graph.width / (stats.history_size - 1)
+            start_x = graph.right - step * (len(values) - 1)
+            points = [
+                (start_x + i * step, graph.bottom - min(value, max_value) / max_value * graph.height)
+                for i, value in enumerate(values)
+            ]
+            pygame.draw.lines(panel, color, False, points, 2)
+
+        return panel
+
     def _draw_debug_menu(self, surface: pygame.Surface) -> None:
         """
         Draws the debug options grid with scrolling, similar to egg selection.
@@ -580,3 +644,74 @@ class SceneDebug:
         else:
             runtime_globals.game_console.log("[SceneDebug] No event triggered")
             return False
+
+    def _log_scheduler_tasks(self) -> bool:
+        """Log every scheduled task with its next due time and run cost."""
+        stats = runtime_globals.game_scheduler.get_task_stats()
+        for task in stats:
+            runtime_globals.game_console.log(
+                f"[SceneDebug] Task {task['name']}: due in {task['due_in']:.1f}s, "
+                f"runs={task['runs']}, avg={task['avg_ms']:.2f}ms, max={task['max_ms']:.2f}ms"
+            )
+        return bool(stats)
+
+    def _log_input_latency(self) -> bool:
+        """Log press-to-handle latency percentiles for each input source."""
+        stats = runtime_globals.game_input.get_latency_stats()
+        for source, latency in stats.items():
+            runtime_globals.game_console.log(
+                f"[SceneDebug] Input {source}: n={latency['count']}, p50={latency['p50']:.1f}ms, "
+                f"p95={latency['p95']:.1f}ms, p99={latency['p99']:.1f}ms, max={latency['max']:.1f}ms"
+            )
+        return bool(stats)
+
+    def _toggle_stats_history(self) -> bool:
+        """Show or hide the system stats sparklines."""
+        self.show_stats_history = not self.show_stats_history
+        self._stats_panel = None
+        return True
+
+    def _toggle_frame_profiler(self) -> bool:
+        """Show or hide the per-scene frame time overlay and log the current percentiles."""
+        profiler = runtime_globals.frame_profiler
+        if not profiler.toggle_overlay():
+            for name, timing in profiler.get_percentiles().items():
+                runtime_globals.game_console.log(
+                    f"[SceneDebug] Frame {name}: n={timing['count']}, p50={timing['p50']:.2f}ms, "
+                    f"p95={timing['p95']:.2f}ms, p99={timing['p99']:.2f}ms, max={timing['max']:.2f}ms"
+                )
+        return True
+
+    def _capture_frame_trace(self) -> bool:
+        """Record the next frames as Chrome trace-event JSON in the logs folder."""
+        profiler = runtime_globals.frame_profiler
+        if profiler.capturing:
+            return False
+        path = profiler.capture_trace()
+        runtime_globals.game_console.log(f"[SceneDebug] Capturing frame trace to {path}")
+        return True
+
+    def _log_memory_usage(self) -> bool:
+        """Log surface bytes held per cache, live surfaces by origin and live scene instances."""
+        console = runtime_globals.game_console
+        for name, count, size in get_cache_report():
+            console.log(f"[SceneDebug] Cache {name}: {count} surfaces, {size / 1024:.1f} KiB")
+        for origin, (count, size) in count_live_surfaces().items():
+            console.log(f"[SceneDebug] Surfaces {origin}: {count}, {size / 1024:.1f} KiB")
+        scenes = [type(scene).__name__ for scene in get_live_scenes()]
+        console.log(f"[SceneDebug] Live scenes: {', '.join(scenes)}")
+        current, peak = runtime_globals.memory_inspector.get_traced_memory()
+        if peak:
+            console.log(f"[SceneDebug] Traced memory: {current / 1024:.1f} KiB (peak {peak / 1024:.1f} KiB)")
+        return True
+
+    def _toggle_tracemalloc(self) -> bool:
+        """Start or stop tracemalloc; while on, allocation diffs are logged at every scene change."""
+        inspector = runtime_globals.memory_inspector
+        if inspector.tracing:
+            inspector.stop_tracing()
+            runtime_globals.game_console.log("[SceneDebug] Tracemalloc stopped")
+        else:
+            inspector.start_tracing()
+            runtime_globals.game_console.log("[SceneDebug] Tracemalloc started")
+        return True
@@ -7,6 +7,7 @@ from core import runtime_globals
 import game.core.constants as constants
 from core.game_digidex import is_pet_unlocked, load_digidex
 from core.game_digidex_entry import GameDigidexEntry
+from core.game_evolution_graph import get_evolution_graph
 from core.utils.module_utils import get_module
 from core.utils.pygame_utils import blit_with_shadow, get_font, sprite_load_percent
 from core.utils.scene_utils import change_scene
@@ -30,11 +31,15 @@ class SceneDigidex:
         )
         self.digidex_data = load_digidex()
         self.pets = self.build_pet_list()
+        self.entry_index = {}
+        for pet in self.pets:
+            self.entry_index.setdefault((pet.module, pet.version, pet.name), pet)
         self.selector = WindowPetSelector()
         self.selector.pets = self.pets
         self.state = "menu"
         self.tree_root = None
         self.tree_data = {}
+        self.tree_layers = []
         self.tree_node_pos = {}
         self.tree_node_grid = {}
         self.tree_color_map = {}
@@ -123,7 +128,7 @@ class SceneDigidex:
                 if not pet.sprite:
                     try:
                         module = get_module(pet.module)
-                        module_path = f"modules/{module.name}"
+                        module_path = module.folder_path
                         
                         # Use the new sprite utilities to load pet sprites with fallback support
                         sprites_dict = load_pet_sprites(
@@ -207,6 +212,7 @@ class SceneDigidex:
                 if selected.known:
                     self.tree_root = self.find_stage_zero_entry(selected)
                     self.tree_data = self.load_evolution_tree(selected)
+                    self.tree_layers = self.load_tree_layers(self.tree_root)
 
                     # Preprocess the tree layout to get positions
                     self._build_tree_layout()
@@ -259,7 +265,7 @@ class SceneDigidex:
             if pet.name in visible_names and not pet.sprite and pet.known:
                 try:
                     module = get_module(pet.module)
-                    module_path = f"modules/{module.name}"
+                    module_path = module.folder_path
                     
                     # Use the new sprite utilities to load pet sprites with fallback support
                     sprites_dict = load_pet_sprites(
@@ -288,18 +294,7 @@ class SceneDigidex:
         self.tree_node_grid = {}
         self.tree_node_pos = {}
 
-        stages = {}
-        queue = [(self.tree_root.name, 0)]
-        visited = set()
-
-        while queue:
-            current, depth = queue.pop(0)
-            if current in visited:
-                continue
-            visited.add(current)
-            stages.setdefault(depth, []).append(current)
-            for child in self.tree_data.get(current, []):
-                queue.append((child, depth + 1))
+        stages = dict(enumerate(self.tree_layers))
 
         sprite_size = SPRITE_SIZE
         vertical_spacing = int(100 * constants.UI_SCALE)
@@ -344,7 +339,7 @@ class SceneDigidex:
                 self.tree_color_map[x_idx, y_idx] = color
 
             for child_name in children:
-                child_pos = next((k for k, v in self.tree_node_grid.items() if v == child_name), None)
+                child_pos = self.tree_node_pos.get(child_name)
                 if not child_pos:
                     continue
 
@@ -409,26 +404,25 @@ class SceneDigidex:
 
     def load_evolution_tree(self, root_entry):
         """
-        Carrega a árvore de evolução completa do pet (por módulo e versão).
+        Carrega a árvore de evolução completa do pet (por módulo e versão) a partir do grafo pré-calculado.
         Retorna um dicionário onde cada chave é o nome do pet e o valor é uma lista de nomes dos filhos.
         """
-        module = next((m for m in runtime_globals.game_modules.values() if m.name == root_entry.module), None)
+        module = runtime_globals.game_modules.get(root_entry.module)
         if not module:
             runtime_globals.game_console.log(f"[Digidex] Módulo '{root_entry.module}' não encontrado.")
             return {}
 
-        tree = {}
-        monsters = module.get_all_monsters()
-        monsters = [m for m in monsters if m["version"] == root_entry.version]
+        return get_evolution_graph(module).get_tree(root_entry.version)
 
-        # Indexa os monstros por nome
-        valid_names = {m["name"] for m in monsters}
-        for monster in monsters:
-            name = monster["name"]
-            evolutions = monster.get("evolve", [])
-            tree[name] = [evo["to"] for evo in evolutions if evo["to"] in valid_names]
+    def load_tree_layers(self, root_entry):
+        """
+        Retorna as camadas (nomes por profundidade) da árvore a partir da raiz, já pré-calculadas no grafo.
+        """
+        module = runtime_globals.game_modules.get(root_entry.module)
+        if not module:
+            return [[root_entry.name]]
 
-        return tree
+        return get_evolution_graph(module).get_layers(root_entry.version, root_entry.name)
     
     def _build_tree_layout(self):
         """
@@ -438,18 +432,7 @@ class SceneDigidex:
         self.tree_node_grid = {}
         self.tree_node_pos = {}
 
-        stages = {}
-        queue = [(self.tree_root.name, 0)]
-        visited = set()
-
-        while queue:
-            current, depth = queue.pop(0)
-            if current in visited:
-                continue
-            visited.add(current)
-            stages.setdefault(depth, []).append(current)
-            for child in self.tree_data.get(current, []):
-                queue.append((child, depth + 1))
+        stages = dict(enumerate(self.tree_layers))
 
         max_line_length = max(len(names) for names in stages.values())
         for y_idx, names in stages.items():
@@ -464,7 +447,4 @@ class SceneDigidex:
                 self.tree_node_pos[name] = (px, py)
 
     def get_entry_by_name(self, name):
-        for pet in self.pets:
-            if pet.name == name and pet.module == self.tree_root.module and pet.version == self.tree_root.version:
-                return pet
-        return None
\ No newline at end of file
+        return self.entry_index.get((self.tree_root.module, self.tree_root.version, name))
\ No newline at end of file
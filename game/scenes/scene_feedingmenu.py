@@ -9,7 +9,7 @@ import pygame
 from components.window_background import WindowBackground
 from components.window_horizontalmenu import WindowHorizontalMenu
 from components.window_petview import WindowPetList
-from core import game_globals, runtime_globals
+from core import game_globals, module_bundle, runtime_globals
 import game.core.constants as constants
 from core.utils.inventory_utils import add_to_inventory, get_inventory_value, remove_from_inventory
 from core.utils.pet_utils import distribute_pets_evenly, get_selected_pets
@@ -58,12 +58,12 @@ class SceneFeedingMenu:
                             sprite_name += ".png"
                         sprite_path = os.path.join(module.folder_path, "items", sprite_name)
                         anim_path = os.path.join(module.folder_path, "items", f"{sprite_name.split('.')[0]}_anim.png")
-                        if os.path.exists(sprite_path):
-                            icon = pygame.image.load(sprite_path).convert_alpha()
+                        if module_bundle.exists(sprite_path):
+                            icon = pygame.image.load(module_bundle.image_source(sprite_path)).convert_alpha()
                         else:
                             icon = pygame.Surface((int(48 * constants.UI_SCALE), int(48 * constants.UI_SCALE)), pygame.SRCALPHA)
                         # For inventory items, include amount
-                        self.options.append((item.name, icon, amount, anim_path if os.path.exists(anim_path) else None, item.id))
+                        self.options.append((item.name, icon, amount, anim_path if module_bundle.exists(anim_path) else None, item.id))
 
         # Use new method for selection background, scale to screen width, keep proportions
         self.selectionBackground = sprite_load_percent(
@@ -126,12 +126,12 @@ class SceneFeedingMenu:
                                 sprite_name += ".png"
                             sprite_path = os.path.join(module.folder_path, "items", sprite_name)
                             anim_path = os.path.join(module.folder_path, "items", f"{sprite_name.split('.')[0]}_anim.png")
-                            if os.path.exists(sprite_path):
-                                icon = pygame.image.load(sprite_path).convert_alpha()
+                            if module_bundle.exists(sprite_path):
+                                icon = pygame.image.load(module_bundle.image_source(sprite_path)).convert_alpha()
                             else:
                                 icon = pygame.Surface((int(48 * constants.UI_SCALE), int(48 * constants.UI_SCALE)), pygame.SRCALPHA)
                             # For inventory items, include amount
-                            self.options.append((item.name, icon, amount, anim_path if os.path.exists(anim_path) else None, item.id))
+                            self.options.append((item.name, icon, amount, anim_path if module_bundle.exists(anim_path) else None, item.id))
 
     def get_selected_item(self):
         """
@@ -337,8 +337,8 @@ class SceneFeedingMenu:
                 if accepted:
                     pet.animation_counter = 0  # <-- Reset animation for new food!
                     anim_frames = None
-                    if anim_path and os.path.exists(anim_path):
-                        anim_image = pygame.image.load(anim_path).convert_alpha()
+                    if anim_path and module_bundle.exists(anim_path):
+                        anim_image = pygame.image.load(module_bundle.image_source(anim_path)).convert_alpha()
                         w, h = anim_image.get_width() // 4, anim_image.get_height()
                         anim_frames = [
                             pygame.transform.smoothscale(
@@ -8,7 +8,7 @@ import pygame
 
 from components.window_background import WindowBackground
 from components.reward_popup import RewardPopup
-from core import game_globals, runtime_globals
+from core import game_globals, module_bundle, runtime_globals
 import game.core.constants as constants
 from core.utils.scene_utils import change_scene
 from game.core.utils.inventory_utils import get_item_by_name
@@ -287,9 +287,10 @@ class SceneLibrary:
             item_instance = get_item_by_name(quest.module, quest.reward_value)
             
             if item_instance:
-                item_sprite_path = f"modules/{quest.module}/items/{item_instance.sprite_name}.png"
-                if os.path.exists(item_sprite_path):
-                    item_icon = pygame.image.load(item_sprite_path).convert_alpha()
+                from core.utils.module_utils import get_module
+                item_sprite_path = os.path.join(get_module(quest.module).folder_path, "items", f"{item_instance.sprite_name}.png")
+                if module_bundle.exists(item_sprite_path):
+                    item_icon = pygame.image.load(module_bundle.image_source(item_sprite_path)).convert_alpha()
                     return pygame.transform.scale(item_icon, (int(20 * constants.UI_SCALE), int(20 * constants.UI_SCALE)))
         except:
             pass
@@ -5,22 +5,20 @@ The main scene where pets live, eat, sleep, move, and interact.
 import platform
 import random
 import pygame
-import datetime
 import os
-import time
 
 from components.window_background import WindowBackground
 from components.window_clock import WindowClock
 from components.window_mainmenu import WindowMenu
-from core import game_globals, runtime_globals
+from core import game_globals, module_bundle, runtime_globals
 import game.core.constants as constants
 from core.game_evolution_entity import GameEvolutionEntity
 from core.utils.module_utils import get_module
 from core.utils.pet_utils import all_pets_hatched, distribute_pets_evenly, draw_pet_outline, get_selected_pets
-from core.utils.pygame_utils import blit_with_cache, get_font, sprite_load
+from core.utils.pygame_utils import blit_with_cache, get_font, load_font, render_text, sprite_load
 from core.utils.scene_utils import change_scene
 from core.utils.inventory_utils import add_to_inventory, get_item_by_name
-from game.core.utils.quest_event_utils import generate_daily_quests, get_hourly_random_event
+from game.core.utils.quest_event_utils import check_new_day, generate_daily_quests, get_hourly_random_event
 from core.utils.inventory_utils import add_to_inventory
 
 HEARTS_SIZE = int(8 * constants.UI_SCALE)
@@ -59,13 +57,7 @@ class SceneMainGame:
         self._hearts_cache = {}
         self._fade_overlay_cache = None  # Cache fade overlay surface
 
-        today = datetime.date.today()
-        if game_globals.xai_date < today:
-            game_globals.xai = random.randint(1, 7)
-            game_globals.xai_date = today
-            # Reset daily quests when day changes
-            game_globals.quests = []
-            runtime_globals.game_console.log(f"[SceneMainGame] New day detected, XAI set to {game_globals.xai}, quests reset")
+        check_new_day()
 
         self.food_anims = {}  # {pet_index: [frames]} for animated food sprites
         self.load()
@@ -124,6 +116,11 @@ class SceneMainGame:
         if game_globals.event_time is None:
             game_globals.event_time = 60  # 60 minutes until first event check
 
+        # Event countdown ticks once a minute; the task is cancelled when the scene is replaced
+        runtime_globals.game_scheduler.every("event_countdown", 60, self.tick_event_countdown, owner=self)
+        # Per-minute/hourly/daily pet checks; each pet acts when its own frame timers cross a boundary
+        runtime_globals.game_scheduler.every("pet_checks", 1, self.run_pet_checks, owner=self)
+
     def update(self) -> None:
         """
         Updates all game objects (pets, background, poops, cleaning effect).
@@ -139,8 +136,11 @@ class SceneMainGame:
             runtime_globals.last_input_frame = self.frame_counter
 
         # Update pets and poops only if necessary
+        profiler = runtime_globals.frame_profiler
+        start = profiler.start()
         for pet in game_globals.pet_list:
             pet.update()
+        profiler.stop("pets.update", start)
 
         for poop in game_globals.poop_list:
             poop.update()
@@ -245,31 +245,10 @@ class SceneMainGame:
         """
         Updates the event system - checks for new events every hour based on XAI and pet awakeness.
         """
-        # Stage 1: Check for new events every hour (optimized using frame counter)
-        if game_globals.event is None and self.event_stage == 0:
-            # Count minutes using frame rate - every 60 seconds * frame rate = 1 minute
-            if self.frame_counter % (constants.FRAME_RATE * 60) == 0:
-                game_globals.event_time -= 1
-                if game_globals.event_time <= 0:
-                    # Check if all pets are awake before triggering events
-                    all_pets_awake = all(pet.state != "nap" and pet.state != "sleep" for pet in game_globals.pet_list)
-                    
-                    if all_pets_awake:
-                        # Time to check for an event with XAI-based probability
-                        game_globals.event = get_hourly_random_event()
-                        runtime_globals.game_console.log(f"[Event] Event check with XAI {game_globals.xai} (all pets awake)")
-                    else:
-                        runtime_globals.game_console.log(f"[Event] Skipping event check - some pets are sleeping")
-                    
-                    game_globals.event_time = 60  # Reset timer for next hour
-                    
-                    if game_globals.event:
-                        self.event_stage = 1  # Move to alert stage
-                        self.event_sound_played = False
-                        runtime_globals.game_console.log(f"[Event] New event: {game_globals.event.name}")
-        
+        # Stage 1: New events are checked once an hour by tick_event_countdown (scheduler task)
+
         # Stage 2: Alert stage - blink alert icon and wait for player input
-        elif game_globals.event is not None and self.event_stage == 1:
+        if game_globals.event is not None and self.event_stage == 1:
             # Play alert sound once
             if not self.event_sound_played:
                 runtime_globals.game_sound.play("need_attention")
@@ -295,6 +274,45 @@ class SceneMainGame:
                 game_globals.event = None
                 self.event_stage = 0
 
+    def run_pet_checks(self) -> None:
+        """
+        Scheduler task (every second): runs the timed care checks of every pet.
+        """
+        if self.lock_updates:
+            return
+        for pet in list(game_globals.pet_list):
+            pet.update_timed_checks()
+
+    def tick_event_countdown(self) -> None:
+        """
+        Scheduler task (every minute): counts down event_time and rolls an hourly event when it expires.
+        """
+        if self.lock_updates or game_globals.event is not None or self.event_stage != 0:
+            return
+
+        if game_globals.event_time is None:
+            game_globals.event_time = 60  # Cleared after an event was handled
+        game_globals.event_time -= 1
+        if game_globals.event_time > 0:
+            return
+
+        # Check if all pets are awake before triggering events
+        all_pets_awake = all(pet.state != "nap" and pet.state != "sleep" for pet in game_globals.pet_list)
+
+        if all_pets_awake:
+            # Time to check for an event with XAI-based probability
+            game_globals.event = get_hourly_random_event()
+            runtime_globals.game_console.log(f"[Event] Event check with XAI {game_globals.xai} (all pets awake)")
+        else:
+            runtime_globals.game_console.log(f"[Event] Skipping event check - some pets are sleeping")
+
+        game_globals.event_time = 60  # Reset timer for next hour
+
+        if game_globals.event:
+            self.event_stage = 1  # Move to alert stage
+            self.event_sound_played = False
+            runtime_globals.game_console.log(f"[Event] New event: {game_globals.event.name}")
+
     def update_gift_animation(self) -> None:
         """
         Handles the gift animation for ITEM_PACKAGE events.
@@ -395,7 +413,7 @@ class SceneMainGame:
 
         self.menu.check_alert()  # Ensure alert state is updated
 
-        now_dt = datetime.datetime.now()
+        now_dt = runtime_globals.game_clock.now
         time_str = now_dt.strftime("%H:%M")
         text = self._ss_time_font.render(time_str, True, constants.FONT_COLOR_DEFAULT)
 
@@ -653,9 +671,9 @@ class SceneMainGame:
                     
                     # Try to load item sprite from modules
                     try:
-                        item_sprite_path = f"modules/{game_globals.event.module}/items/{item_name}.png"
-                        if os.path.exists(item_sprite_path):
-                            item_sprite = pygame.image.load(item_sprite_path).convert_alpha()
+                        item_sprite_path = os.path.join(get_module(game_globals.event.module).folder_path, "items", f"{item_name}.png")
+                        if module_bundle.exists(item_sprite_path):
+                            item_sprite = pygame.image.load(module_bundle.image_source(item_sprite_path)).convert_alpha()
                             item_sprite = pygame.transform.scale(item_sprite,
                                                                (int(48 * constants.UI_SCALE), int(48 * constants.UI_SCALE)))
                     except:
@@ -674,16 +692,16 @@ class SceneMainGame:
                         surface.blit(item_sprite, (item_x, item_y))
                         
                         # Show quantity text below item
-                        font = pygame.font.Font(None, int(20 * constants.UI_SCALE))
-                        quantity_text = font.render(f"+{game_globals.event.item_quantity}", True, constants.FONT_COLOR_DEFAULT)
+                        font = load_font(None, int(20 * constants.UI_SCALE))
+                        quantity_text = render_text(font, f"+{game_globals.event.item_quantity}", True, constants.FONT_COLOR_DEFAULT)
                         text_x = center_x - quantity_text.get_width() // 2
                         text_y = item_y + item_sprite.get_height() + 5
                         surface.blit(quantity_text, (text_x, text_y))
                     else:
                         # Fallback: show item name and quantity as text
-                        font = pygame.font.Font(None, int(24 * constants.UI_SCALE))
-                        text_surface = font.render(f"+{game_globals.event.item_quantity} {item_name}", 
-                                                 True, constants.FONT_COLOR_DEFAULT)
+                        font = load_font(None, int(24 * constants.UI_SCALE))
+                        text_surface = render_text(font, f"+{game_globals.event.item_quantity} {item_name}",
+                                                   True, constants.FONT_COLOR_DEFAULT)
                         text_x = center_x - text_surface.get_width() // 2
                         text_y = center_y - text_surface.get_height() // 2
                         surface.blit(text_surface, (text_x, text_y))
@@ -694,7 +712,7 @@ class SceneMainGame:
         Uses a cache to avoid redrawing every frame.
         """
         cache_key = (x, y, value, factor)
-        now = time.time()
+        now = runtime_globals.game_clock.wall
         cache_entry = self._hearts_cache.get(cache_key)
 
         # Refresh cache if older than 1 second or not present
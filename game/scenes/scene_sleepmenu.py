@@ -1,5 +1,4 @@
 import pygame
-from datetime import datetime
 
 from components.window_background import WindowBackground
 from components.window_horizontalmenu import WindowHorizontalMenu
@@ -93,7 +92,7 @@ class SceneSleepMenu:
             self.wake_pets()
 
     def put_pets_to_sleep(self) -> None:
-        now = datetime.now()
+        now = runtime_globals.game_clock.now
         pets = self.pets_can_sleep()
         if len(pets) > 0:
             runtime_globals.game_sound.play("menu")
@@ -109,7 +108,7 @@ class SceneSleepMenu:
         change_scene("game")
 
     def wake_pets(self) -> None:
-        now = datetime.now()
+        now = runtime_globals.game_clock.now
         pets = self.pets_can_wake()
         if len(pets) > 0:
             runtime_globals.game_sound.play("menu")
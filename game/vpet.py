@@ -7,36 +7,19 @@ Display and audio initialization is handled by main.py
 import pygame
 import time
 
-# Scenes
+# Scenes are imported on first use through the scene registry (core.utils.scene_utils)
 from core import game_globals, runtime_globals
-from core.input.system_stats import get_system_stats
+from components.window_background import update_time_of_day
+from core.module_watcher import ModuleWatcher
+from core.utils.quest_event_utils import daily_reset_task
 from core.utils.module_utils import load_modules
 from core.utils.pygame_utils import blit_with_cache, load_misc_sprites
+from core.utils.scene_utils import get_scene_class, warm_up_next_scene
 from game.core import constants
-from scenes.scene_battle import SceneBattle
-from scenes.scene_battle_pvp import SceneBattlePvP
-from scenes.scene_boot import SceneBoot
-from scenes.scene_connect import SceneConnect
-from scenes.scene_digidex import SceneDigidex
-from scenes.scene_eggselection import SceneEggSelection
-from scenes.scene_evolution import SceneEvolution
-from scenes.scene_freezerbox import SceneFreezerBox
-from scenes.scene_library import SceneLibrary
-from scenes.scene_settingsmenu import SceneSettingsMenu
-from scenes.scene_sleepmenu import SceneSleepMenu
-from scenes.scene_statusmenu import SceneStatusMenu
-from scenes.scene_maingame import SceneMainGame
-from scenes.scene_feedingmenu import SceneFeedingMenu
-from scenes.scene_training import SceneTraining
-from scenes.scene_debug import SceneDebug
 
 # Game Version
 runtime_globals.VERSION = "0.9.8"
 
-# Global timing variable for system stats updates
-last_stats_update = time.time()
-cached_stats = get_system_stats()  # Initialize with actual values
-
 
 class VirtualPetGame:
     """
@@ -45,10 +28,12 @@ class VirtualPetGame:
     """
 
     def __init__(self) -> None:
-        runtime_globals.misc_sprites = load_misc_sprites()
-        load_modules()
-        game_globals.load()
-        self.scene = SceneBoot()
+        self.timed_step("load misc sprites", self.load_misc_sprites)
+        self.timed_step("load modules", load_modules)
+        self.timed_step("load save", game_globals.load)
+        self.register_tasks()
+        self.scene = self.timed_step("create SceneBoot", get_scene_class("boot"))
+        self.first_frame_drawn = False
         print("[Init] Omnibot initialized with SceneBoot")
         self.rotated = False
         self.stat_font = pygame.font.Font(None, 16)
@@ -58,14 +43,24 @@ class VirtualPetGame:
         """
         Updates the current scene and handles scene transitions if needed.
         """
+        # One time snapshot per frame, shared by pets, scenes and windows
+        runtime_globals.game_clock.tick()
+        profiler = runtime_globals.frame_profiler
+        profiler.begin_frame(type(self.scene).__name__)
+
+        # Shakes detected by the sensor thread since the last frame join the input queue
+        start = profiler.start()
+        game_input = runtime_globals.game_input
+        for timestamp, event in runtime_globals.shake_detector.get_events():
+            game_input.push(event, "shake", timestamp)
+
+        # Deliver keyboard, joystick, GPIO and shake input in press order
+        self.dispatch_inputs()
+        profiler.stop("input", start)
+
+        start = profiler.start()
         self.scene.update()
-
-        # Poll GPIO actions
-        self.poll_gpio_inputs()
-
-        # Poll joystick actions (including analog stick directions)
-        #for action in runtime_globals.game_input.get_just_pressed_joystick():
-        #    self.scene.handle_event(action)
+        profiler.stop("scene.update", start)
 
         if runtime_globals.game_state_update:
             self.change_scene()
@@ -74,27 +69,76 @@ class VirtualPetGame:
             game_globals.rotated = False
             self.rotated = not self.rotated
 
-        if runtime_globals.shake_detector.check_for_shake():
-            self.scene.handle_event("SHAKE")
-            
-        # Handle autosave
-        game_globals.autosave()
+        # Run due timed tasks (autosave, time of day, daily reset, scene tasks)
+        start = profiler.start()
+        runtime_globals.game_scheduler.update()
+
+        # Finish preloaded sprites decoded in the background
+        runtime_globals.game_assets.update()
+
+        # Advance music fades
+        runtime_globals.game_sound.update()
+        profiler.stop("tasks", start)
+
+    def register_tasks(self) -> None:
+        """
+        Registers the global recurring tasks with the scheduler.
+        """
+        scheduler = runtime_globals.game_scheduler
+        update_time_of_day()
+        scheduler.every("autosave", game_globals.AUTOSAVE_INTERVAL_SECONDS, game_globals.save)
+        scheduler.every("time_of_day", 60, update_time_of_day)
+        scheduler.every("daily_reset", 60, daily_reset_task)
+        # Import the remaining scenes one per tick while the boot splash is showing
+        self.warm_up_task = scheduler.every("scene_warm_up", 0.1, self.warm_up_scenes, first_delay=0.5)
+        if constants.MODULE_HOT_RELOAD:
+            runtime_globals.module_watcher = ModuleWatcher()
+            runtime_globals.module_watcher.start()
+            scheduler.every("module_hot_reload", 0.5, runtime_globals.module_watcher.apply_changes)
+
+    def warm_up_scenes(self) -> None:
+        if not warm_up_next_scene():
+            self.warm_up_task.cancel()
+
+    def load_misc_sprites(self) -> None:
+        runtime_globals.misc_sprites = load_misc_sprites()
+
+    def timed_step(self, name: str, step):
+        """Runs one startup step and records its duration for the startup report."""
+        start = time.perf_counter()
+        result = step()
+        runtime_globals.startup_timings[name] = time.perf_counter() - start
+        return result
+
+    def log_startup_report(self) -> None:
+        """Logs startup steps slowest first, similar to python -X importtime."""
+        total = time.perf_counter() - runtime_globals.startup_time
+        runtime_globals.game_console.log(f"[Startup] First frame after {total * 1000:.1f} ms")
+        for name, seconds in sorted(runtime_globals.startup_timings.items(), key=lambda item: item[1], reverse=True):
+            runtime_globals.game_console.log(f"[Startup] {seconds * 1000:8.1f} ms | {name}")
 
     def draw(self, surface: pygame.Surface, clock: pygame.time.Clock = None) -> None:
         """
         Draws the current scene to the given surface.
         """
+        profiler = runtime_globals.frame_profiler
+        start = profiler.start()
         self.scene.draw(surface)
+        profiler.stop("scene.draw", start)
 
-        global last_stats_update, cached_stats
+        if not self.first_frame_drawn:
+            self.first_frame_drawn = True
+            if constants.DEBUG_MODE:
+                self.log_startup_report()
 
         # Draw debug stats if DEBUG_MODE is enabled and clock is provided
+        # (sampled on the SystemStatsSampler thread, only the latest sample is read here)
         if constants.DEBUG_MODE and clock is not None:
-            now = time.time()
-            if now - last_stats_update >= 3:  # Update stats every 3 seconds
-                cached_stats = get_system_stats()
-                last_stats_update = now
-            draw_system_stats(clock, surface, cached_stats, self.stat_font)
+            draw_system_stats(clock, surface, runtime_globals.system_stats.latest, self.stat_font)
+
+        # Per-scene frame time percentiles (toggled from SceneDebug)
+        if profiler.overlay:
+            profiler.draw_overlay(surface, self.stat_font)
 
         if self.rotated:
             rotated_surface = pygame.transform.rotate(surface, 180)  # Rotate only the surface
@@ -102,19 +146,20 @@ class VirtualPetGame:
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """
-        Delegates event handling to the current scene.
+        Translates a pygame event into a queued input action.
+        """
+        # Actions are queued with their timestamp and delivered by dispatch_inputs
+        runtime_globals.game_input.process_event(event)
+
+    def dispatch_inputs(self) -> None:
+        """
+        Delivers queued input actions to the scene in press order and records
+        press-to-handle latency per source.
         """
-        input_action = runtime_globals.game_input.process_event(event)
-        if input_action:
-            self.scene.handle_event(input_action)
-        else: #Analog inputs
-            for action in runtime_globals.game_input.get_just_pressed_joystick():
-                if action in ("ANALOG_UP", "ANALOG_DOWN", "ANALOG_LEFT", "ANALOG_RIGHT"):
-                    self.scene.handle_event(action.replace("ANALOG_", ""))
-
-    def poll_gpio_inputs(self):
-        for action in runtime_globals.game_input.get_gpio_just_pressed():
+        game_input = runtime_globals.game_input
+        for timestamp, source, action in game_input.drain():
             self.scene.handle_event(action)
+            game_input.record_latency(source, timestamp)
 
     def change_scene(self) -> None:
         """
@@ -123,28 +168,13 @@ class VirtualPetGame:
         runtime_globals.game_state_update = False
         state = runtime_globals.game_state
 
-        scene_mapping = {
-            "egg": SceneEggSelection,
-            "game": SceneMainGame,
-            "settings": SceneSettingsMenu,
-            "status": SceneStatusMenu,
-            "feeding": SceneFeedingMenu,
-            "training": SceneTraining,
-            "sleepmenu": SceneSleepMenu,
-            "battle": SceneBattle,
-            "battle_pvp": SceneBattlePvP,
-            "connect": SceneConnect,
-            "digidex": SceneDigidex,
-            "evolution": SceneEvolution,
-            "freezer": SceneFreezerBox,
-            "library": SceneLibrary,
-            "debug": SceneDebug,
-        }
-
-        scene_class = scene_mapping.get(state)
+        scene_class = get_scene_class(state) if state != "boot" else None
         if scene_class and type(self.scene) is not scene_class:  # Prevent redundant scene switches
             print(f"[Scene] Switching to {scene_class.__name__}")
+            runtime_globals.game_scheduler.cancel_owner(self.scene)
             self.scene = scene_class()
+            runtime_globals.game_assets.preload_for_scene(state)
+            runtime_globals.memory_inspector.on_scene_change(state)
 
     def save(self) -> None:
         """
@@ -176,7 +206,7 @@ def draw_system_stats(clock, surface, stats, font):
     if not show_system_stats and not show_fps_only:
         return
 
-    temp, cpu_usage, memory_usage = stats
+    temp, cpu_usage, memory_usage = stats.temp, stats.cpu, stats.memory
     fps = int(clock.get_fps())
     stats_tuple = (fps, temp, cpu_usage, memory_usage, show_system_stats, show_fps_only)
 
@@ -18,6 +18,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'game'))
 
 from game.core import constants
 from game.vpet import VirtualPetGame
+from core import runtime_globals
 from game.core.constants import *
 
 # Game Version
@@ -195,18 +196,19 @@ def main():
     setup_pygame()
     screen, screen_width, screen_height = setup_display()
     
+    # Optional session recording for deterministic replay (utilities/replay_session.py)
+    session = None
+    if "--record" in sys.argv:
+        from game.core.game_session import SessionRecorder
+        record_index = sys.argv.index("--record") + 1
+        record_path = sys.argv[record_index] if record_index < len(sys.argv) else "session.omr"
+        session = SessionRecorder(record_path, screen.get_width(), screen.get_height())
+        session.start()
+
     # Initialize and run the game
     try:
         game = VirtualPetGame()
-        
-        # Build module documentation
-        try:
-            from game.core.utils.document_utils import build_module_documentation
-            project_root = os.path.dirname(__file__)
-            print("[Init] Building module documentation...")
-            build_module_documentation(project_root)
-        except Exception as e:
-            print(f"[Init] Failed to build module documentation: {e}")
+        documentation_started = False
         
         print("[Init] Game initialized successfully")
         print("[Game] Starting main game loop...")
@@ -231,10 +233,25 @@ def main():
             game.draw(screen, clock)
 
             # If scaling, blit scaled render surface to fullscreen display
+            profiler = runtime_globals.frame_profiler
             if scale_to_screen:
+                start = profiler.start()
                 pygame.transform.scale(screen, (native_width, native_height), final_screen)
+                profiler.stop("scale", start)
 
+            start = profiler.start()
             pygame.display.flip()
+            profiler.stop("flip", start)
+            profiler.end_frame()
+            
+            # Build module documentation in the background once the first frame is up
+            if not documentation_started:
+                documentation_started = True
+                try:
+                    from game.core.utils.document_utils import build_module_documentation_async
+                    build_module_documentation_async(os.path.dirname(os.path.abspath(__file__)))
+                except Exception as e:
+                    print(f"[Init] Failed to build module documentation: {e}")
             
             # Maintain framerate
             clock.tick(constants.FRAME_RATE)
@@ -246,6 +263,8 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
+        if session is not None:
+            session.close()
         pygame.quit()
         print("[Game] Goodbye!")
 
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Omnimon Benchmark Suite
+
+Boots the game headlessly (SDL dummy drivers, no I2C) and times boot, module loading,
+save/load, main-scene frames with 1-4 pets, battle, training and the evolution scene.
+Results can be stored as a baseline; later runs fail when a benchmark regresses.
+
+Usage:
+    python utilities/benchmark.py [--frames N] [--save-baseline FILE] [--baseline FILE] [--tolerance 0.25]
+
+Example:
+    python utilities/benchmark.py --save-baseline save/benchmark_baseline.json
+    python utilities/benchmark.py --baseline save/benchmark_baseline.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(PROJECT_ROOT)  # Config, assets and modules are loaded relative to the project root
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "game"))
+
+from game.core.headless_runner import HeadlessRunner
+
+# A benchmark regresses when it is this much slower (relative) AND at least MIN_REGRESSION_MS slower
+DEFAULT_TOLERANCE = 0.25
+MIN_REGRESSION_MS = 0.5
+
+
+def summarize(timings: list) -> dict:
+    """Returns mean/p95/max in milliseconds for a list of durations in seconds."""
+    values = sorted(t * 1000 for t in timings)
+    return {
+        "mean_ms": statistics.fmean(values),
+        "p95_ms": values[min(len(values) - 1, int(len(values) * 0.95))],
+        "max_ms": values[-1],
+    }
+
+
+def time_calls(func, repeat: int) -> list:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_suite(frames: int) -> dict:
+    """Runs every benchmark and returns {name: summary}. A benchmark that raises is reported and skipped."""
+    from core import game_globals, runtime_globals
+    from core.game_evolution_entity import GameEvolutionEntity
+    from core.utils.module_utils import load_modules
+
+    results = {}
+
+    def bench(name, func):
+        try:
+            results[name] = summarize(func())
+            print(f"[Benchmark] {name}: {results[name]['mean_ms']:.2f} ms")
+        except Exception as e:
+            print(f"[Benchmark] {name}: skipped ({type(e).__name__}: {e})")
+
+    def press_every(interval):
+        return {i: ["A"] for i in range(0, frames, interval)}
+
+    def boot():
+        runner.boot()
+        return [runner.boot_time]
+
+    def main_scene(count):
+        runner.set_pets(count)
+        runner.change_scene("game", 30)
+        return runner.run_frames(frames)
+
+    def battle():
+        runner.set_pets(2)
+        runner.change_scene("battle", 10)
+        return runner.run_frames(frames, press_every(15))
+
+    def training():
+        runner.set_pets(2)
+        runner.change_scene("training", 10)
+        return runner.run_frames(frames, press_every(15))
+
+    def evolution():
+        pet_from, pet_to = runner.set_pets(2)
+        runtime_globals.evolution_pet = pet_from
+        runtime_globals.evolution_data = [GameEvolutionEntity(
+            from_name=pet_from.name,
+            from_attribute=pet_from.attribute,
+            from_sprite=runtime_globals.pet_sprites[pet_from][0],
+            to_attribute=pet_to.attribute,
+            to_name=pet_to.name,
+            to_sprite=runtime_globals.pet_sprites[pet_to][0],
+            stage=pet_from.stage + 1)]
+        try:
+            runner.change_scene("evolution", 1)
+            return runner.run_frames(frames)
+        finally:
+            runtime_globals.evolution_pet = None
+
+    runner = HeadlessRunner()
+    bench("boot", boot)
+    bench("module_load", lambda: time_calls(load_modules, 3))
+
+    runner.set_pets(2)
+    bench("save", lambda: time_calls(game_globals.save, 5))
+    bench("load", lambda: time_calls(game_globals.load, 5))
+
+    for count in range(1, 5):
+        bench(f"main_scene_{count}_pets", lambda: main_scene(count))
+    bench("battle", battle)
+    bench("training", training)
+    bench("evolution", evolution)
+
+    runner.close()
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Returns a description of every benchmark whose mean regressed against the baseline."""
+    regressions = []
+    for name, summary in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        current, previous = summary["mean_ms"], reference["mean_ms"]
+        if current > previous * (1 + tolerance) and current - previous >= MIN_REGRESSION_MS:
+            regressions.append(f"{name}: {previous:.2f} ms -> {current:.2f} ms (+{(current / previous - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Omnimon headless benchmark suite.")
+    parser.add_argument("--frames", type=int, default=300, help="Frames measured per scene benchmark")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against (exit code 1 on regression)")
+    parser.add_argument("--save-baseline", help="Write the results as a new baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed relative slowdown")
+    args = parser.parse_args()
+
+    results = run_suite(args.frames)
+
+    print(f"\n{'Benchmark':<22}{'mean ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for name, summary in results.items():
+        print(f"{name:<22}{summary['mean_ms']:>10.2f}{summary['p95_ms']:>10.2f}{summary['max_ms']:>10.2f}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,19 +6,35 @@ This script takes a path to a monsters folder (like modules/DMC/monsters),
 goes through each monster folder, creates a ZIP file of the folder contents,
 and moves the ZIP files to the global assets/monsters folder without replacing existing files.
 
+With --bundle it instead packs a whole module folder into a single .omb
+bundle (see game/core/module_bundle.py): every module file, the frames of each
+monster listed in monster.json (taken from the module's monster folders/zips or
+from assets/monsters), and frame strips pre-scaled to the sizes the game
+requests. The bundle is written next to the folder (modules/DMC.omb); the game
+loads it when the folder itself is not present.
+
 Usage:
     python create_monster_zips.py <monsters_folder_path>
+    python create_monster_zips.py --bundle <module_folder_path> [--output FILE] [--strip-size N ...]
     
 Example:
     python create_monster_zips.py "modules/DMH/monsters"
+    python create_monster_zips.py --bundle "modules/DMC" --strip-size 60 --strip-size 90
 """
 
+import argparse
+import io
+import json
 import os
 import sys
 import zipfile
 import shutil
 from pathlib import Path
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "game"))
+
 
 def create_zip_from_folder(folder_path: str, zip_path: str) -> bool:
     """
@@ -117,14 +133,149 @@ def process_monsters_folder(monsters_path: str) -> int:
     return created_count
 
 
+#=====================================================================
+# Module bundles
+#=====================================================================
+
+BUNDLE_SKIP_FOLDERS = ("documentation", "monsters")  # Documentation is not read in game; sprites are repacked
+COMPRESSED_SUFFIXES = (".png", ".jpg", ".jpeg", ".zip", ".ogg", ".mp3")
+
+
+def default_strip_sizes() -> list:
+    """Pet, boss and Digidex sprite sizes for the configured resolution."""
+    import core.constants as constants
+    pet = constants.PET_WIDTH
+    return sorted({pet, int(pet * constants.BOSS_MULTIPLIER), int(48 * constants.UI_SCALE)})
+
+
+def read_frames(sources: list) -> dict:
+    """
+    Returns {frame name: PNG bytes} from the first source that has frames,
+    in the same order sprite_utils.load_pet_sprites searches them.
+    """
+    for source in sources:
+        frames = {}
+        if source.is_dir():
+            for png in source.glob("*.png"):
+                frames[png.stem] = png.read_bytes()
+        elif source.is_file():
+            try:
+                with zipfile.ZipFile(source) as zipf:
+                    for entry in zipf.namelist():
+                        if entry.lower().endswith(".png"):
+                            frames[Path(entry).stem] = zipf.read(entry)
+            except zipfile.BadZipFile as e:
+                print(f"  Skipping invalid ZIP {source}: {e}")
+        if frames:
+            return frames
+    return {}
+
+
+def frame_order(name: str):
+    return (0, int(name), "") if name.isdigit() else (1, 0, name)
+
+
+def build_strip(frames: dict, size: int):
+    """Scales every frame to size x size and returns (frame names, RGBA pixels of the strip)."""
+    import pygame
+    names = sorted(frames, key=frame_order)
+    sheet = pygame.Surface((size * len(names), size), pygame.SRCALPHA)
+    for i, name in enumerate(names):
+        image = pygame.image.load(io.BytesIO(frames[name]))
+        sheet.blit(pygame.transform.scale(image, (size, size)), (i * size, 0))
+    return names, pygame.image.tobytes(sheet, "RGBA")
+
+
+def build_bundle(module_path: str, output: str = None, strip_sizes: list = None,
+                 assets_monsters: str = None) -> str:
+    """
+    Packs a module folder into a single .omb bundle and returns its path.
+    """
+    from core.module_bundle import BUNDLE_EXTENSION, SPRITES_PREFIX, BundleWriter
+    from core.utils.sprite_utils import get_sprite_name
+
+    module_folder = Path(module_path)
+    if not (module_folder / "module.json").is_file():
+        print(f"Error: '{module_folder}' is not a module folder (no module.json)")
+        return None
+    output = output or str(module_folder.parent / (module_folder.name + BUNDLE_EXTENSION))
+    assets_monsters = Path(assets_monsters or os.path.join(PROJECT_ROOT, "assets", "monsters"))
+    strip_sizes = default_strip_sizes() if strip_sizes is None else strip_sizes
+
+    with open(module_folder / "module.json", "r", encoding="utf-8") as f:
+        name_format = json.load(f).get("name_format", "$_dmc")
+    monster_names = []
+    if (module_folder / "monster.json").is_file():
+        with open(module_folder / "monster.json", "r", encoding="utf-8") as f:
+            monster_names = [monster["name"] for monster in json.load(f).get("monster", [])]
+
+    writer = BundleWriter(output)
+    try:
+        file_count = 0
+        for file_path in sorted(module_folder.rglob("*")):
+            relative = file_path.relative_to(module_folder)
+            if not file_path.is_file() or relative.parts[0] in BUNDLE_SKIP_FOLDERS:
+                continue
+            compress = file_path.suffix.lower() not in COMPRESSED_SUFFIXES
+            writer.add(relative.as_posix(), file_path.read_bytes(), compress=compress)
+            file_count += 1
+
+        # Monster frames: every monster of monster.json plus anything shipped in the module's monsters folder
+        module_monsters = module_folder / "monsters"
+        sprite_names = [get_sprite_name(name, name_format) for name in monster_names]
+        if module_monsters.is_dir():
+            sprite_names += [entry.stem if entry.suffix.lower() == ".zip" else entry.name
+                             for entry in sorted(module_monsters.iterdir())]
+
+        sprite_count = strip_count = 0
+        missing = []
+        for sprite_name in dict.fromkeys(sprite_names):
+            frames = read_frames([module_monsters / sprite_name, module_monsters / f"{sprite_name}.zip",
+                                  assets_monsters / sprite_name, assets_monsters / f"{sprite_name}.zip"])
+            if not frames:
+                missing.append(sprite_name)
+                continue
+            for frame_name, data in frames.items():
+                writer.add(f"{SPRITES_PREFIX}{sprite_name}/{frame_name}.png", data)
+            for size in strip_sizes:
+                names, pixels = build_strip(frames, size)
+                writer.add_strip(sprite_name, (size, size), names, pixels)
+                strip_count += 1
+            sprite_count += 1
+    except Exception:
+        writer.abort()
+        raise
+    writer.close()
+
+    print(f"  {file_count} module files, {sprite_count} monsters, {strip_count} strips ({', '.join(map(str, strip_sizes)) or 'none'} px)")
+    if missing:
+        print(f"  No sprites found for {len(missing)} monsters: {', '.join(missing[:10])}{' ...' if len(missing) > 10 else ''}")
+    return output
+
+
 def main():
     """Main function to handle command line arguments and process folders."""
-    if len(sys.argv) != 2:
-        print("Usage: python create_monster_zips.py <monsters_folder_path>")
-        print("Example: python create_monster_zips.py 'modules/DMC/monsters'")
-        sys.exit(1)
-    
-    monsters_folder = sys.argv[1]
+    parser = argparse.ArgumentParser(description="Create monster ZIP files, or pack a module into a .omb bundle.")
+    parser.add_argument("path", help="Monsters folder (ZIP mode) or module folder (--bundle)")
+    parser.add_argument("--bundle", action="store_true", help="Pack the module folder into a single .omb bundle")
+    parser.add_argument("--output", help="Bundle file to write (default: <module folder>.omb)")
+    parser.add_argument("--strip-size", type=int, action="append", dest="strip_sizes",
+                        help="Pre-scaled strip size in pixels, repeatable (default: pet, boss and Digidex sizes)")
+    parser.add_argument("--no-strips", action="store_true", help="Only store the original PNG frames")
+    parser.add_argument("--assets", help="Global monsters folder (default: assets/monsters)")
+    args = parser.parse_args()
+
+    if args.bundle:
+        print(f"Packing module bundle from: {args.path}")
+        print("-" * 50)
+        output = build_bundle(args.path, args.output, [] if args.no_strips else args.strip_sizes, args.assets)
+        if output is None:
+            sys.exit(1)
+        print("-" * 50)
+        print(f"Created {output} ({os.path.getsize(output) / (1024 * 1024):.1f} MB)")
+        return
+
+    monsters_folder = args.path
     
     print(f"Creating monster ZIP files from: {monsters_folder}")
     print(f"Target directory: assets/monsters/")
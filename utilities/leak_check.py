@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Omnimon Memory Leak Check
+
+Boots the game headlessly and cycles through the scenes hundreds of times,
+sampling Python heap usage (tracemalloc), live Surface bytes and live scene
+instances. After a warm-up the memory must plateau: the check fails (exit
+code 1) when the second half of the run still grows, or when old scene
+instances stay alive.
+
+Usage:
+    python utilities/leak_check.py [--cycles N] [--frames N] [--tolerance 0.05]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(PROJECT_ROOT)  # Config, assets and modules are loaded relative to the project root
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "game"))
+
+from game.core.headless_runner import HeadlessRunner
+
+SCENES = ["game", "status", "feeding", "training", "battle", "sleepmenu", "settings",
+          "digidex", "freezer", "library", "debug"]
+
+# Growth below this many bytes is never reported, whatever the tolerance
+MIN_GROWTH_BYTES = 256 * 1024
+
+SAMPLE_EVERY = 10  # cycles
+
+
+def sample():
+    """Returns (heap bytes, surface bytes, live scenes) after a full collection."""
+    from core.memory_inspector import count_live_surfaces, get_live_scenes
+    gc.collect()
+    heap, _ = tracemalloc.get_traced_memory()
+    surfaces = sum(size for _, size in count_live_surfaces().values())
+    return heap, surfaces, len(get_live_scenes())
+
+
+def grew(name, middle, final, tolerance):
+    growth = final - middle
+    if growth > MIN_GROWTH_BYTES and growth > middle * tolerance:
+        return f"{name} grew {growth / 1024:.0f} KiB in the second half ({middle / 1024:.0f} -> {final / 1024:.0f} KiB)"
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cycle scenes headlessly and check that memory plateaus.")
+    parser.add_argument("--cycles", type=int, default=300, help="Times every scene is entered")
+    parser.add_argument("--frames", type=int, default=5, help="Frames run in each scene per visit")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Allowed relative growth in the second half")
+    args = parser.parse_args()
+
+    runner = HeadlessRunner()
+    runner.boot()
+    runner.set_pets(2)
+
+    skipped = set()
+    tracemalloc.start()
+    samples = []
+    for cycle in range(1, args.cycles + 1):
+        for state in SCENES:
+            if state in skipped:
+                continue
+            try:
+                runner.change_scene(state, args.frames)
+            except Exception as e:
+                print(f"[LeakCheck] {state}: skipped ({type(e).__name__}: {e})")
+                skipped.add(state)
+        if cycle % SAMPLE_EVERY == 0:
+            samples.append(sample())
+            heap, surfaces, scenes = samples[-1]
+            print(f"[LeakCheck] cycle {cycle:>4}: heap {heap / 1024:8.0f} KiB, surfaces {surfaces / 1024:8.0f} KiB, live scenes {scenes}")
+    tracemalloc.stop()
+    runner.close()
+
+    if len(samples) < 4:
+        print("[LeakCheck] Not enough samples, run more cycles")
+        sys.exit(1)
+
+    # The first half is warm-up (caches filling), the second half must stay flat
+    middle, final = samples[len(samples) // 2], samples[-1]
+    failures = [
+        grew("Heap", middle[0], final[0], args.tolerance),
+        grew("Surface memory", middle[1], final[1], args.tolerance),
+    ]
+    if final[2] > 2:
+        failures.append(f"{final[2]} scene instances still alive")
+    failures = [failure for failure in failures if failure]
+
+    if failures:
+        print("\n[LeakCheck] Memory did not plateau:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\n[LeakCheck] Memory plateaued")
+
+
+if __name__ == "__main__":
+    main()
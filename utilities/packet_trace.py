@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Omnimon Packet Trace Tool
+
+Decodes captured link-cable battle traces (DMC, DM20, PEN20 and DMX) in bulk:
+validates packet sizes, EOLs and checksums, re-simulates every outcome from
+the exchanged hits and flags battles whose recorded winner differs.
+See game/core/combat/sim/packet_trace.py for the hex and binary trace formats.
+
+Usage:
+    python utilities/packet_trace.py TRACE [--jobs N] [--dump N] [--issues N]
+    python utilities/packet_trace.py --generate COUNT OUTPUT [--hex] [--seed N] [--protocol DM20_BS]
+
+Example:
+    python utilities/packet_trace.py --generate 100000 save/sample.trace --seed 1
+    python utilities/packet_trace.py save/sample.trace --jobs 4
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "game"))
+
+from core.combat.sim.models import BattleProtocol
+from core.combat.sim.packet_trace import (
+    TraceReport, decode_battle, generate_battles, process_trace, read_trace, write_trace
+)
+
+CHUNK_SIZE = 20000  # Battles per worker task with --jobs
+
+
+def process_chunk(battles):
+    return process_trace(battles)
+
+
+def process_parallel(battles, jobs: int, max_issues: int) -> TraceReport:
+    """Splits the trace into chunks processed by a pool of worker processes."""
+    start = time.perf_counter()
+    report = TraceReport()
+    chunks = iter(lambda: list(islice(battles, CHUNK_SIZE)), [])
+    offset = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for chunk_report in pool.map(process_chunk, chunks):
+            report.invalid += chunk_report.invalid
+            report.mismatches += chunk_report.mismatches
+            for name, count in chunk_report.by_protocol.items():
+                report.by_protocol[name] = report.by_protocol.get(name, 0) + count
+            for number, protocol, errors in chunk_report.issues:
+                if len(report.issues) < max_issues:
+                    report.issues.append((number + offset, protocol, errors))
+            offset += chunk_report.battles
+            report.battles += chunk_report.battles
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def print_report(report: TraceReport) -> None:
+    print(f"[PacketTrace] {report.battles} battles in {report.elapsed:.2f} s ({report.rate:,.0f} battles/s)")
+    for name, count in sorted(report.by_protocol.items()):
+        print(f"  {name:<10}{count:>10}")
+    print(f"  invalid packets: {report.invalid}, outcome mismatches: {report.mismatches}")
+    for number, protocol, errors in report.issues:
+        print(f"  battle {number} ({protocol}): {'; '.join(errors)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decode and validate captured battle packet traces.")
+    parser.add_argument("trace", nargs="?", help="Hex or binary trace file")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes")
+    parser.add_argument("--dump", type=int, default=0, help="Print the first N decoded battles")
+    parser.add_argument("--issues", type=int, default=20, help="Number of problem battles listed")
+    parser.add_argument("--generate", nargs=2, metavar=("COUNT", "OUTPUT"), help="Write a trace of simulated battles")
+    parser.add_argument("--hex", action="store_true", help="Write the generated trace as hex text")
+    parser.add_argument("--seed", type=int, help="Seed for generated battles")
+    parser.add_argument("--protocol", action="append", choices=[p.name for p in BattleProtocol],
+                        help="Protocol of generated battles (repeatable, default all)")
+    args = parser.parse_args()
+
+    if args.generate:
+        count, output = int(args.generate[0]), args.generate[1]
+        protocols = [BattleProtocol[name] for name in args.protocol] if args.protocol else None
+        written = write_trace(output, generate_battles(count, protocols, args.seed), binary=not args.hex)
+        print(f"[PacketTrace] Wrote {written} battles to {output}")
+        return
+
+    if not args.trace:
+        parser.error("a trace file or --generate is required")
+
+    try:
+        for number, battle in enumerate(islice(read_trace(args.trace), args.dump), 1):
+            record = decode_battle(battle)
+            print(f"Battle {number} {record.protocol.name}: winner={record.winner} hp={record.device1_hp}/{record.device2_hp}")
+            print(f"  device1 {record.device1}")
+            print(f"  device2 {record.device2}")
+            for error in record.errors:
+                print(f"  ! {error}")
+
+        battles = read_trace(args.trace)
+        if args.jobs > 1:
+            report = process_parallel(battles, args.jobs, args.issues)
+        else:
+            report = process_trace(battles, args.issues)
+    except (OSError, ValueError) as e:  # Missing, truncated or corrupt trace
+        print(f"[PacketTrace] {e}")
+        sys.exit(2)
+    print_report(report)
+    sys.exit(1 if report.invalid or report.mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
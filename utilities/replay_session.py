@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Omnimon Session Replayer
+
+Replays a session recorded with `python main.py --record FILE` headlessly and as
+fast as possible. The recorded save, RNG seed, frame times and inputs are restored,
+so the replay reaches the same state frame by frame; state checksums stored in the
+recording are compared to report the first divergence. The slowest frames are
+listed for profiling.
+
+Usage:
+    python utilities/replay_session.py FILE [--slowest N] [--verbose]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(PROJECT_ROOT)  # Config, assets and modules are loaded relative to the project root
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "game"))
+
+from game.core.game_session import SessionReplayer
+from game.core.headless_runner import HeadlessRunner
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded Omnimon session headlessly.")
+    parser.add_argument("path", help="Session recording (main.py --record FILE)")
+    parser.add_argument("--slowest", type=int, default=10, help="Number of slowest frames to list")
+    parser.add_argument("--verbose", action="store_true", help="Show the game console output")
+    args = parser.parse_args()
+
+    replayer = SessionReplayer(args.path)
+    runner = HeadlessRunner(replayer.width, replayer.height, verbose=args.verbose)
+    runner.boot(session=replayer)
+
+    timings = []
+    start = time.perf_counter()
+    while not replayer.finished:
+        timings.append((runner.step(), replayer.frame))
+    elapsed = time.perf_counter() - start
+
+    replayer.close()
+    runner.close()
+
+    print(f"[Replay] {replayer.frame} frames in {elapsed:.2f} s ({replayer.frame / max(elapsed, 1e-9):.0f} fps)")
+    if replayer.divergences:
+        frame, recorded, replayed = replayer.divergences[0]
+        print(f"[Replay] Diverged at frame {frame}: checksum {recorded:08x} recorded, {replayed:08x} replayed "
+              f"({len(replayer.divergences)} mismatching checkpoints)")
+    else:
+        print("[Replay] State matched the recording at every checkpoint")
+
+    print("\nSlowest frames:")
+    for duration, frame in sorted(timings, reverse=True)[:args.slowest]:
+        print(f"  frame {frame:>7}: {duration * 1000:.2f} ms")
+
+    sys.exit(1 if replayer.divergences else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Omnimon Tournament Loopback Test
+
+Runs a LAN tournament between several headless instances on this machine:
+one host process and N client processes connected over 127.0.0.1 with
+random teams. Checks that every participant received the same final
+standings and that they match the same tournament played serially in one
+process (so concurrent simulation does not change results). Bracket runs also
+check that no player gets more than one bye, for every bracket size (e.g. 5).
+UDP discovery is not used; clients connect to the host port directly.
+
+Usage:
+    python utilities/tournament_loopback.py [--players N] [--mode bracket|league] [--seed N] [--port P] [--processes]
+
+Example:
+    python utilities/tournament_loopback.py --players 6 --mode league --processes
+    python utilities/tournament_loopback.py --players 5 --mode bracket
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "game"))
+
+from core.combat.tournament import (MAX_PLAYERS, MODES, TOURNAMENT_PORT, Tournament, TournamentClient,
+                                   TournamentHost, play_local)
+
+ATTRIBUTES = ("Va", "Da", "Vi", "")
+
+
+def random_team(rng: random.Random, player: int) -> list:
+    """A team of 1-3 pets in SceneConnect.create_pet_data() format."""
+    return [{
+        "name": f"Pet{player}{i}",
+        "stage": rng.randint(2, 6),
+        "level": rng.randint(1, 10),
+        "hp": rng.randint(8, 30),
+        "power": rng.randint(10, 200),
+        "attribute": rng.choice(ATTRIBUTES),
+        "atk_main": rng.randint(0, 40),
+        "atk_alt": rng.randint(0, 40),
+        "module": "DMC",
+        "sick": False,
+        "traited": False,
+        "shook": False
+    } for i in range(rng.randint(1, 3))]
+
+
+def make_teams(players: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [random_team(rng, player) for player in range(players)]
+
+
+def log_stderr(text: str) -> None:
+    print(text, file=sys.stderr, flush=True)
+
+
+def repeated_byes() -> list:
+    """Bracket sizes up to MAX_PLAYERS where some player gets a second bye, for every way the matches can go."""
+    failing = []
+    for players in range(2, MAX_PLAYERS + 1):
+        for outcomes in range(2 ** players):  # Bit n decides the n-th match; a bracket has players - 1 of them
+            tournament = Tournament(range(players), "bracket")
+            byes_seen = []
+            match = 0
+            while not tournament.finished:
+                pairs, byes = tournament.next_round()
+                for a, b in pairs:
+                    tournament.record(a, b, bool(outcomes >> match & 1))
+                    match += 1
+                byes_seen += byes
+                tournament.end_round(byes)
+            if len(byes_seen) != len(set(byes_seen)):
+                failing.append(players)
+                break
+    return failing
+
+
+#=====================================================================
+# Roles (run in child processes)
+#=====================================================================
+
+def run_host(args) -> None:
+    teams = make_teams(args.players, args.seed)
+    host = TournamentHost("HOST", teams[0], mode=args.mode, port=args.port, address="127.0.0.1",
+                          use_processes=args.processes, seed=args.seed, log=log_stderr)
+    host.open_lobby()
+    deadline = time.time() + 30
+    while len(host.player_names()) < args.players and time.time() < deadline:
+        time.sleep(0.05)
+    if len(host.player_names()) < args.players:
+        log_stderr(f"[Loopback] Only {len(host.player_names())} of {args.players} players joined")
+    tournament = host.run()
+    host.stop()
+    print(json.dumps({"role": "host", "players": host.player_names(), "standings": tournament.standings(),
+                      "champion": tournament.champion}))
+
+
+def run_client(args) -> None:
+    team = make_teams(args.players, args.seed)[args.index]
+    client = TournamentClient(f"P{args.index:02d}", team, log=log_stderr)
+    for _ in range(50):
+        try:
+            client.connect("127.0.0.1", args.port)
+            break
+        except OSError:
+            time.sleep(0.1)  # Host not listening yet
+    while True:
+        message = client.messages.get(timeout=60)
+        if message is None:
+            break
+        if message["t"] == "result" and client.state.round_complete:
+            client.ready(client.state.round)
+    client.close()
+    print(json.dumps({"role": client.name, "standings": client.state.standings, "champion": client.state.champion}))
+
+
+#=====================================================================
+# Driver
+#=====================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a LAN tournament between local headless instances.")
+    parser.add_argument("--players", type=int, default=4, help="Participants, host included")
+    parser.add_argument("--mode", choices=MODES, default="bracket")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--port", type=int, default=TOURNAMENT_PORT)
+    parser.add_argument("--processes", action="store_true", help="Simulate matches on a process pool")
+    parser.add_argument("--role", choices=("host", "client"), help=argparse.SUPPRESS)
+    parser.add_argument("--index", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.role == "host":
+        return run_host(args)
+    if args.role == "client":
+        return run_client(args)
+
+    start = time.perf_counter()
+    command = [sys.executable, os.path.abspath(__file__), "--players", str(args.players), "--mode", args.mode,
+               "--seed", str(args.seed), "--port", str(args.port)] + (["--processes"] if args.processes else [])
+    processes = [subprocess.Popen(command + ["--role", "host"], stdout=subprocess.PIPE, text=True)]
+    processes += [subprocess.Popen(command + ["--role", "client", "--index", str(index)], stdout=subprocess.PIPE, text=True)
+                  for index in range(1, args.players)]
+
+    reports = []
+    for process in processes:
+        output, _ = process.communicate(timeout=120)
+        reports.append(json.loads(output.strip().splitlines()[-1]) if output.strip() else None)
+
+    if reports[0] is None:
+        print("[Loopback] FAILED: the host did not report")
+        sys.exit(1)
+
+    # Player ids follow join order: replay the same seating serially
+    teams = make_teams(args.players, args.seed)
+    seating = [0 if name == "HOST" else int(name[1:]) for name in reports[0]["players"]]
+    expected = play_local([teams[index] for index in seating], args.mode, args.seed)
+    expected_report = {"standings": expected.standings(), "champion": expected.champion}
+
+    failed = False
+    if args.mode == "bracket":
+        for players in repeated_byes():
+            print(f"[Loopback] A player gets a second bye in a {players} player bracket")
+            failed = True
+    for process, report in zip(processes, reports):
+        if report is None or process.returncode:
+            print(f"[Loopback] A participant failed (exit code {process.returncode})")
+            failed = True
+        elif {"standings": report["standings"], "champion": report["champion"]} != expected_report:
+            print(f"[Loopback] {report['role']} standings differ: {report['standings']}")
+            failed = True
+
+    print(f"[Loopback] {args.players} players, {args.mode}, {expected.round} rounds "
+          f"in {time.perf_counter() - start:.2f} s")
+    for player, wins, losses, hp in expected.standings():
+        print(f"  {reports[0]['players'][player]:<6}{wins}W {losses}L {hp} hp")
+    if expected.champion is not None:
+        print(f"  champion: {reports[0]['players'][expected.champion]}")
+    print("[Loopback] FAILED" if failed else "[Loopback] All participants agree")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()